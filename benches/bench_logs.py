@@ -0,0 +1,67 @@
+import asyncio
+import logging
+import uuid
+from typing import TYPE_CHECKING
+
+import pendulum
+import pytest
+
+from prefect.logging.handlers import APILogHandler
+from prefect.server import models, schemas
+from prefect.server.database.dependencies import provide_database_interface
+from prefect.settings import (
+    PREFECT_SERVER_DATABASE_CONNECTION_URL,
+    temporary_settings,
+)
+
+if TYPE_CHECKING:
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+
+def bench_api_log_handler_prepare(benchmark: "BenchmarkFixture"):
+    handler = APILogHandler()
+    record = logging.LogRecord(
+        name="prefect.task_runs",
+        level=logging.INFO,
+        pathname=__file__,
+        lineno=1,
+        msg="Finished in state %s",
+        args=("Completed()",),
+        exc_info=None,
+    )
+    record.flow_run_id = uuid.uuid4()
+    record.task_run_id = uuid.uuid4()
+
+    benchmark(handler.prepare, record)
+
+
+async def insert_logs(logs):
+    db = provide_database_interface()
+    async with db.session_context(begin_transaction=True) as session:
+        for batch in models.logs.split_logs_into_batches(logs):
+            await models.logs.create_logs(session=session, logs=batch)
+
+
+@pytest.mark.parametrize("count", [10_000])
+def bench_create_logs(benchmark: "BenchmarkFixture", tmp_path, count: int):
+    loop = asyncio.new_event_loop()
+    url = f"sqlite+aiosqlite:///{tmp_path}/bench.db"
+    flow_run_id = uuid.uuid4()
+    logs = [
+        schemas.actions.LogCreate(
+            name="prefect.task_runs",
+            level=logging.INFO,
+            message=f"Log message {i}",
+            timestamp=pendulum.now("UTC"),
+            flow_run_id=flow_run_id,
+        )
+        for i in range(count)
+    ]
+
+    try:
+        with temporary_settings({PREFECT_SERVER_DATABASE_CONNECTION_URL: url}):
+            loop.run_until_complete(provide_database_interface().create_db())
+
+            benchmark(lambda: loop.run_until_complete(insert_logs(logs)))
+    finally:
+        loop.close()
@@ -0,0 +1,73 @@
+import asyncio
+import datetime
+from typing import TYPE_CHECKING
+
+import pytest
+import sqlalchemy as sa
+
+from prefect.server import models, schemas
+from prefect.server.database.dependencies import provide_database_interface
+from prefect.server.services.scheduler import Scheduler
+from prefect.settings import (
+    PREFECT_SERVER_DATABASE_CONNECTION_URL,
+    temporary_settings,
+)
+
+if TYPE_CHECKING:
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+
+SCHEDULES = [
+    schemas.schedules.CronSchedule(cron="0 * * * *"),
+    schemas.schedules.CronSchedule(cron="*/15 * * * *"),
+    schemas.schedules.IntervalSchedule(interval=datetime.timedelta(hours=1)),
+    schemas.schedules.RRuleSchedule(rrule="FREQ=DAILY;BYHOUR=9"),
+]
+
+
+async def create_deployments(count: int):
+    db = provide_database_interface()
+    await db.create_db()
+
+    async with db.session_context(begin_transaction=True) as session:
+        flow = await models.flows.create_flow(
+            session=session, flow=schemas.core.Flow(name="bench")
+        )
+        for i in range(count):
+            await models.deployments.create_deployment(
+                session=session,
+                deployment=schemas.core.Deployment(
+                    name=f"deployment-{i}",
+                    flow_id=flow.id,
+                    schedules=[
+                        schemas.core.DeploymentSchedule(
+                            schedule=SCHEDULES[i % len(SCHEDULES)]
+                        )
+                    ],
+                ),
+            )
+
+
+async def delete_flow_runs():
+    db = provide_database_interface()
+    async with db.session_context(begin_transaction=True) as session:
+        await session.execute(sa.delete(db.FlowRun))
+
+
+@pytest.mark.parametrize("deployments", [10, 100, 1000])
+def bench_scheduler_run_once(benchmark: "BenchmarkFixture", tmp_path, deployments: int):
+    loop = asyncio.new_event_loop()
+    url = f"sqlite+aiosqlite:///{tmp_path}/bench.db"
+
+    try:
+        with temporary_settings({PREFECT_SERVER_DATABASE_CONNECTION_URL: url}):
+            loop.run_until_complete(create_deployments(deployments))
+            scheduler = Scheduler()
+
+            benchmark.pedantic(
+                lambda: loop.run_until_complete(scheduler.run_once()),
+                setup=lambda: loop.run_until_complete(delete_flow_runs()),
+                rounds=3,
+            )
+    finally:
+        loop.close()
@@ -0,0 +1,51 @@
+import os
+from typing import TYPE_CHECKING
+
+from prefect.settings import (
+    PREFECT_API_URL,
+    PREFECT_LOGGING_TO_API_BATCH_SIZE,
+    Settings,
+)
+from prefect.settings.context import _get_settings_snapshot, get_current_settings
+
+if TYPE_CHECKING:
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+
+def bench_settings_from_environment(benchmark: "BenchmarkFixture"):
+    benchmark(Settings)
+
+
+def bench_settings_snapshot(benchmark: "BenchmarkFixture"):
+    _get_settings_snapshot()
+    benchmark(_get_settings_snapshot)
+
+
+def bench_settings_snapshot_with_large_environment(benchmark: "BenchmarkFixture"):
+    # the cost of a snapshot read should not grow with the size of the environment
+    variables = {f"BENCH_UNRELATED_VARIABLE_{i}": "value" for i in range(500)}
+    variables.update({f"PREFECT_BENCH_UNUSED_{i}": "value" for i in range(50)})
+    os.environ.update(variables)
+    try:
+        _get_settings_snapshot()
+        benchmark(_get_settings_snapshot)
+    finally:
+        for key in variables:
+            del os.environ[key]
+
+
+def bench_get_current_settings(benchmark: "BenchmarkFixture"):
+    benchmark(get_current_settings)
+
+
+def bench_setting_value(benchmark: "BenchmarkFixture"):
+    benchmark(PREFECT_API_URL.value)
+
+
+def bench_nested_setting_value(benchmark: "BenchmarkFixture"):
+    benchmark(PREFECT_LOGGING_TO_API_BATCH_SIZE.value)
+
+
+def bench_settings_attribute(benchmark: "BenchmarkFixture"):
+    settings = get_current_settings()
+    benchmark(lambda: settings.logging.to_api.batch_size)
@@ -0,0 +1,67 @@
+from typing import TYPE_CHECKING
+from uuid import uuid4
+
+import pendulum
+import pytest
+
+from prefect.server.events import actions, triggers
+from prefect.server.events.schemas.automations import (
+    Automation,
+    EventTrigger,
+    Posture,
+)
+from prefect.server.events.schemas.events import ReceivedEvent
+
+if TYPE_CHECKING:
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+
+def make_automation(i: int) -> Automation:
+    # A typical mix of automations watching specific deployments, all flow runs of a
+    # flow, and particular events
+    if i % 3 == 0:
+        match = {"prefect.resource.id": f"prefect.flow-run.{uuid4()}"}
+        match_related = {}
+    elif i % 3 == 1:
+        match = {"prefect.resource.id": "prefect.flow-run.*"}
+        match_related = {"prefect.resource.id": f"prefect.deployment.{uuid4()}"}
+    else:
+        match = {}
+        match_related = {}
+
+    return Automation(
+        name=f"automation-{i}",
+        trigger=EventTrigger(
+            expect={f"custom.event-{i}" if i % 3 == 2 else "prefect.flow-run.Failed"},
+            match=match,
+            match_related=match_related,
+            posture=Posture.Reactive,
+            threshold=1,
+        ),
+        actions=[actions.DoNothing()],
+    )
+
+
+@pytest.mark.parametrize("automations", [10, 100, 1000, 10000])
+def bench_find_interested_triggers(benchmark: "BenchmarkFixture", automations: int):
+    for i in range(automations):
+        triggers.load_automation(make_automation(i))
+
+    event = ReceivedEvent(
+        occurred=pendulum.now("UTC"),
+        event="prefect.flow-run.Failed",
+        resource={"prefect.resource.id": f"prefect.flow-run.{uuid4()}"},
+        related=[
+            {
+                "prefect.resource.id": f"prefect.deployment.{uuid4()}",
+                "prefect.resource.role": "deployment",
+            }
+        ],
+        id=uuid4(),
+    )
+
+    try:
+        benchmark(triggers.find_interested_triggers, event)
+    finally:
+        for automation in list(triggers.automations_by_id.values()):
+            triggers.forget_automation(automation.id)
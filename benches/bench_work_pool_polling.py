@@ -0,0 +1,79 @@
+import asyncio
+from typing import TYPE_CHECKING
+
+import pendulum
+import pytest
+import sqlalchemy as sa
+
+from prefect.server import models, schemas
+from prefect.server.database.dependencies import provide_database_interface
+from prefect.settings import (
+    PREFECT_SERVER_DATABASE_CONNECTION_URL,
+    temporary_settings,
+)
+
+if TYPE_CHECKING:
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+
+async def create_scheduled_flow_runs(count: int):
+    db = provide_database_interface()
+    await db.create_db()
+
+    async with db.session_context(begin_transaction=True) as session:
+        flow = await models.flows.create_flow(
+            session=session, flow=schemas.core.Flow(name="bench")
+        )
+        work_pool = await models.workers.create_work_pool(
+            session=session,
+            work_pool=schemas.actions.WorkPoolCreate(name="bench-pool"),
+        )
+        start = pendulum.now("UTC").subtract(hours=1)
+        await session.execute(
+            sa.insert(db.FlowRun),
+            [
+                dict(
+                    name=f"run-{i}",
+                    flow_id=flow.id,
+                    work_queue_id=work_pool.default_queue_id,
+                    work_queue_name="default",
+                    state_type=schemas.states.StateType.SCHEDULED,
+                    state_name="Scheduled",
+                    expected_start_time=start.add(seconds=i),
+                    next_scheduled_start_time=start.add(seconds=i),
+                )
+                for i in range(count)
+            ],
+        )
+
+    return work_pool.id
+
+
+async def poll(work_pool_id):
+    db = provide_database_interface()
+    async with db.session_context() as session:
+        return await db.queries.get_scheduled_flow_runs_from_work_pool(
+            session=session,
+            work_pool_ids=[work_pool_id],
+            scheduled_before=pendulum.now("UTC"),
+            limit=10,
+        )
+
+
+@pytest.mark.parametrize("flow_runs", [100_000])
+def bench_get_scheduled_flow_runs_from_work_pool(
+    benchmark: "BenchmarkFixture", tmp_path, flow_runs: int
+):
+    loop = asyncio.new_event_loop()
+    url = f"sqlite+aiosqlite:///{tmp_path}/bench.db"
+
+    try:
+        with temporary_settings({PREFECT_SERVER_DATABASE_CONNECTION_URL: url}):
+            work_pool_id = loop.run_until_complete(
+                create_scheduled_flow_runs(flow_runs)
+            )
+
+            runs = benchmark(lambda: loop.run_until_complete(poll(work_pool_id)))
+            assert len(runs) == 10
+    finally:
+        loop.close()
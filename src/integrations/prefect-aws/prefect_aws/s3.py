@@ -7,6 +7,7 @@ import uuid
 from pathlib import Path
 from typing import Any, BinaryIO, Dict, List, Optional, Tuple, Union, get_args
 
+from botocore.exceptions import ClientError
 from botocore.paginate import PageIterator
 from botocore.response import StreamingBody
 from pydantic import Field, field_validator
@@ -1153,6 +1154,95 @@ class S3Bucket(WritableFileSystem, WritableDeploymentStorage, ObjectStorageBlock
 
         return self._read_sync(path)
 
+    def _exists_sync(self, key: str) -> bool:
+        """
+        Called by exists(). Creates an S3 client and requests the metadata of
+        the object without downloading it.
+        """
+
+        s3_client = self._get_s3_client()
+
+        try:
+            s3_client.head_object(Bucket=self.bucket_name, Key=key)
+        except ClientError as exc:
+            if exc.response.get("Error", {}).get("Code") in ("404", "NoSuchKey"):
+                return False
+            raise
+        return True
+
+    async def aexists(self, path: str) -> bool:
+        """
+        Asynchronously checks if an object exists at a specified path in the S3
+        bucket without downloading its contents.
+
+        Args:
+            path: Entire path to (and including) the key.
+
+        Returns:
+            True if the object exists, False otherwise.
+        """
+        path = self._resolve_path(path)
+        return await run_sync_in_worker_thread(self._exists_sync, path)
+
+    @async_dispatch(aexists)
+    def exists(self, path: str) -> bool:
+        """
+        Checks if an object exists at a specified path in the S3 bucket without
+        downloading its contents.
+
+        Args:
+            path: Entire path to (and including) the key.
+
+        Returns:
+            True if the object exists, False otherwise.
+        """
+        path = self._resolve_path(path)
+        return self._exists_sync(path)
+
+    def _read_prefix_sync(self, key: str, size: int) -> bytes:
+        """
+        Called by read_path_prefix(). Creates an S3 client and retrieves the
+        first `size` bytes of an object with a ranged request.
+        """
+
+        s3_client = self._get_s3_client()
+
+        response = s3_client.get_object(
+            Bucket=self.bucket_name, Key=key, Range=f"bytes=0-{size - 1}"
+        )
+        return response["Body"].read()
+
+    async def aread_path_prefix(self, path: str, size: int) -> bytes:
+        """
+        Asynchronously reads at most the first `size` bytes of the object at a
+        specified path in the S3 bucket without downloading the rest of it.
+
+        Args:
+            path: Entire path to (and including) the key.
+            size: The maximum number of bytes to read.
+
+        Returns:
+            The first `size` bytes of the object.
+        """
+        path = self._resolve_path(path)
+        return await run_sync_in_worker_thread(self._read_prefix_sync, path, size)
+
+    @async_dispatch(aread_path_prefix)
+    def read_path_prefix(self, path: str, size: int) -> bytes:
+        """
+        Reads at most the first `size` bytes of the object at a specified path in
+        the S3 bucket without downloading the rest of it.
+
+        Args:
+            path: Entire path to (and including) the key.
+            size: The maximum number of bytes to read.
+
+        Returns:
+            The first `size` bytes of the object.
+        """
+        path = self._resolve_path(path)
+        return self._read_prefix_sync(path, size)
+
     def _write_sync(self, key: str, data: bytes) -> None:
         """
         Called by write_path(). Creates an S3 client and uploads a file
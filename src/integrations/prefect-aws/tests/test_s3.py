@@ -753,6 +753,30 @@ def test_write_path_in_sync_context(s3_bucket):
     assert content == b"hello"
 
 
+def test_exists_in_sync_context(s3_bucket_with_file):
+    """Test that exists works in a sync context."""
+    s3_bucket, key = s3_bucket_with_file
+    assert s3_bucket.exists(key)
+    assert not s3_bucket.exists("missing.txt")
+
+
+async def test_exists(s3_bucket_with_file):
+    s3_bucket, key = s3_bucket_with_file
+    assert await s3_bucket.aexists(key)
+    assert not await s3_bucket.exists("missing.txt")
+
+
+def test_read_path_prefix_in_sync_context(s3_bucket_with_file):
+    s3_bucket, key = s3_bucket_with_file
+    assert s3_bucket.read_path_prefix(key, 2) == b"he"
+
+
+async def test_read_path_prefix(s3_bucket_with_file):
+    s3_bucket, key = s3_bucket_with_file
+    assert await s3_bucket.aread_path_prefix(key, 2) == b"he"
+    assert await s3_bucket.read_path_prefix(key, 10) == b"hello"
+
+
 def test_resolve_path(s3_bucket):
     assert s3_bucket._resolve_path("") == ""
 
@@ -770,6 +770,43 @@ class GcsBucket(WritableDeploymentStorage, WritableFileSystem, ObjectStorageBloc
             )
         return contents
 
+    @sync_compatible
+    async def exists(self, path: str) -> bool:
+        """
+        Checks if a blob exists at the specified path in GCS without downloading
+        its contents.
+
+        Args:
+            path: Entire path to (and including) the key.
+
+        Returns:
+            True if the blob exists, False otherwise.
+        """
+        path = self._resolve_path(path)
+        client = self.gcp_credentials.get_cloud_storage_client()
+        blob = client.bucket(self.bucket).blob(path)
+        return await run_sync_in_worker_thread(blob.exists)
+
+    @sync_compatible
+    async def read_path_prefix(self, path: str, size: int) -> bytes:
+        """
+        Reads at most the first `size` bytes of the blob at the specified path in
+        GCS without downloading the rest of it.
+
+        Args:
+            path: Entire path to (and including) the key.
+            size: The maximum number of bytes to read.
+
+        Returns:
+            The first `size` bytes of the blob.
+        """
+        path = self._resolve_path(path)
+        client = self.gcp_credentials.get_cloud_storage_client()
+        blob = client.bucket(self.bucket).blob(path)
+        return await run_sync_in_worker_thread(
+            blob.download_as_bytes, start=0, end=size - 1
+        )
+
     @sync_compatible
     async def write_path(self, path: str, content: bytes) -> str:
         """
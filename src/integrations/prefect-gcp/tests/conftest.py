@@ -97,6 +97,14 @@ class CloudStorageClient:
         bucket_obj.blob.side_effect = lambda blob, **kwds: blob_obj
         return bucket_obj
 
+    def bucket(self, bucket):
+        bucket_obj = MagicMock(bucket=bucket)
+        bucket_obj.blob.side_effect = lambda blob, **kwds: MagicMock(
+            exists=MagicMock(return_value=blob.endswith("blob")),
+            download_as_bytes=lambda start=0, end=None: b"bytes"[start : end + 1],
+        )
+        return bucket_obj
+
     def list_blobs(self, bucket, prefix=None):
         blob_obj = Blob(name="blob.txt")
         blob_directory = Blob(name="directory/")
@@ -143,6 +143,13 @@ class TestGcsBucket:
     def test_read_path(self, gcs_bucket):
         assert gcs_bucket.read_path("blob") == b"bytes"
 
+    def test_exists(self, gcs_bucket):
+        assert gcs_bucket.exists("blob")
+        assert not gcs_bucket.exists("missing")
+
+    def test_read_path_prefix(self, gcs_bucket):
+        assert gcs_bucket.read_path_prefix("blob", 2) == b"by"
+
     def test_write_path(self, gcs_bucket):
         bucket_folder = gcs_bucket.bucket_folder
         assert gcs_bucket.write_path("blob", b"bytes_data") == f"{bucket_folder}blob"
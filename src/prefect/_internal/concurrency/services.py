@@ -3,11 +3,27 @@ import asyncio
 import atexit
 import concurrent.futures
 import contextlib
+import dataclasses
 import logging
+import os
 import queue
+import struct
 import sys
+import tempfile
 import threading
-from typing import Awaitable, Dict, Generic, List, Optional, Type, TypeVar, Union
+from typing import (
+    Awaitable,
+    Dict,
+    Generic,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+)
 
 from typing_extensions import Self
 
@@ -19,20 +35,170 @@ from prefect._internal.concurrency.threads import WorkerThread, get_global_loop
 
 T = TypeVar("T")
 
+OverflowPolicy = Literal["block", "drop_oldest", "spill"]
+
+
+@dataclasses.dataclass
+class QueueServiceStats:
+    """
+    Counters describing the items waiting to be handled by a queue service.
+    """
+
+    depth: int = 0
+    """The number of items waiting in memory."""
+
+    size: int = 0
+    """The total size of the items waiting in memory, as measured by `_get_size`."""
+
+    spooled: int = 0
+    """The number of items waiting in the spool file."""
+
+    dropped: int = 0
+    """The number of items dropped because the queue was full."""
+
+    spilled: int = 0
+    """The number of items written to the spool file because the queue was full."""
+
+
+class SpoolFile:
+    """
+    An append-only file of serialized items, read back in the order they were
+    written.
+
+    Each record is prefixed with its length and the size of its item. A record with
+    neither marks the end of the service's items.
+    """
+
+    _header = struct.Struct("!IQ")
+
+    def __init__(self, prefix: str) -> None:
+        self._prefix = prefix
+        self._file = None
+        self._read_offset = 0
+        self.count = 0
+
+    def append(self, data: Optional[bytes], size: int = 0) -> None:
+        if self._file is None:
+            fd, path = tempfile.mkstemp(prefix=self._prefix, suffix=".spool")
+            self._file = os.fdopen(fd, "w+b")
+            # The file is only needed by this process, so remove it from the
+            # filesystem while keeping it open
+            os.unlink(path)
+
+        self._file.seek(0, os.SEEK_END)
+        if data is None:
+            self._file.write(self._header.pack(0, 0))
+        else:
+            self._file.write(self._header.pack(len(data), size) + data)
+        self.count += 1
+
+    def peek(self) -> Tuple[bool, int]:
+        """
+        Read whether the oldest record in the file is the end marker, and the size of
+        its item, without removing it.
+        """
+        assert self._file is not None and self.count, "The spool file is empty"
+
+        self._file.flush()
+        self._file.seek(self._read_offset)
+        length, size = self._header.unpack(self._file.read(self._header.size))
+        return not (length or size), size
+
+    def pop(self) -> Tuple[Optional[bytes], int]:
+        """
+        Read the oldest record in the file, returning `None` for the end marker.
+        """
+        assert self._file is not None and self.count, "The spool file is empty"
+
+        self._file.flush()
+        self._file.seek(self._read_offset)
+        length, size = self._header.unpack(self._file.read(self._header.size))
+        data = self._file.read(length) if length or size else None
+        self._read_offset = self._file.tell()
+        self.count -= 1
+
+        if not self.count:
+            # Start over once every record has been read so the file does not grow
+            # for the lifetime of the service
+            self.close()
+
+        return data, size
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+        self._file = None
+        self._read_offset = 0
+        self.count = 0
+
+
+class SpillableItemsMixin(abc.ABC, Generic[T]):
+    """
+    A mixin for queue services whose items can be written to a spool file, as
+    required by the `"spill"` overflow policy.
+    """
+
+    @abc.abstractmethod
+    def _serialize_item(self, item: T) -> bytes:
+        """
+        Serialize an item to be written to the spool file.
+        """
+
+    @abc.abstractmethod
+    def _deserialize_item(self, data: bytes) -> T:
+        """
+        Deserialize an item read back from the spool file.
+        """
+
 
 class QueueService(abc.ABC, Generic[T]):
+    """
+    A service that handles items sent to it from any thread on the global loop thread.
+
+    The items waiting to be handled are unbounded by default. Services may set
+    `_max_queue_items` and `_max_queue_size` to bound them, with an
+    `_overflow_policy` for items sent while the queue is full:
+
+    - `"block"`: wait until there is room in the queue; items sent from the global
+        loop thread can't wait for the queue to be emptied on that thread, so the
+        oldest waiting items are dropped for them instead, with a warning
+    - `"drop_oldest"`: drop the oldest waiting items to make room
+    - `"spill"`: write items to a local spool file, which is read back into the queue
+        as there is room again; requires the service to use `SpillableItemsMixin`
+
+    The queue is never considered full while it is empty, so a single item larger than
+    `_max_queue_size` is still accepted.
+    """
+
     _instances: Dict[int, Self] = {}
     _instance_lock = threading.Lock()
 
+    _max_queue_items: Optional[int] = None
+    _max_queue_size: Optional[int] = None
+    _overflow_policy: OverflowPolicy = "block"
+
     def __init__(self, *args) -> None:
         self._queue: queue.Queue = queue.Queue()
         self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread_ident: Optional[int] = None
         self._done_event: Optional[asyncio.Event] = None
         self._task: Optional[asyncio.Task] = None
         self._stopped: bool = False
         self._started: bool = False
         self._key = hash(args)
         self._lock = threading.Lock()
+        self._capacity = threading.Condition(self._lock)
+        self._stats = QueueServiceStats()
+        self._warned_of_loop_thread_drops = False
+        self._queue_limits = (self._max_queue_items, self._max_queue_size)
+        self._queue_overflow_policy = self._overflow_policy
+        self._spool = SpoolFile(prefix=f"prefect-{type(self).__name__.lower()}-")
+        if self._queue_overflow_policy == "spill" and not isinstance(
+            self, SpillableItemsMixin
+        ):
+            raise ValueError(
+                f"{type(self).__name__} does not support spilling items to a file."
+            )
         self._queue_get_thread = WorkerThread(
             # TODO: This thread should not need to be a daemon but when it is not, it
             #       can prevent the interpreter from exiting.
@@ -49,6 +215,7 @@ class QueueService(abc.ABC, Generic[T]):
             raise RuntimeError("Services must run on the global loop thread.")
 
         self._loop = loop_thread._loop
+        self._loop_thread_ident = threading.get_ident()
         self._done_event = asyncio.Event()
         self._task = self._loop.create_task(self._run())
         self._queue_get_thread.start()
@@ -97,19 +264,154 @@ class QueueService(abc.ABC, Generic[T]):
             # EngineContext. Issue #10338.
             self._task = None
 
-            # Signal completion to the loop
-            self._queue.put_nowait(None)
+            # Signal completion to the loop, after any items in the spool file
+            if self._spool.count:
+                self._spool.append(None)
+            else:
+                self._queue.put_nowait(None)
+
+            # Wake senders waiting for room in the queue
+            self._capacity.notify_all()
 
     def send(self, item: T):
         """
         Send an item to this instance of the service.
+
+        If the queue is full, the item is handled according to the service's
+        `_overflow_policy`.
         """
-        with self._lock:
+        dropped_in_loop_thread = False
+        with self._capacity:
             if self._stopped:
                 raise RuntimeError("Cannot put items in a stopped service instance.")
 
             logger.debug("Service %r enqueuing item %r", self, item)
-            self._queue.put_nowait(self._prepare_item(item))
+            item = self._prepare_item(item)
+            size = self._get_size(item)
+
+            if self._spool.count:
+                # Keep items in order while earlier items are waiting in the file
+                self._spill(item, size)
+                return
+
+            policy = self._queue_overflow_policy
+            while not self._has_room(size):
+                if policy == "spill":
+                    self._spill(item, size)
+                    return
+                elif policy == "drop_oldest":
+                    if not self._drop_oldest():
+                        break
+                elif self._in_loop_thread():
+                    # Waiting on the loop thread would prevent the queue from ever
+                    # being emptied, so drop items instead
+                    if not self._drop_oldest():
+                        break
+                    dropped_in_loop_thread = True
+                else:
+                    self._capacity.wait(timeout=1)
+                    if self._stopped:
+                        raise RuntimeError(
+                            "Cannot put items in a stopped service instance."
+                        )
+
+            self._put(item, size)
+
+        # Warned outside of the lock, since logging may send items to a service
+        if dropped_in_loop_thread:
+            self._warn_of_loop_thread_drop()
+
+    @property
+    def stats(self) -> QueueServiceStats:
+        """
+        A snapshot of the counters of this instance of the service.
+        """
+        with self._lock:
+            return dataclasses.replace(self._stats)
+
+    def _has_room(self, size: int) -> bool:
+        max_items, max_size = self._queue_limits
+        if not self._stats.depth:
+            return True
+        if max_items is not None and self._stats.depth >= max_items:
+            return False
+        if max_size is not None and self._stats.size + size > max_size:
+            return False
+        return True
+
+    def _in_loop_thread(self) -> bool:
+        return threading.get_ident() == self._loop_thread_ident
+
+    def _warn_of_loop_thread_drop(self) -> None:
+        if self._warned_of_loop_thread_drops:
+            return
+        self._warned_of_loop_thread_drops = True
+        self._logger.warning(
+            "Queue is full and items sent from the global loop thread cannot wait for"
+            " room, so the oldest waiting items are being dropped. Raise the queue"
+            " limits or use the 'spill' overflow policy to keep them."
+        )
+
+    def _put(self, item: T, size: int) -> None:
+        self._stats.depth += 1
+        self._stats.size += size
+        self._queue.put_nowait((item, size))
+
+    def _spill(self, item: T, size: int) -> None:
+        spillable = cast("SpillableItemsMixin[T]", self)
+        self._spool.append(spillable._serialize_item(item), size)
+        self._stats.spooled += 1
+        self._stats.spilled += 1
+
+    def _drop_oldest(self) -> bool:
+        try:
+            entry = self._queue.get_nowait()
+        except queue.Empty:
+            return False
+
+        item, size = entry
+        self._stats.depth -= 1
+        self._stats.size -= size
+        self._stats.dropped += 1
+        self._queue.task_done()
+        self._on_item_dropped(item)
+        return True
+
+    def _release(self, size: int) -> None:
+        """
+        Account for an item taken from the queue to be handled, reading items back
+        from the spool file into the room it leaves.
+        """
+        with self._capacity:
+            self._stats.depth -= 1
+            self._stats.size -= size
+
+            while self._spool.count:
+                is_end, next_size = self._spool.peek()
+                if not is_end and not self._has_room(next_size):
+                    break
+
+                data, size = self._spool.pop()
+                if data is None:
+                    self._queue.put_nowait(None)
+                else:
+                    self._stats.spooled -= 1
+                    spillable = cast("SpillableItemsMixin[T]", self)
+                    self._put(spillable._deserialize_item(data), size)
+
+            self._capacity.notify_all()
+
+    def _get_size(self, item: T) -> int:
+        """
+        Calculate the size of a single item.
+        """
+        # By default, the size is just the number of items
+        return 1
+
+    def _on_item_dropped(self, item: T) -> None:
+        """
+        Called when an item is dropped because the queue is full.
+        """
 
     def _prepare_item(self, item: T) -> T:
         """
@@ -144,12 +446,16 @@ class QueueService(abc.ABC, Generic[T]):
             self._stopped = True
             self._done_event.set()
 
+            with self._capacity:
+                self._spool.close()
+                self._capacity.notify_all()
+
     async def _main_loop(self):
         last_log_time = 0
         log_interval = 4  # log every 4 seconds
 
         while True:
-            item: T = await self._queue_get_thread.submit(
+            entry: Optional[Tuple[T, int]] = await self._queue_get_thread.submit(
                 create_call(self._queue.get)
             ).aresult()
 
@@ -163,11 +469,14 @@ class QueueService(abc.ABC, Generic[T]):
                     )
                     last_log_time = current_time
 
-            if item is None:
+            if entry is None:
                 logger.debug("Exiting service %r", self)
                 self._queue.task_done()
                 break
 
+            item, size = entry
+            self._release(size)
+
             try:
                 logger.debug("Service %r handling item %r", self, item)
                 await self._handle(item)
@@ -298,11 +607,15 @@ class BatchedQueueService(QueueService[T]):
     A queue service that handles a batch of items instead of a single item at a time.
 
     Items will be processed when the batch reaches the configured `_max_batch_size`
-    or after an interval of `_min_interval` seconds (if set).
+    or after an interval of `_min_interval` seconds (if set). With a `_min_interval`
+    of zero, a batch is processed as soon as an item is available, together with any
+    other items that are already waiting.
     """
 
     _max_batch_size: int
     _min_interval: Optional[float] = None
+    # Whether `_max_batch_size` counts items instead of adding up their sizes
+    _batch_by_count: bool = False
 
     async def _main_loop(self):
         done = False
@@ -315,16 +628,27 @@ class BatchedQueueService(QueueService[T]):
             deadline = get_deadline(self._min_interval)
             while batch_size < self._max_batch_size:
                 try:
-                    item = await self._queue_get_thread.submit(
-                        create_call(self._queue.get, timeout=get_timeout(deadline))
-                    ).aresult()
-
-                    if item is None:
+                    timeout = get_timeout(deadline)
+                    if not batch and self._min_interval == 0:
+                        # Wait for the first item of the batch
+                        timeout = None
+
+                    if timeout == 0:
+                        entry = self._queue.get_nowait()
+                    else:
+                        entry = await self._queue_get_thread.submit(
+                            create_call(self._queue.get, timeout=timeout)
+                        ).aresult()
+
+                    if entry is None:
+                        self._queue.task_done()
                         done = True
                         break
 
+                    item, size = entry
+                    self._release(size)
                     batch.append(item)
-                    batch_size += self._get_size(item)
+                    batch_size += 1 if self._batch_by_count else size
                     logger.debug(
                         "Service %r added item %r to batch (size %s/%s)",
                         self,
@@ -355,6 +679,9 @@ class BatchedQueueService(QueueService[T]):
                     batch_size,
                     exc_info=log_traceback,
                 )
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
 
     @abc.abstractmethod
     async def _handle_batch(self, items: List[T]):
@@ -365,13 +692,6 @@ class BatchedQueueService(QueueService[T]):
     async def _handle(self, item: T):
         assert False, "`_handle` should never be called for batched queue services"
 
-    def _get_size(self, item: T) -> int:
-        """
-        Calculate the size of a single item.
-        """
-        # By default, batch size is just the number of items
-        return 1
-
 
 @contextlib.contextmanager
 def drain_on_exit(service: QueueService):
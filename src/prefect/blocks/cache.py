@@ -0,0 +1,213 @@
+"""
+A process-level cache of the block documents loaded by blocks.
+
+Loading a block reads its block document from the API every time, so tasks that load
+the same credentials block on every call make as many identical requests. When
+`PREFECT_CLIENT_BLOCKS_CACHE_ENABLED` is set, `Block.load` and `Block.load_from_ref`
+read block documents from this cache instead, until they expire or change.
+"""
+
+import asyncio
+import atexit
+import threading
+from typing import Any, Dict, FrozenSet, Hashable, Iterable, Optional, Tuple
+from uuid import UUID
+
+from cachetools import TTLCache
+from typing_extensions import Self
+
+from prefect._internal.concurrency.api import create_call, from_sync
+from prefect._internal.concurrency.threads import get_global_loop
+from prefect.client.schemas.objects import BlockDocument
+from prefect.events.clients import get_events_subscriber
+from prefect.events.filters import EventFilter, EventNameFilter
+from prefect.logging.loggers import get_logger
+from prefect.settings import PREFECT_API_URL, get_current_settings
+
+BLOCK_DOCUMENT_EVENT_PREFIX = "prefect.block-document."
+
+
+def _referenced_block_document_ids(
+    block_document_references: Dict[str, Dict[str, Any]],
+) -> Iterable[UUID]:
+    for reference in block_document_references.values():
+        referenced = reference.get("block_document") or {}
+        if referenced.get("id"):
+            yield UUID(str(referenced["id"]))
+        yield from _referenced_block_document_ids(
+            referenced.get("block_document_references") or {}
+        )
+
+
+class BlockDocumentCache:
+    """
+    A thread-safe cache of the block documents read from the API, keyed by block
+    document ID and by block type slug and block document name, whose entries expire
+    after a time to live.
+
+    A single instance is shared by the process, see `BlockDocumentCache.instance`.
+    It listens for block document events from the API and drops the documents that
+    were updated or deleted, along with the documents that reference them. Documents
+    changed while the cache isn't listening, for example when there is no API URL
+    to subscribe to, are used until they expire.
+    """
+
+    _instance: Optional[Self] = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, max_size: int, ttl_seconds: float):
+        self.logger = get_logger("blocks.cache")
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        # each entry holds the document and the IDs of the documents it includes
+        self._documents: TTLCache[
+            Hashable, Tuple[BlockDocument, FrozenSet[UUID]]
+        ] = TTLCache(maxsize=max_size, ttl=ttl_seconds)
+        self._lock = threading.Lock()
+        self._consumer_task: Optional[asyncio.Task] = None
+
+    def get_by_id(
+        self, api_url: str, block_document_id: UUID
+    ) -> Optional[BlockDocument]:
+        return self._get(("id", api_url, block_document_id))
+
+    def get_by_name(
+        self, api_url: str, block_type_slug: str, name: str
+    ) -> Optional[BlockDocument]:
+        return self._get(("name", api_url, block_type_slug, name))
+
+    def _get(self, key: Hashable) -> Optional[BlockDocument]:
+        with self._lock:
+            entry = self._documents.get(key)
+        if entry is None:
+            return None
+        # loading a block may modify the document's data
+        return entry[0].model_copy(deep=True)
+
+    def set(self, api_url: str, block_document: BlockDocument) -> None:
+        """Caches a block document read from the API at the given URL"""
+        included_ids = frozenset(
+            [
+                block_document.id,
+                *_referenced_block_document_ids(
+                    block_document.block_document_references
+                ),
+            ]
+        )
+        entry = (block_document.model_copy(deep=True), included_ids)
+        with self._lock:
+            self._documents[("id", api_url, block_document.id)] = entry
+            if block_document.block_type and block_document.name:
+                self._documents[
+                    (
+                        "name",
+                        api_url,
+                        block_document.block_type.slug,
+                        block_document.name,
+                    )
+                ] = entry
+
+    def invalidate(self, block_document_id: UUID) -> None:
+        """
+        Drops the given block document, and every document that references it, from
+        the cache
+        """
+        with self._lock:
+            for key, (_, included_ids) in list(self._documents.items()):
+                if block_document_id in included_ids:
+                    self._documents.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._documents.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._documents)
+
+    def start(self):
+        """
+        Start listening for block document events on the global loop thread.
+        """
+        loop_thread = get_global_loop()
+        if not asyncio.get_running_loop() == loop_thread._loop:
+            raise RuntimeError("BlockDocumentCache must run on the global loop thread.")
+
+        self._consumer_task = loop_thread._loop.create_task(self._consume_events())
+        loop_thread.add_shutdown_call(create_call(self.stop))
+        atexit.register(self.stop)
+
+    async def _consume_events(self):
+        try:
+            async with get_events_subscriber(
+                filter=EventFilter(
+                    event=EventNameFilter(prefix=[BLOCK_DOCUMENT_EVENT_PREFIX])
+                )
+            ) as subscriber:
+                async for event in subscriber:
+                    try:
+                        self.invalidate(
+                            UUID(
+                                event.resource.id.replace(
+                                    BLOCK_DOCUMENT_EVENT_PREFIX, ""
+                                )
+                            )
+                        )
+                    except Exception as exc:
+                        self.logger.error(f"Error processing event: {exc}")
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            self.logger.warning(
+                "Stopped listening for block document events, cached block documents"
+                f" will be used until they expire: {exc!r}"
+            )
+
+    def stop(self):
+        """
+        Stop listening for block document events.
+        """
+        if self._consumer_task:
+            self._consumer_task.cancel()
+            self._consumer_task = None
+
+    @classmethod
+    def instance(cls) -> Optional[Self]:
+        """
+        Get the block document cache shared by the process, or None if block
+        documents aren't cached.
+
+        The cache is created on first use and configured by the
+        `PREFECT_CLIENT_BLOCKS_CACHE_*` settings.
+        """
+        settings = get_current_settings().client.blocks
+        if not settings.cache_enabled:
+            return None
+
+        with cls._instance_lock:
+            instance = cls._instance
+            if (
+                instance is None
+                or instance.max_size != settings.cache_max_size
+                or instance.ttl_seconds != settings.cache_ttl_seconds
+            ):
+                if instance is not None:
+                    instance.stop()
+                instance = cls._instance = cls._new_instance(
+                    max_size=settings.cache_max_size,
+                    ttl_seconds=settings.cache_ttl_seconds,
+                )
+            return instance
+
+    @classmethod
+    def _new_instance(cls, max_size: int, ttl_seconds: float) -> Self:
+        instance = cls(max_size=max_size, ttl_seconds=ttl_seconds)
+
+        # without an API to subscribe to, cached documents expire on their own
+        if PREFECT_API_URL.value():
+            if threading.get_ident() == get_global_loop().thread.ident:
+                instance.start()
+            else:
+                from_sync.call_soon_in_loop_thread(create_call(instance.start)).result()
+
+        return instance
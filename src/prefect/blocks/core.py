@@ -41,6 +41,7 @@ from pydantic.json_schema import GenerateJsonSchema
 from typing_extensions import Literal, ParamSpec, Self, get_args
 
 import prefect.exceptions
+from prefect.blocks.cache import BlockDocumentCache
 from prefect.client.schemas import (
     DEFAULT_BLOCK_SCHEMA_VERSION,
     BlockDocument,
@@ -789,6 +790,14 @@ class Block(BaseModel, ABC):
             block_type_slug = cls.get_block_type_slug()
             block_document_name = name
 
+        cache = BlockDocumentCache.instance()
+        if cache is not None:
+            block_document = cache.get_by_name(
+                str(client.api_url), block_type_slug, block_document_name
+            )
+            if block_document is not None:
+                return block_document, block_document_name
+
         try:
             block_document = await client.read_block_document_by_name(
                 name=block_document_name, block_type_slug=block_type_slug
@@ -799,6 +808,9 @@ class Block(BaseModel, ABC):
                 f" type {block_type_slug}"
             ) from e
 
+        if cache is not None:
+            cache.set(str(client.api_url), block_document)
+
         return block_document, block_document_name
 
     @classmethod
@@ -817,6 +829,12 @@ class Block(BaseModel, ABC):
                     f"Block document ID {block_document_id!r} is not a valid UUID"
                 )
 
+        cache = BlockDocumentCache.instance()
+        if cache is not None:
+            block_document = cache.get_by_id(str(client.api_url), block_document_id)
+            if block_document is not None:
+                return block_document, block_document.name
+
         try:
             block_document = await client.read_block_document(
                 block_document_id=block_document_id
@@ -826,6 +844,9 @@ class Block(BaseModel, ABC):
                 f"Unable to find block document with ID {block_document_id!r}"
             )
 
+        if cache is not None:
+            cache.set(str(client.api_url), block_document)
+
         return block_document, block_document.name
 
     @classmethod
@@ -853,6 +874,10 @@ class Block(BaseModel, ABC):
         this case, the block attributes will default to `None` and must be set manually
         and saved to a new block document before the block can be used as expected.
 
+        When `PREFECT_CLIENT_BLOCKS_CACHE_ENABLED` is set, block documents loaded
+        within the last `PREFECT_CLIENT_BLOCKS_CACHE_TTL_SECONDS` are read from a
+        process-level cache instead of the API.
+
         Args:
             name: The name or slug of the block document. A block document slug is a
                 string with the format <block_type_slug>/<block_document_name>
@@ -1186,6 +1211,9 @@ class Block(BaseModel, ABC):
                     " values that are saved, then save with `overwrite=True`."
                 ) from err
 
+        if cache := BlockDocumentCache.instance():
+            cache.invalidate(block_document.id)
+
         # Update metadata on block instance for later use.
         self._block_document_name = block_document.name
         self._block_document_id = block_document.id
@@ -1224,6 +1252,9 @@ class Block(BaseModel, ABC):
 
         await client.delete_block_document(block_document.id)
 
+        if cache := BlockDocumentCache.instance():
+            cache.invalidate(block_document.id)
+
     def __new__(cls: Type[Self], **kwargs) -> Self:
         """
         Create an instance of the Block subclass type if a `block_type_slug` is
@@ -6,9 +6,9 @@ from typing import TYPE_CHECKING, Any, Callable, Dict, List, Literal, Optional,
 
 from typing_extensions import Self
 
-from prefect.context import TaskRunContext
+from prefect.context import FlowRunContext, TaskRunContext
 from prefect.exceptions import HashError
-from prefect.utilities.hashing import hash_objects
+from prefect.utilities.hashing import hash_objects, stream_hash_objects
 
 if TYPE_CHECKING:
     from prefect.filesystems import WritableFileSystem
@@ -200,6 +200,42 @@ class _None(CachePolicy):
         return other
 
 
+@dataclass
+class _Chunked(CachePolicy):
+    """
+    Policy for a chunked copy of a task that computes the key of the wrapped
+    policy for the parameters of each element of the chunk and hashes them together.
+
+    If the key of any element is `None`, the chunk is not cached.
+    """
+
+    policy: Optional[CachePolicy] = None
+
+    def compute_key(
+        self,
+        task_ctx: TaskRunContext,
+        inputs: Dict[str, Any],
+        flow_parameters: Dict[str, Any],
+        **kwargs: Any,
+    ) -> Optional[str]:
+        if self.policy is None:
+            return None
+        keys: List[str] = []
+        for parameters in (inputs or {}).get("chunk", []):
+            key = self.policy.compute_key(
+                task_ctx=task_ctx,
+                inputs=parameters,
+                flow_parameters=flow_parameters,
+                **kwargs,
+            )
+            if key is None:
+                return None
+            keys.append(key)
+        if not keys:
+            return None
+        return hash_objects(*keys, raise_on_failure=True)
+
+
 @dataclass
 class TaskSource(CachePolicy):
     """
@@ -271,9 +307,16 @@ class RunId(CachePolicy):
 class Inputs(CachePolicy):
     """
     Policy that computes a cache key based on a hash of the runtime inputs provided to the task..
+
+    With `streaming=True`, inputs are hashed with `stream_hash_objects`, so large
+    buffers such as NumPy arrays are hashed without being serialized. Use
+    `prefect.utilities.hashing.register_type_hasher` to control how inputs of other
+    types are hashed. Streamed keys differ from the default ones, so opting in
+    invalidates existing cache entries once.
     """
 
     exclude: List[str] = field(default_factory=list)
+    streaming: bool = False
 
     def compute_key(
         self,
@@ -294,7 +337,16 @@ class Inputs(CachePolicy):
                 hashed_inputs[key] = val
 
         try:
-            return hash_objects(hashed_inputs, raise_on_failure=True)
+            if not self.streaming:
+                return hash_objects(hashed_inputs, raise_on_failure=True)
+
+            # digests of immutable inputs are reused across the tasks of a flow run
+            flow_run_context = FlowRunContext.get()
+            return stream_hash_objects(
+                hashed_inputs,
+                memo=flow_run_context.input_hash_memo if flow_run_context else None,
+                raise_on_failure=True,
+            )
         except HashError as exc:
             msg = (
                 f"{exc}\n\n"
@@ -309,7 +361,7 @@ class Inputs(CachePolicy):
     def __sub__(self, other: str) -> "CachePolicy":
         if not isinstance(other, str):  # type: ignore[reportUnnecessaryIsInstance]
             raise TypeError("Can only subtract strings from key policies.")
-        return Inputs(exclude=self.exclude + [other])
+        return Inputs(exclude=self.exclude + [other], streaming=self.streaming)
 
 
 INPUTS = Inputs()
@@ -1,8 +1,10 @@
 import asyncio
 import datetime
+import gzip
+import json
 import ssl
 import warnings
-from collections.abc import Iterable
+from collections.abc import AsyncIterator, Iterable
 from contextlib import AsyncExitStack
 from logging import Logger
 from typing import TYPE_CHECKING, Any, Literal, NoReturn, Optional, Union, overload
@@ -98,6 +100,7 @@ from prefect.client.schemas.responses import (
     DeploymentResponse,
     FlowRunResponse,
     GlobalConcurrencyLimitResponse,
+    RunOrchestrationResult,
     WorkerFlowRunResponse,
 )
 from prefect.client.schemas.schedules import SCHEDULE_TYPES
@@ -2171,6 +2174,60 @@ class PrefectClient:
         response = await self._client.post("/flow_runs/filter", json=body)
         return pydantic.TypeAdapter(list[FlowRun]).validate_python(response.json())
 
+    async def iter_flow_runs(
+        self,
+        *,
+        flow_filter: Optional[FlowFilter] = None,
+        flow_run_filter: Optional[FlowRunFilter] = None,
+        task_run_filter: Optional[TaskRunFilter] = None,
+        deployment_filter: Optional[DeploymentFilter] = None,
+        work_pool_filter: Optional[WorkPoolFilter] = None,
+        work_queue_filter: Optional[WorkQueueFilter] = None,
+        sort: FlowRunSort = FlowRunSort.ID_DESC,
+        page_size: int = 200,
+    ) -> AsyncIterator[FlowRun]:
+        """
+        Iterate over all flow runs matching the given criteria, reading them from the
+        Prefect API a page at a time with cursors, so that reading the last page costs
+        the same as reading the first.
+
+        Args:
+            flow_filter: filter criteria for flows
+            flow_run_filter: filter criteria for flow runs
+            task_run_filter: filter criteria for task runs
+            deployment_filter: filter criteria for deployments
+            work_pool_filter: filter criteria for work pools
+            work_queue_filter: filter criteria for work pool queues
+            sort: sort criteria for the flow runs
+            page_size: the number of flow runs to read with each request
+
+        Yields:
+            Flow Run model representations of the flow runs
+        """
+        body: dict[str, Any] = {
+            "flows": flow_filter.model_dump(mode="json") if flow_filter else None,
+            "flow_runs": (
+                flow_run_filter.model_dump(mode="json", exclude_unset=True)
+                if flow_run_filter
+                else None
+            ),
+            "task_runs": (
+                task_run_filter.model_dump(mode="json") if task_run_filter else None
+            ),
+            "deployments": (
+                deployment_filter.model_dump(mode="json") if deployment_filter else None
+            ),
+            "work_pools": (
+                work_pool_filter.model_dump(mode="json") if work_pool_filter else None
+            ),
+            "work_pool_queues": (
+                work_queue_filter.model_dump(mode="json") if work_queue_filter else None
+            ),
+            "sort": sort,
+        }
+        async for flow_run in self._paginate("/flow_runs/paginate", body, page_size):
+            yield FlowRun.model_validate(flow_run)
+
     async def set_flow_run_state(
         self,
         flow_run_id: Union[UUID, str],
@@ -2214,6 +2271,38 @@ class PrefectClient:
         )
         return result
 
+    async def set_flow_run_states(
+        self,
+        flow_run_ids: Iterable[UUID],
+        state: "prefect.states.State[T]",
+        force: bool = False,
+    ) -> list[RunOrchestrationResult[T]]:
+        """
+        Set the state of several flow runs with a single request.
+
+        Args:
+            flow_run_ids: the ids of the flow runs
+            state: the state to set on each flow run
+            force: if True, disregard orchestration logic when setting the states,
+                forcing the Prefect API to accept the states
+
+        Returns:
+            a RunOrchestrationResult for each flow run that exists
+        """
+        state_create = state.to_state_create()
+        state_create.state_details.transition_id = uuid4()
+        response = await self._client.post(
+            "/flow_runs/set_state",
+            json=dict(
+                flow_run_ids=[str(flow_run_id) for flow_run_id in flow_run_ids],
+                state=state_create.model_dump(mode="json", serialize_as_any=True),
+                force=force,
+            ),
+        )
+        return pydantic.TypeAdapter(list[RunOrchestrationResult[T]]).validate_python(
+            response.json()
+        )
+
     async def read_flow_run_states(
         self, flow_run_id: UUID
     ) -> list[prefect.states.State]:
@@ -2388,6 +2477,50 @@ class PrefectClient:
         response = await self._client.post("/task_runs/filter", json=body)
         return pydantic.TypeAdapter(list[TaskRun]).validate_python(response.json())
 
+    async def iter_task_runs(
+        self,
+        *,
+        flow_filter: Optional[FlowFilter] = None,
+        flow_run_filter: Optional[FlowRunFilter] = None,
+        task_run_filter: Optional[TaskRunFilter] = None,
+        deployment_filter: Optional[DeploymentFilter] = None,
+        sort: TaskRunSort = TaskRunSort.ID_DESC,
+        page_size: int = 200,
+    ) -> AsyncIterator[TaskRun]:
+        """
+        Iterate over all task runs matching the given criteria, reading them from the
+        Prefect API a page at a time with cursors, so that reading the last page costs
+        the same as reading the first.
+
+        Args:
+            flow_filter: filter criteria for flows
+            flow_run_filter: filter criteria for flow runs
+            task_run_filter: filter criteria for task runs
+            deployment_filter: filter criteria for deployments
+            sort: sort criteria for the task runs
+            page_size: the number of task runs to read with each request
+
+        Yields:
+            Task Run model representations of the task runs
+        """
+        body: dict[str, Any] = {
+            "flows": flow_filter.model_dump(mode="json") if flow_filter else None,
+            "flow_runs": (
+                flow_run_filter.model_dump(mode="json", exclude_unset=True)
+                if flow_run_filter
+                else None
+            ),
+            "task_runs": (
+                task_run_filter.model_dump(mode="json") if task_run_filter else None
+            ),
+            "deployments": (
+                deployment_filter.model_dump(mode="json") if deployment_filter else None
+            ),
+            "sort": sort,
+        }
+        async for task_run in self._paginate("/task_runs/paginate", body, page_size):
+            yield TaskRun.model_validate(task_run)
+
     async def delete_task_run(self, task_run_id: UUID) -> None:
         """
         Delete a task run by id.
@@ -2435,6 +2568,37 @@ class PrefectClient:
         )
         return result
 
+    async def set_task_run_states(
+        self,
+        task_run_ids: Iterable[UUID],
+        state: prefect.states.State[T],
+        force: bool = False,
+    ) -> list[RunOrchestrationResult[T]]:
+        """
+        Set the state of several task runs with a single request.
+
+        Args:
+            task_run_ids: the ids of the task runs
+            state: the state to set on each task run
+            force: if True, disregard orchestration logic when setting the states,
+                forcing the Prefect API to accept the states
+
+        Returns:
+            a RunOrchestrationResult for each task run that exists
+        """
+        state_create = state.to_state_create()
+        response = await self._client.post(
+            "/task_runs/set_state",
+            json=dict(
+                task_run_ids=[str(task_run_id) for task_run_id in task_run_ids],
+                state=state_create.model_dump(mode="json"),
+                force=force,
+            ),
+        )
+        return pydantic.TypeAdapter(list[RunOrchestrationResult[T]]).validate_python(
+            response.json()
+        )
+
     async def read_task_run_states(
         self, task_run_id: UUID
     ) -> list[prefect.states.State]:
@@ -2455,19 +2619,34 @@ class PrefectClient:
         )
 
     async def create_logs(
-        self, logs: Iterable[Union[LogCreate, dict[str, Any]]]
+        self,
+        logs: Iterable[Union[LogCreate, dict[str, Any]]],
+        compress: bool = False,
     ) -> None:
         """
         Create logs for a flow or task run
 
         Args:
             logs: An iterable of `LogCreate` objects or already json-compatible dicts
+            compress: Whether to gzip the request body, which requires an API that
+                accepts gzip-encoded request bodies
         """
         serialized_logs = [
             log.model_dump(mode="json") if isinstance(log, LogCreate) else log
             for log in logs
         ]
-        await self._client.post("/logs/", json=serialized_logs)
+        if not compress:
+            await self._client.post("/logs/", json=serialized_logs)
+            return
+
+        # Logs are highly repetitive, so the fastest compression level still shrinks
+        # batches considerably
+        content = gzip.compress(json.dumps(serialized_logs).encode(), compresslevel=1)
+        await self._client.post(
+            "/logs/",
+            content=content,
+            headers={"Content-Type": "application/json", "Content-Encoding": "gzip"},
+        )
 
     async def create_flow_run_notification_policy(
         self,
@@ -2634,6 +2813,41 @@ class PrefectClient:
         response = await self._client.post("/logs/filter", json=body)
         return pydantic.TypeAdapter(list[Log]).validate_python(response.json())
 
+    async def iter_logs(
+        self,
+        log_filter: Optional[LogFilter] = None,
+        sort: LogSort = LogSort.TIMESTAMP_ASC,
+        page_size: int = 200,
+    ) -> AsyncIterator[Log]:
+        """
+        Iterate over all flow and task run logs matching the filter, reading them from
+        the Prefect API a page at a time with cursors, so that reading the last page
+        costs the same as reading the first.
+        """
+        body: dict[str, Any] = {
+            "logs": log_filter.model_dump(mode="json") if log_filter else None,
+            "sort": sort,
+        }
+        async for log in self._paginate("/logs/paginate", body, page_size):
+            yield Log.model_validate(log)
+
+    async def _paginate(
+        self, path: str, body: dict[str, Any], page_size: int
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Reads the results of a paginate endpoint, following its cursors"""
+        cursor = ""
+        while True:
+            response = await self._client.post(
+                path, json={**body, "limit": page_size, "cursor": cursor}
+            )
+            page = response.json()
+            for result in page["results"]:
+                yield result
+
+            if not page.get("next_page"):
+                return
+            cursor = page["next_page"]
+
     async def send_worker_heartbeat(
         self,
         work_pool_name: str,
@@ -2943,6 +3157,50 @@ class PrefectClient:
             response.json()
         )
 
+    async def claim_flow_runs_for_work_pool(
+        self,
+        work_pool_name: str,
+        work_queue_names: Optional[list[str]] = None,
+        scheduled_before: Optional[datetime.datetime] = None,
+        limit: Optional[int] = None,
+        worker_name: Optional[str] = None,
+    ) -> list[WorkerFlowRunResponse]:
+        """
+        Claims scheduled flow runs for the provided set of work pool queues by moving
+        them to a Pending state. Each flow run is claimed by only one caller.
+
+        Args:
+            work_pool_name: The name of the work pool that the work pool
+                queues are associated with.
+            work_queue_names: The names of the work pool queues from which
+                to claim scheduled flow runs.
+            scheduled_before: Datetime used to filter claimed flow runs. Flow runs
+                scheduled for after the given datetime string will not be claimed.
+            limit: The maximum number of flow runs to claim.
+            worker_name: The name of the worker claiming the flow runs.
+
+        Returns:
+            A list of worker flow run responses containing information about the
+            claimed flow runs, which are in a Pending state.
+        """
+        body: dict[str, Any] = {}
+        if work_queue_names is not None:
+            body["work_queue_names"] = list(work_queue_names)
+        if scheduled_before:
+            body["scheduled_before"] = str(scheduled_before)
+        if limit is not None:
+            body["limit"] = limit
+        if worker_name is not None:
+            body["worker_name"] = worker_name
+
+        response = await self._client.post(
+            f"/work_pools/{work_pool_name}/claim_flow_runs",
+            json=body,
+        )
+        return pydantic.TypeAdapter(list[WorkerFlowRunResponse]).validate_python(
+            response.json()
+        )
+
     async def create_artifact(
         self,
         artifact: ArtifactCreate,
@@ -3146,16 +3404,32 @@ class PrefectClient:
         slots: int,
         mode: str,
         create_if_missing: Optional[bool] = None,
+        wait_seconds: Optional[float] = None,
     ) -> httpx.Response:
-        return await self._client.post(
-            "/v2/concurrency_limits/increment",
-            json={
-                "names": names,
-                "slots": slots,
-                "mode": mode,
-                "create_if_missing": create_if_missing if create_if_missing else False,
-            },
-        )
+        """
+        Increment concurrency slots for the specified limits.
+
+        Args:
+            names (List[str]): A list of limit names for which to increment slots.
+            slots (int): The number of concurrency slots to increment.
+            mode (str): Either "concurrency" or "rate_limit".
+            create_if_missing (bool, optional): Whether to create missing limits.
+            wait_seconds (float, optional): How long the server may wait for slots to
+                be released before responding with 423 Locked.
+
+        Returns:
+            httpx.Response: The HTTP response from the server.
+        """
+        json = {
+            "names": names,
+            "slots": slots,
+            "mode": mode,
+            "create_if_missing": create_if_missing if create_if_missing else False,
+        }
+        if wait_seconds:
+            json["wait_seconds"] = wait_seconds
+
+        return await self._client.post("/v2/concurrency_limits/increment", json=json)
 
     async def release_concurrency_slots(
         self, names: list[str], slots: int, occupancy_seconds: float
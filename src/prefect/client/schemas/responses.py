@@ -7,7 +7,11 @@ from pydantic_extra_types.pendulum_dt import DateTime
 from typing_extensions import Literal
 
 import prefect.client.schemas.objects as objects
-from prefect._internal.schemas.bases import ObjectBaseModel, PrefectBaseModel
+from prefect._internal.schemas.bases import (
+    IDBaseModel,
+    ObjectBaseModel,
+    PrefectBaseModel,
+)
 from prefect._internal.schemas.fields import CreatedBy, UpdatedBy
 from prefect.types import KeyValueLabelsField
 from prefect.utilities.collections import AutoEnum
@@ -140,6 +144,15 @@ class OrchestrationResult(PrefectBaseModel, Generic[T]):
     details: StateResponseDetails
 
 
+class RunOrchestrationResult(OrchestrationResult[T], Generic[T]):
+    """
+    The output of state orchestration for one of several runs whose states were set
+    together.
+    """
+
+    id: UUID = Field(default=..., description="The id of the flow or task run.")
+
+
 class WorkerFlowRunResponse(PrefectBaseModel):
     model_config: ClassVar[ConfigDict] = ConfigDict(arbitrary_types_allowed=True)
 
@@ -148,6 +161,24 @@ class WorkerFlowRunResponse(PrefectBaseModel):
     flow_run: objects.FlowRun
 
 
+class DueFlowRun(IDBaseModel):
+    """
+    A scheduled flow run that is due to be submitted, as pushed to subscribed workers
+    and runners.
+    """
+
+    id: UUID = Field(default=..., description="The flow run id.")
+    deployment_id: Optional[UUID] = Field(
+        default=None, description="The id of the flow run's deployment."
+    )
+    work_queue_id: Optional[UUID] = Field(
+        default=None, description="The id of the flow run's work queue."
+    )
+    next_scheduled_start_time: Optional[DateTime] = Field(
+        default=None, description="The time the flow run is scheduled to start."
+    )
+
+
 class FlowRunResponse(ObjectBaseModel):
     name: str = Field(
         default_factory=lambda: generate_slug(2),
@@ -1,7 +1,7 @@
 import asyncio
-from collections.abc import Iterable
+from collections.abc import Awaitable, Iterable
 from logging import Logger
-from typing import Any, Generic, Optional, TypeVar
+from typing import Any, Callable, Generic, Optional, TypeVar
 
 import orjson
 import websockets
@@ -10,8 +10,9 @@ from starlette.status import WS_1008_POLICY_VIOLATION
 from typing_extensions import Self
 
 from prefect._internal.schemas.bases import IDBaseModel
+from prefect.client.schemas.responses import DueFlowRun
 from prefect.logging import get_logger
-from prefect.settings import PREFECT_API_KEY
+from prefect.settings import PREFECT_API_KEY, PREFECT_API_URL
 
 logger: Logger = get_logger(__name__)
 
@@ -26,9 +27,11 @@ class Subscription(Generic[S]):
         keys: Iterable[str],
         client_id: Optional[str] = None,
         base_url: Optional[str] = None,
+        parameters: Optional[dict[str, Any]] = None,
     ):
         self.model = model
         self.client_id = client_id
+        self.parameters: dict[str, Any] = parameters or {}
         base_url = base_url.replace("http", "ws", 1) if base_url else None
         self.subscription_url: str = f"{base_url}{path}"
 
@@ -83,7 +86,11 @@ class Subscription(Generic[S]):
             auth: dict[str, Any] = orjson.loads(await websocket.recv())
             assert auth["type"] == "auth_success", auth.get("message")
 
-            message: dict[str, Any] = {"type": "subscribe", "keys": self.keys}
+            message: dict[str, Any] = {
+                **self.parameters,
+                "type": "subscribe",
+                "keys": self.keys,
+            }
             if self.client_id:
                 message.update({"client_id": self.client_id})
 
@@ -116,3 +123,67 @@ class Subscription(Generic[S]):
 
     def __repr__(self) -> str:
         return f"{type(self).__name__}[{self.model.__name__}]"
+
+
+async def watch_due_flow_runs(
+    path: str,
+    keys: Iterable[str],
+    on_due: Callable[[], Awaitable[Any]],
+    prefetch_seconds: float = 0,
+    client_id: Optional[str] = None,
+    retry_seconds: float = 10,
+) -> None:
+    """
+    Subscribes to scheduled flow runs at the given path and calls `on_due` when the
+    server pushes flow runs as due, resubscribing after `retry_seconds` if the
+    subscription fails. Runs until cancelled.
+
+    `on_due` is expected to get and submit every due flow run, so flow runs pushed
+    while it is running are handled by a single further call rather than one call
+    each.
+    """
+    base_url = PREFECT_API_URL.value()
+    if not base_url:
+        logger.warning(
+            "`PREFECT_API_URL` must be set to subscribe to scheduled flow runs; "
+            "flow runs will only be found by polling."
+        )
+        return
+
+    due = asyncio.Event()
+
+    async def handle_due_flow_runs() -> None:
+        while True:
+            await due.wait()
+            due.clear()
+            try:
+                await on_due()
+            except Exception:
+                logger.exception("Failed to handle due flow runs")
+
+    handler = asyncio.create_task(handle_due_flow_runs())
+    try:
+        while True:
+            subscription = Subscription(
+                model=DueFlowRun,
+                path=path,
+                keys=keys,
+                client_id=client_id,
+                base_url=base_url,
+                parameters={"prefetch_seconds": prefetch_seconds},
+            )
+            try:
+                async for flow_run in subscription:
+                    logger.debug("Flow run %s is due", flow_run.id)
+                    due.set()
+            except Exception as exc:
+                logger.debug(
+                    "Subscription to scheduled flow runs at %r failed; resubscribing"
+                    " in %s seconds",
+                    path,
+                    retry_seconds,
+                    exc_info=exc,
+                )
+            await asyncio.sleep(retry_seconds)
+    finally:
+        handler.cancel()
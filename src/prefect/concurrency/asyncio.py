@@ -5,6 +5,7 @@ from typing import AsyncGenerator, List, Literal, Optional, Union, cast
 import anyio
 import httpx
 import pendulum
+from starlette import status
 
 from prefect._internal.compatibility.deprecated import deprecated_parameter
 
@@ -16,15 +17,28 @@ except ImportError:
 
 from prefect.client.orchestration import get_client
 from prefect.client.schemas.responses import MinimalConcurrencyLimitResponse
-from prefect.logging.loggers import get_run_logger
+from prefect.logging.loggers import get_logger, get_run_logger
+from prefect.settings import get_current_settings
+from prefect.utilities.asyncutils import run_coro_as_sync
 
 from .context import ConcurrencyContext
 from .events import (
     _emit_concurrency_acquisition_events,
     _emit_concurrency_release_events,
 )
+from .leases import (
+    ConcurrencySlotLease,
+    add_lease,
+    lease_recently_failed,
+    lease_size,
+    record_lease_failure,
+    record_limits,
+    take_leased_slots,
+)
 from .services import ConcurrencySlotAcquisitionService
 
+logger = get_logger("concurrency")
+
 
 class ConcurrencySlotAcquisitionError(Exception):
     """Raised when an unhandlable occurs while acquiring concurrency slots."""
@@ -78,14 +92,18 @@ async def concurrency(
 
     names = names if isinstance(names, list) else [names]
 
-    limits = await _aacquire_concurrency_slots(
-        names,
-        occupy,
-        timeout_seconds=timeout_seconds,
-        create_if_missing=create_if_missing,
-        max_retries=max_retries,
-        strict=strict,
-    )
+    lease = await _aacquire_leased_concurrency_slots(names, occupy)
+    if lease:
+        limits = lease.limits
+    else:
+        limits = await _aacquire_concurrency_slots(
+            names,
+            occupy,
+            timeout_seconds=timeout_seconds,
+            create_if_missing=create_if_missing,
+            max_retries=max_retries,
+            strict=strict,
+        )
     acquisition_time = pendulum.now("UTC")
     emitted_events = _emit_concurrency_acquisition_events(limits, occupy)
 
@@ -94,9 +112,16 @@ async def concurrency(
     finally:
         occupancy_period = cast(Interval, (pendulum.now("UTC") - acquisition_time))
         try:
-            await _arelease_concurrency_slots(
-                names, occupy, occupancy_period.total_seconds()
-            )
+            if lease:
+                # Slots go back to the lease unless it has expired in the meantime
+                if expired_slots := lease.release(occupy):
+                    await _arelease_concurrency_slots(
+                        names, expired_slots, occupancy_period.total_seconds()
+                    )
+            else:
+                await _arelease_concurrency_slots(
+                    names, occupy, occupancy_period.total_seconds()
+                )
         except anyio.get_cancelled_exc_class():
             # The task was cancelled before it could release the slots. Add the
             # slots to the cleanup list so they can be released when the
@@ -137,14 +162,18 @@ async def rate_limit(
 
     names = names if isinstance(names, list) else [names]
 
-    limits = await _aacquire_concurrency_slots(
-        names,
-        occupy,
-        mode="rate_limit",
-        timeout_seconds=timeout_seconds,
-        create_if_missing=create_if_missing,
-        strict=strict,
-    )
+    lease = await _aacquire_leased_concurrency_slots(names, occupy, mode="rate_limit")
+    if lease:
+        limits = lease.limits
+    else:
+        limits = await _aacquire_concurrency_slots(
+            names,
+            occupy,
+            mode="rate_limit",
+            timeout_seconds=timeout_seconds,
+            create_if_missing=create_if_missing,
+            strict=strict,
+        )
     _emit_concurrency_acquisition_events(limits, occupy)
 
 
@@ -181,6 +210,7 @@ async def _aacquire_concurrency_slots(
         ) from response_or_exception
 
     retval = _response_to_minimal_concurrency_limit_response(response_or_exception)
+    record_limits((frozenset(names), mode), retval)
 
     if strict and not retval:
         raise ConcurrencySlotAcquisitionError(
@@ -197,6 +227,75 @@ async def _aacquire_concurrency_slots(
     return retval
 
 
+async def _aacquire_leased_concurrency_slots(
+    names: List[str],
+    slots: int,
+    mode: Literal["concurrency", "rate_limit"] = "concurrency",
+) -> Optional[ConcurrencySlotLease]:
+    """Takes slots from this process's lease on the given concurrency limits,
+    acquiring a new lease if needed.
+
+    Returns `None` when leasing is disabled or a lease can't be acquired right away, in
+    which case the slots should be acquired individually."""
+    settings = get_current_settings().client.concurrency
+    key = (frozenset(names), mode)
+
+    size = lease_size(key, settings.lease_slots)
+    if size <= slots:
+        return None
+
+    if lease := take_leased_slots(key, slots):
+        return lease
+
+    if lease_recently_failed(key):
+        return None
+
+    try:
+        async with get_client() as client:
+            response = await client.increment_concurrency_slots(
+                names=names, slots=size, mode=mode
+            )
+    except httpx.HTTPStatusError as exc:
+        if exc.response.status_code in (
+            status.HTTP_422_UNPROCESSABLE_ENTITY,
+            status.HTTP_423_LOCKED,
+        ):
+            # Either the lease is larger than one of the limits or its slots aren't
+            # free at the moment, so fall back to acquiring slots individually and
+            # don't try leasing these limits again until a lease would have expired
+            record_lease_failure(key, settings.lease_ttl_seconds)
+            return None
+        raise
+
+    limits = _response_to_minimal_concurrency_limit_response(response)
+    record_limits(key, limits)
+    if not limits:
+        return None
+
+    lease = add_lease(
+        key,
+        size,
+        limits,
+        ttl_seconds=settings.lease_ttl_seconds,
+        on_return=_return_leased_slots,
+    )
+    return lease if lease.take(slots) else None
+
+
+def _return_leased_slots(lease: ConcurrencySlotLease, slots: int) -> None:
+    try:
+        run_coro_as_sync(
+            _arelease_concurrency_slots(lease.names, slots, lease.held_seconds)
+        )
+    except Exception:
+        logger.warning(
+            "Failed to return %s leased slot(s) to concurrency limits %r",
+            slots,
+            lease.names,
+            exc_info=True,
+        )
+
+
 async def _arelease_concurrency_slots(
     names: List[str], slots: int, occupancy_seconds: float
 ) -> List[MinimalConcurrencyLimitResponse]:
@@ -0,0 +1,186 @@
+import atexit
+import threading
+import time
+from typing import Callable, Dict, FrozenSet, List, Optional, Tuple
+
+from typing_extensions import Literal
+
+from prefect.client.schemas.responses import MinimalConcurrencyLimitResponse
+
+LeaseKey = Tuple[FrozenSet[str], Literal["concurrency", "rate_limit"]]
+
+
+class ConcurrencySlotLease:
+    """
+    A block of slots acquired from a set of global concurrency limits at once, which
+    are handed out within this process until the lease expires.
+
+    In `concurrency` mode, slots are returned to the lease when released and are handed
+    out again. In `rate_limit` mode, slots are consumed when taken. Once the lease
+    expires, any unused slots are passed to `on_return` to be returned to the server,
+    as is each slot released by a holder afterwards.
+    """
+
+    def __init__(
+        self,
+        names: List[str],
+        mode: Literal["concurrency", "rate_limit"],
+        slots: int,
+        limits: List[MinimalConcurrencyLimitResponse],
+        ttl_seconds: float,
+        on_return: Callable[["ConcurrencySlotLease", int], None],
+    ):
+        self.names = names
+        self.mode = mode
+        self.limits = limits
+        self.acquired_at = time.monotonic()
+        self.expires_at = self.acquired_at + ttl_seconds
+        self._on_return = on_return
+        self._lock = threading.Lock()
+        self._available = slots
+        self._in_use = 0
+        self._expired = False
+        self._timer = threading.Timer(ttl_seconds, self.expire)
+        self._timer.daemon = True
+        self._timer.start()
+
+    @property
+    def expired(self) -> bool:
+        return self._expired or time.monotonic() >= self.expires_at
+
+    @property
+    def available(self) -> int:
+        return self._available
+
+    @property
+    def held_seconds(self) -> float:
+        return time.monotonic() - self.acquired_at
+
+    def add(self, slots: int) -> bool:
+        """Adds newly acquired slots to the lease, unless it has expired"""
+        with self._lock:
+            if self.expired:
+                return False
+            self._available += slots
+            return True
+
+    def take(self, slots: int) -> bool:
+        """Takes slots from the lease if enough are available and it has not
+        expired"""
+        with self._lock:
+            if self.expired or self._available < slots:
+                return False
+            self._available -= slots
+            if self.mode == "concurrency":
+                self._in_use += slots
+            return True
+
+    def release(self, slots: int) -> int:
+        """Gives slots taken from the lease back, returning the number of slots that
+        must be released to the server because the lease has expired"""
+        with self._lock:
+            self._in_use -= slots
+            if self.expired:
+                return slots
+            self._available += slots
+            return 0
+
+    def expire(self) -> None:
+        """Stops handing out slots and returns any unused slots"""
+        with self._lock:
+            if self._expired:
+                return
+            self._expired = True
+            self._timer.cancel()
+            unused, self._available = self._available, 0
+
+        if unused:
+            self._on_return(self, unused)
+
+
+_leases: Dict[LeaseKey, ConcurrencySlotLease] = {}
+_known_limits: Dict[LeaseKey, int] = {}
+_lease_failures: Dict[str, float] = {}
+_leases_lock = threading.Lock()
+
+
+def lease_size(key: LeaseKey, lease_slots: int) -> int:
+    """The number of slots to request for a new lease, which may not exceed the
+    smallest of the limits seen for the given names"""
+    with _leases_lock:
+        known_limit = _known_limits.get(key)
+    return lease_slots if known_limit is None else min(lease_slots, known_limit)
+
+
+def record_limits(key: LeaseKey, limits: List[MinimalConcurrencyLimitResponse]):
+    if limits:
+        with _leases_lock:
+            _known_limits[key] = min(limit.limit for limit in limits)
+
+
+def record_lease_failure(key: LeaseKey, ttl_seconds: float) -> None:
+    """Remembers that a lease couldn't be acquired on the given names, so that
+    acquisitions on any of them skip leasing for `ttl_seconds`"""
+    names, _ = key
+    retry_at = time.monotonic() + ttl_seconds
+    with _leases_lock:
+        for name in names:
+            _lease_failures[name] = retry_at
+
+
+def lease_recently_failed(key: LeaseKey) -> bool:
+    """Whether a lease couldn't be acquired on any of the given names recently"""
+    names, _ = key
+    now = time.monotonic()
+    with _leases_lock:
+        return any(_lease_failures.get(name, 0.0) > now for name in names)
+
+
+def take_leased_slots(key: LeaseKey, slots: int) -> Optional[ConcurrencySlotLease]:
+    """Takes slots from the current lease for the given names and mode, if it has
+    enough available"""
+    with _leases_lock:
+        lease = _leases.get(key)
+    if lease and lease.take(slots):
+        return lease
+    return None
+
+
+def add_lease(
+    key: LeaseKey,
+    slots: int,
+    limits: List[MinimalConcurrencyLimitResponse],
+    ttl_seconds: float,
+    on_return: Callable[[ConcurrencySlotLease, int], None],
+) -> ConcurrencySlotLease:
+    """Adds newly acquired slots to the current lease for the given names and mode,
+    or starts a new lease if there is none"""
+    names, mode = key
+    with _leases_lock:
+        lease = _leases.get(key)
+        if lease is None or not lease.add(slots):
+            lease = ConcurrencySlotLease(
+                names=sorted(names),
+                mode=mode,
+                slots=slots,
+                limits=limits,
+                ttl_seconds=ttl_seconds,
+                on_return=on_return,
+            )
+            _leases[key] = lease
+    return lease
+
+
+def expire_leases() -> None:
+    """Expires all current leases, returning their unused slots"""
+    with _leases_lock:
+        leases = list(_leases.values())
+        _leases.clear()
+        _known_limits.clear()
+        _lease_failures.clear()
+
+    for lease in leases:
+        lease.expire()
+
+
+atexit.register(expire_leases)
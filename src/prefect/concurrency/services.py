@@ -1,5 +1,6 @@
 import asyncio
 import concurrent.futures
+import time
 from contextlib import asynccontextmanager
 from typing import (
     TYPE_CHECKING,
@@ -15,6 +16,7 @@ from starlette import status
 from prefect._internal.concurrency import logger
 from prefect._internal.concurrency.services import QueueService
 from prefect.client.orchestration import get_client
+from prefect.settings import get_current_settings
 from prefect.utilities.timeout import timeout_async
 
 if TYPE_CHECKING:
@@ -66,14 +68,20 @@ class ConcurrencySlotAcquisitionService(QueueService):
         create_if_missing: Optional[bool] = None,
         max_retries: Optional[int] = None,
     ) -> httpx.Response:
+        deadline = (
+            time.monotonic() + timeout_seconds if timeout_seconds is not None else None
+        )
         with timeout_async(seconds=timeout_seconds):
             while True:
+                wait_seconds = self._wait_seconds(deadline, max_retries)
+                started = time.monotonic()
                 try:
                     response = await self._client.increment_concurrency_slots(
                         names=self.concurrency_limit_names,
                         slots=slots,
                         mode=mode,
                         create_if_missing=create_if_missing,
+                        wait_seconds=wait_seconds,
                     )
                 except Exception as exc:
                     if (
@@ -82,11 +90,18 @@ class ConcurrencySlotAcquisitionService(QueueService):
                     ):
                         if max_retries is not None and max_retries <= 0:
                             raise exc
-                        retry_after = float(exc.response.headers["Retry-After"])
-                        logger.debug(
-                            f"Unable to acquire concurrency slot. Retrying in {retry_after} second(s)."
-                        )
-                        await asyncio.sleep(retry_after)
+                        if wait_seconds and time.monotonic() - started >= wait_seconds:
+                            # The server already held the request in line for slots,
+                            # so ask again right away
+                            logger.debug(
+                                "Unable to acquire concurrency slot. Retrying now."
+                            )
+                        else:
+                            retry_after = float(exc.response.headers["Retry-After"])
+                            logger.debug(
+                                f"Unable to acquire concurrency slot. Retrying in {retry_after} second(s)."
+                            )
+                            await asyncio.sleep(retry_after)
                         if max_retries is not None:
                             max_retries -= 1
                     else:
@@ -94,19 +109,29 @@ class ConcurrencySlotAcquisitionService(QueueService):
                 else:
                     return response
 
+    @staticmethod
+    def _wait_seconds(deadline: Optional[float], retries_left: Optional[int]) -> float:
+        """How long to ask the server to wait for slots, leaving time for the response
+        to arrive before the acquisition times out.
+
+        Waiting on the server takes the place of sleeping before a retry, so an
+        attempt with no retries left doesn't wait and fails as soon as the slots are
+        unavailable."""
+        if retries_left is not None and retries_left <= 0:
+            return 0.0
+        wait_seconds = get_current_settings().client.concurrency.slot_wait_seconds
+        if deadline is not None:
+            wait_seconds = min(wait_seconds, deadline - time.monotonic() - 1.0)
+        return max(wait_seconds, 0.0)
+
     def send(
         self, item: Tuple[int, str, Optional[float], Optional[bool], Optional[int]]
     ) -> concurrent.futures.Future:
-        with self._lock:
-            if self._stopped:
-                raise RuntimeError("Cannot put items in a stopped service instance.")
+        future: concurrent.futures.Future = concurrent.futures.Future()
 
-            logger.debug("Service %r enqueuing item %r", self, item)
-            future: concurrent.futures.Future = concurrent.futures.Future()
-
-            occupy, mode, timeout_seconds, create_if_missing, max_retries = item
-            self._queue.put_nowait(
-                (occupy, mode, timeout_seconds, future, create_if_missing, max_retries)
-            )
+        occupy, mode, timeout_seconds, create_if_missing, max_retries = item
+        super().send(
+            (occupy, mode, timeout_seconds, future, create_if_missing, max_retries)
+        )
 
         return future
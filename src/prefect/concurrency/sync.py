@@ -11,6 +11,7 @@ from typing import (
 import pendulum
 from typing_extensions import Literal
 
+from prefect.settings import get_current_settings
 from prefect.utilities.asyncutils import run_coro_as_sync
 
 try:
@@ -23,12 +24,14 @@ from prefect.client.schemas.responses import MinimalConcurrencyLimitResponse
 
 from .asyncio import (
     _aacquire_concurrency_slots,
+    _aacquire_leased_concurrency_slots,
     _arelease_concurrency_slots,
 )
 from .events import (
     _emit_concurrency_acquisition_events,
     _emit_concurrency_release_events,
 )
+from .leases import ConcurrencySlotLease
 
 T = TypeVar("T")
 
@@ -63,6 +66,16 @@ def _acquire_concurrency_slots(
     return result
 
 
+def _acquire_leased_concurrency_slots(
+    names: List[str],
+    slots: int,
+    mode: Literal["concurrency", "rate_limit"] = "concurrency",
+) -> Optional[ConcurrencySlotLease]:
+    if not get_current_settings().client.concurrency.lease_slots:
+        return None
+    return run_coro_as_sync(_aacquire_leased_concurrency_slots(names, slots, mode))
+
+
 @contextmanager
 def concurrency(
     names: Union[str, List[str]],
@@ -107,14 +120,18 @@ def concurrency(
 
     names = names if isinstance(names, list) else [names]
 
-    limits: List[MinimalConcurrencyLimitResponse] = _acquire_concurrency_slots(
-        names,
-        occupy,
-        timeout_seconds=timeout_seconds,
-        create_if_missing=create_if_missing,
-        strict=strict,
-        max_retries=max_retries,
-    )
+    lease = _acquire_leased_concurrency_slots(names, occupy)
+    if lease:
+        limits = lease.limits
+    else:
+        limits = _acquire_concurrency_slots(
+            names,
+            occupy,
+            timeout_seconds=timeout_seconds,
+            create_if_missing=create_if_missing,
+            strict=strict,
+            max_retries=max_retries,
+        )
     acquisition_time = pendulum.now("UTC")
     emitted_events = _emit_concurrency_acquisition_events(limits, occupy)
 
@@ -122,11 +139,18 @@ def concurrency(
         yield
     finally:
         occupancy_period = cast(Interval, pendulum.now("UTC") - acquisition_time)
-        _release_concurrency_slots(
-            names,
-            occupy,
-            occupancy_period.total_seconds(),
-        )
+        if lease:
+            # Slots go back to the lease unless it has expired in the meantime
+            if expired_slots := lease.release(occupy):
+                _release_concurrency_slots(
+                    names, expired_slots, occupancy_period.total_seconds()
+                )
+        else:
+            _release_concurrency_slots(
+                names,
+                occupy,
+                occupancy_period.total_seconds(),
+            )
         _emit_concurrency_release_events(limits, occupy, emitted_events)
 
 
@@ -158,12 +182,16 @@ def rate_limit(
 
     names = names if isinstance(names, list) else [names]
 
-    limits = _acquire_concurrency_slots(
-        names,
-        occupy,
-        mode="rate_limit",
-        timeout_seconds=timeout_seconds,
-        create_if_missing=create_if_missing,
-        strict=strict,
-    )
+    lease = _acquire_leased_concurrency_slots(names, occupy, mode="rate_limit")
+    if lease:
+        limits = lease.limits
+    else:
+        limits = _acquire_concurrency_slots(
+            names,
+            occupy,
+            mode="rate_limit",
+            timeout_seconds=timeout_seconds,
+            create_if_missing=create_if_missing,
+            strict=strict,
+        )
     _emit_concurrency_acquisition_events(limits, occupy)
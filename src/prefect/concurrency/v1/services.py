@@ -103,14 +103,9 @@ class ConcurrencySlotAcquisitionService(QueueService):
                     return response
 
     def send(self, item: Tuple[UUID, Optional[float]]) -> concurrent.futures.Future:
-        with self._lock:
-            if self._stopped:
-                raise RuntimeError("Cannot put items in a stopped service instance.")
+        future: concurrent.futures.Future = concurrent.futures.Future()
 
-            logger.debug("Service %r enqueuing item %r", self, item)
-            future: concurrent.futures.Future = concurrent.futures.Future()
-
-            task_run_id, timeout_seconds = item
-            self._queue.put_nowait((task_run_id, future, timeout_seconds))
+        task_run_id, timeout_seconds = item
+        super().send((task_run_id, future, timeout_seconds))
 
         return future
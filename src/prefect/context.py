@@ -43,11 +43,13 @@ from prefect.results import (
     get_default_persist_setting_for_tasks,
 )
 from prefect.settings import Profile, Settings
+from prefect.settings.context import invalidate_settings_snapshot
 from prefect.settings.legacy import (
     _get_settings_fields,  # type: ignore[reportPrivateUsage]
 )
 from prefect.states import State
 from prefect.task_runners import TaskRunner
+from prefect.utilities.hashing import HashMemo
 from prefect.utilities.services import start_client_metrics_server
 
 T = TypeVar("T")
@@ -367,6 +369,9 @@ class EngineContext(RunContext):
     # Events worker to emit events
     events: Optional[EventsWorker] = None
 
+    # Digests of immutable task inputs, reused by the streaming `Inputs` cache policy
+    input_hash_memo: HashMemo = Field(default_factory=HashMemo)
+
     __var__: ContextVar[Self] = ContextVar("flow_run")
 
     def serialize(self: Self, include_secrets: bool = True) -> Dict[str, Any]:
@@ -616,8 +621,12 @@ def use_profile(
 
     new_settings = settings.copy_with_update(updates=profile_settings)
 
-    with SettingsContext(profile=profile, settings=new_settings) as ctx:
-        yield ctx
+    invalidate_settings_snapshot()
+    try:
+        with SettingsContext(profile=profile, settings=new_settings) as ctx:
+            yield ctx
+    finally:
+        invalidate_settings_snapshot()
 
 
 def root_settings_context():
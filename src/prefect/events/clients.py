@@ -67,6 +67,9 @@ EVENT_WEBSOCKET_CHECKPOINTS = Counter(
 
 logger = get_logger(__name__)
 
+BATCHED_EVENTS_SUBPROTOCOL = Subprotocol("prefect-event-batches")
+"""The websocket subprotocol negotiated by servers that accept arrays of events"""
+
 
 def http_to_ws(url: str):
     return url.replace("https://", "wss://").replace("http://", "ws://").rstrip("/")
@@ -161,10 +164,27 @@ class EventsClient(abc.ABC):
         finally:
             EVENTS_EMITTED.labels(self.client_name).inc()
 
+    async def emit_batch(self, events: List[Event]) -> None:
+        """Emit a batch of events"""
+        if not hasattr(self, "_in_context"):
+            raise TypeError(
+                "Events may only be emitted while this client is being used as a "
+                "context manager"
+            )
+
+        try:
+            return await self._emit_batch(events)
+        finally:
+            EVENTS_EMITTED.labels(self.client_name).inc(len(events))
+
     @abc.abstractmethod
     async def _emit(self, event: Event) -> None:  # pragma: no cover
         ...
 
+    async def _emit_batch(self, events: List[Event]) -> None:
+        for event in events:
+            await self._emit(event)
+
     async def __aenter__(self) -> Self:
         self._in_context = True
         return self
@@ -239,9 +259,16 @@ def _get_api_url_and_key(
 
 
 class PrefectEventsClient(EventsClient):
-    """A Prefect Events client that streams events to a Prefect server"""
+    """A Prefect Events client that streams events to a Prefect server
+
+    When the server accepts batches, the events of a batch are sent as JSON arrays,
+    each in a single websocket message of up to `max_frame_size` bytes.
+    """
+
+    max_frame_size: ClassVar[int] = 1_000_000
 
     _websocket: Optional[WebSocketClientProtocol]
+    _sends_batches: bool
     _unconfirmed_events: List[Event]
 
     def __init__(
@@ -265,8 +292,11 @@ class PrefectEventsClient(EventsClient):
             )
 
         self._events_socket_url = events_in_socket_from_api_url(api_url)
-        self._connect = connect(self._events_socket_url)
+        self._connect = connect(
+            self._events_socket_url, subprotocols=[BATCHED_EVENTS_SUBPROTOCOL]
+        )
         self._websocket = None
+        self._sends_batches = False
         self._reconnection_attempts = reconnection_attempts
         self._unconfirmed_events = []
         self._checkpoint_every = checkpoint_every
@@ -314,17 +344,19 @@ class PrefectEventsClient(EventsClient):
             )
             raise
 
+        self._sends_batches = self._websocket.subprotocol == BATCHED_EVENTS_SUBPROTOCOL
+
         events_to_resend = self._unconfirmed_events
         # Clear the unconfirmed events here, because they are going back through emit
         # and will be added again through the normal checkpointing process
         self._unconfirmed_events = []
-        for event in events_to_resend:
-            await self.emit(event)
+        if events_to_resend:
+            await self.emit_batch(events_to_resend)
 
-    async def _checkpoint(self, event: Event) -> None:
+    async def _checkpoint(self, events: List[Event]) -> None:
         assert self._websocket
 
-        self._unconfirmed_events.append(event)
+        self._unconfirmed_events.extend(events)
 
         unconfirmed_count = len(self._unconfirmed_events)
         if unconfirmed_count < self._checkpoint_every:
@@ -341,6 +373,36 @@ class PrefectEventsClient(EventsClient):
         EVENT_WEBSOCKET_CHECKPOINTS.labels(self.client_name).inc()
 
     async def _emit(self, event: Event) -> None:
+        await self._send([event])
+
+    async def _emit_batch(self, events: List[Event]) -> None:
+        if not self._sends_batches:
+            for event in events:
+                await self._send([event])
+            return
+
+        batch: List[Event] = []
+        messages: List[str] = []
+        frame_size = 0
+        for event in events:
+            message = event.model_dump_json()
+            if batch and frame_size + len(message) > self.max_frame_size:
+                await self._send(batch, messages)
+                batch, messages, frame_size = [], [], 0
+
+            batch.append(event)
+            messages.append(message)
+            frame_size += len(message) + 1
+
+        if batch:
+            await self._send(batch, messages)
+
+    async def _send(
+        self, events: List[Event], messages: Optional[List[str]] = None
+    ) -> None:
+        if messages is None:
+            messages = [event.model_dump_json() for event in events]
+
         for i in range(self._reconnection_attempts + 1):
             try:
                 # If we're here and the websocket is None, then we've had a failure in a
@@ -348,13 +410,23 @@ class PrefectEventsClient(EventsClient):
                 #
                 # Otherwise, after the first time through this loop, we're recovering
                 # from a ConnectionClosed, so reconnect now, resending any unconfirmed
-                # events before we send this one.
+                # events before we send these ones.
                 if not self._websocket or i > 0:
                     await self._reconnect()
                     assert self._websocket
 
-                await self._websocket.send(event.model_dump_json())
-                await self._checkpoint(event)
+                if len(messages) == 1:
+                    await self._websocket.send(messages[0])
+                elif self._sends_batches:
+                    await self._websocket.send("[" + ",".join(messages) + "]")
+                else:
+                    # the server we reconnected to doesn't accept batches
+                    for message in messages:
+                        await self._websocket.send(message)
+
+                # the whole batch is replayed if the connection is lost before the
+                # next checkpoint
+                await self._checkpoint(events)
 
                 return
             except ConnectionClosed:
@@ -404,6 +476,13 @@ class AssertingPassthroughEventsClient(PrefectEventsClient):
         # record the event for inspection
         self.events.append(event)
 
+    async def _emit_batch(self, events: List[Event]) -> None:
+        # actually send the events to the server
+        await super()._emit_batch(events)
+
+        # record the events for inspection
+        self.events.extend(events)
+
     async def __aenter__(self) -> Self:
         await super().__aenter__()
         self.events = []
@@ -437,6 +516,7 @@ class PrefectCloudEventsClient(PrefectEventsClient):
         )
         self._connect = connect(
             self._events_socket_url,
+            subprotocols=[BATCHED_EVENTS_SUBPROTOCOL],
             extra_headers={"Authorization": f"bearer {api_key}"},
         )
 
@@ -22,6 +22,7 @@ from .schemas.events import RelatedResource
 if TYPE_CHECKING:
     from prefect._internal.schemas.bases import ObjectBaseModel
     from prefect.client.orchestration import PrefectClient
+    from prefect.client.schemas.objects import FlowRun, TaskRun
 
 ResourceCacheEntry = Dict[str, Union[str, "ObjectBaseModel", None]]
 RelatedResourceCache = Dict[str, Tuple[ResourceCacheEntry, DateTime]]
@@ -54,25 +55,42 @@ def object_as_related_resource(kind: str, role: str, object: Any) -> RelatedReso
     )
 
 
+def runs_from_run_context() -> Tuple[Optional["FlowRun"], Optional["TaskRun"]]:
+    from prefect.context import FlowRunContext, TaskRunContext
+
+    flow_run_context = FlowRunContext.get()
+    task_run_context = TaskRunContext.get()
+
+    return (
+        getattr(flow_run_context, "flow_run", None),
+        getattr(task_run_context, "task_run", None),
+    )
+
+
 async def related_resources_from_run_context(
     client: "PrefectClient",
     exclude: Optional[Set[str]] = None,
+) -> List[RelatedResource]:
+    flow_run, task_run = runs_from_run_context()
+    return await related_resources_from_runs(
+        client, flow_run=flow_run, task_run=task_run, exclude=exclude
+    )
+
+
+async def related_resources_from_runs(
+    client: "PrefectClient",
+    flow_run: Optional["FlowRun"],
+    task_run: Optional["TaskRun"],
+    exclude: Optional[Set[str]] = None,
 ) -> List[RelatedResource]:
     from prefect.client.schemas.objects import FlowRun
-    from prefect.context import FlowRunContext, TaskRunContext
 
     if exclude is None:
         exclude = set()
 
-    flow_run_context = FlowRunContext.get()
-    task_run_context = TaskRunContext.get()
-
-    if not flow_run_context and not task_run_context:
-        return []
-
-    flow_run_id: Optional[UUID] = getattr(
-        getattr(flow_run_context, "flow_run", None), "id", None
-    ) or getattr(getattr(task_run_context, "task_run", None), "flow_run_id", None)
+    flow_run_id: Optional[UUID] = getattr(flow_run, "id", None) or getattr(
+        task_run, "flow_run_id", None
+    )
     if flow_run_id is None:
         return []
 
@@ -81,12 +99,12 @@ async def related_resources_from_run_context(
     async def dummy_read():
         return {}
 
-    if flow_run_context:
+    if flow_run:
         related_objects.append(
             {
                 "kind": "flow-run",
                 "role": "flow-run",
-                "object": flow_run_context.flow_run,
+                "object": flow_run,
             },
         )
     else:
@@ -100,12 +118,12 @@ async def related_resources_from_run_context(
             )
         )
 
-    if task_run_context:
+    if task_run:
         related_objects.append(
             {
                 "kind": "task-run",
                 "role": "task-run",
-                "object": task_run_context.task_run,
+                "object": task_run,
             },
         )
 
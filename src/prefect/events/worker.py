@@ -1,17 +1,24 @@
+import json
 from contextlib import asynccontextmanager
-from contextvars import Context, copy_context
-from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple, Type
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Type
 from uuid import UUID
 
 from typing_extensions import Self
 
-from prefect._internal.concurrency.services import QueueService
+from prefect._internal.concurrency.services import (
+    BatchedQueueService,
+    SpillableItemsMixin,
+)
+from prefect.logging import get_logger
 from prefect.settings import (
     PREFECT_API_KEY,
     PREFECT_API_URL,
+    PREFECT_CLIENT_EVENTS_BATCH_SIZE,
+    PREFECT_CLIENT_EVENTS_MAX_QUEUE_ITEMS,
+    PREFECT_CLIENT_EVENTS_MAX_QUEUE_SIZE,
+    PREFECT_CLIENT_EVENTS_OVERFLOW_POLICY,
     PREFECT_CLOUD_API_URL,
 )
-from prefect.utilities.context import temporary_context
 
 from .clients import (
     EventsClient,
@@ -19,11 +26,14 @@ from .clients import (
     PrefectCloudEventsClient,
     PrefectEventsClient,
 )
-from .related import related_resources_from_run_context
+from .related import related_resources_from_runs, runs_from_run_context
 from .schemas.events import Event
 
 if TYPE_CHECKING:
     from prefect.client.orchestration import PrefectClient
+    from prefect.client.schemas.objects import FlowRun, TaskRun
+
+logger = get_logger(__name__)
 
 
 def should_emit_events() -> bool:
@@ -50,7 +60,12 @@ def should_emit_events_to_ephemeral_server() -> bool:
     return PREFECT_API_KEY.value() is None
 
 
-class EventsWorker(QueueService[Event]):
+class EventsWorker(SpillableItemsMixin[Event], BatchedQueueService[Event]):
+    # Emit events as soon as they arrive, batching those that are already waiting
+    _min_interval = 0
+    # The batch size is a number of events, while their sizes bound the queue
+    _batch_by_count = True
+
     def __init__(
         self, client_type: Type[EventsClient], client_options: Tuple[Tuple[str, Any]]
     ):
@@ -59,7 +74,11 @@ class EventsWorker(QueueService[Event]):
         self.client_options = client_options
         self._client: EventsClient
         self._orchestration_client: "PrefectClient"
-        self._context_cache: Dict[UUID, Context] = {}
+        # The flow run and task run that each event was emitted from, which are used
+        # to attach related resources to the event once it is handled
+        self._context_cache: Dict[
+            UUID, Tuple[Optional["FlowRun"], Optional["TaskRun"]]
+        ] = {}
 
     @asynccontextmanager
     async def _lifespan(self):
@@ -71,21 +90,95 @@ class EventsWorker(QueueService[Event]):
             async with self._orchestration_client:
                 yield
 
+    @property
+    def _max_batch_size(self):
+        return PREFECT_CLIENT_EVENTS_BATCH_SIZE.value()
+
+    @property
+    def _max_queue_items(self):
+        return PREFECT_CLIENT_EVENTS_MAX_QUEUE_ITEMS.value()
+
+    @property
+    def _max_queue_size(self):
+        return PREFECT_CLIENT_EVENTS_MAX_QUEUE_SIZE.value()
+
+    @property
+    def _overflow_policy(self):
+        return PREFECT_CLIENT_EVENTS_OVERFLOW_POLICY.value()
+
+    def _get_size(self, event: Event) -> int:
+        # Only pay for serializing events when their size is bounded
+        if self._queue_limits[1] is None:
+            return 1
+        return len(event.model_dump_json().encode())
+
     def _prepare_item(self, event: Event) -> Event:
-        self._context_cache[event.id] = copy_context()
+        self._context_cache[event.id] = runs_from_run_context()
         return event
 
-    async def _handle(self, event: Event):
-        context = self._context_cache.pop(event.id)
-        with temporary_context(context=context):
-            await self.attach_related_resources_from_context(event)
-
-        await self._client.emit(event)
+    def _on_item_dropped(self, event: Event) -> None:
+        self._context_cache.pop(event.id, None)
+
+    def _serialize_item(self, event: Event) -> bytes:
+        # Spilled events take their runs with them, so that memory doesn't grow with
+        # the number of events waiting in the spool file
+        flow_run, task_run = self._context_cache.pop(event.id, (None, None))
+        return json.dumps(
+            {
+                "event": event.model_dump(mode="json"),
+                "flow_run": flow_run.model_dump(mode="json") if flow_run else None,
+                "task_run": task_run.model_dump(mode="json") if task_run else None,
+            }
+        ).encode()
+
+    def _deserialize_item(self, data: bytes) -> Event:
+        from prefect.client.schemas.objects import FlowRun, TaskRun
+
+        spilled = json.loads(data)
+        event = Event.model_validate(spilled["event"])
+        self._context_cache[event.id] = (
+            FlowRun.model_validate(spilled["flow_run"])
+            if spilled["flow_run"]
+            else None,
+            TaskRun.model_validate(spilled["task_run"])
+            if spilled["task_run"]
+            else None,
+        )
+        return event
 
-    async def attach_related_resources_from_context(self, event: Event):
+    async def _handle_batch(self, events: List[Event]):
+        batch: List[Event] = []
+        for event in events:
+            flow_run, task_run = self._context_cache.pop(event.id, (None, None))
+            try:
+                await self.attach_related_resources_from_context(
+                    event, flow_run=flow_run, task_run=task_run
+                )
+            except Exception:
+                logger.error(
+                    "Failed to attach related resources to event %r",
+                    event.id,
+                    exc_info=True,
+                )
+                continue
+
+            batch.append(event)
+
+        if batch:
+            await self._client.emit_batch(batch)
+
+    async def attach_related_resources_from_context(
+        self,
+        event: Event,
+        flow_run: Optional["FlowRun"] = None,
+        task_run: Optional["TaskRun"] = None,
+    ):
         exclude = {resource.id for resource in event.involved_resources}
-        event.related += await related_resources_from_run_context(
-            client=self._orchestration_client, exclude=exclude
+        event.related += await related_resources_from_runs(
+            client=self._orchestration_client,
+            flow_run=flow_run,
+            task_run=task_run,
+            exclude=exclude,
         )
 
     @classmethod
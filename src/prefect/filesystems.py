@@ -38,6 +38,29 @@ class WritableFileSystem(Block, abc.ABC):
     async def write_path(self, path: str, content: bytes) -> None:
         pass
 
+    async def exists(self, path: str) -> bool:
+        """
+        Check if a file exists at the given path.
+
+        File systems should override this with a check that does not read the
+        file's contents.
+        """
+        try:
+            await self.read_path(path)
+        except Exception:
+            return False
+        return True
+
+    async def read_path_prefix(self, path: str, size: int) -> bytes:
+        """
+        Read at most the first `size` bytes of the file at the given path.
+
+        File systems should override this with a read that does not download the
+        rest of the file.
+        """
+        content = await self.read_path(path)
+        return content[:size]
+
 
 class ReadableDeploymentStorage(Block, abc.ABC):
     _block_schema_capabilities = ["get-directory"]
@@ -240,6 +263,20 @@ class LocalFileSystem(WritableFileSystem, WritableDeploymentStorage):
         # Leave path stringify to the OS
         return str(path)
 
+    @sync_compatible
+    async def exists(self, path: str) -> bool:
+        return self._resolve_path(path).is_file()
+
+    @sync_compatible
+    async def read_path_prefix(self, path: str, size: int) -> bytes:
+        path: Path = self._resolve_path(path)
+
+        if not path.is_file():
+            raise ValueError(f"Path {path} does not exist or is not a file.")
+
+        async with await anyio.open_file(str(path), mode="rb") as f:
+            return await f.read(size)
+
 
 class RemoteFileSystem(WritableFileSystem, WritableDeploymentStorage):
     """
@@ -399,6 +436,20 @@ class RemoteFileSystem(WritableFileSystem, WritableDeploymentStorage):
             await run_sync_in_worker_thread(file.write, content)
         return path
 
+    @sync_compatible
+    async def exists(self, path: str) -> bool:
+        path = self._resolve_path(path)
+        return await run_sync_in_worker_thread(self.filesystem.isfile, path)
+
+    @sync_compatible
+    async def read_path_prefix(self, path: str, size: int) -> bytes:
+        path = self._resolve_path(path)
+
+        with self.filesystem.open(path, "rb") as file:
+            content = await run_sync_in_worker_thread(file.read, size)
+
+        return content
+
     @property
     def filesystem(self) -> fsspec.AbstractFileSystem:
         if not self._filesystem:
@@ -518,6 +569,14 @@ class SMB(WritableFileSystem, WritableDeploymentStorage):
     async def write_path(self, path: str, content: bytes) -> str:
         return await self.filesystem.write_path(path=path, content=content)
 
+    @sync_compatible
+    async def exists(self, path: str) -> bool:
+        return await self.filesystem.exists(path)
+
+    @sync_compatible
+    async def read_path_prefix(self, path: str, size: int) -> bytes:
+        return await self.filesystem.read_path_prefix(path, size)
+
 
 class NullFileSystem(BaseModel):
     """
@@ -530,6 +589,12 @@ class NullFileSystem(BaseModel):
     async def write_path(self, path: str, content: bytes) -> None:
         pass
 
+    async def exists(self, path: str) -> bool:
+        return False
+
+    async def read_path_prefix(self, path: str, size: int) -> None:
+        pass
+
     async def get_directory(
         self, from_path: Optional[str] = None, local_path: Optional[str] = None
     ) -> None:
@@ -2,9 +2,10 @@ import abc
 import asyncio
 import collections
 import concurrent.futures
+import queue
 import threading
 import uuid
-from collections.abc import Generator, Iterator
+from collections.abc import AsyncIterator, Generator, Iterator
 from functools import partial
 from typing import Any, Callable, Generic, List, Optional, Set, Union, cast
 
@@ -17,7 +18,7 @@ from prefect.logging.loggers import get_logger, get_run_logger
 from prefect.states import Pending, State
 from prefect.task_runs import TaskRunWaiter
 from prefect.utilities.annotations import quote
-from prefect.utilities.asyncutils import run_coro_as_sync
+from prefect.utilities.asyncutils import run_coro_as_sync, run_sync_in_worker_thread
 from prefect.utilities.collections import StopVisiting, visit_collection
 from prefect.utilities.timeout import timeout as timeout_context
 
@@ -279,6 +280,60 @@ class PrefectDistributedFuture(PrefectFuture[R]):
         return hash(self.task_run_id)
 
 
+class PrefectChunkedFuture(PrefectFuture[R]):
+    """
+    A Prefect future for a single element of a chunk of mapped parameters that ran
+    together in one task run. This future is returned by `Task.map` when a
+    `chunksize` is given.
+
+    All futures for the same chunk share the task run, and so the task run ID and
+    final state, of the wrapped chunk future.
+    """
+
+    def __init__(self, chunk_future: PrefectFuture[List[R]], index: int):
+        self._chunk_future = chunk_future
+        self._index = index
+        super().__init__(chunk_future.task_run_id)
+
+    @property
+    def chunk_future(self) -> PrefectFuture[List[R]]:
+        """The future for the task run that computes the whole chunk"""
+        return self._chunk_future
+
+    @property
+    def state(self) -> State:
+        """
+        The current state of the chunk task run. Once the chunk has completed, the
+        state's data is this future's element of the chunk result.
+        """
+        if self._final_state:
+            return self._final_state
+        state = self._chunk_future.state
+        if not state.is_completed():
+            return state
+        self._final_state = state.model_copy(update={"data": self.result()})
+        return self._final_state
+
+    def wait(self, timeout: Optional[float] = None) -> None:
+        self._chunk_future.wait(timeout=timeout)
+
+    def result(
+        self,
+        timeout: Optional[float] = None,
+        raise_on_failure: bool = True,
+    ) -> R:
+        results = self._chunk_future.result(
+            timeout=timeout, raise_on_failure=raise_on_failure
+        )
+        if not isinstance(results, list):
+            # The chunk failed and `raise_on_failure` is `False`
+            return results
+        return results[self._index]
+
+    def add_done_callback(self, fn: Callable[[PrefectFuture[R]], None]):
+        self._chunk_future.add_done_callback(lambda _: fn(self))
+
+
 class PrefectFutureList(list, Iterator, Generic[F]):
     """
     A list of Prefect futures.
@@ -330,6 +385,68 @@ class PrefectFutureList(list, Iterator, Generic[F]):
             ) from exc
 
 
+class PrefectResultIterator(Iterator[R], AsyncIterator[R]):
+    """
+    An iterator over the results of lazily submitted futures, in the order the
+    futures complete.
+
+    Futures are pulled from the given iterator, which is expected to submit work
+    as it is advanced, so that at most `max_in_flight` futures have not yet had
+    their results consumed. A completed future is released as soon as its result
+    is returned, so memory use is bounded by `max_in_flight` rather than by the
+    total number of futures.
+
+    Supports both `for` and `async for`. When used asynchronously, submission and
+    waiting happen in a worker thread so the event loop is not blocked.
+    """
+
+    def __init__(
+        self,
+        futures: Iterator[PrefectFuture[R]],
+        max_in_flight: int,
+        raise_on_failure: bool = True,
+    ):
+        if max_in_flight < 1:
+            raise ValueError("`max_in_flight` must be a positive integer.")
+        self._futures = futures
+        self._max_in_flight = max_in_flight
+        self._raise_on_failure = raise_on_failure
+        self._in_flight = 0
+        self._done: queue.Queue[PrefectFuture[R]] = queue.Queue()
+        self._exhausted = False
+
+    def __iter__(self) -> "PrefectResultIterator[R]":
+        return self
+
+    def __next__(self) -> R:
+        while not self._exhausted and self._in_flight < self._max_in_flight:
+            try:
+                future = next(self._futures)
+            except StopIteration:
+                self._exhausted = True
+                break
+            self._in_flight += 1
+            future.add_done_callback(self._done.put)
+
+        if not self._in_flight:
+            raise StopIteration
+
+        future = self._done.get()
+        self._in_flight -= 1
+        return future.result(raise_on_failure=self._raise_on_failure)
+
+    def __aiter__(self) -> "PrefectResultIterator[R]":
+        return self
+
+    async def __anext__(self) -> R:
+        # `StopIteration` cannot be raised through an awaitable
+        exhausted = object()
+        result = await run_sync_in_worker_thread(next, self, exhausted)
+        if result is exhausted:
+            raise StopAsyncIteration
+        return result
+
+
 def as_completed(
     futures: List[PrefectFuture[R]], timeout: Optional[float] = None
 ) -> Generator[PrefectFuture[R], None]:
@@ -1,3 +1,4 @@
+import datetime
 import json
 import logging
 import sys
@@ -6,6 +7,7 @@ import traceback
 import uuid
 import warnings
 from contextlib import asynccontextmanager
+from json.encoder import encode_basestring_ascii as _encode_json_string
 from typing import Any, Dict, List, Optional, Type, Union
 
 import pendulum
@@ -17,7 +19,10 @@ from typing_extensions import Self
 import prefect.context
 from prefect._internal.concurrency.api import create_call, from_sync
 from prefect._internal.concurrency.event_loop import get_running_loop
-from prefect._internal.concurrency.services import BatchedQueueService
+from prefect._internal.concurrency.services import (
+    BatchedQueueService,
+    SpillableItemsMixin,
+)
 from prefect._internal.concurrency.threads import in_global_loop
 from prefect.client.orchestration import get_client
 from prefect.client.schemas.actions import LogCreate
@@ -30,12 +35,18 @@ from prefect.settings import (
     PREFECT_LOGGING_MARKUP,
     PREFECT_LOGGING_TO_API_BATCH_INTERVAL,
     PREFECT_LOGGING_TO_API_BATCH_SIZE,
+    PREFECT_LOGGING_TO_API_COMPRESS,
     PREFECT_LOGGING_TO_API_MAX_LOG_SIZE,
+    PREFECT_LOGGING_TO_API_MAX_QUEUE_ITEMS,
+    PREFECT_LOGGING_TO_API_MAX_QUEUE_SIZE,
+    PREFECT_LOGGING_TO_API_OVERFLOW_POLICY,
     PREFECT_LOGGING_TO_API_WHEN_MISSING_FLOW,
 )
 
 
-class APILogWorker(BatchedQueueService[Dict[str, Any]]):
+class APILogWorker(
+    SpillableItemsMixin[Dict[str, Any]], BatchedQueueService[Dict[str, Any]]
+):
     @property
     def _max_batch_size(self):
         return max(
@@ -48,9 +59,23 @@ class APILogWorker(BatchedQueueService[Dict[str, Any]]):
     def _min_interval(self):
         return PREFECT_LOGGING_TO_API_BATCH_INTERVAL.value()
 
+    @property
+    def _max_queue_items(self):
+        return PREFECT_LOGGING_TO_API_MAX_QUEUE_ITEMS.value()
+
+    @property
+    def _max_queue_size(self):
+        return PREFECT_LOGGING_TO_API_MAX_QUEUE_SIZE.value()
+
+    @property
+    def _overflow_policy(self):
+        return PREFECT_LOGGING_TO_API_OVERFLOW_POLICY.value()
+
     async def _handle_batch(self, items: List):
         try:
-            await self._client.create_logs(items)
+            await self._client.create_logs(
+                items, compress=PREFECT_LOGGING_TO_API_COMPRESS.value()
+            )
         except Exception as e:
             # Roughly replicate the behavior of the stdlib logger error handling
             if logging.raiseExceptions and sys.stderr:
@@ -72,6 +97,9 @@ class APILogWorker(BatchedQueueService[Dict[str, Any]]):
             PREFECT_LOGGING_TO_API_BATCH_SIZE.value(),
             PREFECT_API_URL.value(),
             PREFECT_LOGGING_TO_API_MAX_LOG_SIZE.value(),
+            PREFECT_LOGGING_TO_API_MAX_QUEUE_ITEMS.value(),
+            PREFECT_LOGGING_TO_API_MAX_QUEUE_SIZE.value(),
+            PREFECT_LOGGING_TO_API_OVERFLOW_POLICY.value(),
         )
 
         # Ensure a unique worker is retrieved per relevant logging settings
@@ -80,6 +108,12 @@ class APILogWorker(BatchedQueueService[Dict[str, Any]]):
     def _get_size(self, item: Dict[str, Any]) -> int:
         return item.pop("__payload_size__", None) or len(json.dumps(item).encode())
 
+    def _serialize_item(self, item: Dict[str, Any]) -> bytes:
+        return json.dumps(item).encode()
+
+    def _deserialize_item(self, data: bytes) -> Dict[str, Any]:
+        return json.loads(data)
+
 
 class APILogHandler(logging.Handler):
     """
@@ -203,9 +237,6 @@ class APILogHandler(logging.Handler):
                     "run information."
                 )
 
-        # Parsing to a `LogCreate` object here gives us nice parsing error messages
-        # from the standard lib `handleError` method if something goes wrong and
-        # prevents malformed logs from entering the queue
         try:
             is_uuid_like = isinstance(flow_run_id, uuid.UUID) or (
                 isinstance(flow_run_id, str) and uuid.UUID(flow_run_id)
@@ -213,29 +244,92 @@ class APILogHandler(logging.Handler):
         except ValueError:
             is_uuid_like = False
 
-        log = LogCreate(
+        log = self._build_log(
+            record,
             flow_run_id=flow_run_id if is_uuid_like else None,
             task_run_id=task_run_id,
             worker_id=worker_id,
-            name=record.name,
-            level=record.levelno,
-            timestamp=pendulum.from_timestamp(
-                getattr(record, "created", None) or time.time()
-            ),
-            message=self.format(record),
-        ).model_dump(mode="json")
+        )
+        self._check_payload_size(log)
 
+        return log
+
+    def _build_log(
+        self,
+        record: logging.LogRecord,
+        flow_run_id: Any = None,
+        task_run_id: Any = None,
+        worker_id: Any = None,
+    ) -> Dict[str, Any]:
+        """
+        Build the JSON-compatible `LogCreate` payload for a record.
+        """
+        timestamp = getattr(record, "created", None) or time.time()
+
+        if not all(
+            id_ is None or isinstance(id_, uuid.UUID)
+            for id_ in (flow_run_id, task_run_id, worker_id)
+        ):
+            # Parsing to a `LogCreate` object here gives us nice parsing error
+            # messages from the standard lib `handleError` method if something goes
+            # wrong and prevents malformed logs from entering the queue
+            return LogCreate(
+                flow_run_id=flow_run_id,
+                task_run_id=task_run_id,
+                worker_id=worker_id,
+                name=record.name,
+                level=record.levelno,
+                timestamp=pendulum.from_timestamp(timestamp),
+                message=self.format(record),
+            ).model_dump(mode="json")
+
+        # The fields of well-formed records are already the right types, so the
+        # payload can be built directly instead of validating and dumping a model
+        log = {
+            "name": record.name,
+            "level": record.levelno,
+            "message": self.format(record),
+            "timestamp": datetime.datetime.fromtimestamp(
+                timestamp, datetime.timezone.utc
+            ).isoformat()[:-6]
+            + "Z",
+            "flow_run_id": str(flow_run_id) if flow_run_id else None,
+            "task_run_id": str(task_run_id) if task_run_id else None,
+        }
+        if worker_id:
+            log["worker_id"] = str(worker_id)
+        return log
+
+    def _check_payload_size(self, log: Dict[str, Any]) -> None:
+        """
+        Record the serialized size of a log, so it is not measured again when it is
+        batched, and drop logs exceeding the maximum size.
+        """
+        max_log_size = PREFECT_LOGGING_TO_API_MAX_LOG_SIZE.value()
         log_size = log["__payload_size__"] = self._get_payload_size(log)
-        if log_size > PREFECT_LOGGING_TO_API_MAX_LOG_SIZE.value():
+        if log_size > max_log_size:
             raise ValueError(
                 f"Log of size {log_size} is greater than the max size of "
-                f"{PREFECT_LOGGING_TO_API_MAX_LOG_SIZE.value()}"
+                f"{max_log_size}"
             )
 
-        return log
-
     def _get_payload_size(self, log: Dict[str, Any]) -> int:
-        return len(json.dumps(log).encode())
+        # Logs are flat, so the size of their JSON encoding can be summed from the
+        # encoded size of each key and value, along with a brace and separators
+        if not log:
+            return 2
+        size = 4 * len(log)
+        for key, value in log.items():
+            size += len(_encode_json_string(key))
+            if isinstance(value, str):
+                size += len(_encode_json_string(value))
+            elif value is None:
+                size += 4
+            elif isinstance(value, int) and not isinstance(value, bool):
+                size += len(str(value))
+            else:
+                size += len(json.dumps(value))
+        return size
 
 
 class WorkerAPILogHandler(APILogHandler):
@@ -258,22 +352,8 @@ class WorkerAPILogHandler(APILogHandler):
 
         worker_id = getattr(record, "worker_id", None)
 
-        log = LogCreate(
-            worker_id=worker_id,
-            name=record.name,
-            level=record.levelno,
-            timestamp=pendulum.from_timestamp(
-                getattr(record, "created", None) or time.time()
-            ),
-            message=self.format(record),
-        ).model_dump(mode="json")
-
-        log_size = log["__payload_size__"] = self._get_payload_size(log)
-        if log_size > PREFECT_LOGGING_TO_API_MAX_LOG_SIZE.value():
-            raise ValueError(
-                f"Log of size {log_size} is greater than the max size of "
-                f"{PREFECT_LOGGING_TO_API_MAX_LOG_SIZE.value()}"
-            )
+        log = self._build_log(record, worker_id=worker_id)
+        self._check_payload_size(log)
 
         return log
 
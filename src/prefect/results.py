@@ -1,8 +1,12 @@
 import abc
+import datetime
+import hashlib
 import inspect
+import json
 import os
 import socket
 import threading
+import time
 import uuid
 from functools import partial
 from pathlib import Path
@@ -11,6 +15,7 @@ from typing import (
     Annotated,
     Any,
     Callable,
+    ClassVar,
     Dict,
     Generic,
     Optional,
@@ -71,6 +76,10 @@ ResultStorage = Union[WritableFileSystem, str]
 ResultSerializer = Union[Serializer, str]
 LITERAL_TYPES = {type(None), bool, UUID}
 
+# Number of bytes read from the start of a result record to find its metadata
+RECORD_METADATA_PREFIX_SIZE = 4096
+_RECORD_METADATA_MARKER = b'{"metadata":'
+
 
 def DEFAULT_STORAGE_KEY_FN():
     return uuid.uuid4().hex
@@ -83,6 +92,240 @@ R = TypeVar("R")
 _default_storages: Dict[Tuple[str, str], WritableFileSystem] = {}
 
 
+class ResultRecordCache:
+    """
+    A thread-safe, least-recently-used cache of deserialized result records bounded
+    by the total size of the records' serialized results.
+
+    A single instance is shared by all result stores in the process, see
+    `get_result_record_cache`, so keys must identify a record across result storages.
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._records: LRUCache = LRUCache(
+            maxsize=max_bytes, getsizeof=lambda entry: entry[1]
+        )
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional["ResultRecord"]:
+        with self._lock:
+            entry = self._records.get(key)
+        return entry[0] if entry is not None else None
+
+    def set(self, key: str, record: "ResultRecord", nbytes: int) -> None:
+        """
+        Cache a record under the given key.
+
+        Args:
+            key: The key to cache the record under.
+            record: The record to cache.
+            nbytes: The size of the record's serialized result, used to bound the
+                size of the cache. Records larger than the cache are not cached.
+        """
+        with self._lock:
+            try:
+                self._records[key] = (record, nbytes)
+            except ValueError:
+                # The record is larger than the whole cache
+                self._records.pop(key, None)
+
+    def pop(self, key: str) -> Optional["ResultRecord"]:
+        with self._lock:
+            entry = self._records.pop(key, None)
+        return entry[0] if entry is not None else None
+
+    def clear(self) -> None:
+        with self._lock:
+            self._records.clear()
+
+    @property
+    def current_bytes(self) -> int:
+        """The total size of the serialized results of the cached records"""
+        return int(self._records.currsize)
+
+    def __contains__(self, key: object) -> bool:
+        with self._lock:
+            return key in self._records
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+
+_result_record_cache: Optional[ResultRecordCache] = None
+
+
+def get_result_record_cache() -> ResultRecordCache:
+    """
+    Get the in-memory result record cache shared by all result stores in the process.
+
+    The cache is created on first use and sized by the
+    `PREFECT_RESULTS_MEMORY_CACHE_MAX_BYTES` setting.
+    """
+    global _result_record_cache
+    if _result_record_cache is None:
+        _result_record_cache = ResultRecordCache(
+            max_bytes=get_current_settings().results.memory_cache_max_bytes
+        )
+    return _result_record_cache
+
+
+class ResultMetadataIndex:
+    """
+    An on-disk index of the metadata of result records known to exist in storage.
+
+    The index allows result stores to check the expiration of a record with an
+    existence check against storage instead of reading the record. Each entry is a
+    small file named by a hash of the record's key, so the index can be shared by
+    processes on the same machine.
+
+    Entries that haven't been written or read for `max_age` are removed from the
+    index, which is checked in a background thread at most once every
+    `PRUNE_INTERVAL` in each process.
+    """
+
+    PRUNE_INTERVAL: ClassVar[datetime.timedelta] = datetime.timedelta(hours=1)
+
+    # when each index path was last pruned by this process, on the monotonic clock
+    _last_pruned: ClassVar[Dict[Path, float]] = {}
+
+    def __init__(self, path: Path, max_age: Optional[datetime.timedelta] = None):
+        self.path = Path(path)
+        self.max_age = max_age
+
+    def _entry_path(self, key: str) -> Path:
+        return self.path / hashlib.sha256(key.encode()).hexdigest()
+
+    def get(self, key: str) -> Optional["ResultRecordMetadata"]:
+        entry_path = self._entry_path(key)
+        try:
+            content = entry_path.read_bytes()
+            metadata = ResultRecordMetadata.load_bytes(content)
+        except (OSError, ValidationError):
+            return None
+
+        # Mark the entry as used, so that it isn't pruned
+        try:
+            os.utime(entry_path)
+        except OSError:
+            pass
+        return metadata
+
+    def set(self, key: str, metadata: "ResultRecordMetadata") -> None:
+        entry_path = self._entry_path(key)
+        # Write to a temporary file first so readers never see a partial entry
+        tmp_path = entry_path.with_name(f"{entry_path.name}.{uuid.uuid4().hex}")
+        try:
+            self.path.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_bytes(metadata.dump_bytes())
+            os.replace(tmp_path, entry_path)
+        except OSError:
+            logger.debug("Failed to index result record %r", key, exc_info=True)
+            tmp_path.unlink(missing_ok=True)
+
+        if self.max_age is not None:
+            self._prune_if_due()
+
+    def remove(self, key: str) -> None:
+        try:
+            self._entry_path(key).unlink(missing_ok=True)
+        except OSError:
+            logger.debug("Failed to remove result record %r from index", key)
+
+    def _prune_if_due(self) -> None:
+        now = time.monotonic()
+        last_pruned = self._last_pruned.get(self.path)
+        if (
+            last_pruned is not None
+            and now - last_pruned < self.PRUNE_INTERVAL.total_seconds()
+        ):
+            return
+        self._last_pruned[self.path] = now
+        # Scanning the whole index can take a while, so keep it off the caller's
+        # thread, which may be running an event loop
+        threading.Thread(
+            target=self.prune, name="PrefectResultIndexPrune", daemon=True
+        ).start()
+
+    def prune(self) -> int:
+        """
+        Remove the entries that haven't been written or read for longer than the
+        index's maximum age, along with partially written entries.
+
+        Returns:
+            The number of entries removed.
+        """
+        if self.max_age is None:
+            return 0
+
+        oldest = time.time() - self.max_age.total_seconds()
+        removed = 0
+        try:
+            entries = list(os.scandir(self.path))
+        except OSError:
+            return 0
+        for entry in entries:
+            try:
+                if entry.stat().st_mtime < oldest:
+                    os.unlink(entry.path)
+                    removed += 1
+            except OSError:
+                # another process may have removed or replaced the entry
+                continue
+
+        if removed:
+            logger.debug("Removed %d entries from the result metadata index", removed)
+        return removed
+
+
+def _storage_identity(storage: Optional[WritableFileSystem]) -> str:
+    """
+    Identify a storage across result stores and processes, so that the same key in
+    two storages, such as two buckets, isn't mistaken for the same record
+    """
+    if storage is None:
+        return "default"
+    if block_document_id := getattr(storage, "_block_document_id", None):
+        return str(block_document_id)
+    try:
+        configuration = storage.model_dump_json()
+    except Exception:
+        # storages that can't be identified aren't shared
+        return f"{type(storage).__name__}-{id(storage)}"
+    digest = hashlib.sha256(configuration.encode()).hexdigest()
+    return f"{type(storage).__name__}-{digest[:16]}"
+
+
+def _metadata_from_record_prefix(prefix: bytes) -> Optional["ResultRecordMetadata"]:
+    """
+    Parse the metadata at the start of a serialized result record, or return `None`
+    if the prefix doesn't contain the whole metadata.
+    """
+    if not prefix.startswith(_RECORD_METADATA_MARKER):
+        return None
+    # The prefix may end partway through a multi-byte character of the result
+    text = prefix[len(_RECORD_METADATA_MARKER) :].decode(errors="replace")
+    try:
+        _, end = json.JSONDecoder().raw_decode(text)
+        return ResultRecordMetadata.load_bytes(text[:end].encode())
+    except ValueError:
+        return None
+
+
+def get_result_metadata_index() -> Optional[ResultMetadataIndex]:
+    """
+    Get the on-disk result metadata index at the path configured by the
+    `PREFECT_RESULTS_METADATA_INDEX_PATH` setting, or `None` if no path is set.
+    """
+    settings = get_current_settings().results
+    if settings.metadata_index_path is None:
+        return None
+    return ResultMetadataIndex(
+        settings.metadata_index_path,
+        max_age=datetime.timedelta(seconds=settings.metadata_index_max_age_seconds),
+    )
+
+
 @sync_compatible
 async def get_default_result_storage() -> WritableFileSystem:
     """
@@ -267,6 +510,12 @@ class ResultStore(BaseModel):
         cache_result_in_memory: Whether to cache results in memory.
         serializer: The serializer to use for results.
         storage_key_fn: The function to generate storage keys.
+        cache: The in-memory cache of result records written or read by this store.
+        shared_cache: The in-memory cache of result records read by any result store.
+            Defaults to the cache shared by all result stores in the process.
+        metadata_index: The on-disk index of the metadata of result records used to
+            check for the existence of records without reading them. Defaults to
+            the index at `PREFECT_RESULTS_METADATA_INDEX_PATH`, if set.
     """
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
@@ -285,6 +534,12 @@ class ResultStore(BaseModel):
     serializer: Serializer = Field(default_factory=get_default_result_serializer)
     storage_key_fn: Callable[[], str] = Field(default=DEFAULT_STORAGE_KEY_FN)
     cache: LRUCache = Field(default_factory=lambda: LRUCache(maxsize=1000))
+    shared_cache: Optional[ResultRecordCache] = Field(
+        default_factory=get_result_record_cache
+    )
+    metadata_index: Optional[ResultMetadataIndex] = Field(
+        default_factory=get_result_metadata_index
+    )
 
     # Deprecated fields
     persist_result: Optional[bool] = Field(default=None)
@@ -393,9 +648,34 @@ class ResultStore(BaseModel):
         Returns:
             bool: True if the result record exists, False otherwise.
         """
-        if self.metadata_storage is not None:
-            # TODO: Add an `exists` method to commonly used storage blocks
-            # so the entire payload doesn't need to be read
+        cache_key = self._cache_key(key)
+        if (record := self._get_cached_record(cache_key)) is not None:
+            metadata = record.metadata
+        elif self.metadata_index is not None:
+            metadata = self.metadata_index.get(cache_key)
+        else:
+            metadata = None
+
+        if metadata is not None:
+            # The metadata is known, so only check that the record is still in
+            # storage instead of reading it
+            storage = (
+                self.metadata_storage
+                if self.metadata_storage is not None
+                else self.result_storage
+            )
+            try:
+                exists = await storage.exists(key)
+            except Exception:
+                exists = False
+            if not exists:
+                self.cache.pop(cache_key, None)
+                if self.shared_cache is not None:
+                    self.shared_cache.pop(cache_key)
+                if self.metadata_index is not None:
+                    self.metadata_index.remove(cache_key)
+                return False
+        elif self.metadata_storage is not None:
             try:
                 metadata_content = await self.metadata_storage.read_path(key)
                 if metadata_content is None:
@@ -404,24 +684,54 @@ class ResultStore(BaseModel):
 
             except Exception:
                 return False
+            self._index_metadata(key, metadata)
         else:
-            try:
-                content = await self.result_storage.read_path(key)
-                if content is None:
-                    return False
-                record = ResultRecord.deserialize(content)
-                metadata = record.metadata
-            except Exception:
+            metadata = await self._read_record_metadata(key)
+            if metadata is None:
                 return False
+            self._index_metadata(key, metadata)
 
         if metadata.expiration:
             # if the result has an expiration,
             # check if it is still in the future
             exists = metadata.expiration > pendulum.now("utc")
+            if not exists and self.metadata_index is not None:
+                self.metadata_index.remove(cache_key)
         else:
             exists = True
         return exists
 
+    async def _read_record_metadata(self, key: str) -> Optional["ResultRecordMetadata"]:
+        """
+        Read the metadata of a result record stored with its result, or return
+        `None` if the record can't be read.
+
+        Records are serialized with their metadata first, so only the start of the
+        record is read unless its metadata doesn't fit in
+        `RECORD_METADATA_PREFIX_SIZE` bytes.
+        """
+        try:
+            prefix = await self.result_storage.read_path_prefix(
+                key, RECORD_METADATA_PREFIX_SIZE
+            )
+        except Exception:
+            return None
+        if prefix is None:
+            return None
+        if (metadata := _metadata_from_record_prefix(prefix)) is not None:
+            return metadata
+
+        try:
+            content = await self.result_storage.read_path(key)
+            if content is None:
+                return None
+            record = ResultRecord.deserialize(content)
+        except Exception:
+            return None
+        # The whole record was read, so keep it for a subsequent `read`
+        self._cache_record(key, record, len(content))
+        return record.metadata
+
     def exists(self, key: str) -> bool:
         """
         Check if a result record exists in storage.
@@ -465,8 +775,8 @@ class ResultStore(BaseModel):
         if self.lock_manager is not None and not self.is_lock_holder(key, holder):
             await self.await_for_lock(key)
 
-        if key in self.cache:
-            return self.cache[key]
+        if (cached_record := self._get_cached_record(self._cache_key(key))) is not None:
+            return cached_record
 
         if self.result_storage is None:
             self.result_storage = await get_default_result_storage()
@@ -481,22 +791,76 @@ class ResultStore(BaseModel):
             result_record = ResultRecord.deserialize_from_result_and_metadata(
                 result=result_content, metadata=metadata_content
             )
+            nbytes = len(result_content)
         else:
             content = await self.result_storage.read_path(key)
             result_record = ResultRecord.deserialize(
                 content, backup_serializer=self.serializer
             )
+            nbytes = len(content)
 
-        if self.cache_result_in_memory:
-            if self.result_storage_block_id is None and hasattr(
-                self.result_storage, "_resolve_path"
-            ):
-                cache_key = str(self.result_storage._resolve_path(key))
+        self._cache_record(key, result_record, nbytes)
+        self._index_metadata(key, result_record.metadata)
+        return result_record
+
+    def _cache_key(self, key: str) -> str:
+        """
+        Get the key of a record in the in-memory cache, which is shared across result
+        storages.
+        """
+        if isinstance(self.result_storage, LocalFileSystem):
+            # a local path identifies the same record for any storage block
+            cache_key = str(self.result_storage._resolve_path(key))
+        elif self.result_storage_block_id is None:
+            if hasattr(self.result_storage, "_resolve_path"):
+                storage_key = str(self.result_storage._resolve_path(key))
             else:
-                cache_key = key
+                storage_key = key
+            cache_key = f"{_storage_identity(self.result_storage)}:{storage_key}"
+        else:
+            cache_key = f"{self.result_storage_block_id}/{key}"
 
+        # Records with separate metadata only exist alongside their metadata, so
+        # the same result key is a different record for each metadata storage
+        if self.metadata_storage is not None and not isinstance(
+            self.metadata_storage, NullFileSystem
+        ):
+            cache_key = f"{_storage_identity(self.metadata_storage)}:{cache_key}"
+        return cache_key
+
+    def _get_cached_record(self, cache_key: str) -> Optional["ResultRecord"]:
+        if (record := self.cache.get(cache_key)) is not None:
+            return record
+        if self.shared_cache is not None:
+            return self.shared_cache.get(cache_key)
+        return None
+
+    def _cache_record(self, key: str, result_record: "ResultRecord", nbytes: int):
+        """Cache a record read from storage for any result store to read"""
+        if self.cache_result_in_memory:
+            cache_key = self._cache_key(key)
             self.cache[cache_key] = result_record
-        return result_record
+            if self.shared_cache is not None:
+                self.shared_cache.set(cache_key, result_record, nbytes)
+
+    def _cache_written_record(self, key: str, result_record: "ResultRecord"):
+        """
+        Cache a record written to storage for this store to read.
+
+        Other stores only see the record once it is read from storage, and no longer
+        see a record it replaced.
+        """
+        cache_key = self._cache_key(key)
+        if self.shared_cache is not None:
+            self.shared_cache.pop(cache_key)
+        if self.cache_result_in_memory:
+            self.cache[cache_key] = result_record
+
+    def _index_metadata(self, key: str, metadata: "ResultRecordMetadata"):
+        if self.metadata_index is not None and not isinstance(
+            self.metadata_storage, NullFileSystem
+        ):
+            self.metadata_index.set(self._cache_key(key), metadata)
 
     def read(
         self,
@@ -655,9 +1019,9 @@ class ResultStore(BaseModel):
 
         # If metadata storage is configured, write result and metadata separately
         if self.metadata_storage is not None:
+            content = result_record.serialize_result()
             await self.result_storage.write_path(
-                result_record.metadata.storage_key,
-                content=result_record.serialize_result(),
+                result_record.metadata.storage_key, content=content
             )
             await self.metadata_storage.write_path(
                 base_key,
@@ -665,12 +1029,13 @@ class ResultStore(BaseModel):
             )
         # Otherwise, write the result metadata and result together
         else:
+            content = result_record.serialize()
             await self.result_storage.write_path(
-                result_record.metadata.storage_key, content=result_record.serialize()
+                result_record.metadata.storage_key, content=content
             )
 
-        if self.cache_result_in_memory:
-            self.cache[key] = result_record
+        self._cache_written_record(key, result_record)
+        self._index_metadata(key, result_record.metadata)
 
     def persist_result_record(
         self, result_record: "ResultRecord", holder: Optional[str] = None
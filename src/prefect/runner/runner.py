@@ -80,6 +80,7 @@ from prefect.client.schemas.objects import (
     StateType,
 )
 from prefect.client.schemas.objects import Flow as APIFlow
+from prefect.client.subscriptions import watch_due_flow_runs
 from prefect.concurrency.asyncio import (
     AcquireConcurrencySlotTimeoutError,
     ConcurrencySlotAcquisitionError,
@@ -97,6 +98,7 @@ from prefect.settings import (
     PREFECT_RUNNER_POLL_FREQUENCY,
     PREFECT_RUNNER_PROCESS_LIMIT,
     PREFECT_RUNNER_SERVER_ENABLE,
+    PREFECT_RUNNER_SUBSCRIBE_TO_SCHEDULED_FLOW_RUNS,
     get_current_settings,
 )
 from prefect.states import (
@@ -441,6 +443,14 @@ class Runner:
                         jitter_range=0.3,
                     )
                 )
+                if (
+                    PREFECT_RUNNER_SUBSCRIBE_TO_SCHEDULED_FLOW_RUNS.value()
+                    and not run_once
+                ):
+                    # submit flow runs as soon as they are due in between polls
+                    loops_task_group.start_soon(
+                        runner._subscribe_to_scheduled_flow_runs
+                    )
 
     def execute_in_background(
         self, func: Callable[..., Any], *args: Any, **kwargs: Any
@@ -736,6 +746,20 @@ class Runner:
         self.last_polled = pendulum.now("UTC")
         return await self._submit_scheduled_flow_runs(flow_run_response=runs_response)
 
+    async def _subscribe_to_scheduled_flow_runs(self):
+        """
+        Gets and submits scheduled flow runs whenever the server reports that a flow
+        run of one of this runner's deployments is due.
+        """
+        await watch_due_flow_runs(
+            path="/deployments/subscriptions/scheduled_flow_runs",
+            keys=[str(deployment_id) for deployment_id in self._deployment_ids],
+            on_due=self._get_and_submit_flow_runs,
+            prefetch_seconds=self._prefetch_seconds,
+            client_id=self.name,
+            retry_seconds=self.query_seconds,
+        )
+
     async def _check_for_cancelled_flow_runs(
         self,
         should_stop: Callable[[], bool] = lambda: False,
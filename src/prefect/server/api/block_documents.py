@@ -5,12 +5,15 @@ Routes for interacting with block objects.
 from typing import List, Optional
 from uuid import UUID
 
+import pendulum
 from fastapi import Body, Depends, HTTPException, Path, Query, status
 
 from prefect.server import models, schemas
 from prefect.server.api import dependencies
 from prefect.server.database.dependencies import provide_database_interface
 from prefect.server.database.interface import PrefectDBInterface
+from prefect.server.database.orm_models import ORMBlockDocument
+from prefect.server.events.clients import PrefectServerEventsClient
 from prefect.server.utilities.server import PrefectRouter
 
 router = PrefectRouter(prefix="/block_documents", tags=["Block documents"])
@@ -127,6 +130,7 @@ async def delete_block_document(
     db: PrefectDBInterface = Depends(provide_database_interface),
 ):
     async with db.session_context(begin_transaction=True) as session:
+        orm_block_document = await session.get(db.BlockDocument, block_document_id)
         result = await models.block_documents.delete_block_document(
             session=session, block_document_id=block_document_id
         )
@@ -135,6 +139,9 @@ async def delete_block_document(
             status.HTTP_404_NOT_FOUND, detail="Block document not found"
         )
 
+    if orm_block_document is not None:
+        await _emit_block_document_event(orm_block_document, "deleted")
+
 
 @router.patch("/{id:uuid}", status_code=status.HTTP_204_NO_CONTENT)
 async def update_block_document_data(
@@ -151,6 +158,7 @@ async def update_block_document_data(
                 block_document_id=block_document_id,
                 block_document=block_document,
             )
+            orm_block_document = await session.get(db.BlockDocument, block_document_id)
     except ValueError as exc:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -161,3 +169,19 @@ async def update_block_document_data(
         raise HTTPException(
             status.HTTP_404_NOT_FOUND, detail="Block document not found"
         )
+
+    if orm_block_document is not None:
+        await _emit_block_document_event(orm_block_document, "updated")
+
+
+async def _emit_block_document_event(
+    block_document: ORMBlockDocument, action: str
+) -> None:
+    async with PrefectServerEventsClient() as events:
+        await events.emit(
+            models.events.block_document_event(
+                block_document=block_document,
+                action=action,
+                occurred=pendulum.now("UTC"),
+            )
+        )
@@ -1,16 +1,19 @@
-from typing import List, Literal, Optional, Union
+import time
+from typing import List, Literal, Optional, Tuple, Union
 from uuid import UUID
 
-from fastapi import Body, Depends, HTTPException, Path, status
+from fastapi import Body, Depends, HTTPException, Path, Request, status
 
 import prefect.server.models as models
 import prefect.server.schemas as schemas
 from prefect.server.api.dependencies import LimitBody
+from prefect.server.concurrency_waiters import ConcurrencySlotWaiters
 from prefect.server.database.dependencies import provide_database_interface
 from prefect.server.database.interface import PrefectDBInterface
 from prefect.server.schemas import actions
 from prefect.server.utilities.schemas import PrefectBaseModel
 from prefect.server.utilities.server import PrefectRouter
+from prefect.settings import get_current_settings
 
 router = PrefectRouter(prefix="/v2/concurrency_limits", tags=["Concurrency Limits V2"])
 
@@ -147,12 +150,83 @@ class MinimalConcurrencyLimitResponse(PrefectBaseModel):
 
 @router.post("/increment", status_code=status.HTTP_200_OK)
 async def bulk_increment_active_slots(
+    request: Request,
     slots: int = Body(..., gt=0),
     names: List[str] = Body(..., min_items=1),
     mode: Literal["concurrency", "rate_limit"] = Body("concurrency"),
     create_if_missing: Optional[bool] = Body(None),
+    wait_seconds: float = Body(
+        0.0,
+        ge=0.0,
+        description=(
+            "How long to wait in line for slots to be released before responding "
+            "with 423 Locked, up to the server's maximum."
+        ),
+    ),
     db: PrefectDBInterface = Depends(provide_database_interface),
 ) -> List[MinimalConcurrencyLimitResponse]:
+    wait_seconds = min(
+        wait_seconds, get_current_settings().server.concurrency.max_slot_wait_seconds
+    )
+    deadline = time.monotonic() + wait_seconds
+    denied = False
+
+    while True:
+        limits, active_limits, acquired = await _increment_active_slots(
+            db, names=names, slots=slots, mode=mode, create_if_missing=create_if_missing
+        )
+        if acquired:
+            return [
+                MinimalConcurrencyLimitResponse(
+                    id=limit.id, name=str(limit.name), limit=limit.limit
+                )
+                for limit in limits
+            ]
+
+        if not denied:
+            # Only count the request against the limits once, however many times it
+            # retries while waiting in line
+            async with db.session_context(begin_transaction=True) as session:
+                await models.concurrency_limits_v2.bulk_update_denied_slots(
+                    session=session,
+                    concurrency_limit_ids=[limit.id for limit in active_limits],
+                    slots=slots,
+                )
+
+        blocking_limit, retry_after = _retry_after(active_limits, slots)
+
+        remaining = deadline - time.monotonic()
+        if remaining <= 0 or await request.is_disconnected():
+            raise HTTPException(
+                status_code=status.HTTP_423_LOCKED,
+                headers={
+                    "Retry-After": str(retry_after),
+                },
+            )
+
+        # Wait to be woken by a release of slots on one of the limits. Slots may also
+        # be released by another server process or by slot decay, so don't wait much
+        # longer than the estimated time for the slots to become available.
+        if blocking_limit.slot_decay_per_second == 0.0:
+            retry_after = max(retry_after, 1.0)
+        await ConcurrencySlotWaiters.wait(
+            [limit.id for limit in active_limits],
+            slots,
+            timeout=min(remaining, retry_after),
+            first=denied,
+        )
+        denied = True
+
+
+async def _increment_active_slots(
+    db: PrefectDBInterface,
+    names: List[str],
+    slots: int,
+    mode: Literal["concurrency", "rate_limit"],
+    create_if_missing: Optional[bool],
+) -> Tuple[
+    List[schemas.core.ConcurrencyLimitV2], List[schemas.core.ConcurrencyLimitV2], bool
+]:
     async with db.session_context(begin_transaction=True) as session:
         limits = [
             schemas.core.ConcurrencyLimitV2.model_validate(limit)
@@ -195,44 +269,31 @@ async def bulk_increment_active_slots(
         if not acquired:
             await session.rollback()
 
-    if acquired:
-        return [
-            MinimalConcurrencyLimitResponse(
-                id=limit.id, name=str(limit.name), limit=limit.limit
-            )
-            for limit in limits
-        ]
-    else:
-        async with db.session_context(begin_transaction=True) as session:
-            await models.concurrency_limits_v2.bulk_update_denied_slots(
-                session=session,
-                concurrency_limit_ids=[limit.id for limit in active_limits],
-                slots=slots,
-            )
+    return limits, active_limits, acquired
 
-        def num_blocking_slots(limit: schemas.core.ConcurrencyLimitV2) -> float:
-            if limit.slot_decay_per_second > 0.0:
-                return slots + limit.denied_slots
-            else:
-                return (slots + limit.denied_slots) / limit.limit
 
-        blocking_limit = max((limit for limit in active_limits), key=num_blocking_slots)
-        blocking_slots = num_blocking_slots(blocking_limit)
+def _retry_after(
+    active_limits: List[schemas.core.ConcurrencyLimitV2], slots: int
+) -> Tuple[schemas.core.ConcurrencyLimitV2, float]:
+    """Finds the limit blocking the request and estimates how long until it has
+    enough free slots"""
 
-        wait_time_per_slot = (
-            blocking_limit.avg_slot_occupancy_seconds
-            if blocking_limit.slot_decay_per_second == 0.0
-            else (1.0 / blocking_limit.slot_decay_per_second)
-        )
+    def num_blocking_slots(limit: schemas.core.ConcurrencyLimitV2) -> float:
+        if limit.slot_decay_per_second > 0.0:
+            return slots + limit.denied_slots
+        else:
+            return (slots + limit.denied_slots) / limit.limit
 
-        retry_after = wait_time_per_slot * blocking_slots
+    blocking_limit = max((limit for limit in active_limits), key=num_blocking_slots)
+    blocking_slots = num_blocking_slots(blocking_limit)
 
-        raise HTTPException(
-            status_code=status.HTTP_423_LOCKED,
-            headers={
-                "Retry-After": str(retry_after),
-            },
-        )
+    wait_time_per_slot = (
+        blocking_limit.avg_slot_occupancy_seconds
+        if blocking_limit.slot_decay_per_second == 0.0
+        else (1.0 / blocking_limit.slot_decay_per_second)
+    )
+
+    return blocking_limit, wait_time_per_slot * blocking_slots
 
 
 @router.post("/decrement", status_code=status.HTTP_200_OK)
@@ -253,13 +314,16 @@ async def bulk_decrement_active_slots(
         if not limits:
             return []
 
+        active_limit_ids = [limit.id for limit in limits if bool(limit.active)]
         await models.concurrency_limits_v2.bulk_decrement_active_slots(
             session=session,
-            concurrency_limit_ids=[limit.id for limit in limits if bool(limit.active)],
+            concurrency_limit_ids=active_limit_ids,
             slots=slots,
             occupancy_seconds=occupancy_seconds,
         )
 
+    ConcurrencySlotWaiters.notify(active_limit_ids, slots)
+
     return [
         MinimalConcurrencyLimitResponse(
             id=limit.id, name=str(limit.name), limit=limit.limit
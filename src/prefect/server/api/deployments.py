@@ -8,7 +8,7 @@ from uuid import UUID
 
 import jsonschema.exceptions
 import pendulum
-from fastapi import Body, Depends, HTTPException, Path, Response, status
+from fastapi import Body, Depends, HTTPException, Path, Response, WebSocket, status
 from pydantic_extra_types.pendulum_dt import DateTime
 from starlette.background import BackgroundTasks
 
@@ -19,7 +19,11 @@ from prefect.server.api.validation import (
     validate_job_variables_for_deployment,
     validate_job_variables_for_deployment_flow_run,
 )
-from prefect.server.api.workers import WorkerLookups
+from prefect.server.api.workers import (
+    WorkerLookups,
+    read_flow_run_subscription,
+    stream_due_flow_runs,
+)
 from prefect.server.database.dependencies import provide_database_interface
 from prefect.server.database.interface import PrefectDBInterface
 from prefect.server.exceptions import MissingVariableError, ObjectNotFoundError
@@ -457,6 +461,33 @@ async def get_scheduled_flow_runs_for_deployments(
     return flow_run_responses
 
 
+@router.websocket("/subscriptions/scheduled_flow_runs")
+async def scheduled_flow_run_subscription(websocket: WebSocket):
+    """
+    Pushes flow runs scheduled for a set of deployments to a runner as they become
+    due. The subscribe message's `keys` are the ids of the deployments to subscribe to.
+
+    Only flow runs scheduled through this server are pushed, so runners should keep
+    polling for scheduled flow runs on a longer interval.
+    """
+    subscription = await read_flow_run_subscription(websocket)
+    if subscription is None:
+        return
+
+    try:
+        deployment_ids = [UUID(key) for key in subscription.get("keys") or []]
+    except (TypeError, ValueError):
+        return await websocket.close(
+            code=4001, reason="Protocol violation: expected deployment ids as 'keys'"
+        )
+
+    await stream_due_flow_runs(
+        websocket,
+        deployment_ids=deployment_ids,
+        prefetch_seconds=subscription["prefetch_seconds"],
+    )
+
+
 @router.post("/count")
 async def count_deployments(
     flows: schemas.filters.FlowFilter = None,
@@ -1,6 +1,7 @@
 import base64
 from typing import List, Optional
 
+import pydantic
 from fastapi import Response, WebSocket, status
 from fastapi.exceptions import HTTPException
 from fastapi.param_functions import Depends, Path
@@ -40,6 +41,18 @@ logger = get_logger(__name__)
 
 router = PrefectRouter(prefix="/events", tags=["Events"])
 
+BATCHED_EVENTS_SUBPROTOCOL = "prefect-event-batches"
+
+_event_batch_adapter = pydantic.TypeAdapter(List[Event])
+
+
+def _events_from_message(message: str) -> List[Event]:
+    """Parses a message from the incoming events websocket, which is either a single
+    event or, for clients that negotiated batches, an array of events"""
+    if message.lstrip().startswith("["):
+        return _event_batch_adapter.validate_json(message)
+    return [Event.model_validate_json(message)]
+
 
 @router.post("", status_code=status.HTTP_204_NO_CONTENT, response_class=Response)
 async def create_events(
@@ -58,13 +71,17 @@ async def create_events(
 async def stream_events_in(websocket: WebSocket) -> None:
     """Open a WebSocket to stream incoming Events"""
 
-    await websocket.accept()
+    subprotocol = None
+    if BATCHED_EVENTS_SUBPROTOCOL in websocket.scope.get("subprotocols", []):
+        subprotocol = BATCHED_EVENTS_SUBPROTOCOL
+
+    await websocket.accept(subprotocol=subprotocol)
 
     try:
         async with messaging.create_event_publisher() as publisher:
-            async for event_json in websocket.iter_text():
-                event = Event.model_validate_json(event_json)
-                await publisher.publish_event(event.receive())
+            async for message in websocket.iter_text():
+                for event in _events_from_message(message):
+                    await publisher.publish_event(event.receive())
     except subscriptions.NORMAL_DISCONNECT_EXCEPTIONS:  # pragma: no cover
         pass  # it's fine if a client disconnects either normally or abnormally
 
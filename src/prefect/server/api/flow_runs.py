@@ -2,9 +2,7 @@
 Routes for interacting with flow run objects.
 """
 
-import csv
 import datetime
-import io
 from typing import Any, Dict, List, Optional, Type
 from uuid import UUID
 
@@ -28,6 +26,7 @@ import prefect.server.api.dependencies as dependencies
 import prefect.server.models as models
 import prefect.server.schemas as schemas
 from prefect.logging import get_logger
+from prefect.server.api.logs import export_logs
 from prefect.server.api.run_history import run_history
 from prefect.server.api.validation import validate_job_variables_for_deployment_flow_run
 from prefect.server.database.dependencies import provide_database_interface
@@ -43,7 +42,9 @@ from prefect.server.schemas.graph import Graph
 from prefect.server.schemas.responses import (
     FlowRunPaginationResponse,
     OrchestrationResult,
+    RunOrchestrationResult,
 )
+from prefect.server.utilities.pagination import next_cursor
 from prefect.server.utilities.server import PrefectRouter
 from prefect.utilities import schema_tools
 
@@ -603,6 +604,60 @@ async def set_flow_run_state(
     return orchestration_result
 
 
+@router.post("/set_state")
+async def set_flow_run_states(
+    flow_run_ids: List[UUID] = Body(
+        ..., description="The ids of the flow runs to transition."
+    ),
+    state: schemas.actions.StateCreate = Body(..., description="The intended state."),
+    force: bool = Body(
+        False,
+        description=(
+            "If false, orchestration rules will be applied that may alter or prevent"
+            " the state transitions. If True, orchestration rules are not applied."
+        ),
+    ),
+    db: PrefectDBInterface = Depends(provide_database_interface),
+    flow_policy: Type[BaseOrchestrationPolicy] = Depends(
+        orchestration_dependencies.provide_flow_policy
+    ),
+    orchestration_parameters: Dict[str, Any] = Depends(
+        orchestration_dependencies.provide_flow_orchestration_parameters
+    ),
+    api_version=Depends(dependencies.provide_request_api_version),
+) -> List[RunOrchestrationResult]:
+    """
+    Set the state of several flow runs at once, invoking orchestration rules for each
+    run. Runs that do not exist are omitted from the results.
+    """
+
+    # pass the request version to the orchestration engine to support compatibility code
+    orchestration_parameters.update({"api-version": api_version})
+
+    async with db.session_context(
+        begin_transaction=True, with_for_update=True
+    ) as session:
+        orchestration_results = await models.flow_runs.set_flow_run_states(
+            session=session,
+            flow_run_ids=flow_run_ids,
+            # convert to a full State object
+            state=schemas.states.State.model_validate(state),
+            force=force,
+            flow_policy=flow_policy,
+            orchestration_parameters=orchestration_parameters,
+        )
+
+    return [
+        RunOrchestrationResult(
+            id=flow_run_id,
+            state=result.state,
+            status=result.status,
+            details=result.details,
+        )
+        for flow_run_id, result in orchestration_results.items()
+    ]
+
+
 @router.post("/{id}/input", status_code=status.HTTP_201_CREATED)
 async def create_flow_run_input(
     flow_run_id: UUID = Path(..., description="The flow run id", alias="id"),
@@ -714,6 +769,14 @@ async def paginate_flow_runs(
     sort: schemas.sorting.FlowRunSort = Body(schemas.sorting.FlowRunSort.ID_DESC),
     limit: int = dependencies.LimitBody(),
     page: int = Body(1, ge=1),
+    cursor: Optional[str] = Body(
+        None,
+        description=(
+            "The cursor of the page to read, from the `next_page` of the previous page."
+            " Pass an empty cursor to read the first page and start paging with"
+            " cursors, which costs the same for every page."
+        ),
+    ),
     flows: Optional[schemas.filters.FlowFilter] = None,
     flow_runs: Optional[schemas.filters.FlowRunFilter] = None,
     task_runs: Optional[schemas.filters.TaskRunFilter] = None,
@@ -725,7 +788,7 @@ async def paginate_flow_runs(
     """
     Pagination query for flow runs.
     """
-    offset = (page - 1) * limit
+    offset = (page - 1) * limit if cursor is None else None
 
     async with db.session_context() as session:
         runs = await models.flow_runs.read_flow_runs(
@@ -739,16 +802,23 @@ async def paginate_flow_runs(
             offset=offset,
             limit=limit,
             sort=sort,
+            cursor=cursor,
         )
 
-        count = await models.flow_runs.count_flow_runs(
-            session=session,
-            flow_filter=flows,
-            flow_run_filter=flow_runs,
-            task_run_filter=task_runs,
-            deployment_filter=deployments,
-            work_pool_filter=work_pools,
-            work_queue_filter=work_pool_queues,
+        # Counting every matching run costs as much as reading them all, so pages
+        # read with cursors don't include the totals
+        count = (
+            await models.flow_runs.count_flow_runs(
+                session=session,
+                flow_filter=flows,
+                flow_run_filter=flow_runs,
+                task_run_filter=task_runs,
+                deployment_filter=deployments,
+                work_pool_filter=work_pools,
+                work_queue_filter=work_pool_queues,
+            )
+            if cursor is None
+            else None
         )
 
         # Instead of relying on fastapi.encoders.jsonable_encoder to convert the
@@ -766,8 +836,13 @@ async def paginate_flow_runs(
             results=results,
             count=count,
             limit=limit,
-            pages=(count + limit - 1) // limit,
-            page=page,
+            pages=(count + limit - 1) // limit if count is not None else None,
+            page=page if cursor is None else None,
+            next_page=(
+                next_cursor(sort.as_sql_keyset(), runs, limit)
+                if cursor is not None
+                else None
+            ),
         ).model_dump(mode="json")
 
         return ORJSONResponse(content=response)
@@ -782,7 +857,8 @@ async def download_logs(
     db: PrefectDBInterface = Depends(provide_database_interface),
 ) -> StreamingResponse:
     """
-    Download all flow run logs as a CSV file, collecting all logs until there are no more logs to retrieve.
+    Download all flow run logs as a CSV file, streamed while they are read from the
+    database.
     """
     async with db.session_context() as session:
         flow_run = await models.flow_runs.read_flow_run(
@@ -792,49 +868,15 @@ async def download_logs(
         if not flow_run:
             raise HTTPException(status.HTTP_404_NOT_FOUND, detail="Flow run not found")
 
-        async def generate():
-            data = io.StringIO()
-            csv_writer = csv.writer(data)
-            csv_writer.writerow(
-                ["timestamp", "level", "flow_run_id", "task_run_id", "message"]
-            )
-
-            offset = 0
-            limit = FLOW_RUN_LOGS_DOWNLOAD_PAGE_LIMIT
-
-            while True:
-                results = await models.logs.read_logs(
-                    session=session,
-                    log_filter=schemas.filters.LogFilter(
-                        flow_run_id={"any_": [flow_run_id]}
-                    ),
-                    offset=offset,
-                    limit=limit,
-                    sort=schemas.sorting.LogSort.TIMESTAMP_ASC,
-                )
-
-                if not results:
-                    break
-
-                offset += limit
-
-                for log in results:
-                    csv_writer.writerow(
-                        [
-                            log.timestamp,
-                            log.level,
-                            log.flow_run_id,
-                            log.task_run_id,
-                            log.message,
-                        ]
-                    )
-                    data.seek(0)
-                    yield data.read()
-                    data.seek(0)
-                    data.truncate(0)
-
         return StreamingResponse(
-            generate(),
+            export_logs(
+                db,
+                log_filter=schemas.filters.LogFilter(
+                    flow_run_id={"any_": [flow_run_id]}
+                ),
+                format="csv",
+                batch_size=FLOW_RUN_LOGS_DOWNLOAD_PAGE_LIMIT,
+            ),
             media_type="text/csv",
             headers={
                 "Content-Disposition": f"attachment; filename={flow_run.name}-logs.csv"
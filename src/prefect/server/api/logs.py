@@ -2,19 +2,45 @@
 Routes for interacting with log objects.
 """
 
-from typing import List
+import csv
+import datetime
+import io
+from contextlib import AsyncExitStack
+from typing import AsyncGenerator, List, Literal, Optional
+from uuid import uuid4
 
-from fastapi import Body, Depends, status
+import pendulum
+from fastapi import Body, Depends, WebSocket, status
+from fastapi.responses import StreamingResponse
+from starlette.status import WS_1002_PROTOCOL_ERROR, WS_1008_POLICY_VIOLATION
 
 import prefect.server.api.dependencies as dependencies
 import prefect.server.models as models
 import prefect.server.schemas as schemas
+from prefect.logging import get_logger
 from prefect.server.database.dependencies import provide_database_interface
 from prefect.server.database.interface import PrefectDBInterface
+from prefect.server.logs import messaging, stream
+from prefect.server.schemas.responses import LogPaginationResponse
+from prefect.server.utilities import subscriptions
+from prefect.server.utilities.pagination import next_cursor
 from prefect.server.utilities.server import PrefectRouter
+from prefect.settings import (
+    PREFECT_SERVER_LOGS_MAXIMUM_WEBSOCKET_BACKFILL,
+    PREFECT_SERVER_LOGS_STREAM_BATCH_SIZE,
+    PREFECT_SERVER_LOGS_STREAM_OUT_ENABLED,
+)
+
+logger = get_logger(__name__)
 
 router = PrefectRouter(prefix="/logs", tags=["Logs"])
 
+LOGS_CSV_COLUMNS = ["timestamp", "level", "flow_run_id", "task_run_id", "message"]
+
+# Logs created this long before a websocket subscribed may be both backfilled and
+# streamed to it, so their ids are remembered to skip the streamed copy
+BACKFILL_DEDUPLICATION_WINDOW = datetime.timedelta(seconds=30)
+
 
 @router.post("/", status_code=status.HTTP_201_CREATED)
 async def create_logs(
@@ -22,9 +48,28 @@ async def create_logs(
     db: PrefectDBInterface = Depends(provide_database_interface),
 ):
     """Create new logs from the provided schema."""
+    now = pendulum.now("UTC")
+    stream_out = PREFECT_SERVER_LOGS_STREAM_OUT_ENABLED.value()
+
     for batch in models.logs.split_logs_into_batches(logs):
+        # Assign ids here rather than in the database, so that the logs streamed out
+        # to websockets are the same as the stored ones
+        created = [
+            schemas.core.Log.model_construct(
+                id=uuid4(), created=now, updated=now, **log.model_dump()
+            )
+            for log in batch
+        ]
+
         async with db.session_context(begin_transaction=True) as session:
-            await models.logs.create_logs(session=session, logs=batch)
+            await models.logs.create_logs(session=session, logs=created)
+
+        if stream_out:
+            try:
+                await messaging.publish(created)
+            except Exception:
+                # the logs are already stored, so only the live stream misses them
+                logger.warning("Failed to publish logs to stream", exc_info=True)
 
 
 @router.post("/filter")
@@ -42,3 +87,221 @@ async def read_logs(
         return await models.logs.read_logs(
             session=session, log_filter=logs, offset=offset, limit=limit, sort=sort
         )
+
+
+@router.post("/paginate")
+async def paginate_logs(
+    limit: int = dependencies.LimitBody(),
+    cursor: Optional[str] = Body(
+        None, description="The cursor of the page to read, or none for the first page"
+    ),
+    logs: Optional[schemas.filters.LogFilter] = None,
+    sort: schemas.sorting.LogSort = Body(schemas.sorting.LogSort.TIMESTAMP_ASC),
+    db: PrefectDBInterface = Depends(provide_database_interface),
+) -> LogPaginationResponse:
+    """
+    Query for logs a page at a time. Each page returns the cursor to read the next
+    page with, and reading a page costs the same no matter how deep it is.
+    """
+    async with db.session_context() as session:
+        results = await models.logs.read_logs(
+            session=session,
+            log_filter=logs,
+            limit=limit,
+            sort=sort,
+            cursor=cursor or "",
+        )
+
+    return LogPaginationResponse(
+        results=results,
+        limit=limit,
+        next_page=next_cursor(sort.as_sql_keyset(), results, limit),
+    )
+
+
+async def export_logs(
+    db: PrefectDBInterface,
+    log_filter: Optional[schemas.filters.LogFilter],
+    sort: schemas.sorting.LogSort = schemas.sorting.LogSort.TIMESTAMP_ASC,
+    format: Literal["ndjson", "csv"] = "ndjson",
+    batch_size: Optional[int] = None,
+) -> AsyncGenerator[str, None]:
+    """
+    Generates the logs matching the filter as NDJSON lines or CSV rows, a batch at a
+    time, reading them with a single server-side cursor.
+    """
+    async with db.session_context() as session:
+        logs = models.logs.stream_logs(
+            session=session,
+            log_filter=log_filter,
+            sort=sort,
+            batch_size=batch_size or PREFECT_SERVER_LOGS_STREAM_BATCH_SIZE.value(),
+        )
+
+        if format == "ndjson":
+            async for batch in logs:
+                yield "".join(
+                    schemas.core.Log.model_validate(
+                        log, from_attributes=True
+                    ).model_dump_json()
+                    + "\n"
+                    for log in batch
+                )
+            return
+
+        data = io.StringIO()
+        csv_writer = csv.writer(data)
+        csv_writer.writerow(LOGS_CSV_COLUMNS)
+
+        async for batch in logs:
+            csv_writer.writerows(
+                [
+                    log.timestamp,
+                    log.level,
+                    log.flow_run_id,
+                    log.task_run_id,
+                    log.message,
+                ]
+                for log in batch
+            )
+            yield data.getvalue()
+            data.seek(0)
+            data.truncate(0)
+
+        # an export without any logs is just the header
+        if data.tell():
+            yield data.getvalue()
+
+
+@router.post("/export")
+async def stream_logs_export(
+    logs: Optional[schemas.filters.LogFilter] = None,
+    sort: schemas.sorting.LogSort = Body(schemas.sorting.LogSort.TIMESTAMP_ASC),
+    format: Literal["ndjson", "csv"] = Body(
+        "ndjson", description="Whether to export logs as NDJSON or CSV"
+    ),
+    db: PrefectDBInterface = Depends(provide_database_interface),
+) -> StreamingResponse:
+    """
+    Export all logs matching the filter, streamed as NDJSON or CSV while they are
+    read from the database.
+    """
+    return StreamingResponse(
+        export_logs(db, log_filter=logs, sort=sort, format=format),
+        media_type="application/x-ndjson" if format == "ndjson" else "text/csv",
+    )
+
+
+def _clamp_log_filter(
+    log_filter: schemas.filters.LogFilter, max_duration: datetime.timedelta
+) -> schemas.filters.LogFilter:
+    """Limit how far a log filter can look back based on the given duration"""
+    earliest = pendulum.now("UTC") - max_duration
+    timestamp = log_filter.timestamp or schemas.filters.LogFilterTimestamp()
+    after = earliest if timestamp.after_ is None else max(earliest, timestamp.after_)
+    return log_filter.model_copy(
+        update={"timestamp": timestamp.model_copy(update={"after_": after})}
+    )
+
+
+@router.websocket("/out")
+async def stream_logs_out(
+    websocket: WebSocket,
+    db: PrefectDBInterface = Depends(provide_database_interface),
+) -> None:
+    """
+    Open a WebSocket to stream the logs matching a filter, then to follow the logs
+    as they are created
+
+    Only logs from the last `PREFECT_SERVER_LOGS_MAXIMUM_WEBSOCKET_BACKFILL` are
+    backfilled; use the `/logs/export` endpoint to read older logs.
+    """
+    websocket = await subscriptions.accept_prefect_socket(websocket)
+    if not websocket:
+        return
+
+    try:
+        # After authentication, the next message is expected to be a filter message,
+        # any other type of message will close the connection.
+        message = await websocket.receive_json()
+
+        if message["type"] != "filter":
+            return await websocket.close(
+                WS_1002_PROTOCOL_ERROR, reason="Expected 'filter' message"
+            )
+
+        try:
+            log_filter = schemas.filters.LogFilter.model_validate(
+                message.get("filter") or {}
+            )
+        except Exception as e:
+            return await websocket.close(
+                WS_1002_PROTOCOL_ERROR, reason=f"Invalid filter: {e}"
+            )
+
+        wants_backfill = message.get("backfill", True)
+        follow = message.get("follow", True)
+
+        if follow and not PREFECT_SERVER_LOGS_STREAM_OUT_ENABLED.value():
+            return await websocket.close(
+                WS_1008_POLICY_VIOLATION, reason="Following logs is not enabled"
+            )
+
+        async with AsyncExitStack() as stack:
+            # subscribe to the ongoing log stream first so we don't miss logs...
+            if follow:
+                log_stream = await stack.enter_async_context(stream.logs(log_filter))
+            subscribed_at = pendulum.now("UTC")
+
+            # ...then if the user wants, send the recent logs that already exist...
+            backfilled_ids = set()
+            if wants_backfill:
+                backfill_filter = _clamp_log_filter(
+                    log_filter, PREFECT_SERVER_LOGS_MAXIMUM_WEBSOCKET_BACKFILL.value()
+                )
+                async with db.session_context() as session:
+                    async for batch in models.logs.stream_logs(
+                        session=session,
+                        log_filter=backfill_filter,
+                        batch_size=PREFECT_SERVER_LOGS_STREAM_BATCH_SIZE.value(),
+                    ):
+                        backfilled_ids.update(
+                            log.id
+                            for log in batch
+                            if log.created
+                            >= subscribed_at - BACKFILL_DEDUPLICATION_WINDOW
+                        )
+                        await websocket.send_json(
+                            {
+                                "type": "logs",
+                                "logs": [
+                                    schemas.core.Log.model_validate(
+                                        log, from_attributes=True
+                                    ).model_dump(mode="json")
+                                    for log in batch
+                                ],
+                            }
+                        )
+
+            if not follow:
+                return await websocket.close()
+
+            # ...before following the logs as they are created
+            async for log in log_stream:
+                if not log:
+                    if await subscriptions.still_connected(websocket):
+                        continue
+                    break
+
+                if log.id in backfilled_ids:
+                    backfilled_ids.remove(log.id)
+                    continue
+
+                await websocket.send_json(
+                    {"type": "logs", "logs": [log.model_dump(mode="json")]}
+                )
+
+    except subscriptions.NORMAL_DISCONNECT_EXCEPTIONS:  # pragma: no cover
+        pass  # it's fine if a client disconnects either normally or abnormally
+
+    return None
@@ -6,6 +6,7 @@ import datetime
 import json
 from typing import List, Optional
 
+import pendulum
 import pydantic
 import sqlalchemy as sa
 from pydantic_extra_types.pendulum_dt import DateTime
@@ -16,6 +17,7 @@ import prefect.server.schemas as schemas
 from prefect.logging import get_logger
 from prefect.server.database.dependencies import db_injector
 from prefect.server.database.interface import PrefectDBInterface
+from prefect.settings import PREFECT_SERVER_SERVICES_RUN_HISTORY_ROLLUPS_ENABLED
 
 logger = get_logger("server.api")
 
@@ -63,54 +65,86 @@ async def run_history(
         history_interval,
     ).cte("intervals")
 
-    # apply filters to the flow runs (and related states)
-    runs = (
-        await run_filter_function(
-            sa.select(
-                run_model.id,
-                run_model.expected_start_time,
-                run_model.estimated_run_time,
-                run_model.estimated_start_time_delta,
-                run_model.state_type,
-                run_model.state_name,
-            ).select_from(run_model),
-            flow_filter=flows,
-            flow_run_filter=flow_runs,
-            task_run_filter=task_runs,
-            deployment_filter=deployments,
-            work_pool_filter=work_pools,
-            work_queue_filter=work_queues,
+    # read runs from the rollups where possible, counting only the runs that aren't
+    # in them from the runs table
+    rollups_refreshed_until = None
+    if _can_read_rollups(
+        history_start=history_start,
+        history_interval=history_interval,
+        flows=flows,
+        flow_runs=flow_runs,
+        task_runs=task_runs,
+        deployments=deployments,
+        work_pools=work_pools,
+        work_queues=work_queues,
+    ):
+        rollups_refreshed_until = await models.run_history_rollups.read_refreshed_until(
+            session=session
         )
-    ).alias("runs")
+
+    # apply filters to the flow runs (and related states), counting each run once
+    # and totalling only positive run times and lateness (to avoid any unexpected
+    # corner cases)
+    runs = await run_filter_function(
+        sa.select(
+            run_model.expected_start_time,
+            sa.cast(run_model.state_type, sa.String).label("state_type"),
+            run_model.state_name,
+            sa.literal_column("1", sa.Integer).label("count_runs"),
+            db.greatest(0, sa.extract("epoch", run_model.estimated_run_time)).label(
+                "sum_estimated_run_time"
+            ),
+            db.greatest(
+                0, sa.extract("epoch", run_model.estimated_start_time_delta)
+            ).label("sum_estimated_lateness"),
+        ).select_from(run_model),
+        flow_filter=flows,
+        flow_run_filter=flow_runs,
+        task_run_filter=task_runs,
+        deployment_filter=deployments,
+        work_pool_filter=work_pools,
+        work_queue_filter=work_queues,
+    )
+    if rollups_refreshed_until is not None:
+        runs = runs.where(
+            models.run_history_rollups.is_not_rolled_up(
+                run_model, rollups_refreshed_until
+            )
+        ).union_all(
+            _read_rollups(
+                db,
+                run_type=run_type,
+                history_start=history_start,
+                history_end=history_end,
+                flows=flows,
+                deployments=deployments,
+            )
+        )
+    runs = runs.subquery("runs")
+
     # outer join intervals to the filtered runs to create a dataset composed of
     # every interval and the aggregate of all its runs. The runs aggregate is represented
     # by a descriptive JSON object
+    count_runs = sa.func.sum(runs.c.count_runs)
     counts = (
         sa.select(
             intervals.c.interval_start,
             intervals.c.interval_end,
-            # build a JSON object, ignoring the case where the count of runs is 0
+            # build a JSON object, ignoring the case where there are no runs
             sa.case(
-                (sa.func.count(runs.c.id) == 0, None),
+                (count_runs.is_(None), None),
                 else_=db.build_json_object(
                     "state_type",
                     runs.c.state_type,
                     "state_name",
                     runs.c.state_name,
                     "count_runs",
-                    sa.func.count(runs.c.id),
-                    # estimated run times only includes positive run times (to avoid any unexpected corner cases)
+                    count_runs,
                     "sum_estimated_run_time",
-                    sa.func.sum(
-                        db.greatest(0, sa.extract("epoch", runs.c.estimated_run_time))
-                    ),
+                    sa.func.sum(runs.c.sum_estimated_run_time),
                     # estimated lateness is the sum of any positive start time deltas
                     "sum_estimated_lateness",
-                    sa.func.sum(
-                        db.greatest(
-                            0, sa.extract("epoch", runs.c.estimated_start_time_delta)
-                        )
-                    ),
+                    sa.func.sum(runs.c.sum_estimated_lateness),
                 ),
             ).label("state_agg"),
         )
@@ -163,3 +197,82 @@ async def run_history(
     return pydantic.TypeAdapter(
         List[schemas.responses.HistoryResponse]
     ).validate_python(records)
+
+
+def _can_read_rollups(
+    history_start: DateTime,
+    history_interval: datetime.timedelta,
+    flows: Optional[schemas.filters.FlowFilter],
+    flow_runs: Optional[schemas.filters.FlowRunFilter],
+    task_runs: Optional[schemas.filters.TaskRunFilter],
+    deployments: Optional[schemas.filters.DeploymentFilter],
+    work_pools: Optional[schemas.filters.WorkPoolFilter],
+    work_queues: Optional[schemas.filters.WorkQueueFilter],
+) -> bool:
+    """
+    Rollups count the runs of each flow and deployment by the hour, so they can only
+    answer queries for whole hours that filter by nothing but flow and deployment ids
+    """
+    if not PREFECT_SERVER_SERVICES_RUN_HISTORY_ROLLUPS_ENABLED.value():
+        return False
+
+    if history_interval % models.run_history_rollups.ROLLUP_INTERVAL:
+        return False
+
+    start = pendulum.instance(history_start).in_timezone("UTC")
+    if (start.minute, start.second, start.microsecond) != (0, 0, 0):
+        return False
+
+    if any(f is not None for f in (flow_runs, task_runs, work_pools, work_queues)):
+        return False
+
+    if flows is not None and flows != schemas.filters.FlowFilter(
+        id=schemas.filters.FlowFilterId(any_=flows.id.any_) if flows.id else None
+    ):
+        return False
+
+    if deployments is not None and deployments != schemas.filters.DeploymentFilter(
+        id=(
+            schemas.filters.DeploymentFilterId(any_=deployments.id.any_)
+            if deployments.id
+            else None
+        )
+    ):
+        return False
+
+    return True
+
+
+def _read_rollups(
+    db: PrefectDBInterface,
+    run_type: Literal["flow_run", "task_run"],
+    history_start: DateTime,
+    history_end: DateTime,
+    flows: Optional[schemas.filters.FlowFilter],
+    deployments: Optional[schemas.filters.DeploymentFilter],
+) -> sa.Select:
+    """
+    Selects the rolled up runs in the same shape as the runs in `run_history`, with
+    each hour standing in for the expected start times of its runs
+    """
+    query = sa.select(
+        db.RunHistoryRollup.bucket_start.label("expected_start_time"),
+        db.RunHistoryRollup.state_type,
+        db.RunHistoryRollup.state_name,
+        db.RunHistoryRollup.count_runs,
+        db.RunHistoryRollup.sum_estimated_run_time,
+        db.RunHistoryRollup.sum_estimated_lateness,
+    ).where(
+        db.RunHistoryRollup.run_type == run_type,
+        db.RunHistoryRollup.bucket_start >= history_start,
+        db.RunHistoryRollup.bucket_start < history_end,
+    )
+    if flows is not None and flows.id is not None and flows.id.any_ is not None:
+        query = query.where(db.RunHistoryRollup.flow_id.in_(flows.id.any_))
+    if (
+        deployments is not None
+        and deployments.id is not None
+        and deployments.id.any_ is not None
+    ):
+        query = query.where(db.RunHistoryRollup.deployment_id.in_(deployments.id.any_))
+    return query
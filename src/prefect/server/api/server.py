@@ -47,8 +47,11 @@ from prefect.server.events.services.actions import Actions
 from prefect.server.events.services.event_persister import EventPersister
 from prefect.server.events.services.triggers import ProactiveTriggers, ReactiveTriggers
 from prefect.server.exceptions import ObjectNotFoundError
+from prefect.server.logs import stream as logs_stream
 from prefect.server.services.task_run_recorder import TaskRunRecorder
+from prefect.server.task_queue import TaskQueueFull
 from prefect.server.utilities.database import get_dialect
+from prefect.server.utilities.pagination import InvalidCursorError
 from prefect.settings import (
     PREFECT_API_DATABASE_CONNECTION_URL,
     PREFECT_API_LOG_RETRYABLE_ERRORS,
@@ -277,6 +280,22 @@ async def prefect_object_not_found_exception_handler(
     )
 
 
+async def invalid_cursor_exception_handler(request: Request, exc: InvalidCursorError):
+    """Return 422 status code for cursors that can't be used to page"""
+    return JSONResponse(
+        content={"exception_message": str(exc)},
+        status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+    )
+
+
+async def task_queue_full_exception_handler(request: Request, exc: TaskQueueFull):
+    """Return 503 status code when a task run can't be queued, so clients retry"""
+    return JSONResponse(
+        content={"exception_message": str(exc)},
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+    )
+
+
 def create_api_app(
     dependencies: Optional[List[Depends]] = None,
     health_check_path: str = "/health",
@@ -540,6 +559,9 @@ def create_app(
         if prefect.settings.PREFECT_API_EVENTS_STREAM_OUT_ENABLED:
             service_instances.append(stream.Distributor())
 
+        if prefect.settings.PREFECT_SERVER_LOGS_STREAM_OUT_ENABLED.value():
+            service_instances.append(logs_stream.LogDistributor())
+
         # don't run services in ephemeral mode
         if not ephemeral:
             if prefect.settings.PREFECT_API_SERVICES_SCHEDULER_ENABLED.value():
@@ -554,6 +576,11 @@ def create_app(
             if prefect.settings.PREFECT_API_SERVICES_PAUSE_EXPIRATIONS_ENABLED.value():
                 service_instances.append(services.pause_expirations.FailExpiredPauses())
 
+            if prefect.settings.PREFECT_SERVER_SERVICES_RUN_HISTORY_ROLLUPS_ENABLED.value():
+                service_instances.append(
+                    services.run_history_rollups.RunHistoryRollups()
+                )
+
             if prefect.settings.PREFECT_API_SERVICES_CANCELLATION_CLEANUP_ENABLED.value():
                 service_instances.append(
                     services.cancellation_cleanup.CancellationCleanup()
@@ -634,6 +661,8 @@ def create_app(
                 RequestValidationError: validation_exception_handler,
                 sa.exc.IntegrityError: integrity_exception_handler,
                 ObjectNotFoundError: prefect_object_not_found_exception_handler,
+                InvalidCursorError: invalid_cursor_exception_handler,
+                TaskQueueFull: task_queue_full_exception_handler,
             }
         },
     )
@@ -30,10 +30,16 @@ from prefect.server.database.interface import PrefectDBInterface
 from prefect.server.orchestration import dependencies as orchestration_dependencies
 from prefect.server.orchestration.core_policy import CoreTaskPolicy
 from prefect.server.orchestration.policies import BaseOrchestrationPolicy
-from prefect.server.schemas.responses import OrchestrationResult
-from prefect.server.task_queue import MultiQueue, TaskQueue
+from prefect.server.schemas.responses import (
+    OrchestrationResult,
+    RunOrchestrationResult,
+    TaskRunPaginationResponse,
+)
+from prefect.server.task_queue import MultiQueue, TaskQueue, TaskQueueFull
 from prefect.server.utilities import subscriptions
+from prefect.server.utilities.pagination import next_cursor
 from prefect.server.utilities.server import PrefectRouter
+from prefect.settings import PREFECT_SERVER_TASKS_SCHEDULING_VISIBILITY_TIMEOUT
 
 logger = get_logger("server.api")
 
@@ -211,6 +217,42 @@ async def read_task_runs(
         )
 
 
+@router.post("/paginate")
+async def paginate_task_runs(
+    sort: schemas.sorting.TaskRunSort = Body(schemas.sorting.TaskRunSort.ID_DESC),
+    limit: int = dependencies.LimitBody(),
+    cursor: Optional[str] = Body(
+        None, description="The cursor of the page to read, or none for the first page"
+    ),
+    flows: Optional[schemas.filters.FlowFilter] = None,
+    flow_runs: Optional[schemas.filters.FlowRunFilter] = None,
+    task_runs: Optional[schemas.filters.TaskRunFilter] = None,
+    deployments: Optional[schemas.filters.DeploymentFilter] = None,
+    db: PrefectDBInterface = Depends(provide_database_interface),
+) -> TaskRunPaginationResponse:
+    """
+    Query for task runs a page at a time. Each page returns the cursor to read the
+    next page with, and reading a page costs the same no matter how deep it is.
+    """
+    async with db.session_context() as session:
+        results = await models.task_runs.read_task_runs(
+            session=session,
+            flow_filter=flows,
+            flow_run_filter=flow_runs,
+            task_run_filter=task_runs,
+            deployment_filter=deployments,
+            limit=limit,
+            sort=sort,
+            cursor=cursor or "",
+        )
+
+    return TaskRunPaginationResponse(
+        results=results,
+        limit=limit,
+        next_page=next_cursor(sort.as_sql_keyset(), results, limit),
+    )
+
+
 @router.delete("/{id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_task_run(
     task_run_id: UUID = Path(..., description="The task run id", alias="id"),
@@ -275,6 +317,53 @@ async def set_task_run_state(
     return orchestration_result
 
 
+@router.post("/set_state")
+async def set_task_run_states(
+    task_run_ids: List[UUID] = Body(
+        ..., description="The ids of the task runs to transition."
+    ),
+    state: schemas.actions.StateCreate = Body(..., description="The intended state."),
+    force: bool = Body(
+        False,
+        description=(
+            "If false, orchestration rules will be applied that may alter or prevent"
+            " the state transitions. If True, orchestration rules are not applied."
+        ),
+    ),
+    db: PrefectDBInterface = Depends(provide_database_interface),
+    orchestration_parameters: Dict[str, Any] = Depends(
+        orchestration_dependencies.provide_task_orchestration_parameters
+    ),
+) -> List[RunOrchestrationResult]:
+    """
+    Set the state of several task runs at once, invoking orchestration rules for each
+    run. Runs that do not exist are omitted from the results.
+    """
+
+    async with db.session_context(
+        begin_transaction=True, with_for_update=True
+    ) as session:
+        orchestration_results = await models.task_runs.set_task_run_states(
+            session=session,
+            task_run_ids=task_run_ids,
+            # convert to a full State object
+            state=schemas.states.State.model_validate(state),
+            force=force,
+            task_policy=CoreTaskPolicy,
+            orchestration_parameters=orchestration_parameters,
+        )
+
+    return [
+        RunOrchestrationResult(
+            id=task_run_id,
+            state=result.state,
+            status=result.status,
+            details=result.details,
+        )
+        for task_run_id, result in orchestration_results.items()
+    ]
+
+
 @router.websocket("/subscriptions/scheduled")
 async def scheduled_task_subscription(websocket: WebSocket):
     websocket = await subscriptions.accept_prefect_socket(websocket)
@@ -308,34 +397,66 @@ async def scheduled_task_subscription(websocket: WebSocket):
     logger.info(f"Task worker {client_id!r} subscribed to task keys {task_keys!r}")
 
     while True:
-        try:
-            # observe here so that all workers with active websockets are tracked
-            await models.task_workers.observe_worker(task_keys, client_id)
-            task_run = await asyncio.wait_for(subscribed_queue.get(), timeout=1)
-        except asyncio.TimeoutError:
+        # observe here so that all workers with active websockets are tracked
+        await models.task_workers.observe_worker(task_keys, client_id)
+        task_run = await subscribed_queue.get(timeout=1)
+        if not task_run:
             if not await subscriptions.still_connected(websocket):
                 await models.task_workers.forget_worker(client_id)
                 return
             continue
 
+        queue = TaskQueue.for_key(task_run.task_key)
         try:
             await websocket.send_json(task_run.model_dump(mode="json"))
 
-            acknowledgement = await websocket.receive_json()
+            acknowledgement = await _receive_acknowledgement(websocket, queue, task_run)
             ack_type = acknowledgement.get("type")
             if ack_type != "ack":
                 if ack_type == "quit":
+                    await queue.ack(task_run)
                     return await websocket.close()
 
                 raise WebSocketDisconnect(
                     code=4001, reason="Protocol violation: expected 'ack' message"
                 )
 
+            await queue.ack(task_run)
             await models.task_workers.observe_worker([task_run.task_key], client_id)
 
         except subscriptions.NORMAL_DISCONNECT_EXCEPTIONS:
             # If sending fails or pong fails, put the task back into the retry queue
-            await asyncio.shield(TaskQueue.for_key(task_run.task_key).retry(task_run))
+            try:
+                await asyncio.shield(queue.retry(task_run))
+            except TaskQueueFull:
+                # the task run stays in flight and is delivered again once its
+                # visibility timeout passes
+                logger.warning(
+                    "Retry queue for %r is full; task run %s will be delivered again"
+                    " after its visibility timeout",
+                    task_run.task_key,
+                    task_run.id,
+                )
             return
         finally:
             await models.task_workers.forget_worker(client_id)
+
+
+async def _receive_acknowledgement(
+    websocket: WebSocket, queue: TaskQueue, task_run: schemas.core.TaskRun
+) -> Dict[str, Any]:
+    """
+    Waits for the task worker to acknowledge a task run, keeping the task run from
+    being delivered again while the task worker is still connected
+    """
+    interval = PREFECT_SERVER_TASKS_SCHEDULING_VISIBILITY_TIMEOUT.value() / 2
+
+    receiving = asyncio.ensure_future(websocket.receive_json())
+    try:
+        while True:
+            done, _ = await asyncio.wait([receiving], timeout=interval.total_seconds())
+            if done:
+                return receiving.result()
+            await queue.extend(task_run)
+    finally:
+        receiving.cancel()
@@ -2,7 +2,7 @@
 Routes for interacting with work queue objects.
 """
 
-from typing import TYPE_CHECKING, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple, Type
 from uuid import UUID, uuid4
 
 import pendulum
@@ -13,10 +13,12 @@ from fastapi import (
     Depends,
     HTTPException,
     Path,
+    WebSocket,
     status,
 )
 from pydantic_extra_types.pendulum_dt import DateTime
 from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.websockets import WebSocketDisconnect
 
 import prefect.server.api.dependencies as dependencies
 import prefect.server.models as models
@@ -24,13 +26,17 @@ import prefect.server.schemas as schemas
 from prefect.server.api.validation import validate_job_variable_defaults_for_work_pool
 from prefect.server.database.dependencies import provide_database_interface
 from prefect.server.database.interface import PrefectDBInterface
+from prefect.server.flow_run_subscriptions import FlowRunSubscriptions
 from prefect.server.models.deployments import mark_deployments_ready
 from prefect.server.models.work_queues import (
     emit_work_queue_status_event,
     mark_work_queues_ready,
 )
 from prefect.server.models.workers import emit_work_pool_status_event
+from prefect.server.orchestration import dependencies as orchestration_dependencies
+from prefect.server.orchestration.policies import BaseOrchestrationPolicy
 from prefect.server.schemas.statuses import WorkQueueStatus
+from prefect.server.utilities import subscriptions
 from prefect.server.utilities.server import PrefectRouter
 
 if TYPE_CHECKING:
@@ -317,6 +323,62 @@ async def delete_work_pool(
         )
 
 
+async def _read_polled_work_queues(
+    session: AsyncSession,
+    work_pool_name: str,
+    work_queue_names: Optional[List[str]],
+    worker_lookups: WorkerLookups,
+) -> Tuple[UUID, List["ORMWorkQueue"], Optional[List[UUID]]]:
+    """
+    Reads the work pool id and the work queues polled by a worker, as well as the
+    work queue ids to filter scheduled runs by.
+    """
+    work_pool_id = await worker_lookups._get_work_pool_id_from_name(
+        session=session, work_pool_name=work_pool_name
+    )
+
+    if not work_queue_names:
+        work_queues = list(
+            await models.workers.read_work_queues(
+                session=session, work_pool_id=work_pool_id
+            )
+        )
+        # None here instructs get_scheduled_flow_runs to use the default behavior
+        # of just operating on all work queues of the pool
+        work_queue_ids = None
+    else:
+        work_queues = [
+            await worker_lookups._get_work_queue_from_name(
+                session=session,
+                work_pool_name=work_pool_name,
+                work_queue_name=name,
+            )
+            for name in work_queue_names
+        ]
+        work_queue_ids = [wq.id for wq in work_queues]
+
+    return work_pool_id, work_queues, work_queue_ids
+
+
+def _mark_polled_work_queues_ready(
+    background_tasks: BackgroundTasks, work_queues: List["ORMWorkQueue"]
+) -> None:
+    background_tasks.add_task(
+        mark_work_queues_ready,
+        polled_work_queue_ids=[
+            wq.id for wq in work_queues if wq.status != WorkQueueStatus.NOT_READY
+        ],
+        ready_work_queue_ids=[
+            wq.id for wq in work_queues if wq.status == WorkQueueStatus.NOT_READY
+        ],
+    )
+
+    background_tasks.add_task(
+        mark_deployments_ready,
+        work_queue_ids=[wq.id for wq in work_queues],
+    )
+
+
 @router.post("/{name}/get_scheduled_flow_runs")
 async def get_scheduled_flow_runs(
     background_tasks: BackgroundTasks,
@@ -338,30 +400,13 @@ async def get_scheduled_flow_runs(
     Load scheduled runs for a worker
     """
     async with db.session_context() as session:
-        work_pool_id = await worker_lookups._get_work_pool_id_from_name(
-            session=session, work_pool_name=work_pool_name
+        work_pool_id, work_queues, work_queue_ids = await _read_polled_work_queues(
+            session=session,
+            work_pool_name=work_pool_name,
+            work_queue_names=work_queue_names,
+            worker_lookups=worker_lookups,
         )
 
-        if not work_queue_names:
-            work_queues = list(
-                await models.workers.read_work_queues(
-                    session=session, work_pool_id=work_pool_id
-                )
-            )
-            # None here instructs get_scheduled_flow_runs to use the default behavior
-            # of just operating on all work queues of the pool
-            work_queue_ids = None
-        else:
-            work_queues = [
-                await worker_lookups._get_work_queue_from_name(
-                    session=session,
-                    work_pool_name=work_pool_name,
-                    work_queue_name=name,
-                )
-                for name in work_queue_names
-            ]
-            work_queue_ids = [wq.id for wq in work_queues]
-
     async with db.session_context(begin_transaction=True) as session:
         queue_response = await models.workers.get_scheduled_flow_runs(
             session=session,
@@ -372,24 +417,186 @@ async def get_scheduled_flow_runs(
             limit=limit,
         )
 
-    background_tasks.add_task(
-        mark_work_queues_ready,
-        polled_work_queue_ids=[
-            wq.id for wq in work_queues if wq.status != WorkQueueStatus.NOT_READY
-        ],
-        ready_work_queue_ids=[
-            wq.id for wq in work_queues if wq.status == WorkQueueStatus.NOT_READY
-        ],
-    )
-
-    background_tasks.add_task(
-        mark_deployments_ready,
-        work_queue_ids=[wq.id for wq in work_queues],
-    )
+    _mark_polled_work_queues_ready(background_tasks, work_queues)
 
     return queue_response
 
 
+@router.post("/{name}/claim_flow_runs")
+async def claim_flow_runs(
+    background_tasks: BackgroundTasks,
+    work_pool_name: str = Path(..., description="The work pool name", alias="name"),
+    work_queue_names: List[str] = Body(
+        None, description="The names of work pool queues"
+    ),
+    scheduled_before: DateTime = Body(
+        None, description="The maximum time to look for scheduled flow runs"
+    ),
+    scheduled_after: DateTime = Body(
+        None, description="The minimum time to look for scheduled flow runs"
+    ),
+    limit: int = dependencies.LimitBody(),
+    worker_name: Optional[str] = Body(
+        None, description="The name of the worker claiming the flow runs"
+    ),
+    worker_lookups: WorkerLookups = Depends(WorkerLookups),
+    db: PrefectDBInterface = Depends(provide_database_interface),
+    flow_policy: Type[BaseOrchestrationPolicy] = Depends(
+        orchestration_dependencies.provide_flow_policy
+    ),
+    orchestration_parameters: Dict[str, Any] = Depends(
+        orchestration_dependencies.provide_flow_orchestration_parameters
+    ),
+    api_version=Depends(dependencies.provide_request_api_version),
+) -> List[schemas.responses.WorkerFlowRunResponse]:
+    """
+    Claim scheduled runs for a worker by moving them to a Pending state. Each run is
+    claimed by only one worker, so the returned runs are ready to be submitted.
+    """
+    # pass the request version to the orchestration engine to support compatibility code
+    orchestration_parameters.update({"api-version": api_version})
+
+    async with db.session_context() as session:
+        work_pool_id, work_queues, work_queue_ids = await _read_polled_work_queues(
+            session=session,
+            work_pool_name=work_pool_name,
+            work_queue_names=work_queue_names,
+            worker_lookups=worker_lookups,
+        )
+
+    async with db.session_context(
+        begin_transaction=True, with_for_update=True
+    ) as session:
+        claimed_runs = await models.workers.claim_scheduled_flow_runs(
+            session=session,
+            work_pool_ids=[work_pool_id],
+            work_queue_ids=work_queue_ids,
+            scheduled_before=scheduled_before,
+            scheduled_after=scheduled_after,
+            limit=limit,
+            worker_name=worker_name,
+            flow_policy=flow_policy,
+            orchestration_parameters=orchestration_parameters,
+        )
+
+    _mark_polled_work_queues_ready(background_tasks, work_queues)
+
+    return claimed_runs
+
+
+async def read_flow_run_subscription(websocket: WebSocket) -> Optional[Dict[str, Any]]:
+    """
+    Accepts a websocket subscribing to scheduled flow runs and returns its subscribe
+    message, or returns None if the websocket was closed.
+    """
+    websocket = await subscriptions.accept_prefect_socket(websocket)
+    if not websocket:
+        return None
+
+    try:
+        subscription = await websocket.receive_json()
+    except subscriptions.NORMAL_DISCONNECT_EXCEPTIONS:
+        return None
+
+    if subscription.get("type") != "subscribe":
+        await websocket.close(
+            code=4001, reason="Protocol violation: expected 'subscribe' message"
+        )
+        return None
+
+    try:
+        subscription["prefetch_seconds"] = float(
+            subscription.get("prefetch_seconds") or 0
+        )
+    except (TypeError, ValueError):
+        await websocket.close(
+            code=4001, reason="Protocol violation: invalid 'prefetch_seconds'"
+        )
+        return None
+
+    return subscription
+
+
+async def stream_due_flow_runs(
+    websocket: WebSocket,
+    work_queue_ids: Iterable[UUID] = (),
+    deployment_ids: Iterable[UUID] = (),
+    prefetch_seconds: float = 0,
+) -> None:
+    """
+    Sends flow runs scheduled in the given work queues or for the given deployments
+    over the websocket as they become due, until the client disconnects.
+    """
+    with FlowRunSubscriptions.subscribe(
+        work_queue_ids=work_queue_ids,
+        deployment_ids=deployment_ids,
+        prefetch_seconds=prefetch_seconds,
+    ) as subscription:
+        while True:
+            flow_run = await subscription.next_due(timeout=1)
+            if flow_run is None:
+                if not await subscriptions.still_connected(websocket):
+                    return
+                continue
+
+            try:
+                await websocket.send_json(flow_run.model_dump(mode="json"))
+
+                acknowledgement = await websocket.receive_json()
+                ack_type = acknowledgement.get("type")
+                if ack_type != "ack":
+                    if ack_type == "quit":
+                        return await websocket.close()
+
+                    raise WebSocketDisconnect(
+                        code=4001, reason="Protocol violation: expected 'ack' message"
+                    )
+            except subscriptions.NORMAL_DISCONNECT_EXCEPTIONS:
+                return
+
+
+@router.websocket("/{name}/subscriptions/scheduled_flow_runs")
+async def scheduled_flow_run_subscription(websocket: WebSocket, name: str):
+    """
+    Pushes flow runs scheduled in a work pool's queues to a worker as they become due.
+    The subscribe message's `keys` are the names of the work queues to subscribe to,
+    or all of the work pool's queues if empty.
+
+    Only flow runs scheduled through this server are pushed, and work queues created
+    after subscribing are not included, so workers should keep polling for scheduled
+    flow runs on a longer interval.
+    """
+    subscription = await read_flow_run_subscription(websocket)
+    if subscription is None:
+        return
+
+    work_queue_names = set(subscription.get("keys") or [])
+
+    db = provide_database_interface()
+    async with db.session_context() as session:
+        work_pool = await models.workers.read_work_pool_by_name(
+            session=session, work_pool_name=name
+        )
+        work_queues = (
+            await models.workers.read_work_queues(
+                session=session, work_pool_id=work_pool.id
+            )
+            if work_pool
+            else []
+        )
+        work_queue_ids = [
+            work_queue.id
+            for work_queue in work_queues
+            if not work_queue_names or work_queue.name in work_queue_names
+        ]
+
+    await stream_due_flow_runs(
+        websocket,
+        work_queue_ids=work_queue_ids,
+        prefetch_seconds=subscription["prefetch_seconds"],
+    )
+
+
 # -----------------------------------------------------
 # --
 # --
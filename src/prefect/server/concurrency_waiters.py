@@ -0,0 +1,133 @@
+"""
+Implements in-memory FIFO queues of requests waiting for slots on global concurrency
+limits, so that waiters are woken as soon as slots are released instead of polling.
+"""
+
+import asyncio
+import threading
+from collections import deque
+from typing import Deque, Dict, Iterable, List
+from uuid import UUID
+
+
+class SlotWaiter:
+    """A request waiting in line for slots on one or more concurrency limits"""
+
+    def __init__(self, slots: int):
+        self.slots = slots
+        self.future: asyncio.Future = asyncio.get_running_loop().create_future()
+
+    def wake(self) -> None:
+        loop = self.future.get_loop()
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+
+        if running is loop:
+            self._set_result()
+        elif not loop.is_closed():
+            loop.call_soon_threadsafe(self._set_result)
+
+    def _set_result(self) -> None:
+        if not self.future.done():
+            self.future.set_result(True)
+
+
+class ConcurrencySlotWaiters:
+    """
+    Queues of waiters for each concurrency limit.
+
+    Waiters are only woken by releases handled by this server process, so they should
+    also wait with a timeout to notice slots freed by other processes or slot decay.
+    """
+
+    _queues: Dict[UUID, Deque[SlotWaiter]] = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    async def wait(
+        cls,
+        limit_ids: Iterable[UUID],
+        slots: int,
+        timeout: float,
+        first: bool = False,
+    ) -> bool:
+        """
+        Waits in line on each of the given limits until slots are released on any of
+        them or the timeout expires. Returns whether the waiter was woken.
+
+        Waiters that were already woken once and are waiting again should pass
+        `first=True` to keep their place at the front of the line.
+        """
+        limit_ids = list(limit_ids)
+        waiter = SlotWaiter(slots)
+
+        with cls._lock:
+            for limit_id in limit_ids:
+                queue = cls._queues.setdefault(limit_id, deque())
+                if first:
+                    queue.appendleft(waiter)
+                else:
+                    queue.append(waiter)
+
+        try:
+            await asyncio.wait_for(waiter.future, timeout=timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            cls._remove(waiter, limit_ids)
+
+    @classmethod
+    def notify(cls, limit_ids: Iterable[UUID], slots: int) -> None:
+        """Wakes waiters, in order, for up to the given number of released slots on
+        each limit, always waking at least the first waiter"""
+        woken: List[SlotWaiter] = []
+        with cls._lock:
+            for limit_id in limit_ids:
+                queue = cls._queues.get(limit_id)
+                remaining = slots
+                woke_first = False
+                while queue:
+                    waiter = queue[0]
+                    if waiter.future.done():
+                        queue.popleft()
+                        continue
+                    if woke_first and waiter.slots > remaining:
+                        break
+                    queue.popleft()
+                    remaining -= waiter.slots
+                    woke_first = True
+                    woken.append(waiter)
+                if queue is not None and not queue:
+                    del cls._queues[limit_id]
+
+        for waiter in woken:
+            waiter.wake()
+
+    @classmethod
+    def waiting(cls, limit_id: UUID) -> int:
+        """The number of requests waiting in line for the given limit"""
+        with cls._lock:
+            return len(cls._queues.get(limit_id, ()))
+
+    @classmethod
+    def reset(cls) -> None:
+        """A unit testing utility to reset the state of the waiter queues"""
+        with cls._lock:
+            cls._queues.clear()
+
+    @classmethod
+    def _remove(cls, waiter: SlotWaiter, limit_ids: List[UUID]) -> None:
+        with cls._lock:
+            for limit_id in limit_ids:
+                queue = cls._queues.get(limit_id)
+                if not queue:
+                    continue
+                try:
+                    queue.remove(waiter)
+                except ValueError:
+                    pass
+                if not queue:
+                    del cls._queues[limit_id]
@@ -0,0 +1,86 @@
+"""Add `task_queue_item` table
+
+Revision ID: b5f5644500d2
+Revises: 5d03c01be85e
+Create Date: 2026-10-18 13:07:47.502913
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+import prefect
+
+# revision identifiers, used by Alembic.
+revision = "b5f5644500d2"
+down_revision = "5d03c01be85e"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "task_queue_item",
+        sa.Column(
+            "id",
+            prefect.server.utilities.database.UUID(),
+            server_default=sa.text("(GEN_RANDOM_UUID())"),
+            nullable=False,
+        ),
+        sa.Column(
+            "created",
+            prefect.server.utilities.database.Timestamp(timezone=True),
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated",
+            prefect.server.utilities.database.Timestamp(timezone=True),
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+            nullable=False,
+        ),
+        sa.Column("task_key", sa.String(), nullable=False),
+        sa.Column(
+            "task_run_id", prefect.server.utilities.database.UUID(), nullable=False
+        ),
+        sa.Column("priority", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("retry", sa.Boolean(), server_default="0", nullable=False),
+        sa.Column(
+            "visible_at",
+            prefect.server.utilities.database.Timestamp(timezone=True),
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+            nullable=False,
+        ),
+        sa.Column("deliveries", sa.Integer(), server_default="0", nullable=False),
+        sa.ForeignKeyConstraint(
+            ["task_run_id"],
+            ["task_run.id"],
+            name=op.f("fk_task_queue_item__task_run_id__task_run"),
+            ondelete="cascade",
+        ),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_task_queue_item")),
+        sa.UniqueConstraint(
+            "task_run_id", name=op.f("uq_task_queue_item__task_run_id")
+        ),
+    )
+    op.create_index(
+        op.f("ix_task_queue_item__updated"),
+        "task_queue_item",
+        ["updated"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_task_queue_item__task_key_retry_priority_created",
+        "task_queue_item",
+        ["task_key", "retry", "priority", "created"],
+        unique=False,
+    )
+
+
+def downgrade():
+    op.drop_index(
+        "ix_task_queue_item__task_key_retry_priority_created",
+        table_name="task_queue_item",
+    )
+    op.drop_index(op.f("ix_task_queue_item__updated"), table_name="task_queue_item")
+    op.drop_table("task_queue_item")
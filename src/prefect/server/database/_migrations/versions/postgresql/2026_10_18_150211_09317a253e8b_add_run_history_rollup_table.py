@@ -0,0 +1,81 @@
+"""Add `run_history_rollup` table
+
+Revision ID: 09317a253e8b
+Revises: b5f5644500d2
+Create Date: 2026-10-18 15:02:11.417283
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+import prefect
+
+# revision identifiers, used by Alembic.
+revision = "09317a253e8b"
+down_revision = "b5f5644500d2"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "run_history_rollup",
+        sa.Column(
+            "id",
+            prefect.server.utilities.database.UUID(),
+            server_default=sa.text("(GEN_RANDOM_UUID())"),
+            nullable=False,
+        ),
+        sa.Column(
+            "created",
+            prefect.server.utilities.database.Timestamp(timezone=True),
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated",
+            prefect.server.utilities.database.Timestamp(timezone=True),
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+            nullable=False,
+        ),
+        sa.Column("run_type", sa.String(), nullable=False),
+        sa.Column(
+            "bucket_start",
+            prefect.server.utilities.database.Timestamp(timezone=True),
+            nullable=False,
+        ),
+        sa.Column("flow_id", prefect.server.utilities.database.UUID(), nullable=True),
+        sa.Column(
+            "deployment_id", prefect.server.utilities.database.UUID(), nullable=True
+        ),
+        sa.Column("state_type", sa.String(), nullable=True),
+        sa.Column("state_name", sa.String(), nullable=True),
+        sa.Column("count_runs", sa.Integer(), nullable=False),
+        sa.Column("sum_estimated_run_time", sa.Float(), nullable=False),
+        sa.Column("sum_estimated_lateness", sa.Float(), nullable=False),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_run_history_rollup")),
+    )
+    op.create_index(
+        op.f("ix_run_history_rollup__updated"),
+        "run_history_rollup",
+        ["updated"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_run_history_rollup__run_type_bucket_start",
+        "run_history_rollup",
+        ["run_type", "bucket_start"],
+        unique=False,
+    )
+
+
+def downgrade():
+    op.drop_index(
+        "ix_run_history_rollup__run_type_bucket_start",
+        table_name="run_history_rollup",
+    )
+    op.drop_index(
+        op.f("ix_run_history_rollup__updated"), table_name="run_history_rollup"
+    )
+    op.drop_table("run_history_rollup")
@@ -0,0 +1,89 @@
+"""Add `task_queue_item` table
+
+Revision ID: 3c841a1800a1
+Revises: a49711513ad4
+Create Date: 2026-10-18 13:05:12.117283
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+import prefect
+
+# revision identifiers, used by Alembic.
+revision = "3c841a1800a1"
+down_revision = "a49711513ad4"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "task_queue_item",
+        sa.Column(
+            "id",
+            prefect.server.utilities.database.UUID(),
+            server_default=sa.text(
+                "(\n    (\n        lower(hex(randomblob(4)))\n        || '-'\n       "
+                " || lower(hex(randomblob(2)))\n        || '-4'\n        ||"
+                " substr(lower(hex(randomblob(2))),2)\n        || '-'\n        ||"
+                " substr('89ab',abs(random()) % 4 + 1, 1)\n        ||"
+                " substr(lower(hex(randomblob(2))),2)\n        || '-'\n        ||"
+                " lower(hex(randomblob(6)))\n    )\n    )"
+            ),
+            nullable=False,
+        ),
+        sa.Column(
+            "created",
+            prefect.server.utilities.database.Timestamp(timezone=True),
+            server_default=sa.text("(strftime('%Y-%m-%d %H:%M:%f000', 'now'))"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated",
+            prefect.server.utilities.database.Timestamp(timezone=True),
+            server_default=sa.text("(strftime('%Y-%m-%d %H:%M:%f000', 'now'))"),
+            nullable=False,
+        ),
+        sa.Column("task_key", sa.String(), nullable=False),
+        sa.Column(
+            "task_run_id", prefect.server.utilities.database.UUID(), nullable=False
+        ),
+        sa.Column("priority", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("retry", sa.Boolean(), server_default="0", nullable=False),
+        sa.Column(
+            "visible_at",
+            prefect.server.utilities.database.Timestamp(timezone=True),
+            server_default=sa.text("(strftime('%Y-%m-%d %H:%M:%f000', 'now'))"),
+            nullable=False,
+        ),
+        sa.Column("deliveries", sa.Integer(), server_default="0", nullable=False),
+        sa.ForeignKeyConstraint(
+            ["task_run_id"],
+            ["task_run.id"],
+            name=op.f("fk_task_queue_item__task_run_id__task_run"),
+            ondelete="cascade",
+        ),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_task_queue_item")),
+        sa.UniqueConstraint(
+            "task_run_id", name=op.f("uq_task_queue_item__task_run_id")
+        ),
+    )
+    with op.batch_alter_table("task_queue_item", schema=None) as batch_op:
+        batch_op.create_index(
+            batch_op.f("ix_task_queue_item__updated"), ["updated"], unique=False
+        )
+        batch_op.create_index(
+            "ix_task_queue_item__task_key_retry_priority_created",
+            ["task_key", "retry", "priority", "created"],
+            unique=False,
+        )
+
+
+def downgrade():
+    with op.batch_alter_table("task_queue_item", schema=None) as batch_op:
+        batch_op.drop_index("ix_task_queue_item__task_key_retry_priority_created")
+        batch_op.drop_index(batch_op.f("ix_task_queue_item__updated"))
+
+    op.drop_table("task_queue_item")
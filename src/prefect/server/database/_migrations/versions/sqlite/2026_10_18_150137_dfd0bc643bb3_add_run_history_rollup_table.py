@@ -0,0 +1,82 @@
+"""Add `run_history_rollup` table
+
+Revision ID: dfd0bc643bb3
+Revises: 3c841a1800a1
+Create Date: 2026-10-18 15:01:37.902114
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+import prefect
+
+# revision identifiers, used by Alembic.
+revision = "dfd0bc643bb3"
+down_revision = "3c841a1800a1"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "run_history_rollup",
+        sa.Column(
+            "id",
+            prefect.server.utilities.database.UUID(),
+            server_default=sa.text(
+                "(\n    (\n        lower(hex(randomblob(4)))\n        || '-'\n       "
+                " || lower(hex(randomblob(2)))\n        || '-4'\n        ||"
+                " substr(lower(hex(randomblob(2))),2)\n        || '-'\n        ||"
+                " substr('89ab',abs(random()) % 4 + 1, 1)\n        ||"
+                " substr(lower(hex(randomblob(2))),2)\n        || '-'\n        ||"
+                " lower(hex(randomblob(6)))\n    )\n    )"
+            ),
+            nullable=False,
+        ),
+        sa.Column(
+            "created",
+            prefect.server.utilities.database.Timestamp(timezone=True),
+            server_default=sa.text("(strftime('%Y-%m-%d %H:%M:%f000', 'now'))"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated",
+            prefect.server.utilities.database.Timestamp(timezone=True),
+            server_default=sa.text("(strftime('%Y-%m-%d %H:%M:%f000', 'now'))"),
+            nullable=False,
+        ),
+        sa.Column("run_type", sa.String(), nullable=False),
+        sa.Column(
+            "bucket_start",
+            prefect.server.utilities.database.Timestamp(timezone=True),
+            nullable=False,
+        ),
+        sa.Column("flow_id", prefect.server.utilities.database.UUID(), nullable=True),
+        sa.Column(
+            "deployment_id", prefect.server.utilities.database.UUID(), nullable=True
+        ),
+        sa.Column("state_type", sa.String(), nullable=True),
+        sa.Column("state_name", sa.String(), nullable=True),
+        sa.Column("count_runs", sa.Integer(), nullable=False),
+        sa.Column("sum_estimated_run_time", sa.Float(), nullable=False),
+        sa.Column("sum_estimated_lateness", sa.Float(), nullable=False),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_run_history_rollup")),
+    )
+    with op.batch_alter_table("run_history_rollup", schema=None) as batch_op:
+        batch_op.create_index(
+            batch_op.f("ix_run_history_rollup__updated"), ["updated"], unique=False
+        )
+        batch_op.create_index(
+            "ix_run_history_rollup__run_type_bucket_start",
+            ["run_type", "bucket_start"],
+            unique=False,
+        )
+
+
+def downgrade():
+    with op.batch_alter_table("run_history_rollup", schema=None) as batch_op:
+        batch_op.drop_index("ix_run_history_rollup__run_type_bucket_start")
+        batch_op.drop_index(batch_op.f("ix_run_history_rollup__updated"))
+
+    op.drop_table("run_history_rollup")
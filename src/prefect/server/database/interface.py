@@ -165,6 +165,16 @@ class PrefectDBInterface(metaclass=DBSingleton):
         """A task run state cache orm model"""
         return orm_models.TaskRunStateCache
 
+    @property
+    def TaskQueueItem(self):
+        """A task queue item orm model"""
+        return orm_models.TaskQueueItem
+
+    @property
+    def RunHistoryRollup(self):
+        """A run history rollup orm model"""
+        return orm_models.RunHistoryRollup
+
     @property
     def Deployment(self):
         """A deployment orm model"""
@@ -362,6 +372,9 @@ class PrefectDBInterface(metaclass=DBSingleton):
     def greatest(self, *values):
         return self.queries.greatest(*values)
 
+    def truncate_to_hour(self, timestamp):
+        return self.queries.truncate_to_hour(timestamp)
+
     def make_timestamp_intervals(
         self,
         start_time: datetime.datetime,
@@ -1226,6 +1226,61 @@ class FlowRunNotificationQueue(Base):
     flow_run_state_id: Mapped[uuid.UUID]
 
 
+class TaskQueueItem(Base):
+    """
+    A background task run waiting to be delivered to a task worker, for the task
+    queues that are stored in the database
+    """
+
+    task_key: Mapped[str]
+    task_run_id: Mapped[uuid.UUID] = mapped_column(
+        sa.ForeignKey("task_run.id", ondelete="cascade")
+    )
+    priority: Mapped[int] = mapped_column(server_default="0", default=0)
+    retry: Mapped[bool] = mapped_column(server_default="0", default=False)
+    visible_at: Mapped[pendulum.DateTime] = mapped_column(
+        server_default=now(), default=lambda: pendulum.now("UTC")
+    )
+    deliveries: Mapped[int] = mapped_column(server_default="0", default=0)
+
+    __table_args__: Any = (
+        sa.UniqueConstraint("task_run_id"),
+        sa.Index(
+            "ix_task_queue_item__task_key_retry_priority_created",
+            "task_key",
+            "retry",
+            "priority",
+            "created",
+        ),
+    )
+
+
+class RunHistoryRollup(Base):
+    """
+    The number of flow or task runs in each state, for a flow and deployment, among
+    the runs expected to start in an hour, along with the sums of their run times and
+    lateness in seconds
+    """
+
+    run_type: Mapped[str]
+    bucket_start: Mapped[pendulum.DateTime]
+    flow_id: Mapped[Optional[uuid.UUID]]
+    deployment_id: Mapped[Optional[uuid.UUID]]
+    state_type: Mapped[Optional[str]]
+    state_name: Mapped[Optional[str]]
+    count_runs: Mapped[int]
+    sum_estimated_run_time: Mapped[float]
+    sum_estimated_lateness: Mapped[float]
+
+    __table_args__: Any = (
+        sa.Index(
+            "ix_run_history_rollup__run_type_bucket_start",
+            "run_type",
+            "bucket_start",
+        ),
+    )
+
+
 class Variable(Base):
     name: Mapped[str]
     value: Mapped[Optional[Any]] = mapped_column(JSON)
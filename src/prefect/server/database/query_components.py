@@ -3,6 +3,7 @@ from abc import ABC, abstractmethod, abstractproperty
 from collections import defaultdict
 from typing import (
     TYPE_CHECKING,
+    Any,
     Dict,
     Hashable,
     List,
@@ -42,12 +43,26 @@ jinja_env = Environment(
 )
 
 
+_FLOW_RUN_FIELDS = tuple(schemas.core.FlowRun.model_fields)
+
+
+def _flow_run_from_trusted_orm(flow_run: orm_models.FlowRun) -> schemas.core.FlowRun:
+    """
+    Builds a flow run schema from a flow run that was just read from the database,
+    skipping validation because every column was already typed by the ORM.
+    """
+    return schemas.core.FlowRun.model_construct(
+        **{field: getattr(flow_run, field) for field in _FLOW_RUN_FIELDS}
+    )
+
+
 class BaseQueryComponents(ABC):
     """
     Abstract base class used to inject dialect-specific SQL operations into Prefect.
     """
 
     CONFIGURATION_CACHE = TTLCache(maxsize=100, ttl=ONE_HOUR)
+    SCHEDULED_FLOW_RUNS_STATEMENTS: Dict[Tuple[Hashable, ...], sa.Select] = {}
 
     def _unique_key(self) -> Tuple[Hashable, ...]:
         """
@@ -69,6 +84,10 @@ class BaseQueryComponents(ABC):
     def least(self, *values):
         """dialect-specific SqlAlchemy binding"""
 
+    @abstractmethod
+    def truncate_to_hour(self, timestamp):
+        """truncates a timestamp to the start of its hour, in UTC"""
+
     # --- dialect-specific JSON handling
 
     @abstractproperty
@@ -310,86 +329,121 @@ class BaseQueryComponents(ABC):
         scheduled_after: Optional[datetime.datetime] = None,
         respect_queue_priorities: bool = False,
     ) -> List[schemas.responses.WorkerFlowRunResponse]:
+        query = self._get_scheduled_flow_runs_from_work_pool_statement(
+            has_work_pool_ids=bool(work_pool_ids),
+            has_work_queue_ids=bool(work_queue_ids),
+            respect_queue_priorities=respect_queue_priorities,
+            has_scheduled_before=bool(scheduled_before),
+            has_scheduled_after=bool(scheduled_after),
+        )
+
+        params: Dict[str, Any] = {
+            "limit": 1000 if limit is None else limit,
+            "worker_limit": 1000 if worker_limit is None else worker_limit,
+            "queue_limit": 1000 if queue_limit is None else queue_limit,
+        }
+
+        if scheduled_before:
+            params["scheduled_before"] = scheduled_before
+
+        if scheduled_after:
+            params["scheduled_after"] = scheduled_after
+
+        # if work pool IDs were provided, bind them
+        if work_pool_ids:
+            assert all(isinstance(i, UUID) for i in work_pool_ids)
+            params["work_pool_ids"] = work_pool_ids
+
+        # if work queue IDs were provided, bind them
+        if work_queue_ids:
+            assert all(isinstance(i, UUID) for i in work_queue_ids)
+            params["work_queue_ids"] = work_queue_ids
+
+        result = await session.execute(query, params)
+
+        return [
+            schemas.responses.WorkerFlowRunResponse.model_construct(
+                work_pool_id=r.run_work_pool_id,
+                work_queue_id=r.run_work_queue_id,
+                flow_run=_flow_run_from_trusted_orm(r.FlowRun),
+            )
+            for r in result
+        ]
+
+    def _get_scheduled_flow_runs_from_work_pool_statement(
+        self,
+        has_work_pool_ids: bool,
+        has_work_queue_ids: bool,
+        respect_queue_priorities: bool,
+        has_scheduled_before: bool,
+        has_scheduled_after: bool,
+    ) -> sa.Select:
+        """
+        Returns the statement for getting scheduled flow runs from work pools, which
+        is rendered once for each combination of options and then reused so that it
+        is only compiled once and can be prepared by the database driver.
+        """
+        key = (
+            self._get_scheduled_flow_runs_from_work_pool_template_path,
+            has_work_pool_ids,
+            has_work_queue_ids,
+            respect_queue_priorities,
+            has_scheduled_before,
+            has_scheduled_after,
+        )
+        statement = self.SCHEDULED_FLOW_RUNS_STATEMENTS.get(key)
+        if statement is not None:
+            return statement
+
         template = jinja_env.get_template(
             self._get_scheduled_flow_runs_from_work_pool_template_path
         )
 
         raw_query = sa.text(
             template.render(
-                work_pool_ids=work_pool_ids,
-                work_queue_ids=work_queue_ids,
+                work_pool_ids=has_work_pool_ids,
+                work_queue_ids=has_work_queue_ids,
                 respect_queue_priorities=respect_queue_priorities,
-                scheduled_before=scheduled_before,
-                scheduled_after=scheduled_after,
+                scheduled_before=has_scheduled_before,
+                scheduled_after=has_scheduled_after,
             )
         )
 
-        bindparams = []
+        bindparams = [
+            sa.bindparam("limit", type_=sa.Integer),
+            sa.bindparam("worker_limit", type_=sa.Integer),
+            sa.bindparam("queue_limit", type_=sa.Integer),
+        ]
 
-        if scheduled_before:
-            bindparams.append(
-                sa.bindparam("scheduled_before", scheduled_before, type_=Timestamp)
-            )
+        if has_scheduled_before:
+            bindparams.append(sa.bindparam("scheduled_before", type_=Timestamp))
 
-        if scheduled_after:
-            bindparams.append(
-                sa.bindparam("scheduled_after", scheduled_after, type_=Timestamp)
-            )
+        if has_scheduled_after:
+            bindparams.append(sa.bindparam("scheduled_after", type_=Timestamp))
 
-        # if work pool IDs were provided, bind them
-        if work_pool_ids:
-            assert all(isinstance(i, UUID) for i in work_pool_ids)
+        if has_work_pool_ids:
             bindparams.append(
-                sa.bindparam(
-                    "work_pool_ids",
-                    work_pool_ids,
-                    expanding=True,
-                    type_=UUIDTypeDecorator,
-                )
+                sa.bindparam("work_pool_ids", expanding=True, type_=UUIDTypeDecorator)
             )
 
-        # if work queue IDs were provided, bind them
-        if work_queue_ids:
-            assert all(isinstance(i, UUID) for i in work_queue_ids)
+        if has_work_queue_ids:
             bindparams.append(
-                sa.bindparam(
-                    "work_queue_ids",
-                    work_queue_ids,
-                    expanding=True,
-                    type_=UUIDTypeDecorator,
-                )
+                sa.bindparam("work_queue_ids", expanding=True, type_=UUIDTypeDecorator)
             )
 
-        query = raw_query.bindparams(
-            *bindparams,
-            limit=1000 if limit is None else limit,
-            worker_limit=1000 if worker_limit is None else worker_limit,
-            queue_limit=1000 if queue_limit is None else queue_limit,
-        )
-
-        orm_query = (
+        statement = (
             sa.select(
-                sa.column("run_work_pool_id"),
-                sa.column("run_work_queue_id"),
+                sa.column("run_work_pool_id", UUIDTypeDecorator),
+                sa.column("run_work_queue_id", UUIDTypeDecorator),
                 orm_models.FlowRun,
             )
-            .from_statement(query)
+            .from_statement(raw_query.bindparams(*bindparams))
             # indicate that the state relationship isn't being loaded
             .options(sa.orm.noload(orm_models.FlowRun.state))
         )
 
-        result = await session.execute(orm_query)
-
-        return [
-            schemas.responses.WorkerFlowRunResponse(
-                work_pool_id=r.run_work_pool_id,
-                work_queue_id=r.run_work_queue_id,
-                flow_run=schemas.core.FlowRun.model_validate(
-                    r.FlowRun, from_attributes=True
-                ),
-            )
-            for r in result
-        ]
+        self.SCHEDULED_FLOW_RUNS_STATEMENTS[key] = statement
+        return statement
 
     async def read_block_documents(
         self,
@@ -634,6 +688,14 @@ class AsyncPostgresQueryComponents(BaseQueryComponents):
     def least(self, *values):
         return sa.func.least(*values)
 
+    def truncate_to_hour(self, timestamp):
+        return sa.type_coerce(
+            sa.func.timezone(
+                "UTC", sa.func.date_trunc("hour", sa.func.timezone("UTC", timestamp))
+            ),
+            Timestamp(),
+        )
+
     # --- Postgres-specific JSON handling
 
     @property
@@ -990,6 +1052,11 @@ class AioSqliteQueryComponents(BaseQueryComponents):
     def least(self, *values):
         return sa.func.min(*values)
 
+    def truncate_to_hour(self, timestamp):
+        return sa.type_coerce(
+            sa.func.strftime("%Y-%m-%d %H:00:00.000000", timestamp), Timestamp()
+        )
+
     # --- Sqlite-specific JSON handling
 
     @property
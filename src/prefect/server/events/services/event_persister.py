@@ -4,12 +4,17 @@ storage as fast as it can.  Never gets tired.
 """
 
 import asyncio
+import time
 from contextlib import asynccontextmanager
 from datetime import timedelta
-from typing import AsyncGenerator, List, Optional
+from pathlib import Path
+from typing import AsyncGenerator, List, Optional, Union
+from uuid import uuid4
 
+import anyio
 import pendulum
 import sqlalchemy as sa
+from prometheus_client import Counter, Gauge, Histogram
 
 from prefect.logging import get_logger
 from prefect.server.database.dependencies import provide_database_interface
@@ -20,10 +25,37 @@ from prefect.settings import (
     PREFECT_API_SERVICES_EVENT_PERSISTER_BATCH_SIZE,
     PREFECT_API_SERVICES_EVENT_PERSISTER_FLUSH_INTERVAL,
     PREFECT_EVENTS_RETENTION_PERIOD,
+    PREFECT_SERVER_SERVICES_EVENT_PERSISTER_MAX_BATCH_SIZE,
+    PREFECT_SERVER_SERVICES_EVENT_PERSISTER_MAX_FLUSH_ATTEMPTS,
+    PREFECT_SERVER_SERVICES_EVENT_PERSISTER_MAX_QUEUE_SIZE,
+    PREFECT_SERVER_SERVICES_EVENT_PERSISTER_USE_COPY,
+    get_current_settings,
 )
 
 logger = get_logger(__name__)
 
+EVENT_PERSISTER_QUEUE_DEPTH = Gauge(
+    "prefect_event_persister_queue_depth",
+    "The number of events waiting to be persisted by the event persister",
+)
+EVENT_PERSISTER_FLUSH_SECONDS = Histogram(
+    "prefect_event_persister_flush_seconds",
+    "The time taken by the event persister to write a batch of events",
+)
+EVENTS_PERSISTED = Counter(
+    "prefect_events_persisted",
+    "The number of events written to the database by the event persister",
+)
+EVENT_PERSISTER_FLUSH_FAILURES = Counter(
+    "prefect_event_persister_flush_failures",
+    "The number of times the event persister failed to write a batch of events",
+)
+EVENTS_DEAD_LETTERED = Counter(
+    "prefect_events_dead_lettered",
+    "The number of events the event persister moved to its dead letter queue "
+    "because they could not be written",
+)
+
 
 class EventPersister:
     """A service that persists events to the database as they arrive."""
@@ -54,6 +86,10 @@ class EventPersister:
             flush_every=timedelta(
                 seconds=PREFECT_API_SERVICES_EVENT_PERSISTER_FLUSH_INTERVAL.value()
             ),
+            max_batch_size=PREFECT_SERVER_SERVICES_EVENT_PERSISTER_MAX_BATCH_SIZE.value(),
+            max_queue_size=PREFECT_SERVER_SERVICES_EVENT_PERSISTER_MAX_QUEUE_SIZE.value(),
+            max_flush_attempts=PREFECT_SERVER_SERVICES_EVENT_PERSISTER_MAX_FLUSH_ATTEMPTS.value(),
+            use_copy=PREFECT_SERVER_SERVICES_EVENT_PERSISTER_USE_COPY.value(),
         ) as handler:
             self.consumer_task = asyncio.create_task(self.consumer.run(handler))
             logger.debug("Event persister started")
@@ -83,33 +119,167 @@ async def create_handler(
     batch_size: int = 20,
     flush_every: timedelta = timedelta(seconds=5),
     trim_every: timedelta = timedelta(minutes=15),
+    max_batch_size: Optional[int] = None,
+    max_queue_size: int = 0,
+    max_retry_delay: timedelta = timedelta(minutes=1),
+    max_flush_attempts: int = 5,
+    dead_letter_queue_path: Union[Path, str, None] = None,
+    use_copy: bool = False,
 ) -> AsyncGenerator[MessageHandler, None]:
     """
     Set up a message handler that will accumulate and send events to
     the database every `batch_size` messages, or every `flush_every` interval to flush
     any remaining messages
+
+    While a batch fills up faster than it takes to write it, the number of messages
+    accumulated before a flush doubles, up to `max_batch_size`, and it halves again
+    once periodic flushes find fewer messages waiting. When `max_queue_size` is set,
+    the handler waits for room in the queue before accepting more messages, so that
+    a slow or unavailable database pushes back on the consumer instead of growing
+    the queue without limit.
+
+    A batch that fails to be written is held aside and retried by the periodic
+    flush, waiting twice as long after each failure, up to `max_retry_delay`. After
+    `max_flush_attempts` failures, the batches waiting to be retried are moved to the
+    dead letter queue, so that a batch that can never be written doesn't hold up the
+    events behind it. A batch the database rejects outright is split in half until
+    the events it rejects are isolated, and only those events are moved to the dead
+    letter queue.
+
+    The dead letter queue is a directory of JSON files, each holding a list of
+    serialized events, which remain there until they are removed manually.
     """
     db = provide_database_interface()
+    dead_letter_queue_path = (
+        Path(dead_letter_queue_path)
+        if dead_letter_queue_path
+        else get_current_settings().home / "dlq" / "events"
+    )
+
+    max_batch_size = max(batch_size, max_batch_size or batch_size)
+    current_batch_size = batch_size
+
+    queue: asyncio.Queue[ReceivedEvent] = asyncio.Queue(
+        maxsize=max(max_queue_size, max_batch_size) if max_queue_size else 0
+    )
+    # Batches from a failed flush, retried before any more events are taken from
+    # the queue
+    pending: List[List[ReceivedEvent]] = []
+    failed_attempts = 0
+    # When the events in the queue started accumulating
+    batch_started = time.monotonic()
+    flush_lock = asyncio.Lock()
+
+    def update_queue_depth() -> None:
+        EVENT_PERSISTER_QUEUE_DEPTH.set(
+            queue.qsize() + sum(len(batch) for batch in pending)
+        )
 
-    queue: asyncio.Queue[ReceivedEvent] = asyncio.Queue()
-
-    async def flush() -> None:
-        logger.debug(f"Persisting {queue.qsize()} events...")
+    async def write(batch: List[ReceivedEvent]) -> float:
+        logger.debug(f"Persisting {len(batch)} events...")
 
-        batch: List[ReceivedEvent] = []
+        start = time.monotonic()
+        async with db.session_context() as session:
+            await write_events(session=session, events=batch, use_copy=use_copy)
+            await session.commit()
+            logger.debug("Finished persisting events.")
 
-        while queue.qsize() > 0:
-            batch.append(await queue.get())
+        write_seconds = time.monotonic() - start
+        EVENT_PERSISTER_FLUSH_SECONDS.observe(write_seconds)
+        EVENTS_PERSISTED.inc(len(batch))
+        return write_seconds
 
+    async def send_to_dead_letter_queue(batch: List[ReceivedEvent]) -> None:
+        EVENTS_DEAD_LETTERED.inc(len(batch))
         try:
-            async with db.session_context() as session:
-                await write_events(session=session, events=batch)
-                await session.commit()
-                logger.debug("Finished persisting events.")
+            dead_letter_queue_path.mkdir(parents=True, exist_ok=True)
+            await anyio.Path(dead_letter_queue_path / f"{uuid4().hex}.json").write_text(
+                "[" + ",".join(event.model_dump_json() for event in batch) + "]"
+            )
         except Exception:
-            logger.debug("Error flushing events, restoring to queue", exc_info=True)
-            for event in batch:
-                queue.put_nowait(event)
+            logger.exception(
+                "Failed to write %s events to the dead letter queue", len(batch)
+            )
+
+    async def write_batches(batches: List[List[ReceivedEvent]]) -> Optional[float]:
+        """Writes the given batches, returning the number of seconds the writes took
+        if they all succeeded, or holding the unwritten batches for a retry"""
+        nonlocal pending, failed_attempts
+
+        write_seconds = 0.0
+        while batches:
+            batch = batches.pop(0)
+            try:
+                write_seconds += await write(batch)
+            except (sa.exc.DataError, sa.exc.IntegrityError):
+                EVENT_PERSISTER_FLUSH_FAILURES.inc()
+                if len(batch) > 1:
+                    # Retrying won't help, so find the events the database rejects
+                    middle = len(batch) // 2
+                    batches[:0] = [batch[:middle], batch[middle:]]
+                else:
+                    logger.error(
+                        "Moving event %s that the database rejected to the dead "
+                        "letter queue",
+                        batch[0].id,
+                        exc_info=True,
+                    )
+                    await send_to_dead_letter_queue(batch)
+            except Exception:
+                EVENT_PERSISTER_FLUSH_FAILURES.inc()
+                failed_attempts += 1
+                unwritten = [batch, *batches]
+                count = sum(len(batch) for batch in unwritten)
+                if failed_attempts < max_flush_attempts:
+                    logger.warning(
+                        "Error persisting %s events, will retry",
+                        count,
+                        exc_info=True,
+                    )
+                    pending = unwritten
+                    return None
+
+                logger.error(
+                    "Error persisting %s events after %s attempts, moving them to the "
+                    "dead letter queue",
+                    count,
+                    failed_attempts,
+                    exc_info=True,
+                )
+                for batch in unwritten:
+                    await send_to_dead_letter_queue(batch)
+                failed_attempts = 0
+                return None
+
+        failed_attempts = 0
+        return write_seconds
+
+    async def flush() -> Optional[float]:
+        """Writes any failed batches and then the queued events, returning the
+        number of seconds the writes took if they succeeded"""
+        nonlocal pending, batch_started
+
+        async with flush_lock:
+            try:
+                if pending:
+                    batches, pending = pending, []
+                    if await write_batches(batches) is None:
+                        return None
+
+                batch: List[ReceivedEvent] = []
+                while queue.qsize() > 0:
+                    batch.append(queue.get_nowait())
+
+                if not batch:
+                    return None
+
+                write_seconds = await write_batches([batch])
+                # The handler waits on threshold flushes, so the next batch starts
+                # filling once this write is done
+                batch_started = time.monotonic()
+                return write_seconds
+            finally:
+                update_queue_depth()
 
     async def trim() -> None:
         older_than = pendulum.now("UTC") - PREFECT_EVENTS_RETENTION_PERIOD.value()
@@ -128,10 +298,23 @@ async def create_handler(
             logger.exception("Error trimming events", exc_info=True)
 
     async def flush_periodically():
+        nonlocal current_batch_size
+
         try:
             while True:
-                await asyncio.sleep(flush_every.total_seconds())
-                if queue.qsize():
+                if pending:
+                    # Back off while the database is failing
+                    delay = min(
+                        flush_every.total_seconds() * 2 ** min(failed_attempts, 32),
+                        max(flush_every, max_retry_delay).total_seconds(),
+                    )
+                else:
+                    delay = flush_every.total_seconds()
+                await asyncio.sleep(delay)
+                if queue.qsize() < current_batch_size // 2:
+                    # Events are arriving slowly, so flush sooner
+                    current_batch_size = max(batch_size, current_batch_size // 2)
+                if queue.qsize() or pending:
                     await flush()
         except asyncio.CancelledError:
             return
@@ -145,6 +328,8 @@ async def create_handler(
             return
 
     async def message_handler(message: Message):
+        nonlocal current_batch_size
+
         if not message.data:
             return
 
@@ -158,9 +343,17 @@ async def create_handler(
         )
 
         await queue.put(event)
-
-        if queue.qsize() >= batch_size:
-            await flush()
+        update_queue_depth()
+
+        # While a failed batch is waiting to be retried, the queue fills up and
+        # pushes back on the consumer instead
+        if not pending and queue.qsize() >= current_batch_size:
+            fill_seconds = time.monotonic() - batch_started
+            write_seconds = await flush()
+            if write_seconds is not None and fill_seconds < write_seconds:
+                # Events are arriving faster than they are written, so write more of
+                # them at once
+                current_batch_size = min(max_batch_size, current_batch_size * 2)
 
     periodic_flush = asyncio.create_task(flush_periodically())
     periodic_trim = asyncio.create_task(trim_periodically())
@@ -170,5 +363,5 @@ async def create_handler(
     finally:
         periodic_flush.cancel()
         periodic_trim.cancel()
-        if queue.qsize():
+        if pending or queue.qsize():
             await flush()
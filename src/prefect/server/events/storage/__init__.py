@@ -17,8 +17,16 @@ class InvalidTokenError(ValueError):
 
 
 def to_page_token(
-    filter: "EventFilter", count: int, page_size: int, current_offset: int
+    filter: "EventFilter",
+    count: int,
+    page_size: int,
+    current_offset: int,
+    cursor: Optional[str] = None,
 ) -> Optional[str]:
+    """
+    Returns the token for the page after the current one, or None if it was the last
+    page. Backends that page with cursors include the cursor after the current page.
+    """
     if current_offset + page_size >= count:
         return None
 
@@ -29,12 +37,15 @@ def to_page_token(
                 "count": count,
                 "page_size": page_size,
                 "offset": current_offset + page_size,
+                "cursor": cursor,
             }
         ).encode()
     ).decode()
 
 
-def from_page_token(page_token: str) -> Tuple["EventFilter", int, int, int]:
+def from_page_token(
+    page_token: str,
+) -> Tuple["EventFilter", int, int, int, Optional[str]]:
     from prefect.server.events.filters import EventFilter
 
     try:
@@ -50,6 +61,7 @@ def from_page_token(page_token: str) -> Tuple["EventFilter", int, int, int]:
         parameters["count"],
         parameters["page_size"],
         parameters["offset"],
+        parameters.get("cursor"),
     )
 
 
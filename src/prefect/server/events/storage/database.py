@@ -1,4 +1,7 @@
+import datetime
+import json
 from typing import TYPE_CHECKING, Any, Dict, Generator, List, Optional, Sequence, Tuple
+from uuid import UUID
 
 import pydantic
 import sqlalchemy as sa
@@ -13,11 +16,13 @@ from prefect.server.events.filters import EventFilter, EventOrder
 from prefect.server.events.schemas.events import EventCount, ReceivedEvent
 from prefect.server.events.storage import (
     INTERACTIVE_PAGE_SIZE,
+    InvalidTokenError,
     from_page_token,
     process_time_based_counts,
     to_page_token,
 )
-from prefect.server.utilities.database import get_dialect
+from prefect.server.utilities.database import JSON, get_dialect
+from prefect.server.utilities.pagination import InvalidCursorError, Keyset, KeysetColumn
 from prefect.settings import PREFECT_API_DATABASE_CONNECTION_URL
 
 if TYPE_CHECKING:
@@ -46,9 +51,11 @@ async def query_events(
 ) -> Tuple[List[ReceivedEvent], int, Optional[str]]:
     assert isinstance(session, AsyncSession)
     count = await raw_count_events(session, filter)
-    page = await read_events(session, filter, limit=page_size, offset=0)
+    page = await read_events(session, filter, limit=page_size, cursor="")
     events = [ReceivedEvent.model_validate(e, from_attributes=True) for e in page]
-    page_token = to_page_token(filter, count, page_size, 0)
+    page_token = to_page_token(
+        filter, count, page_size, 0, cursor=_next_cursor(filter, page)
+    )
     return events, count, page_token
 
 
@@ -57,13 +64,51 @@ async def query_next_page(
     page_token: str,
 ) -> Tuple[List[ReceivedEvent], int, Optional[str]]:
     assert isinstance(session, AsyncSession)
-    filter, count, page_size, offset = from_page_token(page_token)
-    page = await read_events(session, filter, limit=page_size, offset=offset)
+    filter, count, page_size, offset, cursor = from_page_token(page_token)
+    if cursor:
+        try:
+            page = await read_events(session, filter, limit=page_size, cursor=cursor)
+        except InvalidCursorError:
+            raise InvalidTokenError("Unable to parse page token")
+    else:
+        # tokens issued before events were paged with cursors
+        page = await read_events(session, filter, limit=page_size, offset=offset)
     events = [ReceivedEvent.model_validate(e, from_attributes=True) for e in page]
-    next_token = to_page_token(filter, count, page_size, offset)
+    next_token = to_page_token(
+        filter, count, page_size, offset, cursor=_next_cursor(filter, page)
+    )
     return events, count, next_token
 
 
+def _events_keyset(
+    events_filter: EventFilter, occurred: sa.ColumnElement, id: sa.ColumnElement
+) -> Keyset:
+    descending = events_filter.order == EventOrder.DESC
+    return Keyset(
+        f"events:{events_filter.order.value}",
+        [
+            KeysetColumn(
+                occurred,
+                lambda event: event.occurred,
+                datetime.datetime,
+                descending=descending,
+            ),
+            KeysetColumn(id, lambda event: event.id, UUID, descending=descending),
+        ],
+    )
+
+
+@db_injector
+def _next_cursor(
+    db: PrefectDBInterface, events_filter: EventFilter, page: Sequence["ORMEvent"]
+) -> Optional[str]:
+    if not page:
+        return None
+    return _events_keyset(events_filter, db.Event.occurred, db.Event.id).cursor(
+        page[-1]
+    )
+
+
 async def count_events(
     session: AsyncSession,
     filter: EventFilter,
@@ -128,6 +173,7 @@ async def read_events(
     events_filter: EventFilter,
     limit: Optional[int] = None,
     offset: Optional[int] = None,
+    cursor: Optional[str] = None,
 ) -> Sequence["ORMEvent"]:
     """
     Read events from the Postgres database.
@@ -137,6 +183,8 @@ async def read_events(
         filter: filter criteria for events.
         limit: limit for the query.
         offset: offset for the query.
+        cursor: page through the events with cursors, starting after this cursor, or
+            at the first page if empty
 
     Returns:
         A list of events ORM objects.
@@ -169,16 +217,20 @@ async def read_events(
         # Create the final query from the subquery, filtering to get only rows with row_number = 1
         select_events_query = sa.select(aliased_table).where(subquery.c.row_number == 1)
 
-        # Order by the occurred timestamp
-        select_events_query = select_events_query.order_by(order(subquery.c.occurred))
+        keyset = _events_keyset(events_filter, subquery.c.occurred, subquery.c.id)
 
     else:
         # If no distinct fields are provided, create a query for all events
         select_events_query = sa.select(db.Event).where(
             sa.and_(*events_filter.build_where_clauses())
         )
-        # Order by the occurred timestamp
-        select_events_query = select_events_query.order_by(order(db.Event.occurred))
+        keyset = _events_keyset(events_filter, db.Event.occurred, db.Event.id)
+
+    # Order by the occurred timestamp, then by id so that each event has a distinct
+    # position to continue paging from
+    select_events_query = select_events_query.order_by(*keyset.order_by())
+    if cursor:
+        select_events_query = select_events_query.where(keyset.after(cursor))
 
     if limit is not None:
         limit = max(0, min(limit, events_filter.logical_limit))
@@ -192,18 +244,25 @@ async def read_events(
     return select_events_query_result.scalars().unique().all()
 
 
-async def write_events(session: AsyncSession, events: List[ReceivedEvent]) -> None:
+async def write_events(
+    session: AsyncSession, events: List[ReceivedEvent], use_copy: bool = False
+) -> None:
     """
     Write events to the database.
 
     Args:
         session: a database session
         events: the events to insert
+        use_copy: whether to write events to PostgreSQL databases with `COPY`
+            rather than `INSERT` statements; ignored for other databases
     """
     if events:
         dialect = get_dialect(PREFECT_API_DATABASE_CONNECTION_URL.value())
         if dialect.name == "postgresql":
-            await _write_postgres_events(session, events)
+            if use_copy:
+                await _copy_postgres_events(session, events)
+            else:
+                await _write_postgres_events(session, events)
         else:
             await _write_sqlite_events(session, events)
 
@@ -231,8 +290,13 @@ async def _write_sqlite_events(
         events_to_insert = [
             event for event in batch if event.id not in existing_event_ids
         ]
+        if not events_to_insert:
+            continue
+
+        # Pass rows as parameters rather than building a multi-row VALUES clause so
+        # that the statement is compiled once and executed with `executemany`
         event_rows = [event.as_database_row() for event in events_to_insert]
-        await session.execute(db.insert(db.Event).values(event_rows))
+        await session.execute(db.insert(db.Event), event_rows)
 
         resource_rows: List[Dict[str, Any]] = []
         for event in events_to_insert:
@@ -241,7 +305,7 @@ async def _write_sqlite_events(
         if not resource_rows:
             continue
 
-        await session.execute(db.insert(db.EventResource).values(resource_rows))
+        await session.execute(db.insert(db.EventResource), resource_rows)
 
 
 @db_injector
@@ -280,6 +344,111 @@ async def _write_postgres_events(
         await session.execute(db.insert(db.EventResource).values(resource_rows))
 
 
+_EVENT_COPY_COLUMNS = (
+    "id",
+    "occurred",
+    "event",
+    "resource_id",
+    "resource",
+    "related_resource_ids",
+    "related",
+    "payload",
+    "received",
+    "recorded",
+    "follows",
+)
+_EVENT_RESOURCE_COPY_COLUMNS = (
+    "occurred",
+    "resource_id",
+    "resource_role",
+    "resource",
+    "event_id",
+)
+_JSON_COPY_COLUMNS = {"resource", "related_resource_ids", "related", "payload"}
+
+
+def _as_copy_record(row: Dict[str, Any], columns: Tuple[str, ...]) -> Tuple[Any, ...]:
+    """
+    Convert a row to a record for `COPY`, which bypasses SQLAlchemy's type handling,
+    so JSON values are encoded the way the `JSON` column type would encode them
+    """
+    return tuple(
+        (
+            None
+            if row[column] is None
+            else json.dumps(JSON().process_bind_param(row[column], None))
+        )
+        if column in _JSON_COPY_COLUMNS
+        else row[column]
+        for column in columns
+    )
+
+
+@db_injector
+async def _copy_postgres_events(
+    db: PrefectDBInterface, session: AsyncSession, events: List[ReceivedEvent]
+) -> None:
+    """
+    Write events to the Postgres database with `COPY`.
+
+    `COPY` can't skip duplicate events, so events are copied into a temporary
+    staging table and inserted from there, skipping any that already exist. Their
+    resources are then copied directly into the `event_resources` table.
+
+    Args:
+        session: a Postgres events session
+        events: the events to insert
+    """
+    staging_table_name = f"{db.Event.__tablename__}_copy_staging"
+    await session.execute(
+        sa.text(
+            f"CREATE TEMPORARY TABLE IF NOT EXISTS {staging_table_name} "
+            f"(LIKE {db.Event.__tablename__} INCLUDING DEFAULTS) "
+            "ON COMMIT DELETE ROWS"
+        )
+    )
+
+    connection = await session.connection()
+    raw_connection = await connection.get_raw_connection()
+    driver_connection = raw_connection.driver_connection
+    assert driver_connection is not None, "The database connection is closed"
+
+    await driver_connection.copy_records_to_table(
+        staging_table_name,
+        records=[
+            _as_copy_record(event.as_database_row(), _EVENT_COPY_COLUMNS)
+            for event in events
+        ],
+        columns=list(_EVENT_COPY_COLUMNS),
+    )
+
+    staging_table = sa.table(
+        staging_table_name, *(sa.column(column) for column in _EVENT_COPY_COLUMNS)
+    )
+    result = await session.scalars(
+        db.insert(db.Event)
+        .from_select(list(_EVENT_COPY_COLUMNS), sa.select(*staging_table.columns))
+        .on_conflict_do_nothing()
+        .returning(db.Event.id)
+    )
+    inserted_event_ids = set(result.all())
+    await session.execute(sa.delete(staging_table))
+
+    resource_records = [
+        _as_copy_record(resource_row, _EVENT_RESOURCE_COPY_COLUMNS)
+        for event in events
+        # duplicate events already have their resources
+        if event.id in inserted_event_ids
+        for resource_row in event.as_database_resource_rows()
+    ]
+    if resource_records:
+        await driver_connection.copy_records_to_table(
+            db.EventResource.__tablename__,
+            records=resource_records,
+            columns=list(_EVENT_RESOURCE_COPY_COLUMNS),
+        )
+
+
 def get_max_query_parameters() -> int:
     dialect = get_dialect(PREFECT_API_DATABASE_CONNECTION_URL.value())
     if dialect.name == "postgresql":
@@ -4,6 +4,8 @@ to act on them based on the automations that users have set up.
 """
 
 import asyncio
+import itertools
+from collections import defaultdict
 from contextlib import AsyncExitStack, asynccontextmanager
 from datetime import timedelta
 from typing import (
@@ -11,8 +13,10 @@ from typing import (
     AsyncGenerator,
     Collection,
     Dict,
+    Iterable,
     List,
     Optional,
+    Set,
     Tuple,
 )
 from uuid import UUID
@@ -54,7 +58,7 @@ from prefect.server.events.schemas.automations import (
     TriggeredAction,
     TriggerState,
 )
-from prefect.server.events.schemas.events import ReceivedEvent
+from prefect.server.events.schemas.events import ReceivedEvent, ResourceSpecification
 from prefect.server.utilities.messaging import Message, MessageHandler
 from prefect.settings import PREFECT_EVENTS_EXPIRED_BUCKET_BUFFER
 
@@ -623,10 +627,168 @@ async def evaluate_periodically(periodic_granularity: timedelta):
             await asyncio.sleep(periodic_granularity.total_seconds())
 
 
+class _ValueIndex:
+    """Maps exact values and value prefixes to the triggers that expect them"""
+
+    def __init__(self):
+        self.exact: Dict[str, Set[TriggerID]] = defaultdict(set)
+        self.prefixes: Dict[str, Set[TriggerID]] = defaultdict(set)
+        self.prefix_lengths: Dict[int, int] = defaultdict(int)
+
+    def add(self, trigger_id: TriggerID, keys: Iterable[Tuple[str, bool]]) -> None:
+        for value, is_prefix in keys:
+            if is_prefix:
+                self.prefixes[value].add(trigger_id)
+                self.prefix_lengths[len(value)] += 1
+            else:
+                self.exact[value].add(trigger_id)
+
+    def remove(self, trigger_id: TriggerID, keys: Iterable[Tuple[str, bool]]) -> None:
+        for value, is_prefix in keys:
+            index = self.prefixes if is_prefix else self.exact
+            index[value].discard(trigger_id)
+            if not index[value]:
+                del index[value]
+            if is_prefix:
+                self.prefix_lengths[len(value)] -= 1
+                if not self.prefix_lengths[len(value)]:
+                    del self.prefix_lengths[len(value)]
+
+    def find(self, value: str) -> Iterable[Set[TriggerID]]:
+        if value in self.exact:
+            yield self.exact[value]
+        for length in self.prefix_lengths:
+            if length <= len(value) and value[:length] in self.prefixes:
+                yield self.prefixes[value[:length]]
+
+
+def _resource_id_keys(
+    specification: ResourceSpecification,
+) -> Optional[List[Tuple[str, bool]]]:
+    """The exact resource IDs and resource ID prefixes, one of which a resource must
+    have to match the given specification, or None if it may match any resource"""
+    if "prefect.resource.id" not in specification:
+        return None
+
+    keys: List[Tuple[str, bool]] = []
+    for expected in specification["prefect.resource.id"]:
+        if expected.startswith("!") or expected in ("", "*"):
+            return None
+        if expected.endswith("*"):
+            keys.append((expected[:-1], True))
+        else:
+            keys.append((expected, False))
+    return keys or None
+
+
+def _event_name_keys(trigger: EventTrigger) -> Optional[List[Tuple[str, bool]]]:
+    """The event name prefixes, one of which an event must start with to match the
+    trigger's event pattern, or None if it may match any event"""
+    if not trigger.expect:
+        return None
+
+    keys: List[Tuple[str, bool]] = []
+    for pattern in trigger.expect | trigger.after:
+        # The event pattern matches from the start of the event name, with wildcards
+        # matching any non-empty string
+        prefix = pattern.split("*", 1)[0]
+        if not prefix:
+            return None
+        keys.append((prefix, True))
+    return keys
+
+
+class TriggerIndex:
+    """
+    An inverted index of event triggers by the resource IDs, related resource IDs or
+    event names they require, used to find the few triggers that may cover an event
+    without checking every loaded trigger.
+
+    Each trigger is indexed under one of these criteria, preferring exact resource IDs
+    over prefixes, and triggers that constrain none of them are checked for every
+    event.
+    """
+
+    def __init__(self):
+        self._triggers: Dict[TriggerID, EventTrigger] = {}
+        self._order: Dict[TriggerID, int] = {}
+        self._counter = itertools.count()
+        self._resource_ids = _ValueIndex()
+        self._related_resource_ids = _ValueIndex()
+        self._event_names = _ValueIndex()
+        self._unindexed: Set[TriggerID] = set()
+        self._keys: Dict[
+            TriggerID, Tuple[Optional[_ValueIndex], List[Tuple[str, bool]]]
+        ] = {}
+
+    def add(self, trigger: EventTrigger) -> None:
+        self.remove(trigger.id)
+
+        self._triggers[trigger.id] = trigger
+        self._order[trigger.id] = next(self._counter)
+
+        dimensions = [
+            (index, keys)
+            for index, keys in (
+                (self._resource_ids, _resource_id_keys(trigger.match)),
+                (self._related_resource_ids, _resource_id_keys(trigger.match_related)),
+                (self._event_names, _event_name_keys(trigger)),
+            )
+            if keys
+        ]
+        if not dimensions:
+            self._unindexed.add(trigger.id)
+            self._keys[trigger.id] = (None, [])
+            return
+
+        # Prefer the most selective criterion, where exact values beat prefixes
+        index, keys = min(
+            dimensions,
+            key=lambda dimension: any(is_prefix for _, is_prefix in dimension[1]),
+        )
+        index.add(trigger.id, keys)
+        self._keys[trigger.id] = (index, keys)
+
+    def remove(self, trigger_id: TriggerID) -> None:
+        if trigger_id not in self._triggers:
+            return
+
+        index, keys = self._keys.pop(trigger_id)
+        if index:
+            index.remove(trigger_id, keys)
+        self._unindexed.discard(trigger_id)
+        del self._triggers[trigger_id]
+        del self._order[trigger_id]
+
+    def clear(self) -> None:
+        self.__init__()
+
+    def candidates(self, event: ReceivedEvent) -> List[EventTrigger]:
+        """The triggers that may cover the event, in the order they were added"""
+        candidate_ids: Set[TriggerID] = set(self._unindexed)
+
+        for trigger_ids in self._resource_ids.find(event.resource.id):
+            candidate_ids |= trigger_ids
+        for related in event.related:
+            for trigger_ids in self._related_resource_ids.find(related.id):
+                candidate_ids |= trigger_ids
+        for trigger_ids in self._event_names.find(event.event):
+            candidate_ids |= trigger_ids
+
+        return [
+            self._triggers[trigger_id]
+            for trigger_id in sorted(candidate_ids, key=self._order.__getitem__)
+        ]
+
+    def __len__(self) -> int:
+        return len(self._triggers)
+
+
 # The currently loaded automations for this shard, organized both by ID and by
 # account and workspace
 automations_by_id: Dict[UUID, Automation] = {}
 triggers: Dict[TriggerID, EventTrigger] = {}
+trigger_index = TriggerIndex()
 next_proactive_runs: Dict[TriggerID, DateTime] = {}
 
 # This lock governs any changes to the set of loaded automations; any routine that will
@@ -643,7 +805,7 @@ def _automations_lock() -> asyncio.Lock:
 
 
 def find_interested_triggers(event: ReceivedEvent) -> Collection[EventTrigger]:
-    candidates = triggers.values()
+    candidates = trigger_index.candidates(event)
     return [trigger for trigger in candidates if trigger.covers(event)]
 
 
@@ -662,6 +824,7 @@ def load_automation(automation: Optional[Automation]):
 
     for trigger in event_triggers:
         triggers[trigger.id] = trigger
+        trigger_index.add(trigger)
         next_proactive_runs.pop(trigger.id, None)
 
 
@@ -670,6 +833,7 @@ def forget_automation(automation_id: UUID):
     if automation := automations_by_id.pop(automation_id, None):
         for trigger in automation.triggers():
             triggers.pop(trigger.id, None)
+            trigger_index.remove(trigger.id)
             next_proactive_runs.pop(trigger.id, None)
 
 
@@ -962,6 +1126,7 @@ async def reset():
     reset_events_clock()
     automations_by_id.clear()
     triggers.clear()
+    trigger_index.clear()
     next_proactive_runs.clear()
 
 
@@ -0,0 +1,192 @@
+"""
+Implements in-memory subscriptions to scheduled flow runs, so that workers and runners
+are pushed flow runs as soon as they are due instead of having to poll for them.
+
+Subscriptions are registered in the memory of the server process that accepted the
+websocket, and flow runs are only pushed to them when they are scheduled or changed in
+that same process. With more than one server replica, a subscriber is only pushed flow
+runs handled by its replica, and continues to find the rest by polling.
+"""
+
+import asyncio
+import heapq
+import itertools
+import threading
+from contextlib import contextmanager
+from typing import Dict, Hashable, Iterable, Iterator, List, Optional, Set, Tuple
+from uuid import UUID
+
+import pendulum
+import sqlalchemy as sa
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from prefect.server.schemas.responses import DueFlowRun
+
+
+class FlowRunSubscription:
+    """
+    A subscriber's queue of scheduled flow runs, ordered by the time they are due.
+
+    Flow runs are due `prefetch_seconds` before their scheduled start time. Only the
+    earliest `max_pending` flow runs are kept, since subscribers are expected to also
+    poll for flow runs scheduled further in the future.
+    """
+
+    max_pending: int = 1000
+
+    def __init__(self, prefetch_seconds: float):
+        self.prefetch_seconds = prefetch_seconds
+        self._loop = asyncio.get_running_loop()
+        self._pending: List[Tuple[pendulum.DateTime, int, DueFlowRun]] = []
+        self._counter = itertools.count()
+        self._changed = asyncio.Event()
+
+    def push(self, flow_runs: List[DueFlowRun]) -> None:
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+
+        if running is self._loop:
+            self._push(flow_runs)
+        elif not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self._push, flow_runs)
+
+    def _push(self, flow_runs: List[DueFlowRun]) -> None:
+        now = pendulum.now("UTC")
+        for flow_run in flow_runs:
+            due = (flow_run.next_scheduled_start_time or now).subtract(
+                seconds=self.prefetch_seconds
+            )
+            heapq.heappush(self._pending, (due, next(self._counter), flow_run))
+
+        if len(self._pending) > self.max_pending:
+            # a sorted list is a valid heap
+            self._pending = heapq.nsmallest(self.max_pending, self._pending)
+
+        self._changed.set()
+
+    async def next_due(self, timeout: float) -> Optional[DueFlowRun]:
+        """
+        Waits until the next flow run is due and returns it, or returns None if no
+        flow run is due within the timeout.
+        """
+        deadline = self._loop.time() + timeout
+        while True:
+            wait = deadline - self._loop.time()
+            if self._pending:
+                due_in = (self._pending[0][0] - pendulum.now("UTC")).total_seconds()
+                if due_in <= 0:
+                    return heapq.heappop(self._pending)[2]
+                wait = min(wait, due_in)
+
+            if wait <= 0:
+                return None
+
+            self._changed.clear()
+            try:
+                await asyncio.wait_for(self._changed.wait(), timeout=wait)
+            except asyncio.TimeoutError:
+                pass
+
+
+class FlowRunSubscriptions:
+    """
+    Subscriptions to the scheduled flow runs of work queues and deployments.
+
+    Subscribers are only notified of flow runs scheduled by this server process, so
+    they should also poll for scheduled flow runs on a longer interval to find runs
+    scheduled by other processes.
+    """
+
+    _subscriptions: Dict[Hashable, Set[FlowRunSubscription]] = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    @contextmanager
+    def subscribe(
+        cls,
+        work_queue_ids: Iterable[UUID] = (),
+        deployment_ids: Iterable[UUID] = (),
+        prefetch_seconds: float = 0,
+    ) -> Iterator[FlowRunSubscription]:
+        """Subscribes to the flow runs scheduled in the given work queues or for the
+        given deployments for the duration of the context"""
+        keys = [("work_queue", id) for id in work_queue_ids] + [
+            ("deployment", id) for id in deployment_ids
+        ]
+        subscription = FlowRunSubscription(prefetch_seconds=prefetch_seconds)
+
+        with cls._lock:
+            for key in keys:
+                cls._subscriptions.setdefault(key, set()).add(subscription)
+
+        try:
+            yield subscription
+        finally:
+            with cls._lock:
+                for key in keys:
+                    subscriptions = cls._subscriptions.get(key)
+                    if subscriptions is None:
+                        continue
+                    subscriptions.discard(subscription)
+                    if not subscriptions:
+                        del cls._subscriptions[key]
+
+    @classmethod
+    def notify(cls, flow_runs: Iterable[DueFlowRun]) -> None:
+        """Passes newly scheduled flow runs to the subscriptions of their work queues
+        and deployments"""
+        if not cls._subscriptions:
+            return
+
+        notified: Dict[FlowRunSubscription, List[DueFlowRun]] = {}
+        with cls._lock:
+            for flow_run in flow_runs:
+                subscriptions: Set[FlowRunSubscription] = set()
+                if flow_run.work_queue_id:
+                    subscriptions.update(
+                        cls._subscriptions.get(
+                            ("work_queue", flow_run.work_queue_id), ()
+                        )
+                    )
+                if flow_run.deployment_id:
+                    subscriptions.update(
+                        cls._subscriptions.get(
+                            ("deployment", flow_run.deployment_id), ()
+                        )
+                    )
+                for subscription in subscriptions:
+                    notified.setdefault(subscription, []).append(flow_run)
+
+        for subscription, subscribed_flow_runs in notified.items():
+            subscription.push(subscribed_flow_runs)
+
+    @classmethod
+    def notify_after_commit(
+        cls, session: AsyncSession, flow_runs: List[DueFlowRun]
+    ) -> None:
+        """Notifies subscribers of newly scheduled flow runs once the session's
+        transaction is committed, so that the flow runs can be read by then"""
+        if not cls._subscriptions or not flow_runs:
+            return
+
+        def notify(session, **kwargs):
+            cls.notify(flow_runs)
+
+        sa.event.listen(session.sync_session, "after_commit", notify, once=True)
+
+    @classmethod
+    def subscribers(cls, work_queue_id: Optional[UUID] = None) -> int:
+        """The number of subscriptions to the given work queue, or to any work queue
+        or deployment"""
+        with cls._lock:
+            if work_queue_id:
+                return len(cls._subscriptions.get(("work_queue", work_queue_id), ()))
+            return len(set().union(*cls._subscriptions.values()))
+
+    @classmethod
+    def reset(cls) -> None:
+        """A unit testing utility to reset the state of the subscriptions"""
+        with cls._lock:
+            cls._subscriptions.clear()
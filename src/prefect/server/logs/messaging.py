@@ -0,0 +1,30 @@
+from typing import List, Sequence
+
+from pydantic import TypeAdapter
+
+from prefect.logging import get_logger
+from prefect.server.schemas.core import Log
+from prefect.server.utilities.messaging import Publisher, create_publisher
+
+logger = get_logger(__name__)
+
+LOGS_ADAPTER: TypeAdapter[List[Log]] = TypeAdapter(List[Log])
+
+
+async def publish(logs: Sequence[Log]):
+    """
+    Send the given logs via the default publisher. Logs are published together as a
+    single message, since they are created in batches.
+    """
+    if not logs:
+        return
+
+    async with create_log_publisher() as publisher:
+        await publisher.publish_data(
+            LOGS_ADAPTER.dump_json(list(logs)),
+            {"count": str(len(logs))},
+        )
+
+
+def create_log_publisher() -> Publisher:
+    return create_publisher(topic="logs", deduplicate_by=None)
@@ -0,0 +1,178 @@
+import asyncio
+from asyncio import Queue
+from contextlib import asynccontextmanager
+from typing import AsyncGenerator, AsyncIterable, Dict, Optional, Set
+
+from prefect.logging import get_logger
+from prefect.server.logs.messaging import LOGS_ADAPTER
+from prefect.server.schemas.core import Log
+from prefect.server.schemas.filters import LogFilter, Operator
+from prefect.server.utilities import messaging
+
+logger = get_logger(__name__)
+
+subscribers: Set["Queue[Log]"] = set()
+filters: Dict["Queue[Log]", LogFilter] = {}
+
+# The maximum number of logs that can be waiting for one subscriber, after which
+# new logs will be dropped
+SUBSCRIPTION_BACKLOG = 1024
+
+
+def includes(log_filter: LogFilter, log: Log) -> bool:
+    """Checks whether the given log matches the filter, like the filter's SQL would"""
+    criteria = []
+
+    if log_filter.level is not None:
+        criteria.append(
+            (log_filter.level.ge_ is None or log.level >= log_filter.level.ge_)
+            and (log_filter.level.le_ is None or log.level <= log_filter.level.le_)
+        )
+    if log_filter.timestamp is not None:
+        criteria.append(
+            (
+                log_filter.timestamp.before_ is None
+                or log.timestamp <= log_filter.timestamp.before_
+            )
+            and (
+                log_filter.timestamp.after_ is None
+                or log.timestamp >= log_filter.timestamp.after_
+            )
+        )
+    if log_filter.flow_run_id is not None:
+        criteria.append(
+            log_filter.flow_run_id.any_ is None
+            or log.flow_run_id in log_filter.flow_run_id.any_
+        )
+    if log_filter.task_run_id is not None:
+        criteria.append(
+            (
+                log_filter.task_run_id.any_ is None
+                or log.task_run_id in log_filter.task_run_id.any_
+            )
+            and (
+                log_filter.task_run_id.is_null_ is None
+                or (log.task_run_id is None) == log_filter.task_run_id.is_null_
+            )
+        )
+
+    if not criteria:
+        return True
+    return all(criteria) if log_filter.operator == Operator.and_ else any(criteria)
+
+
+@asynccontextmanager
+async def subscribed(
+    filter: LogFilter,
+) -> AsyncGenerator["Queue[Log]", None]:
+    queue: "Queue[Log]" = Queue(maxsize=SUBSCRIPTION_BACKLOG)
+
+    subscribers.add(queue)
+    filters[queue] = filter
+
+    try:
+        yield queue
+    finally:
+        subscribers.remove(queue)
+        del filters[queue]
+
+
+@asynccontextmanager
+async def logs(
+    filter: LogFilter,
+) -> AsyncGenerator[AsyncIterable[Optional[Log]], None]:
+    async with subscribed(filter) as queue:
+
+        async def consume() -> AsyncGenerator[Optional[Log], None]:
+            while True:
+                # Use a brief timeout to allow for cancellation, and yield a None to
+                # give the caller a chance to check if its client is still connected
+                try:
+                    log = await asyncio.wait_for(queue.get(), timeout=1)
+                except asyncio.TimeoutError:
+                    yield None
+                    continue
+
+                yield log
+
+        yield consume()
+
+
+@asynccontextmanager
+async def distributor() -> AsyncGenerator[messaging.MessageHandler, None]:
+    async def message_handler(message: messaging.Message):
+        assert message.data
+
+        if subscribers:
+            for log in LOGS_ADAPTER.validate_json(message.data):
+                for queue in subscribers:
+                    if not includes(filters[queue], log):
+                        continue
+
+                    try:
+                        queue.put_nowait(log)
+                    except asyncio.QueueFull:
+                        continue
+
+    yield message_handler
+
+
+_distributor_task: Optional[asyncio.Task] = None
+_distributor_started: Optional[asyncio.Event] = None
+
+
+async def start_distributor():
+    """Starts the distributor consumer as a global background task"""
+    global _distributor_task
+    global _distributor_started
+    if _distributor_task:
+        return
+
+    _distributor_started = asyncio.Event()
+    _distributor_task = asyncio.create_task(run_distributor(_distributor_started))
+    await _distributor_started.wait()
+
+
+async def stop_distributor():
+    """Stops the distributor consumer global background task"""
+    global _distributor_task
+    global _distributor_started
+    if not _distributor_task:
+        return
+
+    task = _distributor_task
+    _distributor_task = None
+    _distributor_started = None
+
+    task.cancel()
+    try:
+        await asyncio.shield(task)
+    except asyncio.CancelledError:
+        pass
+
+
+class LogDistributor:
+    name: str = "LogDistributor"
+
+    async def start(self):
+        await start_distributor()
+        try:
+            await _distributor_task
+        except asyncio.CancelledError:
+            pass
+
+    async def stop(self):
+        await stop_distributor()
+
+
+async def run_distributor(started: asyncio.Event):
+    """Runs the distributor consumer forever until it is cancelled"""
+    async with messaging.ephemeral_subscription(
+        topic="logs",
+    ) as create_consumer_kwargs:
+        started.set()
+        async with distributor() as handler:
+            consumer = messaging.create_consumer(**create_consumer_kwargs)
+            await consumer.run(
+                handler=handler,
+            )
@@ -3,11 +3,23 @@ Functions for interacting with block document ORM objects.
 Intended for internal use by the Prefect REST API.
 """
 
+import threading
 from copy import copy
-from typing import Dict, List, Optional, Sequence, Tuple, TypeVar, Union
+from typing import (
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+)
 from uuid import UUID, uuid4
 
 import sqlalchemy as sa
+from cachetools import TTLCache
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.sql import Select
 
@@ -20,11 +32,100 @@ from prefect.server.schemas.actions import BlockDocumentReferenceCreate
 from prefect.server.schemas.core import BlockDocument
 from prefect.server.schemas.filters import BlockSchemaFilter
 from prefect.server.utilities.database import UUID as UUIDTypeDecorator
+from prefect.settings import get_current_settings
 from prefect.utilities.collections import dict_to_flatdict, flatdict_to_dict
 from prefect.utilities.names import obfuscate
 
 T = TypeVar("T", bound=tuple)
 
+_block_document_cache: Optional[TTLCache] = None
+_block_document_cache_lock = threading.Lock()
+# incremented whenever the cache is cleared, so that reads which were in progress
+# during a clear don't store what they read
+_block_document_cache_generation = 0
+
+
+def _get_block_document_cache() -> Optional[TTLCache]:
+    """
+    Returns the cache of hydrated block documents for this process, or None if block
+    documents aren't cached
+    """
+    global _block_document_cache
+
+    settings = get_current_settings().server.blocks
+    if not settings.cache_enabled:
+        return None
+
+    with _block_document_cache_lock:
+        if (
+            _block_document_cache is None
+            or _block_document_cache.maxsize != settings.cache_max_size
+            or _block_document_cache.ttl != settings.cache_ttl_seconds
+        ):
+            _block_document_cache = TTLCache(
+                maxsize=settings.cache_max_size, ttl=settings.cache_ttl_seconds
+            )
+        return _block_document_cache
+
+
+def clear_block_document_cache() -> None:
+    """Drops every hydrated block document cached by this process"""
+    global _block_document_cache_generation
+
+    with _block_document_cache_lock:
+        _block_document_cache_generation += 1
+        if _block_document_cache is not None:
+            _block_document_cache.clear()
+
+
+def invalidate_block_document_cache(session: AsyncSession) -> None:
+    """
+    Drops every cached block document, as a block document, block type or block
+    schema is being written in the given session.
+
+    A hydrated block document includes the documents it references and its block
+    type, so one write can change many cached documents. The cache is cleared again
+    once the session commits or rolls back, so that documents read while the write
+    was in progress aren't kept.
+    """
+    clear_block_document_cache()
+    for identifier in ("after_commit", "after_rollback"):
+        sa.event.listen(
+            session.sync_session,
+            identifier,
+            lambda _: clear_block_document_cache(),
+            once=True,
+        )
+
+
+async def _read_cached_block_document(
+    key: Tuple,
+    read: Callable[[], Awaitable[Optional[BlockDocument]]],
+    include_secrets: bool,
+) -> Optional[BlockDocument]:
+    """
+    Reads a hydrated block document through the cache. Reads that include secrets
+    are never cached, so that unobfuscated secrets aren't kept in memory.
+    """
+    cache = _get_block_document_cache()
+    if cache is None or include_secrets:
+        return await read()
+
+    with _block_document_cache_lock:
+        block_document = cache.get(key)
+        generation = _block_document_cache_generation
+    if block_document is None:
+        block_document = await read()
+        if block_document is None:
+            return None
+        with _block_document_cache_lock:
+            # the cache was cleared while reading, so what was read may be stale
+            if generation == _block_document_cache_generation:
+                cache[key] = block_document
+
+    # callers are free to modify the documents they read
+    return block_document.model_copy(deep=True)
+
 
 async def create_block_document(
     session: AsyncSession,
@@ -138,17 +239,22 @@ async def read_block_document_by_id(
     block_document_id: UUID,
     include_secrets: bool = False,
 ) -> Union[BlockDocument, None]:
-    block_documents = await read_block_documents(
-        session=session,
-        block_document_filter=schemas.filters.BlockDocumentFilter(
-            id=dict(any_=[block_document_id]),
-            # don't apply any anonymous filtering
-            is_anonymous=None,
-        ),
-        include_secrets=include_secrets,
-        limit=1,
+    async def read() -> Optional[BlockDocument]:
+        block_documents = await read_block_documents(
+            session=session,
+            block_document_filter=schemas.filters.BlockDocumentFilter(
+                id=dict(any_=[block_document_id]),
+                # don't apply any anonymous filtering
+                is_anonymous=None,
+            ),
+            include_secrets=include_secrets,
+            limit=1,
+        )
+        return block_documents[0] if block_documents else None
+
+    return await _read_cached_block_document(
+        ("id", block_document_id), read, include_secrets
     )
-    return block_documents[0] if block_documents else None
 
 
 async def _construct_full_block_document(
@@ -247,20 +353,26 @@ async def read_block_document_by_name(
     """
     Read a block document with the given name and block type slug.
     """
-    block_documents = await read_block_documents(
-        session=session,
-        block_document_filter=schemas.filters.BlockDocumentFilter(
-            name=dict(any_=[name]),
-            # don't apply any anonymous filtering
-            is_anonymous=None,
-        ),
-        block_type_filter=schemas.filters.BlockTypeFilter(
-            slug=dict(any_=[block_type_slug])
-        ),
-        include_secrets=include_secrets,
-        limit=1,
+
+    async def read() -> Optional[BlockDocument]:
+        block_documents = await read_block_documents(
+            session=session,
+            block_document_filter=schemas.filters.BlockDocumentFilter(
+                name=dict(any_=[name]),
+                # don't apply any anonymous filtering
+                is_anonymous=None,
+            ),
+            block_type_filter=schemas.filters.BlockTypeFilter(
+                slug=dict(any_=[block_type_slug])
+            ),
+            include_secrets=include_secrets,
+            limit=1,
+        )
+        return block_documents[0] if block_documents else None
+
+    return await _read_cached_block_document(
+        ("name", block_type_slug, name), read, include_secrets
     )
-    return block_documents[0] if block_documents else None
 
 
 def _apply_block_document_filters(
@@ -459,6 +571,7 @@ async def delete_block_document(
     session: AsyncSession,
     block_document_id: UUID,
 ) -> bool:
+    invalidate_block_document_cache(session)
     query = sa.delete(orm_models.BlockDocument).where(
         orm_models.BlockDocument.id == block_document_id
     )
@@ -471,6 +584,8 @@ async def update_block_document(
     block_document_id: UUID,
     block_document: schemas.actions.BlockDocumentUpdate,
 ) -> bool:
+    invalidate_block_document_cache(session)
+
     merge_existing_data = block_document.merge_existing_data
     current_block_document = await session.get(
         orm_models.BlockDocument, block_document_id
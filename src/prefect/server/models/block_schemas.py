@@ -12,6 +12,7 @@ import sqlalchemy as sa
 from sqlalchemy import delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+import prefect.server.models as models
 from prefect.server import schemas
 from prefect.server.database import orm_models
 from prefect.server.database.dependencies import db_injector
@@ -292,6 +293,7 @@ async def delete_block_schema(session: AsyncSession, block_schema_id: UUID) -> b
     Returns:
         bool: whether or not the block schema was deleted
     """
+    models.block_documents.invalidate_block_document_cache(session)
 
     result = await session.execute(
         delete(orm_models.BlockSchema).where(
@@ -10,6 +10,7 @@ from uuid import UUID
 import sqlalchemy as sa
 from sqlalchemy.ext.asyncio import AsyncSession
 
+import prefect.server.models as models
 from prefect.server import schemas
 from prefect.server.database.dependencies import db_injector
 from prefect.server.database.interface import PrefectDBInterface
@@ -185,6 +186,8 @@ async def update_block_type(
             )
         )
 
+    models.block_documents.invalidate_block_document_cache(session)
+
     update_statement = (
         sa.update(BlockType)
         .where(BlockType.id == block_type_id)
@@ -205,6 +208,7 @@ async def delete_block_type(session: AsyncSession, block_type_id: str) -> bool:
     Returns:
         bool: True if the block type was updated
     """
+    models.block_documents.invalidate_block_document_cache(session)
 
     result = await session.execute(
         sa.delete(BlockType).where(BlockType.id == block_type_id)
@@ -4,7 +4,17 @@ Intended for internal use by the Prefect REST API.
 """
 
 import datetime
-from typing import Dict, Iterable, List, Optional, Sequence, TypeVar, cast
+from typing import (
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    cast,
+)
 from uuid import UUID, uuid4
 
 import pendulum
@@ -19,7 +29,9 @@ from prefect.server.database.dependencies import db_injector
 from prefect.server.database.interface import PrefectDBInterface
 from prefect.server.events.clients import PrefectServerEventsClient
 from prefect.server.exceptions import ObjectNotFoundError
+from prefect.server.flow_run_subscriptions import FlowRunSubscriptions
 from prefect.server.models.events import deployment_status_event
+from prefect.server.schemas.responses import DueFlowRun
 from prefect.server.schemas.statuses import DeploymentStatus
 from prefect.server.utilities.database import json_contains
 from prefect.settings import (
@@ -651,8 +663,6 @@ async def _generate_scheduled_flow_runs(
     Returns:
         a list of dictionary representations of the `FlowRun` objects to schedule
     """
-    runs = []
-
     deployment = await session.get(orm_models.Deployment, deployment_id)
 
     if not deployment:
@@ -666,29 +676,152 @@ async def _generate_scheduled_flow_runs(
         ),
     )
 
-    for deployment_schedule in active_deployment_schedules:
-        dates = []
+    return _expand_scheduled_flow_runs(
+        deployment=deployment,
+        schedules=[s.schedule for s in active_deployment_schedules],
+        start_time=start_time,
+        end_time=end_time,
+        min_time=min_time,
+        min_runs=min_runs,
+        max_runs=max_runs,
+        auto_scheduled=auto_scheduled,
+    )
+
+
+async def _read_deployments_to_schedule(
+    session: AsyncSession,
+    deployment_ids: Sequence[UUID],
+) -> List[Tuple[orm_models.Deployment, List[schemas.schedules.SCHEDULE_TYPES]]]:
+    """
+    Reads the given deployments and their active schedules with one query each, for
+    scheduling many deployments at once with `_expand_scheduled_flow_runs()`.
+
+    Args:
+        session: a database session
+        deployment_ids: the ids of the deployments to schedule
+
+    Returns:
+        each deployment that exists, in order of id, with its active schedules
+    """
+    if not deployment_ids:
+        return []
+
+    deployments = (
+        (
+            await session.execute(
+                sa.select(orm_models.Deployment)
+                .where(orm_models.Deployment.id.in_(deployment_ids))
+                .order_by(orm_models.Deployment.id)
+                # only load the fields needed to generate flow runs
+                .options(
+                    sa.orm.load_only(
+                        orm_models.Deployment.flow_id,
+                        orm_models.Deployment.version,
+                        orm_models.Deployment.work_queue_name,
+                        orm_models.Deployment.work_queue_id,
+                        orm_models.Deployment.parameters,
+                        orm_models.Deployment.infrastructure_document_id,
+                        orm_models.Deployment.tags,
+                    ),
+                    sa.orm.raiseload("*"),
+                )
+            )
+        )
+        .scalars()
+        .all()
+    )
+
+    schedules: Dict[UUID, List[schemas.schedules.SCHEDULE_TYPES]] = {
+        deployment.id: [] for deployment in deployments
+    }
+    result = await session.execute(
+        sa.select(
+            orm_models.DeploymentSchedule.deployment_id,
+            orm_models.DeploymentSchedule.schedule,
+        )
+        .where(
+            orm_models.DeploymentSchedule.deployment_id.in_(deployment_ids),
+            orm_models.DeploymentSchedule.active.is_(True),
+        )
+        .order_by(orm_models.DeploymentSchedule.updated.desc())
+    )
+    for deployment_id, schedule in result:
+        schedules[deployment_id].append(schedule)
+
+    return [(deployment, schedules[deployment.id]) for deployment in deployments]
+
 
-        # generate up to `n` dates satisfying the min of `max_runs` and `end_time`
-        for dt in deployment_schedule.schedule._get_dates_generator(
-            n=max_runs, start=start_time, end=end_time
-        ):
-            dates.append(dt)
+def _schedule_cache_key(
+    schedule: schemas.schedules.SCHEDULE_TYPES,
+) -> Optional[Hashable]:
+    """
+    Returns a key shared by schedules that generate the same dates, or `None` if the
+    schedule can't be keyed. Each deployment has its own schedule rows, so identical
+    schedules are matched by their fields rather than their ids.
+    """
+    key = (type(schedule), tuple(schedule))
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
 
-            # at any point, if we satisfy both of the minimums, we can stop
-            if len(dates) >= min_runs and dt >= (start_time + min_time):
-                break
 
-        tags = deployment.tags
-        if auto_scheduled:
-            tags = ["auto-scheduled"] + tags
+def _expand_scheduled_flow_runs(
+    deployment: orm_models.Deployment,
+    schedules: Iterable[schemas.schedules.SCHEDULE_TYPES],
+    start_time: datetime.datetime,
+    end_time: datetime.datetime,
+    min_time: datetime.timedelta,
+    min_runs: int,
+    max_runs: int,
+    auto_scheduled: bool = True,
+    dates_cache: Optional[Dict[Hashable, List[pendulum.DateTime]]] = None,
+) -> List[Dict]:
+    """
+    Generates the flow runs for a deployment's schedules, as described in
+    `_generate_scheduled_flow_runs()`.
+
+    When scheduling many deployments with the same arguments, pass the same
+    `dates_cache` to each call so that the dates of identical schedules are only
+    computed once.
+    """
+    runs = []
+
+    tags = deployment.tags
+    if auto_scheduled:
+        tags = ["auto-scheduled"] + tags
+
+    for schedule in schedules:
+        cache_key = None
+        dates = None
+        if dates_cache is not None:
+            cache_key = _schedule_cache_key(schedule)
+            if cache_key is not None:
+                dates = dates_cache.get(cache_key)
+
+        if dates is None:
+            dates = []
+
+            # generate up to `n` dates satisfying the min of `max_runs` and `end_time`
+            for dt in schedule._get_dates_generator(
+                n=max_runs, start=start_time, end=end_time
+            ):
+                dates.append(dt)
+
+                # at any point, if we satisfy both of the minimums, we can stop
+                if len(dates) >= min_runs and dt >= (start_time + min_time):
+                    break
+
+            if dates_cache is not None and cache_key is not None:
+                dates_cache[cache_key] = dates
 
         for date in dates:
             runs.append(
                 {
                     "id": uuid4(),
                     "flow_id": deployment.flow_id,
-                    "deployment_id": deployment_id,
+                    "deployment_id": deployment.id,
                     "deployment_version": deployment.version,
                     "work_queue_name": deployment.work_queue_name,
                     "work_queue_id": deployment.work_queue_id,
@@ -773,6 +906,22 @@ async def _insert_scheduled_flow_runs(
 
         await session.execute(stmt)
 
+    if FlowRunSubscriptions.subscribers():
+        inserted = set(inserted_flow_run_ids)
+        FlowRunSubscriptions.notify_after_commit(
+            session,
+            [
+                DueFlowRun(
+                    id=r["id"],
+                    deployment_id=r.get("deployment_id"),
+                    work_queue_id=r.get("work_queue_id"),
+                    next_scheduled_start_time=r.get("next_scheduled_start_time"),
+                )
+                for r in runs
+                if r["id"] in inserted
+            ],
+        )
+
     return inserted_flow_run_ids
 
 
@@ -8,6 +8,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from prefect.server import models, schemas
 from prefect.server.database.orm_models import (
+    ORMBlockDocument,
     ORMDeployment,
     ORMFlow,
     ORMFlowRun,
@@ -434,3 +435,31 @@ def _get_recent_preceding_work_pool_event_id(
         if time_since_last_event < timedelta(minutes=10)
         else None
     )
+
+
+def block_document_event(
+    block_document: ORMBlockDocument,
+    action: str,
+    occurred: pendulum.DateTime,
+) -> Event:
+    """
+    Returns the event recording that a block document was updated or deleted, which
+    clients caching block documents listen for
+    """
+    return Event(
+        occurred=occurred,
+        event=f"prefect.block-document.{action}",
+        resource={
+            "prefect.resource.id": f"prefect.block-document.{block_document.id}",
+            "prefect.resource.name": block_document.name,
+        },
+        related=[
+            {
+                "prefect.resource.id": (
+                    f"prefect.block-type.{block_document.block_type.slug}"
+                ),
+                "prefect.resource.role": "block-type",
+            }
+        ],
+        id=uuid4(),
+    )
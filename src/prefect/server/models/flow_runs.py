@@ -18,7 +18,7 @@ from typing import (
     Union,
     cast,
 )
-from uuid import UUID
+from uuid import UUID, uuid4
 
 import pendulum
 import sqlalchemy as sa
@@ -37,11 +37,15 @@ from prefect.server.exceptions import ObjectNotFoundError
 from prefect.server.orchestration.core_policy import MinimalFlowPolicy
 from prefect.server.orchestration.global_policy import GlobalFlowPolicy
 from prefect.server.orchestration.policies import BaseOrchestrationPolicy
-from prefect.server.orchestration.rules import FlowOrchestrationContext
+from prefect.server.orchestration.rules import (
+    FlowOrchestrationContext,
+    validate_proposed_states,
+)
 from prefect.server.schemas.core import TaskRunResult
 from prefect.server.schemas.graph import Graph
 from prefect.server.schemas.responses import OrchestrationResult, SetStateStatus
 from prefect.server.schemas.states import State
+from prefect.server.utilities.pagination import apply_sort
 from prefect.server.utilities.schemas import PrefectBaseModel
 from prefect.settings import (
     PREFECT_API_MAX_FLOW_RUN_GRAPH_ARTIFACTS,
@@ -285,6 +289,7 @@ async def read_flow_runs(
     offset: Optional[int] = None,
     limit: Optional[int] = None,
     sort: schemas.sorting.FlowRunSort = schemas.sorting.FlowRunSort.ID_DESC,
+    cursor: Optional[str] = None,
 ) -> Sequence[orm_models.FlowRun]:
     """
     Read flow runs.
@@ -299,20 +304,20 @@ async def read_flow_runs(
         offset: Query offset
         limit: Query limit
         sort: Query sort
+        cursor: page through the flow runs with cursors, starting after this
+            cursor, or at the first page if empty
 
     Returns:
         List[orm_models.FlowRun]: flow runs
     """
-    query = (
-        select(orm_models.FlowRun)
-        .order_by(sort.as_sql_sort())
-        .options(
-            selectinload(orm_models.FlowRun.work_queue).selectinload(
-                orm_models.WorkQueue.work_pool
-            )
+    query = select(orm_models.FlowRun).options(
+        selectinload(orm_models.FlowRun.work_queue).selectinload(
+            orm_models.WorkQueue.work_pool
         )
     )
 
+    query = apply_sort(query, sort, cursor)
+
     if columns:
         query = query.options(load_only(*columns))
 
@@ -586,6 +591,117 @@ async def set_flow_run_state(
     return result
 
 
+async def set_flow_run_states(
+    session: AsyncSession,
+    flow_run_ids: Sequence[UUID],
+    state: schemas.states.State,
+    force: bool = False,
+    flow_policy: Optional[Type[BaseOrchestrationPolicy]] = None,
+    orchestration_parameters: Optional[Dict[str, Any]] = None,
+) -> Dict[UUID, OrchestrationResult]:
+    """
+    Creates a new orchestrated state for each of the given flow runs.
+
+    Each run is orchestrated as in `set_flow_run_state` and gets its own result, but
+    all runs are locked with a single query, orchestration rules are compiled once per
+    distinct transition, and the validated states are written together.
+
+    Args:
+        session: a database session
+        flow_run_ids: the flow run ids
+        state: a flow run state model, copied for each run
+        force: if False, orchestration rules will be applied that may alter or prevent
+            the state transitions. If True, orchestration rules are not applied.
+
+    Returns:
+        OrchestrationResult objects by flow run id, omitting runs that don't exist
+    """
+    # Lock the rows in a consistent order to prevent orchestration race conditions
+    # without deadlocking concurrent bulk requests
+    query = (
+        sa.select(orm_models.FlowRun)
+        .where(orm_models.FlowRun.id.in_(set(flow_run_ids)))
+        .order_by(orm_models.FlowRun.id)
+        .options(
+            selectinload(orm_models.FlowRun.work_queue).selectinload(
+                orm_models.WorkQueue.work_pool
+            )
+        )
+        .with_for_update()
+        # refresh runs already in the session, which may have been loaded without
+        # their current state
+        .execution_options(populate_existing=True)
+    )
+    runs = (await session.execute(query)).scalars().all()
+
+    if force or flow_policy is None:
+        flow_policy = MinimalFlowPolicy
+
+    compiled_rules: Dict[Tuple[Any, Any], Tuple[List[Any], List[Any]]] = {}
+    contexts: List[FlowOrchestrationContext] = []
+
+    # apply orchestration rules for every run, write all of the new flow run states,
+    # then exit the rules in reverse order
+    async with contextlib.AsyncExitStack() as stack:
+        for run in runs:
+            initial_state = run.state.as_state() if run.state else None
+            initial_state_type = initial_state.type if initial_state else None
+            intended_transition = (initial_state_type, state.type)
+
+            if intended_transition not in compiled_rules:
+                compiled_rules[intended_transition] = (
+                    flow_policy.compile_transition_rules(*intended_transition),  # type: ignore
+                    GlobalFlowPolicy.compile_transition_rules(*intended_transition),
+                )
+            orchestration_rules, global_rules = compiled_rules[intended_transition]
+
+            proposed_state = state.model_copy(update={"id": uuid4()}, deep=True)
+            proposed_state.state_details.flow_run_id = run.id
+
+            context = FlowOrchestrationContext(
+                session=session,
+                run=run,
+                initial_state=initial_state,
+                proposed_state=proposed_state,
+            )
+
+            if orchestration_parameters is not None:
+                context.parameters = orchestration_parameters.copy()
+
+            for rule in chain(orchestration_rules, global_rules):
+                context = await stack.enter_async_context(
+                    rule(context, *intended_transition)
+                )
+
+            contexts.append(context)
+
+        await validate_proposed_states(session, contexts)
+
+    results: Dict[UUID, OrchestrationResult] = {}
+    for run, context in zip(runs, contexts):
+        if context.orchestration_error is not None:
+            logger.error(
+                "Error orchestrating flow run %s: %r",
+                run.id,
+                context.orchestration_error,
+            )
+
+        result = OrchestrationResult(
+            state=context.validated_state,
+            status=context.response_status,
+            details=context.response_details,
+        )
+
+        if result.status in (SetStateStatus.ACCEPT, SetStateStatus.REJECT):
+            await models.flow_run_notification_policies.queue_flow_run_notifications(
+                session=session, flow_run=run
+            )
+
+        results[run.id] = result
+
+    return results
+
+
 @db_injector
 async def read_flow_run_graph(
     db: PrefectDBInterface,
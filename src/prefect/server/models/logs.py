@@ -3,7 +3,7 @@ Functions for interacting with log ORM objects.
 Intended for internal use by the Prefect REST API.
 """
 
-from typing import Generator, List, Optional, Sequence, Tuple
+from typing import AsyncGenerator, Generator, List, Optional, Sequence, Tuple
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -14,6 +14,7 @@ from prefect.server.database import orm_models
 from prefect.server.database.dependencies import db_injector
 from prefect.server.database.interface import PrefectDBInterface
 from prefect.server.schemas.actions import LogCreate
+from prefect.server.utilities.pagination import apply_sort
 from prefect.utilities.collections import batched_iterable
 
 # We have a limit of 32,767 parameters at a time for a single query...
@@ -49,9 +50,15 @@ async def create_logs(
     Returns:
         None
     """
+    if not logs:
+        return
+
     try:
+        # Passing the rows as parameters rather than as a multi-row VALUES clause
+        # lets SQLAlchemy reuse the compiled statement and use the driver's bulk
+        # "executemany" path
         await session.execute(
-            db.insert(orm_models.Log).values([log.model_dump() for log in logs])
+            db.insert(orm_models.Log), [log.model_dump() for log in logs]
         )
     except RuntimeError as exc:
         if "can't create new thread at interpreter shutdown" in str(exc):
@@ -69,6 +76,7 @@ async def read_logs(
     offset: Optional[int] = None,
     limit: Optional[int] = None,
     sort: schemas.sorting.LogSort = schemas.sorting.LogSort.TIMESTAMP_ASC,
+    cursor: Optional[str] = None,
 ) -> Sequence[orm_models.Log]:
     """
     Read logs.
@@ -80,16 +88,53 @@ async def read_logs(
         offset: Query offset
         limit: Query limit
         sort: Query sort
+        cursor: page through the logs with cursors, starting after this cursor, or
+            at the first page if empty
 
     Returns:
         List[orm_models.Log]: the matching logs
     """
-    query = (
-        select(orm_models.Log).order_by(sort.as_sql_sort()).offset(offset).limit(limit)
-    )
+    query = select(orm_models.Log).offset(offset).limit(limit)
+    query = apply_sort(query, sort, cursor)
 
     if log_filter:
         query = query.where(log_filter.as_sql_filter())
 
     result = await session.execute(query)
     return result.scalars().unique().all()
+
+
+async def stream_logs(
+    session: AsyncSession,
+    log_filter: Optional[schemas.filters.LogFilter],
+    sort: schemas.sorting.LogSort = schemas.sorting.LogSort.TIMESTAMP_ASC,
+    batch_size: int = 1000,
+) -> AsyncGenerator[Sequence[orm_models.Log], None]:
+    """
+    Read logs in batches from a server-side cursor, so that any number of logs can be
+    read with a single query while only holding one batch in memory at a time.
+
+    Args:
+        session: a database session
+        log_filter: only select logs that match these filters
+        sort: Query sort
+        batch_size: the number of logs to fetch from the database at a time
+
+    Yields:
+        Sequence[orm_models.Log]: batches of the matching logs
+    """
+    query = (
+        select(orm_models.Log)
+        .order_by(sort.as_sql_sort())
+        .execution_options(yield_per=batch_size)
+    )
+
+    if log_filter:
+        query = query.where(log_filter.as_sql_filter())
+
+    result = await session.stream_scalars(query)
+    try:
+        async for batch in result.partitions():
+            yield batch
+    finally:
+        await result.close()
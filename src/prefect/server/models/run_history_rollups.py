@@ -0,0 +1,300 @@
+"""
+Functions for maintaining the run history rollups.
+
+Run history queries count runs by the hour they were expected to start in, which means
+scanning every run in the requested time range. The rollups store those counts, per
+flow, deployment and state, for each hour, so that history over whole hours can be
+read from a handful of rows instead.
+
+Only runs in a terminal state are rolled up, because the estimated run time and
+lateness of other runs grow as time passes. Runs in other states, and runs updated
+after the rollups were last refreshed, are still counted from the run tables.
+
+Deleting a run, or moving it to another hour, leaves it counted in its old hour until
+the counts of every hour are compared with their runs, see `read_miscounted_buckets`.
+"""
+
+import datetime
+from typing import List, Literal, Optional, Sequence
+
+import pendulum
+import sqlalchemy as sa
+from pydantic_extra_types.pendulum_dt import DateTime
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from prefect.server import models, schemas
+from prefect.server.database.dependencies import db_injector
+from prefect.server.database.interface import PrefectDBInterface
+from prefect.server.utilities.database import GenerateUUID, now
+
+RUN_HISTORY_ROLLUPS_CONFIGURATION_KEY = "run_history_rollups"
+
+ROLLUP_INTERVAL = datetime.timedelta(hours=1)
+
+RunType = Literal["flow_run", "task_run"]
+
+
+def _run_model(db: PrefectDBInterface, run_type: RunType):
+    if run_type == "flow_run":
+        return db.FlowRun
+    elif run_type == "task_run":
+        return db.TaskRun
+    raise ValueError(
+        f"Unknown run type {run_type!r}. Expected 'flow_run' or 'task_run'."
+    )
+
+
+def is_rolled_up(run_model, refreshed_until: DateTime):
+    """
+    Returns a clause selecting the runs that are counted by rollups that were
+    refreshed until the given time
+    """
+    return sa.and_(
+        run_model.state_type.in_(schemas.states.TERMINAL_STATES),
+        run_model.updated < refreshed_until,
+    )
+
+
+def is_not_rolled_up(run_model, refreshed_until: DateTime):
+    """
+    Returns a clause selecting the runs that are not counted by rollups that were
+    refreshed until the given time
+    """
+    return sa.or_(
+        run_model.state_type.is_(None),
+        run_model.state_type.not_in(schemas.states.TERMINAL_STATES),
+        run_model.updated >= refreshed_until,
+    )
+
+
+@db_injector
+async def read_refreshed_until(
+    db: PrefectDBInterface, session: AsyncSession
+) -> Optional[DateTime]:
+    """
+    Reads the time until which the run history rollups have been refreshed, or None if
+    they have never been refreshed
+    """
+    # read the configuration directly, as the cached configuration values aren't
+    # cleared in other processes when the rollups are refreshed
+    result = await session.execute(
+        sa.select(db.Configuration.value).where(
+            db.Configuration.key == RUN_HISTORY_ROLLUPS_CONFIGURATION_KEY
+        )
+    )
+    value = result.scalar()
+    if not value or not value.get("refreshed_until"):
+        return None
+    return pendulum.parse(value["refreshed_until"])
+
+
+async def write_refreshed_until(session: AsyncSession, refreshed_until: DateTime):
+    """Records the time until which the run history rollups have been refreshed"""
+    await models.configuration.write_configuration(
+        session=session,
+        configuration=schemas.core.Configuration(
+            key=RUN_HISTORY_ROLLUPS_CONFIGURATION_KEY,
+            value={"refreshed_until": refreshed_until.isoformat()},
+        ),
+    )
+
+
+@db_injector
+async def read_updated_until(
+    db: PrefectDBInterface,
+    session: AsyncSession,
+    run_type: RunType,
+    updated_since: Optional[DateTime],
+    limit: int,
+) -> Optional[DateTime]:
+    """
+    Reads the time until which at most `limit` runs were updated after the given
+    time, or after the earliest update if no time is given, or None if fewer runs
+    than that were updated
+    """
+    run_model = _run_model(db, run_type)
+
+    query = sa.select(run_model.updated).order_by(run_model.updated).offset(limit)
+    if updated_since is not None:
+        query = query.where(run_model.updated > updated_since)
+
+    result = await session.execute(query.limit(1))
+    return result.scalar()
+
+
+@db_injector
+async def read_stale_buckets(
+    db: PrefectDBInterface,
+    session: AsyncSession,
+    run_type: RunType,
+    updated_since: Optional[DateTime],
+    updated_before: Optional[DateTime] = None,
+) -> List[DateTime]:
+    """
+    Reads the start of each hour with runs updated between the given times, or of
+    every hour with runs if no times are given
+    """
+    run_model = _run_model(db, run_type)
+    bucket_start = db.truncate_to_hour(run_model.expected_start_time)
+
+    query = (
+        sa.select(bucket_start)
+        .where(run_model.expected_start_time.is_not(None))
+        .distinct()
+        .order_by(bucket_start)
+    )
+    if updated_since is not None:
+        query = query.where(run_model.updated >= updated_since)
+    if updated_before is not None:
+        query = query.where(run_model.updated < updated_before)
+
+    result = await session.execute(query)
+    return list(result.scalars().all())
+
+
+@db_injector
+async def read_miscounted_buckets(
+    db: PrefectDBInterface,
+    session: AsyncSession,
+    run_type: RunType,
+    refreshed_until: DateTime,
+) -> List[DateTime]:
+    """
+    Reads the start of each hour whose rollups count a different number of runs than
+    there are rolled up runs in the hour.
+
+    Deleting a run, or moving it to another hour, doesn't mark the hour it leaves as
+    updated, so these hours are only found by comparing their counts.
+    """
+    run_model = _run_model(db, run_type)
+    bucket_start = db.truncate_to_hour(run_model.expected_start_time)
+
+    result = await session.execute(
+        sa.select(bucket_start, sa.func.count(run_model.id))
+        .where(
+            run_model.expected_start_time.is_not(None),
+            is_rolled_up(run_model, refreshed_until),
+        )
+        .group_by(bucket_start)
+    )
+    run_counts = {pendulum.instance(start): count for start, count in result.all()}
+
+    result = await session.execute(
+        sa.select(
+            db.RunHistoryRollup.bucket_start,
+            sa.func.sum(db.RunHistoryRollup.count_runs),
+        )
+        .where(db.RunHistoryRollup.run_type == run_type)
+        .group_by(db.RunHistoryRollup.bucket_start)
+    )
+    rollup_counts = {pendulum.instance(start): count for start, count in result.all()}
+
+    return sorted(
+        start
+        for start in run_counts.keys() | rollup_counts.keys()
+        if run_counts.get(start) != rollup_counts.get(start)
+    )
+
+
+@db_injector
+async def refresh_buckets(
+    db: PrefectDBInterface,
+    session: AsyncSession,
+    run_type: RunType,
+    bucket_starts: Sequence[DateTime],
+    refreshed_until: DateTime,
+) -> None:
+    """
+    Recomputes the rollups of the given hours from the runs updated before the given
+    time
+    """
+    if not bucket_starts:
+        return
+
+    run_model = _run_model(db, run_type)
+
+    await session.execute(
+        sa.delete(db.RunHistoryRollup).where(
+            db.RunHistoryRollup.run_type == run_type,
+            db.RunHistoryRollup.bucket_start.in_(bucket_starts),
+        )
+    )
+
+    bucket_start = db.truncate_to_hour(run_model.expected_start_time)
+    query = sa.select(
+        # Python-side defaults are only evaluated once for an INSERT...SELECT, so
+        # generate the ids and timestamps of the rollups in the database
+        GenerateUUID().label("id"),
+        now().label("created"),
+        now().label("updated"),
+        sa.literal(run_type).label("run_type"),
+        bucket_start.label("bucket_start"),
+    )
+    if run_type == "flow_run":
+        flow_id, deployment_id = run_model.flow_id, run_model.deployment_id
+        query = query.select_from(run_model)
+    else:
+        flow_id, deployment_id = db.FlowRun.flow_id, db.FlowRun.deployment_id
+        query = query.select_from(run_model).outerjoin(
+            db.FlowRun, run_model.flow_run_id == db.FlowRun.id
+        )
+
+    query = (
+        query.add_columns(
+            flow_id.label("flow_id"),
+            deployment_id.label("deployment_id"),
+            sa.cast(run_model.state_type, sa.String).label("state_type"),
+            run_model.state_name.label("state_name"),
+            sa.func.count(run_model.id).label("count_runs"),
+            # these sums are the same as the ones computed by `run_history`
+            sa.cast(
+                sa.func.sum(
+                    db.greatest(0, sa.extract("epoch", run_model.estimated_run_time))
+                ),
+                sa.Float,
+            ).label("sum_estimated_run_time"),
+            sa.cast(
+                sa.func.sum(
+                    db.greatest(
+                        0, sa.extract("epoch", run_model.estimated_start_time_delta)
+                    )
+                ),
+                sa.Float,
+            ).label("sum_estimated_lateness"),
+        )
+        .where(
+            sa.or_(
+                *(
+                    sa.and_(
+                        run_model.expected_start_time >= start,
+                        run_model.expected_start_time < start + ROLLUP_INTERVAL,
+                    )
+                    for start in bucket_starts
+                )
+            ),
+            is_rolled_up(run_model, refreshed_until),
+        )
+        .group_by(
+            bucket_start,
+            flow_id,
+            deployment_id,
+            run_model.state_type,
+            run_model.state_name,
+        )
+    )
+
+    columns = [
+        "id",
+        "created",
+        "updated",
+        "run_type",
+        "bucket_start",
+        "flow_id",
+        "deployment_id",
+        "state_type",
+        "state_name",
+        "count_runs",
+        "sum_estimated_run_time",
+        "sum_estimated_lateness",
+    ]
+    await session.execute(sa.insert(db.RunHistoryRollup).from_select(columns, query))
@@ -4,8 +4,20 @@ Intended for internal use by the Prefect REST API.
 """
 
 import contextlib
-from typing import Any, Dict, Optional, Sequence, Type, TypeVar, Union, cast
-from uuid import UUID
+from itertools import chain
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+)
+from uuid import UUID, uuid4
 
 import pendulum
 import sqlalchemy as sa
@@ -26,8 +38,12 @@ from prefect.server.orchestration.core_policy import (
 )
 from prefect.server.orchestration.global_policy import GlobalTaskPolicy
 from prefect.server.orchestration.policies import BaseOrchestrationPolicy
-from prefect.server.orchestration.rules import TaskOrchestrationContext
+from prefect.server.orchestration.rules import (
+    TaskOrchestrationContext,
+    validate_proposed_states,
+)
 from prefect.server.schemas.responses import OrchestrationResult
+from prefect.server.utilities.pagination import apply_sort
 
 T = TypeVar("T", bound=tuple)
 
@@ -265,6 +281,7 @@ async def read_task_runs(
     offset: Optional[int] = None,
     limit: Optional[int] = None,
     sort: schemas.sorting.TaskRunSort = schemas.sorting.TaskRunSort.ID_DESC,
+    cursor: Optional[str] = None,
 ) -> Sequence[orm_models.TaskRun]:
     """
     Read task runs.
@@ -278,12 +295,14 @@ async def read_task_runs(
         offset: Query offset
         limit: Query limit
         sort: Query sort
+        cursor: page through the task runs with cursors, starting after this
+            cursor, or at the first page if empty
 
     Returns:
         List[orm_models.TaskRun]: the task runs
     """
 
-    query = select(orm_models.TaskRun).order_by(sort.as_sql_sort())
+    query = apply_sort(select(orm_models.TaskRun), sort, cursor)
 
     query = await _apply_task_run_filters(
         query,
@@ -487,6 +506,101 @@ async def set_task_run_state(
     return result
 
 
+async def set_task_run_states(
+    session: AsyncSession,
+    task_run_ids: Sequence[UUID],
+    state: schemas.states.State,
+    force: bool = False,
+    task_policy: Optional[Type[BaseOrchestrationPolicy]] = None,
+    orchestration_parameters: Optional[Dict[str, Any]] = None,
+) -> Dict[UUID, OrchestrationResult]:
+    """
+    Creates a new orchestrated state for each of the given task runs.
+
+    Each run is orchestrated as in `set_task_run_state` and gets its own result, but
+    all runs are read with a single query, orchestration rules are compiled once per
+    distinct transition, and the validated states are written together.
+
+    Args:
+        session: a database session
+        task_run_ids: the task run ids
+        state: a task run state model, copied for each run
+        force: if False, orchestration rules will be applied that may alter or prevent
+            the state transitions. If True, orchestration rules are not applied.
+
+    Returns:
+        OrchestrationResult objects by task run id, omitting runs that don't exist
+    """
+    query = (
+        sa.select(orm_models.TaskRun)
+        .where(orm_models.TaskRun.id.in_(set(task_run_ids)))
+        .order_by(orm_models.TaskRun.id)
+    )
+    runs = (await session.execute(query)).scalars().all()
+
+    if state.state_details.deferred:
+        task_policy = BackgroundTaskPolicy  # CoreTaskPolicy + prevent `Running` -> `Running` transition
+    elif force or task_policy is None:
+        task_policy = MinimalTaskPolicy
+
+    compiled_rules: Dict[Tuple[Any, Any], Tuple[List[Any], List[Any]]] = {}
+    contexts: List[TaskOrchestrationContext] = []
+
+    # apply orchestration rules for every run, write all of the new task run states,
+    # then exit the rules in reverse order
+    async with contextlib.AsyncExitStack() as stack:
+        for run in runs:
+            initial_state = run.state.as_state() if run.state else None
+            initial_state_type = initial_state.type if initial_state else None
+            intended_transition = (initial_state_type, state.type)
+
+            if intended_transition not in compiled_rules:
+                compiled_rules[intended_transition] = (
+                    task_policy.compile_transition_rules(*intended_transition),  # type: ignore
+                    GlobalTaskPolicy.compile_transition_rules(*intended_transition),
+                )
+            orchestration_rules, global_rules = compiled_rules[intended_transition]
+
+            proposed_state = state.model_copy(update={"id": uuid4()}, deep=True)
+            proposed_state.state_details.task_run_id = run.id
+
+            context = TaskOrchestrationContext(
+                session=session,
+                run=run,
+                initial_state=initial_state,
+                proposed_state=proposed_state,
+            )
+
+            if orchestration_parameters is not None:
+                context.parameters = orchestration_parameters.copy()
+
+            for rule in chain(orchestration_rules, global_rules):
+                context = await stack.enter_async_context(
+                    rule(context, *intended_transition)
+                )
+
+            contexts.append(context)
+
+        await validate_proposed_states(session, contexts)
+
+    results: Dict[UUID, OrchestrationResult] = {}
+    for run, context in zip(runs, contexts):
+        if context.orchestration_error is not None:
+            logger.error(
+                "Error orchestrating task run %s: %r",
+                run.id,
+                context.orchestration_error,
+            )
+
+        results[run.id] = OrchestrationResult(
+            state=context.validated_state,
+            status=context.response_status,
+            details=context.response_details,
+        )
+
+    return results
+
+
 async def with_system_labels_for_task_run(
     session: AsyncSession,
     task_run: schemas.core.TaskRun,
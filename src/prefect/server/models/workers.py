@@ -5,12 +5,14 @@ Intended for internal use by the Prefect REST API.
 
 import datetime
 from typing import (
+    Any,
     Awaitable,
     Callable,
     Dict,
     List,
     Optional,
     Sequence,
+    Type,
     Union,
 )
 from uuid import UUID, uuid4
@@ -20,6 +22,7 @@ import sqlalchemy as sa
 from sqlalchemy import delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+import prefect.server.models as models
 import prefect.server.schemas as schemas
 from prefect.server.database import orm_models
 from prefect.server.database.dependencies import db_injector
@@ -27,6 +30,8 @@ from prefect.server.database.interface import PrefectDBInterface
 from prefect.server.events.clients import PrefectServerEventsClient
 from prefect.server.exceptions import ObjectNotFoundError
 from prefect.server.models.events import work_pool_status_event
+from prefect.server.orchestration.policies import BaseOrchestrationPolicy
+from prefect.server.schemas.responses import SetStateStatus
 from prefect.server.schemas.statuses import WorkQueueStatus
 from prefect.server.utilities.database import UUID as PrefectUUID
 
@@ -328,6 +333,93 @@ async def get_scheduled_flow_runs(
     )
 
 
+async def claim_scheduled_flow_runs(
+    session: AsyncSession,
+    work_pool_ids: Optional[List[UUID]] = None,
+    work_queue_ids: Optional[List[UUID]] = None,
+    scheduled_before: Optional[datetime.datetime] = None,
+    scheduled_after: Optional[datetime.datetime] = None,
+    limit: Optional[int] = None,
+    respect_queue_priorities: Optional[bool] = None,
+    worker_name: Optional[str] = None,
+    flow_policy: Optional[Type[BaseOrchestrationPolicy]] = None,
+    orchestration_parameters: Optional[Dict[str, Any]] = None,
+) -> List[schemas.responses.WorkerFlowRunResponse]:
+    """
+    Claim runs from queues in a specific work pool by moving them to a Pending state.
+
+    The scheduled runs are selected as in `get_scheduled_flow_runs` and proposed a
+    Pending state in the same transaction. On PostgreSQL, the runs are locked with
+    `FOR UPDATE SKIP LOCKED` so that concurrent claims select different runs, and on
+    SQLite the session's transaction should be begun with `with_for_update=True` so
+    that claims are serialized. Only runs that were moved to Pending are returned.
+
+    Args:
+        session (AsyncSession): a database session
+        work_pool_ids (List[UUID]): a list of work pool ids
+        work_queue_ids (List[UUID]): a list of work pool queue ids
+        scheduled_before (datetime.datetime): a datetime to filter runs scheduled before
+        scheduled_after (datetime.datetime): a datetime to filter runs scheduled after
+        limit (int): the maximum number of runs to claim
+        respect_queue_priorities (bool): whether or not to respect queue priorities
+        worker_name (str): the name of the claiming worker, recorded on the
+            Pending state
+        flow_policy: the orchestration policy to apply to the Pending transitions
+        orchestration_parameters: parameters for the orchestration rules
+
+    Returns:
+        List[WorkerFlowRunResponse]: the claimed runs, with their Pending states
+    """
+    scheduled_runs = await get_scheduled_flow_runs(
+        session=session,
+        work_pool_ids=work_pool_ids,
+        work_queue_ids=work_queue_ids,
+        scheduled_before=scheduled_before,
+        scheduled_after=scheduled_after,
+        limit=limit,
+        respect_queue_priorities=respect_queue_priorities,
+    )
+    if not scheduled_runs:
+        return []
+
+    orchestration_results = await models.flow_runs.set_flow_run_states(
+        session=session,
+        flow_run_ids=[run.flow_run.id for run in scheduled_runs],
+        state=schemas.states.Pending(
+            message=f"Claimed by worker {worker_name!r}" if worker_name else None
+        ),
+        flow_policy=flow_policy,
+        orchestration_parameters=orchestration_parameters,
+    )
+
+    claimed_runs = []
+    for run in scheduled_runs:
+        result = orchestration_results.get(run.flow_run.id)
+        if (
+            result is None
+            or result.status != SetStateStatus.ACCEPT
+            or result.state is None
+        ):
+            continue
+
+        claimed_runs.append(
+            schemas.responses.WorkerFlowRunResponse.model_construct(
+                work_pool_id=run.work_pool_id,
+                work_queue_id=run.work_queue_id,
+                flow_run=run.flow_run.model_copy(
+                    update={
+                        "state": result.state,
+                        "state_id": result.state.id,
+                        "state_type": result.state.type,
+                        "state_name": result.state.name,
+                    }
+                ),
+            )
+        )
+
+    return claimed_runs
+
+
 # -----------------------------------------------------
 # --
 # --
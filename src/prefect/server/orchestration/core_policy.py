@@ -31,7 +31,7 @@ from prefect.server.orchestration.rules import (
 )
 from prefect.server.schemas import core, filters, states
 from prefect.server.schemas.states import StateType
-from prefect.server.task_queue import TaskQueue
+from prefect.server.task_queue import TaskQueue, get_task_run_priority
 from prefect.settings import (
     PREFECT_DEPLOYMENT_CONCURRENCY_SLOT_WAIT_SECONDS,
     PREFECT_TASK_RUN_TAG_CONCURRENCY_SLOT_WAIT_SECONDS,
@@ -682,9 +682,13 @@ class EnqueueScheduledTasks(BaseOrchestrationRule):
         queue: TaskQueue = TaskQueue.for_key(task_run.task_key)
 
         if validated_state.name == "AwaitingRetry":
-            await queue.retry(task_run)
+            await queue.retry(task_run, session=context.session)
         else:
-            await queue.enqueue(task_run)
+            await queue.put(
+                task_run,
+                priority=get_task_run_priority(task_run),
+                session=context.session,
+            )
 
 
 class RenameReruns(BaseOrchestrationRule):
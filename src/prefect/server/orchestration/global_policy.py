@@ -12,6 +12,7 @@ state database, they should be the most deeply nested contexts in orchestration
 from packaging.version import Version
 
 import prefect.server.models as models
+from prefect.server.flow_run_subscriptions import FlowRunSubscriptions
 from prefect.server.orchestration.policies import BaseOrchestrationPolicy
 from prefect.server.orchestration.rules import (
     BaseUniversalTransform,
@@ -20,6 +21,7 @@ from prefect.server.orchestration.rules import (
     TaskOrchestrationContext,
 )
 from prefect.server.schemas.core import FlowRunPolicy
+from prefect.server.schemas.responses import DueFlowRun
 
 
 def COMMON_GLOBAL_TRANSFORMS():
@@ -51,6 +53,7 @@ class GlobalFlowPolicy(BaseOrchestrationPolicy):
             UpdateSubflowStateDetails,
             IncrementFlowRunCount,
             RemoveResumingIndicator,
+            NotifyFlowRunSubscribers,
         ]
 
 
@@ -271,6 +274,33 @@ class SetNextScheduledStartTime(BaseUniversalTransform):
             )
 
 
+class NotifyFlowRunSubscribers(BaseUniversalTransform):
+    """
+    Pushes a run to subscribed workers and runners when it enters a scheduled state.
+    """
+
+    async def after_transition(self, context: OrchestrationContext) -> None:
+        if self.nullified_transition():
+            return
+
+        if not context.validated_state or not context.validated_state.is_scheduled():
+            return
+
+        FlowRunSubscriptions.notify_after_commit(
+            context.session,
+            [
+                DueFlowRun(
+                    id=context.run.id,
+                    deployment_id=context.run.deployment_id,
+                    work_queue_id=context.run.work_queue_id,
+                    next_scheduled_start_time=(
+                        context.validated_state.state_details.scheduled_time
+                    ),
+                )
+            ],
+        )
+
+
 class UpdateSubflowParentTask(BaseUniversalTransform):
     """
     Whenever a subflow changes state, it must update its parent task run's state.
@@ -13,6 +13,13 @@ mechanism to configure and observe exactly what logic will fire against a transi
 """
 
 from abc import ABC, abstractmethod
+from types import MappingProxyType
+from typing import Any, Mapping, Optional, Tuple, Type
+
+from prefect.server.orchestration.rules import ALL_ORCHESTRATION_STATES
+from prefect.server.schemas import states
+
+Transition = Tuple[Optional[states.StateType], Optional[states.StateType]]
 
 
 class BaseOrchestrationPolicy(ABC):
@@ -22,6 +29,9 @@ class BaseOrchestrationPolicy(ABC):
     Different collections of orchestration rules might be used to govern various kinds
     of transitions. For example, flow-run states and task-run states might require
     different orchestration logic.
+
+    The rules for every transition between orchestration states are compiled once per
+    policy class, the first time they are needed, and looked up from then on.
     """
 
     @staticmethod
@@ -39,6 +49,35 @@ class BaseOrchestrationPolicy(ABC):
         Returns rules in policy that are valid for the specified state transition.
         """
 
+        transition_rules = cls.transition_table().get((from_state, to_state))
+        if transition_rules is None:
+            return cls._filter_transition_rules(from_state, to_state)
+        return list(transition_rules)
+
+    @classmethod
+    def transition_table(cls) -> Mapping[Transition, Tuple[Type[Any], ...]]:
+        """
+        An immutable mapping of every transition between orchestration states to the
+        rules in this policy that govern it, in priority order.
+        """
+
+        # stored on each class itself so that subclasses don't share their parent's
+        table = cls.__dict__.get("_transition_table")
+        if table is None:
+            table = MappingProxyType(
+                {
+                    (from_state, to_state): tuple(
+                        cls._filter_transition_rules(from_state, to_state)
+                    )
+                    for from_state in ALL_ORCHESTRATION_STATES
+                    for to_state in ALL_ORCHESTRATION_STATES
+                }
+            )
+            cls._transition_table = table
+        return table
+
+    @classmethod
+    def _filter_transition_rules(cls, from_state, to_state):
         transition_rules = []
         for rule in cls.priority():
             if from_state in rule.FROM_STATES and to_state in rule.TO_STATES:
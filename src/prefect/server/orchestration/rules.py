@@ -18,8 +18,21 @@ single line of user code.
 """
 
 import contextlib
+import time
 from types import TracebackType
-from typing import Any, Dict, Iterable, List, Optional, Type, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+)
 
 import sqlalchemy as sa
 from pydantic import ConfigDict, Field
@@ -49,6 +62,43 @@ TERMINAL_STATES = states.TERMINAL_STATES
 
 logger = get_logger("server")
 
+# called with a rule's class, the phase ("enter" or "exit") and its duration in seconds
+RuleTimingHook = Callable[[Type[Any], str, float], None]
+
+_rule_timing_hook: Optional[RuleTimingHook] = None
+
+
+def set_rule_timing_hook(hook: Optional[RuleTimingHook]) -> Optional[RuleTimingHook]:
+    """
+    Sets a hook that is called with the time spent entering and exiting each
+    orchestration rule and universal transform, returning the previous hook.
+
+    Timings can be aggregated by rule to find which rules dominate the latency of
+    state transitions. Pass `None` to remove the hook.
+    """
+    global _rule_timing_hook
+    previous, _rule_timing_hook = _rule_timing_hook, hook
+    return previous
+
+
+@contextlib.contextmanager
+def temporary_rule_timing_hook(hook: RuleTimingHook) -> Iterator[None]:
+    previous = set_rule_timing_hook(hook)
+    try:
+        yield
+    finally:
+        set_rule_timing_hook(previous)
+
+
+def _record_rule_timing(rule: Any, phase: str, started: float) -> None:
+    hook = _rule_timing_hook
+    if hook is None:
+        return
+    try:
+        hook(type(rule), phase, time.perf_counter() - started)
+    except Exception:
+        logger.exception("Error in orchestration rule timing hook")
+
 
 class OrchestrationContext(PrefectBaseModel):
     """
@@ -173,6 +223,51 @@ class OrchestrationContext(PrefectBaseModel):
         safe_context = self.safe_copy()
         return safe_context.initial_state, safe_context.validated_state, safe_context
 
+    async def stage_proposed_state(self) -> Optional[Tuple[Any, Any]]:
+        """
+        Adds the proposed state to the session without flushing it, so that the states
+        of many runs can be written together.
+
+        Returns the staged ORM state and its data, to be passed to
+        `complete_validation` once the session is flushed, or `None` if the state could
+        not be staged, in which case the context is aborted as in
+        `validate_proposed_state`.
+        """
+        # (circular import)
+        from prefect.server.api.server import is_client_retryable_exception
+
+        try:
+            return await self._stage_proposed_state()
+        except Exception as exc:
+            logger.exception("Encountered error during state validation")
+            self.proposed_state = None
+
+            if is_client_retryable_exception(exc):
+                raise
+
+            reason = f"Error validating state: {exc!r}"
+            self.response_status = SetStateStatus.ABORT
+            self.response_details = StateAbortDetails(reason=reason)
+            return None
+
+    async def _stage_proposed_state(self) -> Tuple[Any, Any]:
+        """
+        Implements a hook that adds the proposed state of the run to the session.
+
+        Returns the staged ORM state and its data. The base context has no run to
+        write states to, so nothing is staged and no state is validated.
+        """
+        return None, None
+
+    def complete_validation(self, validated_orm_state: Any, state_data: Any) -> None:
+        """Sets `self.validated_state` from a staged state after it has been flushed"""
+        if validated_orm_state:
+            self.validated_state = states.State.from_orm_without_result(
+                validated_orm_state, with_data=state_data
+            )
+        else:
+            self.validated_state = None
+
 
 class FlowOrchestrationContext(OrchestrationContext):
     """
@@ -251,11 +346,16 @@ class FlowOrchestrationContext(OrchestrationContext):
             self.response_status = SetStateStatus.ABORT
             self.response_details = StateAbortDetails(reason=reason)
 
+    async def _validate_proposed_state(self):
+        validated_orm_state, state_data = await self._stage_proposed_state()
+        await self.session.flush()
+        self.complete_validation(validated_orm_state, state_data)
+
     @inject_db
-    async def _validate_proposed_state(
+    async def _stage_proposed_state(
         self,
         db: PrefectDBInterface,
-    ):
+    ) -> Tuple[Any, Any]:
         if self.proposed_state is None:
             validated_orm_state = self.run.state
             # We cannot access `self.run.state.data` directly for unknown reasons
@@ -287,14 +387,7 @@ class FlowOrchestrationContext(OrchestrationContext):
 
         self.session.add(validated_orm_state)
         self.run.set_state(validated_orm_state)
-
-        await self.session.flush()
-        if validated_orm_state:
-            self.validated_state = states.State.from_orm_without_result(
-                validated_orm_state, with_data=state_data
-            )
-        else:
-            self.validated_state = None
+        return validated_orm_state, state_data
 
     def safe_copy(self):
         """
@@ -405,11 +498,16 @@ class TaskOrchestrationContext(OrchestrationContext):
             self.response_status = SetStateStatus.ABORT
             self.response_details = StateAbortDetails(reason=reason)
 
+    async def _validate_proposed_state(self):
+        validated_orm_state, state_data = await self._stage_proposed_state()
+        await self.session.flush()
+        self.complete_validation(validated_orm_state, state_data)
+
     @inject_db
-    async def _validate_proposed_state(
+    async def _stage_proposed_state(
         self,
         db: PrefectDBInterface,
-    ):
+    ) -> Tuple[Any, Any]:
         if self.proposed_state is None:
             validated_orm_state = self.run.state
             # We cannot access `self.run.state.data` directly for unknown reasons
@@ -446,14 +544,7 @@ class TaskOrchestrationContext(OrchestrationContext):
 
         self.session.add(validated_orm_state)
         self.run.set_state(validated_orm_state)
-
-        await self.session.flush()
-        if validated_orm_state:
-            self.validated_state = states.State.from_orm_without_result(
-                validated_orm_state, with_data=state_data
-            )
-        else:
-            self.validated_state = None
+        return validated_orm_state, state_data
 
     def safe_copy(self):
         """
@@ -490,6 +581,57 @@ class TaskOrchestrationContext(OrchestrationContext):
         )
 
 
+async def validate_proposed_states(
+    session: AsyncSession, contexts: Sequence[OrchestrationContext]
+) -> None:
+    """
+    Validates the proposed states of many orchestration contexts at once.
+
+    Behaves like calling `validate_proposed_state` on each context, except that all of
+    the states are written with a single flush of the session. If one of the states
+    violates a constraint, the states are written again one run at a time, each in its
+    own savepoint, so that only the runs whose states can't be written are aborted.
+    """
+    try:
+        async with session.begin_nested():
+            staged = [await context.stage_proposed_state() for context in contexts]
+            await session.flush()
+    except sa.exc.IntegrityError:
+        logger.warning(
+            "Failed to write %s states together; writing them one at a time",
+            len(contexts),
+            exc_info=True,
+        )
+    else:
+        for context, staged_state in zip(contexts, staged):
+            if staged_state is not None:
+                context.complete_validation(*staged_state)
+        return
+
+    for context, staged_state in zip(contexts, staged):
+        # runs changed in the rolled back savepoint were expired
+        await session.refresh(context.run)
+
+        if staged_state is None:
+            # the context was already aborted while staging its state
+            continue
+
+        try:
+            async with session.begin_nested():
+                staged_state = await context._stage_proposed_state()
+                await session.flush()
+        except sa.exc.IntegrityError as exc:
+            logger.exception("Encountered error during state validation")
+            await session.refresh(context.run)
+            context.proposed_state = None
+            context.response_status = SetStateStatus.ABORT
+            context.response_details = StateAbortDetails(
+                reason=f"Error validating state: {exc!r}"
+            )
+        else:
+            context.complete_validation(*staged_state)
+
+
 class BaseOrchestrationRule(contextlib.AbstractAsyncContextManager):
     """
     An abstract base class used to implement a discrete piece of orchestration logic.
@@ -595,6 +737,7 @@ class BaseOrchestrationRule(contextlib.AbstractAsyncContextManager):
         will do nothing. Otherwise, `self.before_transition` will fire.
         """
 
+        started = time.perf_counter()
         if await self.invalid():
             pass
         else:
@@ -617,6 +760,7 @@ class BaseOrchestrationRule(contextlib.AbstractAsyncContextManager):
                 self.context.response_details = StateAbortDetails(reason=reason)
                 self.context.orchestration_error = before_transition_error
 
+        _record_rule_timing(self, "enter", started)
         return self.context
 
     async def __aexit__(
@@ -636,6 +780,7 @@ class BaseOrchestrationRule(contextlib.AbstractAsyncContextManager):
         any side-effects produced by `self.before_transition`.
         """
 
+        started = time.perf_counter()
         exit_context = self.context.exit_context()
         if await self.invalid():
             pass
@@ -644,6 +789,7 @@ class BaseOrchestrationRule(contextlib.AbstractAsyncContextManager):
         else:
             await self.after_transition(*exit_context)
             self.context.finalization_signature.append(str(self.__class__))
+        _record_rule_timing(self, "exit", started)
 
     async def before_transition(
         self,
@@ -949,8 +1095,10 @@ class BaseUniversalTransform(contextlib.AbstractAsyncContextManager):
         `self.before_transition` will fire.
         """
 
+        started = time.perf_counter()
         await self.before_transition(self.context)
         self.context.rule_signature.append(str(self.__class__))
+        _record_rule_timing(self, "enter", started)
         return self.context
 
     async def __aexit__(
@@ -967,9 +1115,11 @@ class BaseUniversalTransform(contextlib.AbstractAsyncContextManager):
         proposed state.
         """
 
+        started = time.perf_counter()
         if not self.exception_in_transition():
             await self.after_transition(self.context)
             self.context.finalization_signature.append(str(self.__class__))
+        _record_rule_timing(self, "exit", started)
 
     async def before_transition(self, context) -> None:
         """
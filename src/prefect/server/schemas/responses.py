@@ -165,6 +165,15 @@ class OrchestrationResult(PrefectBaseModel):
     details: StateResponseDetails
 
 
+class RunOrchestrationResult(OrchestrationResult):
+    """
+    The output of state orchestration for one of several runs whose states were set
+    together.
+    """
+
+    id: UUID = Field(default=..., description="The id of the flow or task run.")
+
+
 class WorkerFlowRunResponse(PrefectBaseModel):
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
@@ -173,6 +182,24 @@ class WorkerFlowRunResponse(PrefectBaseModel):
     flow_run: schemas.core.FlowRun
 
 
+class DueFlowRun(PrefectBaseModel):
+    """
+    A scheduled flow run that is due to be submitted, as pushed to subscribed workers
+    and runners.
+    """
+
+    id: UUID = Field(default=..., description="The flow run id.")
+    deployment_id: Optional[UUID] = Field(
+        default=None, description="The id of the flow run's deployment."
+    )
+    work_queue_id: Optional[UUID] = Field(
+        default=None, description="The id of the flow run's work queue."
+    )
+    next_scheduled_start_time: Optional[DateTime] = Field(
+        default=None, description="The time the flow run is scheduled to start."
+    )
+
+
 class FlowRunResponse(ORMBaseModel):
     name: str = Field(
         default_factory=lambda: generate_slug(2),
@@ -575,10 +602,43 @@ class FlowPaginationResponse(BaseModel):
 
 class FlowRunPaginationResponse(BaseModel):
     results: list[FlowRunResponse]
-    count: int
+    count: Optional[int] = Field(
+        default=None,
+        description="The total number of results, when paging by page number",
+    )
     limit: int
-    pages: int
-    page: int
+    pages: Optional[int] = Field(
+        default=None,
+        description="The total number of pages, when paging by page number",
+    )
+    page: Optional[int] = Field(
+        default=None, description="The page number, when paging by page number"
+    )
+    next_page: Optional[str] = Field(
+        default=None,
+        description=(
+            "The cursor of the next page, when paging with cursors and there may be"
+            " more results"
+        ),
+    )
+
+
+class TaskRunPaginationResponse(BaseModel):
+    results: list[schemas.core.TaskRun]
+    limit: int
+    next_page: Optional[str] = Field(
+        default=None,
+        description="The cursor of the next page, if there may be more results",
+    )
+
+
+class LogPaginationResponse(BaseModel):
+    results: list[schemas.core.Log]
+    limit: int
+    next_page: Optional[str] = Field(
+        default=None,
+        description="The cursor of the next page, if there may be more results",
+    )
 
 
 class DeploymentPaginationResponse(BaseModel):
@@ -2,11 +2,14 @@
 Schemas for sorting Prefect REST API objects.
 """
 
+import datetime
 from typing import TYPE_CHECKING
+from uuid import UUID
 
 import sqlalchemy as sa
 
 from prefect.server.database import orm_models
+from prefect.server.utilities.pagination import Keyset, KeysetColumn
 from prefect.utilities.collections import AutoEnum
 
 if TYPE_CHECKING:
@@ -51,6 +54,57 @@ class FlowRunSort(AutoEnum):
         }
         return sort_mapping[self.value]
 
+    def as_sql_keyset(self) -> Keyset:
+        """Return the keyset used to page through flow runs with cursors"""
+        FlowRun = orm_models.FlowRun
+        id_asc = KeysetColumn(FlowRun.id, lambda run: run.id, UUID)
+        id_desc = id_asc._replace(descending=True)
+        start_time = KeysetColumn(
+            sa.func.coalesce(FlowRun.start_time, FlowRun.expected_start_time),
+            lambda run: run.start_time or run.expected_start_time,
+            datetime.datetime,
+            nullable=True,
+        )
+        expected_start_time = KeysetColumn(
+            FlowRun.expected_start_time,
+            lambda run: run.expected_start_time,
+            datetime.datetime,
+            nullable=True,
+        )
+        name = KeysetColumn(FlowRun.name, lambda run: run.name, str)
+        keyset_mapping = {
+            "ID_DESC": [id_desc],
+            "START_TIME_ASC": [start_time, id_asc],
+            "START_TIME_DESC": [start_time._replace(descending=True), id_desc],
+            "EXPECTED_START_TIME_ASC": [expected_start_time, id_asc],
+            "EXPECTED_START_TIME_DESC": [
+                expected_start_time._replace(descending=True),
+                id_desc,
+            ],
+            "NAME_ASC": [name, id_asc],
+            "NAME_DESC": [name._replace(descending=True), id_desc],
+            "NEXT_SCHEDULED_START_TIME_ASC": [
+                KeysetColumn(
+                    FlowRun.next_scheduled_start_time,
+                    lambda run: run.next_scheduled_start_time,
+                    datetime.datetime,
+                    nullable=True,
+                ),
+                id_asc,
+            ],
+            "END_TIME_DESC": [
+                KeysetColumn(
+                    FlowRun.end_time,
+                    lambda run: run.end_time,
+                    datetime.datetime,
+                    descending=True,
+                    nullable=True,
+                ),
+                id_desc,
+            ],
+        }
+        return Keyset(f"flow_runs:{self.value}", keyset_mapping[self.value])
+
 
 class TaskRunSort(AutoEnum):
     """Defines task run sorting options."""
@@ -76,6 +130,49 @@ class TaskRunSort(AutoEnum):
         }
         return sort_mapping[self.value]
 
+    def as_sql_keyset(self) -> Keyset:
+        """Return the keyset used to page through task runs with cursors"""
+        TaskRun = orm_models.TaskRun
+        id_asc = KeysetColumn(TaskRun.id, lambda run: run.id, UUID)
+        id_desc = id_asc._replace(descending=True)
+        expected_start_time = KeysetColumn(
+            TaskRun.expected_start_time,
+            lambda run: run.expected_start_time,
+            datetime.datetime,
+            nullable=True,
+        )
+        name = KeysetColumn(TaskRun.name, lambda run: run.name, str)
+        keyset_mapping = {
+            "ID_DESC": [id_desc],
+            "EXPECTED_START_TIME_ASC": [expected_start_time, id_asc],
+            "EXPECTED_START_TIME_DESC": [
+                expected_start_time._replace(descending=True),
+                id_desc,
+            ],
+            "NAME_ASC": [name, id_asc],
+            "NAME_DESC": [name._replace(descending=True), id_desc],
+            "NEXT_SCHEDULED_START_TIME_ASC": [
+                KeysetColumn(
+                    TaskRun.next_scheduled_start_time,
+                    lambda run: run.next_scheduled_start_time,
+                    datetime.datetime,
+                    nullable=True,
+                ),
+                id_asc,
+            ],
+            "END_TIME_DESC": [
+                KeysetColumn(
+                    TaskRun.end_time,
+                    lambda run: run.end_time,
+                    datetime.datetime,
+                    descending=True,
+                    nullable=True,
+                ),
+                id_desc,
+            ],
+        }
+        return Keyset(f"task_runs:{self.value}", keyset_mapping[self.value])
+
 
 class LogSort(AutoEnum):
     """Defines log sorting options."""
@@ -91,6 +188,24 @@ class LogSort(AutoEnum):
         }
         return sort_mapping[self.value]
 
+    def as_sql_keyset(self) -> Keyset:
+        """Return the keyset used to page through logs with cursors"""
+        descending = self.value == "TIMESTAMP_DESC"
+        return Keyset(
+            f"logs:{self.value}",
+            [
+                KeysetColumn(
+                    orm_models.Log.timestamp,
+                    lambda log: log.timestamp,
+                    datetime.datetime,
+                    descending=descending,
+                ),
+                KeysetColumn(
+                    orm_models.Log.id, lambda log: log.id, UUID, descending=descending
+                ),
+            ],
+        )
+
 
 class FlowSort(AutoEnum):
     """Defines flow sorting options."""
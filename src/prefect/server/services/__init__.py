@@ -3,5 +3,6 @@ import prefect.server.services.flow_run_notifications
 import prefect.server.services.foreman
 import prefect.server.services.late_runs
 import prefect.server.services.pause_expirations
+import prefect.server.services.run_history_rollups
 import prefect.server.services.scheduler
 import prefect.server.services.telemetry
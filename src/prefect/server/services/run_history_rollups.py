@@ -0,0 +1,198 @@
+"""
+The RunHistoryRollups service. Responsible for keeping the run history rollups up to
+date with the flow and task runs.
+"""
+
+import asyncio
+import datetime
+from typing import List, Optional, Tuple
+
+import pendulum
+from sqlalchemy.ext.asyncio import AsyncSession
+
+import prefect.server.models as models
+from prefect.server.database.dependencies import inject_db
+from prefect.server.database.interface import PrefectDBInterface
+from prefect.server.services.loop_service import LoopService
+from prefect.settings import (
+    PREFECT_SERVER_SERVICES_RUN_HISTORY_ROLLUPS_COMMIT_GRACE_SECONDS,
+    PREFECT_SERVER_SERVICES_RUN_HISTORY_ROLLUPS_LOOP_SECONDS,
+    PREFECT_SERVER_SERVICES_RUN_HISTORY_ROLLUPS_RECONCILE_SECONDS,
+)
+
+RUN_TYPES: Tuple[models.run_history_rollups.RunType, ...] = ("flow_run", "task_run")
+
+
+class RunHistoryRollups(LoopService):
+    """
+    A loop service that recomputes the run history rollups of each hour with flow or
+    task runs updated since its last loop, and periodically of each hour whose runs
+    were deleted or moved to another hour.
+    """
+
+    def __init__(self, loop_seconds: Optional[float] = None, **kwargs):
+        super().__init__(
+            loop_seconds=loop_seconds
+            or PREFECT_SERVER_SERVICES_RUN_HISTORY_ROLLUPS_LOOP_SECONDS.value(),
+            **kwargs,
+        )
+
+        # recompute the hours of this many updated runs in each transaction
+        self.batch_size = 1000
+        # recompute this many hours with each statement
+        self.buckets_per_statement = 50
+
+        self.reconcile_interval = datetime.timedelta(
+            seconds=PREFECT_SERVER_SERVICES_RUN_HISTORY_ROLLUPS_RECONCILE_SECONDS.value()
+        )
+        self._last_reconciled: Optional[pendulum.DateTime] = None
+        # runs are stamped with their update time when their transaction starts, so
+        # leave time for recent transactions to commit before counting their runs
+        self.commit_grace_period = datetime.timedelta(
+            seconds=PREFECT_SERVER_SERVICES_RUN_HISTORY_ROLLUPS_COMMIT_GRACE_SECONDS.value()
+        )
+
+    @inject_db
+    async def run_once(self, db: PrefectDBInterface):
+        """
+        Refresh the run history rollups by:
+
+        - Recomputing the rollups of the hours with runs updated since the rollups
+          were last refreshed, or of every hour with runs if they have never been
+          refreshed
+        - Once every reconcile interval, recomputing the rollups of the hours whose
+          counts no longer match their runs
+        """
+        async with db.session_context() as session:
+            previously_refreshed_until = (
+                await models.run_history_rollups.read_refreshed_until(session=session)
+            )
+
+        refreshed_until = await self._refresh_updated_buckets(
+            db, previously_refreshed_until
+        )
+
+        now = pendulum.now("UTC")
+        if (
+            self._last_reconciled is None
+            or now - self._last_reconciled >= self.reconcile_interval
+        ):
+            await self._reconcile_buckets(db, refreshed_until)
+            self._last_reconciled = now
+
+        self.logger.info("Finished refreshing run history rollups.")
+
+    async def _refresh_updated_buckets(
+        self,
+        db: PrefectDBInterface,
+        previously_refreshed_until: Optional[pendulum.DateTime],
+    ) -> pendulum.DateTime:
+        """
+        Recomputes the hours with updated runs a batch of runs at a time, in order of
+        their update time.
+
+        Each batch commits the rollups of its hours along with the time they were
+        refreshed until, the update time of the first run left for the next batch.
+        Readers then count every later run from the run tables, so the rollups are
+        consistent after every batch, and a refresh that is interrupted resumes from
+        its last batch.
+        """
+        refreshed_until = pendulum.now("UTC") - self.commit_grace_period
+        updated_since = None
+        if previously_refreshed_until:
+            refreshed_until = max(refreshed_until, previously_refreshed_until)
+            updated_since = previously_refreshed_until - self.commit_grace_period
+
+        while True:
+            async with db.session_context(begin_transaction=True) as session:
+                batch_refreshed_until = refreshed_until
+                for run_type in RUN_TYPES:
+                    updated_until = await models.run_history_rollups.read_updated_until(
+                        session=session,
+                        run_type=run_type,
+                        updated_since=updated_since,
+                        limit=self.batch_size,
+                    )
+                    if updated_until is not None:
+                        batch_refreshed_until = min(
+                            batch_refreshed_until, updated_until
+                        )
+                # never move the refreshed time backwards, as hours that aren't
+                # recomputed already count the runs updated before it
+                if previously_refreshed_until:
+                    batch_refreshed_until = max(
+                        batch_refreshed_until, previously_refreshed_until
+                    )
+
+                for run_type in RUN_TYPES:
+                    bucket_starts = await models.run_history_rollups.read_stale_buckets(
+                        session=session,
+                        run_type=run_type,
+                        updated_since=updated_since,
+                        updated_before=batch_refreshed_until,
+                    )
+                    await self._refresh_buckets(
+                        session, run_type, bucket_starts, batch_refreshed_until
+                    )
+                    self.logger.debug(
+                        f"Refreshed the {run_type} history rollups of"
+                        f" {len(bucket_starts)} hour(s)."
+                    )
+
+                await models.run_history_rollups.write_refreshed_until(
+                    session=session, refreshed_until=batch_refreshed_until
+                )
+
+            if batch_refreshed_until >= refreshed_until:
+                return refreshed_until
+            updated_since = batch_refreshed_until
+
+    async def _reconcile_buckets(
+        self, db: PrefectDBInterface, refreshed_until: pendulum.DateTime
+    ):
+        """
+        Recomputes the hours whose rollups count a different number of runs than
+        there are rolled up runs in the hour, a batch of hours at a time
+        """
+        for run_type in RUN_TYPES:
+            async with db.session_context() as session:
+                bucket_starts = (
+                    await models.run_history_rollups.read_miscounted_buckets(
+                        session=session,
+                        run_type=run_type,
+                        refreshed_until=refreshed_until,
+                    )
+                )
+
+            for i in range(0, len(bucket_starts), self.buckets_per_statement):
+                async with db.session_context(begin_transaction=True) as session:
+                    await self._refresh_buckets(
+                        session,
+                        run_type,
+                        bucket_starts[i : i + self.buckets_per_statement],
+                        refreshed_until,
+                    )
+
+            self.logger.debug(
+                f"Reconciled the {run_type} history rollups of"
+                f" {len(bucket_starts)} hour(s)."
+            )
+
+    async def _refresh_buckets(
+        self,
+        session: AsyncSession,
+        run_type: models.run_history_rollups.RunType,
+        bucket_starts: List[pendulum.DateTime],
+        refreshed_until: pendulum.DateTime,
+    ):
+        for i in range(0, len(bucket_starts), self.buckets_per_statement):
+            await models.run_history_rollups.refresh_buckets(
+                session=session,
+                run_type=run_type,
+                bucket_starts=bucket_starts[i : i + self.buckets_per_statement],
+                refreshed_until=refreshed_until,
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(RunHistoryRollups(handle_signals=True).start())
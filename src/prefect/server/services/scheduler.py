@@ -4,7 +4,7 @@ The Scheduler service.
 
 import asyncio
 import datetime
-from typing import Dict, List, Optional
+from typing import Dict, Hashable, List, Optional
 from uuid import UUID
 
 import pendulum
@@ -183,70 +183,62 @@ class Scheduler(LoopService):
         session: sa.orm.Session,
         deployment_ids: List[UUID],
     ) -> List[Dict]:
-        runs_to_insert = []
-        for deployment_id in deployment_ids:
-            now = pendulum.now("UTC")
-            # guard against erroneously configured schedules
-            try:
-                runs_to_insert.extend(
-                    await self._generate_scheduled_flow_runs(
-                        session=session,
-                        deployment_id=deployment_id,
-                        start_time=now,
-                        end_time=now + self.max_scheduled_time,
-                        min_time=self.min_scheduled_time,
-                        min_runs=self.min_runs,
-                        max_runs=self.max_runs,
-                    )
-                )
-            except Exception:
-                self.logger.exception(
-                    f"Error scheduling deployment {deployment_id!r}.",
-                )
-            finally:
-                connection = await session.connection()
-                if connection.invalidated:
-                    # If the error we handled above was the kind of database error that
-                    # causes underlying transaction to rollback and the connection to
-                    # become invalidated, rollback this session.  Errors that may cause
-                    # this are connection drops, database restarts, and things of the
-                    # sort.
-                    #
-                    # This rollback _does not rollback a transaction_, since that has
-                    # actually already happened due to the error above.  It brings the
-                    # Python session in sync with underlying connection so that when we
-                    # exec the outer with block, the context manager will not attempt to
-                    # commit the session.
-                    #
-                    # Then, raise TryAgain to break out of these nested loops, back to
-                    # the outer loop, where we'll begin a new transaction with
-                    # session.begin() in the next loop iteration.
-                    await session.rollback()
-                    raise TryAgain()
+        now = pendulum.now("UTC")
+        try:
+            runs_to_insert = await self._generate_scheduled_flow_runs(
+                session=session,
+                deployment_ids=deployment_ids,
+                start_time=now,
+                end_time=now + self.max_scheduled_time,
+                min_time=self.min_scheduled_time,
+                min_runs=self.min_runs,
+                max_runs=self.max_runs,
+            )
+        except Exception:
+            self.logger.exception("Error scheduling deployments.")
+            runs_to_insert = []
+        finally:
+            connection = await session.connection()
+            if connection.invalidated:
+                # If the error we handled above was the kind of database error that
+                # causes underlying transaction to rollback and the connection to
+                # become invalidated, rollback this session.  Errors that may cause
+                # this are connection drops, database restarts, and things of the
+                # sort.
+                #
+                # This rollback _does not rollback a transaction_, since that has
+                # actually already happened due to the error above.  It brings the
+                # Python session in sync with underlying connection so that when we
+                # exec the outer with block, the context manager will not attempt to
+                # commit the session.
+                #
+                # Then, raise TryAgain to break out of these nested loops, back to
+                # the outer loop, where we'll begin a new transaction with
+                # session.begin() in the next loop iteration.
+                await session.rollback()
+                raise TryAgain()
         return runs_to_insert
 
-    @inject_db
     async def _generate_scheduled_flow_runs(
         self,
         session: sa.orm.Session,
-        deployment_id: UUID,
+        deployment_ids: List[UUID],
         start_time: datetime.datetime,
         end_time: datetime.datetime,
         min_time: datetime.timedelta,
         min_runs: int,
         max_runs: int,
-        db: PrefectDBInterface,
     ) -> List[Dict]:
         """
-        Given a `deployment_id` and schedule params, generates a list of flow run
-        objects and associated scheduled states that represent scheduled flow runs.
+        Given a page of `deployment_ids` and schedule params, generates a list of flow
+        run objects and associated scheduled states that represent scheduled flow runs.
 
         Pass-through method for overrides.
 
 
         Args:
             session: a database session
-            deployment_id: the id of the deployment to schedule
+            deployment_ids: the ids of the deployments to schedule
             start_time: the time from which to start scheduling runs
             end_time: runs will be scheduled until at most this time
             min_time: runs will be scheduled until at least this far in the future
@@ -254,8 +246,8 @@ class Scheduler(LoopService):
             max_runs: a maximum amount of runs to schedule
 
         This function will generate the minimum number of runs that satisfy the min
-        and max times, and the min and max counts. Specifically, the following order
-        will be respected:
+        and max times, and the min and max counts for each deployment. Specifically,
+        the following order will be respected:
 
             - Runs will be generated starting on or after the `start_time`
             - No more than `max_runs` runs will be generated
@@ -264,16 +256,35 @@ class Scheduler(LoopService):
             - Runs will be generated until at least `start_time + min_time` is reached
 
         """
-        return await models.deployments._generate_scheduled_flow_runs(
-            session=session,
-            deployment_id=deployment_id,
-            start_time=start_time,
-            end_time=end_time,
-            min_time=min_time,
-            min_runs=min_runs,
-            max_runs=max_runs,
+        deployments = await models.deployments._read_deployments_to_schedule(
+            session=session, deployment_ids=deployment_ids
         )
 
+        # every deployment in the page is scheduled from the same time, so the dates
+        # of identical schedules are only computed once
+        dates_cache: Dict[Hashable, List[pendulum.DateTime]] = {}
+        runs = []
+        for deployment, schedules in deployments:
+            # guard against erroneously configured schedules
+            try:
+                runs.extend(
+                    models.deployments._expand_scheduled_flow_runs(
+                        deployment=deployment,
+                        schedules=schedules,
+                        start_time=start_time,
+                        end_time=end_time,
+                        min_time=min_time,
+                        min_runs=min_runs,
+                        max_runs=max_runs,
+                        dates_cache=dates_cache,
+                    )
+                )
+            except Exception:
+                self.logger.exception(
+                    f"Error scheduling deployment {deployment.id!r}.",
+                )
+        return runs
+
     @inject_db
     async def _insert_scheduled_flow_runs(
         self,
@@ -0,0 +1,279 @@
+"""
+Implements the task queues that deliver background task runs to TaskWorkers.
+
+The implementation is selected with the `PREFECT_SERVER_TASKS_SCHEDULING_QUEUE_BACKEND`
+setting, which points to a module that exports a `TaskQueue` class. By default, task
+runs are queued in memory (`prefect.server.task_queue.memory`). The queues of
+`prefect.server.task_queue.database` are kept in the database instead, so that they
+survive restarts of the API.
+"""
+
+import abc
+import asyncio
+import importlib
+from typing import (
+    ClassVar,
+    Dict,
+    List,
+    Optional,
+    Protocol,
+    Set,
+    Tuple,
+    Type,
+    runtime_checkable,
+)
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+import prefect.server.schemas as schemas
+from prefect.settings import (
+    PREFECT_SERVER_TASKS_SCHEDULING_QUEUE_BACKEND,
+    PREFECT_TASK_SCHEDULING_MAX_RETRY_QUEUE_SIZE,
+    PREFECT_TASK_SCHEDULING_MAX_SCHEDULED_QUEUE_SIZE,
+)
+
+# Task runs tagged `priority:<n>` are queued with priority `n`
+PRIORITY_TAG_PREFIX = "priority:"
+
+
+class TaskQueueFull(Exception):
+    """Raised when a task run is queued on a task queue that is full"""
+
+
+def get_task_run_priority(task_run: schemas.core.TaskRun) -> int:
+    """
+    Returns the priority of a task run from its `priority:<n>` tags, using the highest
+    if there are several. Task runs without a valid priority tag have priority 0.
+    """
+    priorities = []
+    for tag in task_run.tags:
+        if not tag.startswith(PRIORITY_TAG_PREFIX):
+            continue
+        try:
+            priorities.append(int(tag[len(PRIORITY_TAG_PREFIX) :]))
+        except ValueError:
+            continue
+    return max(priorities, default=0)
+
+
+class TaskQueue(abc.ABC):
+    """
+    The queue of background task runs for a single task key.
+
+    Retries are delivered before scheduled task runs, and scheduled task runs are
+    delivered in order of their priority (highest first), then in the order they were
+    queued. A task run that was taken from the queue stays in flight until it is
+    acknowledged with `ack`. If it is neither acknowledged nor retried within the
+    visibility timeout, it is delivered again.
+    """
+
+    _task_queues: ClassVar[Dict[str, "TaskQueue"]] = {}
+
+    default_scheduled_max_size: ClassVar[
+        int
+    ] = PREFECT_TASK_SCHEDULING_MAX_SCHEDULED_QUEUE_SIZE.value()
+    default_retry_max_size: ClassVar[
+        int
+    ] = PREFECT_TASK_SCHEDULING_MAX_RETRY_QUEUE_SIZE.value()
+
+    _queue_size_configs: ClassVar[Dict[str, Tuple[int, int]]] = {}
+    _weights: ClassVar[Dict[str, int]] = {}
+
+    # How long an empty `MultiQueue.get` waits before checking the queue again for
+    # task runs it was not woken for, like those whose visibility timeout passed
+    poll_interval: ClassVar[float] = 1.0
+
+    task_key: str
+    _waiters: Set["asyncio.Future[None]"]
+
+    @classmethod
+    async def enqueue(
+        cls,
+        task_run: schemas.core.TaskRun,
+        priority: Optional[int] = None,
+        session: Optional[AsyncSession] = None,
+    ) -> None:
+        """
+        Queues a scheduled task run on the queue of its task key, with the priority of
+        its tags unless a priority is given.
+        """
+        if priority is None:
+            priority = get_task_run_priority(task_run)
+        await cls.for_key(task_run.task_key).put(
+            task_run, priority=priority, session=session
+        )
+
+    @classmethod
+    def configure_task_key(
+        cls,
+        task_key: str,
+        scheduled_size: Optional[int] = None,
+        retry_size: Optional[int] = None,
+        weight: Optional[int] = None,
+    ):
+        """
+        Configures the queue of a task key.
+
+        Args:
+            task_key: the task key
+            scheduled_size: the maximum number of scheduled task runs to queue
+            retry_size: the maximum number of retries to queue
+            weight: how many task runs in a row subscribers to several task keys take
+                from this task key before moving on to the next one
+        """
+        scheduled_size = scheduled_size or cls.default_scheduled_max_size
+        retry_size = retry_size or cls.default_retry_max_size
+        cls._queue_size_configs[task_key] = (scheduled_size, retry_size)
+        if weight:
+            cls._weights[task_key] = weight
+
+    @classmethod
+    def for_key(cls, task_key: str) -> "TaskQueue":
+        if task_key not in cls._task_queues:
+            sizes = cls._queue_size_configs.get(
+                task_key, (cls.default_scheduled_max_size, cls.default_retry_max_size)
+            )
+            cls._task_queues[task_key] = get_task_queue_class()(task_key, *sizes)
+        return cls._task_queues[task_key]
+
+    @classmethod
+    def reset(cls) -> None:
+        """A unit testing utility to reset the state of the task queues subsystem"""
+        cls._task_queues.clear()
+
+    def __init__(self, task_key: str, scheduled_queue_size: int, retry_queue_size: int):
+        self.task_key = task_key
+        self._waiters = set()
+
+    @property
+    def weight(self) -> int:
+        return self._weights.get(self.task_key, 1)
+
+    @abc.abstractmethod
+    async def put(
+        self,
+        task_run: schemas.core.TaskRun,
+        priority: int = 0,
+        session: Optional[AsyncSession] = None,
+    ) -> None:
+        """
+        Queues a scheduled task run.
+
+        Args:
+            task_run: the task run
+            priority: task runs with a higher priority are delivered first
+            session: a database session whose transaction the task run is queued in,
+                for the queues that are stored in the database
+
+        Raises:
+            TaskQueueFull: if the queue can't take any more scheduled task runs
+        """
+
+    @abc.abstractmethod
+    async def retry(
+        self, task_run: schemas.core.TaskRun, session: Optional[AsyncSession] = None
+    ) -> None:
+        """
+        Queues a task run to be delivered again, ahead of scheduled task runs.
+
+        Raises:
+            TaskQueueFull: if the queue can't take any more retries
+        """
+
+    @abc.abstractmethod
+    async def take(self) -> Optional[schemas.core.TaskRun]:
+        """Takes the next task run to deliver, if there is one"""
+
+    @abc.abstractmethod
+    async def ack(self, task_run: schemas.core.TaskRun) -> None:
+        """Acknowledges that a task run taken from the queue was delivered"""
+
+    @abc.abstractmethod
+    async def extend(self, task_run: schemas.core.TaskRun) -> None:
+        """Keeps a task run that is in flight from being delivered again for another
+        visibility timeout"""
+
+    def _wake_waiters(self) -> None:
+        """Wakes the `MultiQueue.get` calls waiting for this queue's task runs"""
+        for waiter in self._waiters:
+            if not waiter.done():
+                waiter.set_result(None)
+
+
+@runtime_checkable
+class TaskQueueModule(Protocol):
+    TaskQueue: Type[TaskQueue]
+
+
+def get_task_queue_class() -> Type[TaskQueue]:
+    """Returns the task queue implementation configured for this server"""
+    module = importlib.import_module(
+        PREFECT_SERVER_TASKS_SCHEDULING_QUEUE_BACKEND.value()
+    )
+    assert isinstance(module, TaskQueueModule)
+    return module.TaskQueue
+
+
+class MultiQueue:
+    """
+    A queue that can pull tasks from from any of a number of task queues.
+
+    The queues take turns in a weighted round-robin, where each queue may deliver up to
+    its `weight` task runs in a row before the next queue's turn.
+    """
+
+    _queues: List[TaskQueue]
+
+    def __init__(self, task_keys: List[str]):
+        self._queues = [TaskQueue.for_key(task_key) for task_key in task_keys]
+        self._current = 0
+        self._taken = 0
+
+    async def take(self) -> Optional[schemas.core.TaskRun]:
+        """Takes the next task_run from any of the given queues, if there is one"""
+        # visiting one more queue than there are makes sure that the current queue is
+        # checked again after its turn ended
+        for _ in range(len(self._queues) + 1):
+            queue = self._queues[self._current]
+            if self._taken < queue.weight:
+                task_run = await queue.take()
+                if task_run:
+                    self._taken += 1
+                    return task_run
+
+            self._current = (self._current + 1) % len(self._queues)
+            self._taken = 0
+
+        return None
+
+    async def get(
+        self, timeout: Optional[float] = None
+    ) -> Optional[schemas.core.TaskRun]:
+        """
+        Gets the next task_run from any of the given queues, or returns None if there
+        is none within the timeout
+        """
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        while True:
+            # the waiter is registered before taking, so that task runs queued while
+            # the queues are being checked still wake it
+            waiter: "asyncio.Future[None]" = loop.create_future()
+            for queue in self._queues:
+                queue._waiters.add(waiter)
+            try:
+                task_run = await self.take()
+                if task_run:
+                    return task_run
+
+                wait = min(queue.poll_interval for queue in self._queues)
+                if deadline is not None:
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        return None
+                    wait = min(wait, remaining)
+
+                await asyncio.wait([waiter], timeout=wait)
+            finally:
+                for queue in self._queues:
+                    queue._waiters.discard(waiter)
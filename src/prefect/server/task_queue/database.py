@@ -0,0 +1,154 @@
+"""
+Implements task queues that are stored in the database, so that scheduled task runs
+and unacknowledged deliveries survive restarts of the API and are shared by all of
+its processes.
+
+The database queues are not bounded by the scheduled and retry queue sizes.
+"""
+
+import time
+from typing import Any, ClassVar, Dict, Optional
+
+import pendulum
+import sqlalchemy as sa
+from sqlalchemy.ext.asyncio import AsyncSession
+
+import prefect.server.schemas as schemas
+from prefect.server.database.dependencies import provide_database_interface
+from prefect.server.task_queue import TaskQueue as _TaskQueue
+from prefect.settings import PREFECT_SERVER_TASKS_SCHEDULING_VISIBILITY_TIMEOUT
+
+
+class TaskQueue(_TaskQueue):
+    """
+    A task queue kept in the `task_queue_item` table.
+
+    A task run is taken from the queue by moving its `visible_at` time past the
+    visibility timeout, and is acknowledged by deleting it from the table.
+    """
+
+    # How often an empty queue checks for task runs queued by other processes of the
+    # API or whose visibility timeout passed
+    poll_interval: ClassVar[float] = 1.0
+
+    def __init__(self, task_key: str, scheduled_queue_size: int, retry_queue_size: int):
+        super().__init__(task_key, scheduled_queue_size, retry_queue_size)
+        self._last_polled = 0.0
+        self._maybe_ready = True
+
+    async def put(
+        self,
+        task_run: schemas.core.TaskRun,
+        priority: int = 0,
+        session: Optional[AsyncSession] = None,
+    ) -> None:
+        await self._upsert(
+            task_run, session=session, update={"priority": priority, "retry": False}
+        )
+
+    async def retry(
+        self, task_run: schemas.core.TaskRun, session: Optional[AsyncSession] = None
+    ) -> None:
+        await self._upsert(task_run, session=session, update={"retry": True})
+
+    async def take(self) -> Optional[schemas.core.TaskRun]:
+        if (
+            not self._maybe_ready
+            and time.monotonic() - self._last_polled < self.poll_interval
+        ):
+            return None
+
+        self._maybe_ready = False
+        self._last_polled = time.monotonic()
+
+        db = provide_database_interface()
+        now = pendulum.now("UTC")
+
+        async with db.session_context(
+            begin_transaction=True, with_for_update=True
+        ) as session:
+            item = (
+                await session.execute(
+                    sa.select(db.TaskQueueItem)
+                    .where(
+                        db.TaskQueueItem.task_key == self.task_key,
+                        db.TaskQueueItem.visible_at <= now,
+                    )
+                    .order_by(
+                        db.TaskQueueItem.retry.desc(),
+                        db.TaskQueueItem.priority.desc(),
+                        db.TaskQueueItem.created.asc(),
+                    )
+                    .limit(1)
+                    .with_for_update(skip_locked=True)
+                )
+            ).scalar_one_or_none()
+            if not item:
+                return None
+
+            # there may be more task runs waiting
+            self._maybe_ready = True
+
+            item.visible_at = now + self._visibility_timeout()
+            item.deliveries += 1
+
+            task_run = await session.get(db.TaskRun, item.task_run_id)
+            assert task_run, "Queued task runs are deleted with their task run"
+            return schemas.core.TaskRun.model_validate(task_run)
+
+    async def ack(self, task_run: schemas.core.TaskRun) -> None:
+        db = provide_database_interface()
+        async with db.session_context(begin_transaction=True) as session:
+            await session.execute(
+                sa.delete(db.TaskQueueItem).where(
+                    db.TaskQueueItem.task_run_id == task_run.id
+                )
+            )
+
+    async def extend(self, task_run: schemas.core.TaskRun) -> None:
+        db = provide_database_interface()
+        async with db.session_context(begin_transaction=True) as session:
+            await session.execute(
+                sa.update(db.TaskQueueItem)
+                .where(db.TaskQueueItem.task_run_id == task_run.id)
+                .values(visible_at=pendulum.now("UTC") + self._visibility_timeout())
+                .execution_options(synchronize_session=False)
+            )
+
+    async def _upsert(
+        self,
+        task_run: schemas.core.TaskRun,
+        session: Optional[AsyncSession],
+        update: Dict[str, Any],
+    ) -> None:
+        db = provide_database_interface()
+        now = pendulum.now("UTC")
+        statement = (
+            db.insert(db.TaskQueueItem)
+            .values(task_key=task_run.task_key, task_run_id=task_run.id, **update)
+            .on_conflict_do_update(
+                index_elements=[db.TaskQueueItem.task_run_id],
+                set_={**update, "visible_at": now, "updated": now},
+            )
+        )
+
+        if session:
+            await session.execute(statement)
+
+            # the task run can't be taken before the transaction is committed
+            def mark_ready(session, **kwargs):
+                self._maybe_ready = True
+                self._wake_waiters()
+
+            sa.event.listen(session.sync_session, "after_commit", mark_ready, once=True)
+            return
+
+        async with db.session_context(begin_transaction=True) as session:
+            await session.execute(statement)
+
+        self._maybe_ready = True
+        self._wake_waiters()
+
+    @staticmethod
+    def _visibility_timeout():
+        return PREFECT_SERVER_TASKS_SCHEDULING_VISIBILITY_TIMEOUT.value()
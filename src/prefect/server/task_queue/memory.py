@@ -0,0 +1,114 @@
+"""
+Implements in-memory task queues, which are lost when the API restarts.
+"""
+
+import asyncio
+import itertools
+import time
+from typing import Dict, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+import prefect.server.schemas as schemas
+from prefect.server.task_queue import TaskQueue as _TaskQueue
+from prefect.server.task_queue import TaskQueueFull
+from prefect.settings import PREFECT_SERVER_TASKS_SCHEDULING_VISIBILITY_TIMEOUT
+
+
+class TaskQueue(_TaskQueue):
+    """
+    A task queue kept in a pair of bounded `asyncio` queues, one for scheduled task
+    runs and one for retries.
+    """
+
+    _scheduled_queue: asyncio.PriorityQueue
+    _retry_queue: asyncio.Queue
+
+    def __init__(self, task_key: str, scheduled_queue_size: int, retry_queue_size: int):
+        super().__init__(task_key, scheduled_queue_size, retry_queue_size)
+        self._scheduled_queue = asyncio.PriorityQueue(maxsize=scheduled_queue_size)
+        self._retry_queue = asyncio.Queue(maxsize=retry_queue_size)
+        self._sequence = itertools.count()
+        self._in_flight: Dict[UUID, Tuple[float, schemas.core.TaskRun]] = {}
+
+    async def get(self) -> schemas.core.TaskRun:
+        # First, check if there's anything in the retry queue
+        try:
+            return self.get_nowait()
+        except asyncio.QueueEmpty:
+            _, _, task_run = await self._scheduled_queue.get()
+            return self._deliver(task_run)
+
+    def get_nowait(self) -> schemas.core.TaskRun:
+        self._retry_expired()
+
+        # First, check if there's anything in the retry queue
+        try:
+            task_run = self._retry_queue.get_nowait()
+        except asyncio.QueueEmpty:
+            _, _, task_run = self._scheduled_queue.get_nowait()
+
+        return self._deliver(task_run)
+
+    async def take(self) -> Optional[schemas.core.TaskRun]:
+        try:
+            return self.get_nowait()
+        except asyncio.QueueEmpty:
+            return None
+
+    async def put(
+        self,
+        task_run: schemas.core.TaskRun,
+        priority: int = 0,
+        session: Optional[AsyncSession] = None,
+    ) -> None:
+        try:
+            self._scheduled_queue.put_nowait(
+                (-priority, next(self._sequence), task_run)
+            )
+        except asyncio.QueueFull:
+            raise TaskQueueFull(
+                f"The queue of scheduled task runs for {self.task_key!r} is full"
+            )
+        self._wake_waiters()
+
+    async def retry(
+        self, task_run: schemas.core.TaskRun, session: Optional[AsyncSession] = None
+    ) -> None:
+        try:
+            self._retry_queue.put_nowait(task_run)
+        except asyncio.QueueFull:
+            raise TaskQueueFull(f"The retry queue for {self.task_key!r} is full")
+        self._in_flight.pop(task_run.id, None)
+        self._wake_waiters()
+
+    async def ack(self, task_run: schemas.core.TaskRun) -> None:
+        self._in_flight.pop(task_run.id, None)
+
+    async def extend(self, task_run: schemas.core.TaskRun) -> None:
+        if task_run.id in self._in_flight:
+            self._deliver(task_run)
+
+    def _deliver(self, task_run: schemas.core.TaskRun) -> schemas.core.TaskRun:
+        timeout = PREFECT_SERVER_TASKS_SCHEDULING_VISIBILITY_TIMEOUT.value()
+        deadline = time.monotonic() + timeout.total_seconds()
+        self._in_flight[task_run.id] = (deadline, task_run)
+        return task_run
+
+    def _retry_expired(self) -> None:
+        """Moves the task runs whose visibility timeout passed to the retry queue"""
+        if not self._in_flight:
+            return
+
+        now = time.monotonic()
+        for task_run_id, (deadline, task_run) in list(self._in_flight.items()):
+            if deadline > now:
+                continue
+
+            try:
+                self._retry_queue.put_nowait(task_run)
+            except asyncio.QueueFull:
+                return
+
+            del self._in_flight[task_run_id]
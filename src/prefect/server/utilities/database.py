@@ -211,16 +211,25 @@ class Pydantic(TypeDecorator):
     def __init__(self, pydantic_type, sa_column_type=None):
         super().__init__()
         self._pydantic_type = pydantic_type
+        self._adapter: Optional[pydantic.TypeAdapter] = None
         if sa_column_type is not None:
             self.impl = sa_column_type
 
+    @property
+    def adapter(self) -> pydantic.TypeAdapter:
+        # building a type adapter is far more expensive than validating a value, so
+        # it's built once per column type rather than once per row
+        if self._adapter is None:
+            self._adapter = pydantic.TypeAdapter(self._pydantic_type)
+        return self._adapter
+
     def process_bind_param(self, value, dialect) -> Optional[str]:
         if value is None:
             return None
 
         # parse the value to ensure it complies with the schema
         # (this will raise validation errors if not)
-        adapter = pydantic.TypeAdapter(self._pydantic_type)
+        adapter = self.adapter
         value = adapter.validate_python(value)
 
         # sqlalchemy requires the bind parameter's value to be a python-native
@@ -232,7 +241,7 @@ class Pydantic(TypeDecorator):
     def process_result_value(self, value, dialect):
         if value is not None:
             # load the json object into a fully hydrated typed object
-            return pydantic.TypeAdapter(self._pydantic_type).validate_python(value)
+            return self.adapter.validate_python(value)
 
 
 class now(FunctionElement):
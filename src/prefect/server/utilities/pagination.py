@@ -0,0 +1,170 @@
+"""
+Utilities for keyset (cursor) pagination.
+
+Paging with `OFFSET` makes the database read and discard every row before the
+requested page, so each page is slower than the last. Keyset pagination instead orders
+rows by a sort key and a unique id, and continues after the last row of the previous
+page, so that every page costs the same as the first one.
+
+The position after the last row is handed to clients as an opaque cursor string.
+"""
+
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from typing import (
+    Any,
+    Callable,
+    List,
+    NamedTuple,
+    Optional,
+    Protocol,
+    Sequence,
+    TypeVar,
+)
+
+import pydantic
+import sqlalchemy as sa
+from pydantic_core import to_jsonable_python
+from sqlalchemy.sql.expression import ColumnElement, Select
+
+T = TypeVar("T", bound=Select)
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a cursor can't be read, or was issued for a different sort"""
+
+
+class KeysetColumn(NamedTuple):
+    """One of the columns rows are ordered by for keyset pagination"""
+
+    expression: ColumnElement
+    # reads the value of the expression from a row
+    value: Callable[[Any], Any]
+    type_: Any
+    descending: bool = False
+    nullable: bool = False
+
+
+class Keyset:
+    """
+    The ordering of rows for keyset pagination.
+
+    The last column must be unique, so that each row has a distinct position. Rows
+    with null values sort last, in both directions.
+    """
+
+    def __init__(self, name: str, columns: Sequence[KeysetColumn]):
+        self.name = name
+        self.columns = columns
+
+    def order_by(self) -> List[ColumnElement]:
+        """Returns the expressions to order rows by"""
+        order_by = []
+        for column in self.columns:
+            clause = (
+                column.expression.desc() if column.descending else column.expression
+            )
+            if column.nullable:
+                clause = sa.nulls_last(clause)
+            order_by.append(clause)
+        return order_by
+
+    def cursor(self, row: Any) -> str:
+        """Returns a cursor pointing after the given row"""
+        values = [column.value(row) for column in self.columns]
+        return urlsafe_b64encode(
+            json.dumps(
+                {"keyset": self.name, "values": to_jsonable_python(values)}
+            ).encode()
+        ).decode()
+
+    def after(self, cursor: str) -> ColumnElement:
+        """Returns a clause that selects the rows after the given cursor"""
+        try:
+            parameters = json.loads(urlsafe_b64decode(cursor))
+            keyset, values = parameters["keyset"], parameters["values"]
+        except Exception:
+            raise InvalidCursorError("Unable to parse cursor")
+
+        if keyset != self.name or len(values) != len(self.columns):
+            raise InvalidCursorError(f"The cursor is not for the {self.name} order")
+
+        try:
+            values = [
+                pydantic.TypeAdapter(Optional[column.type_]).validate_python(value)
+                for column, value in zip(self.columns, values)
+            ]
+        except pydantic.ValidationError:
+            raise InvalidCursorError("Unable to parse cursor")
+
+        return _after(self.columns, values)
+
+
+def _after(columns: Sequence[KeysetColumn], values: Sequence[Any]) -> ColumnElement:
+    column, *rest = columns
+    value, *rest_values = values
+    expression = column.expression
+
+    if not rest:
+        return expression < value if column.descending else expression > value
+
+    if value is None:
+        # nulls sort last, so only the following nulls come after
+        return sa.and_(expression.is_(None), _after(rest, rest_values))
+
+    if not any(c.nullable for c in columns) and all(
+        c.descending == column.descending for c in rest
+    ):
+        # a row value comparison can be answered straight from an index
+        row = sa.tuple_(*(c.expression for c in columns))
+        bound = sa.tuple_(
+            *(
+                sa.bindparam(None, v, type_=c.expression.type)
+                for c, v in zip(columns, values)
+            )
+        )
+        return row < bound if column.descending else row > bound
+
+    clauses = [
+        expression < value if column.descending else expression > value,
+        sa.and_(expression == value, _after(rest, rest_values)),
+    ]
+    if column.nullable:
+        clauses.append(expression.is_(None))
+    return sa.or_(*clauses)
+
+
+def next_cursor(
+    keyset: Keyset, rows: Sequence[Any], limit: Optional[int]
+) -> Optional[str]:
+    """
+    Returns the cursor for the page after the given rows, or None if the rows didn't
+    fill the page, which means there are no more rows
+    """
+    if not rows or limit is None or len(rows) < limit:
+        return None
+    return keyset.cursor(rows[-1])
+
+
+class KeysetSort(Protocol):
+    def as_sql_sort(self) -> ColumnElement:
+        ...
+
+    def as_sql_keyset(self) -> Keyset:
+        ...
+
+
+def apply_sort(query: T, sort: KeysetSort, cursor: Optional[str] = None) -> T:
+    """
+    Orders a query by the given sort or, when paging with a cursor, by the sort's
+    keyset, selecting only the rows after the cursor. An empty cursor selects the
+    first page.
+    """
+    if cursor is None:
+        return query.order_by(sort.as_sql_sort())
+
+    keyset = sort.as_sql_keyset()
+    query = query.order_by(*keyset.order_by())
+    if cursor:
+        query = query.where(keyset.after(cursor))
+    return query
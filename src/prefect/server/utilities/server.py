@@ -2,13 +2,16 @@
 Utilities for the Prefect REST API server.
 """
 
+import zlib
 from contextlib import AsyncExitStack
 from typing import Any, Callable, Coroutine, Sequence, Set, get_type_hints
 
-from fastapi import APIRouter, Request, Response, status
+from fastapi import APIRouter, HTTPException, Request, Response, status
 from fastapi.routing import APIRoute, BaseRoute
 from starlette.routing import Route as StarletteRoute
 
+from prefect.settings import get_current_settings
+
 
 def method_paths_from_routes(routes: Sequence[BaseRoute]) -> Set[str]:
     """
@@ -25,6 +28,45 @@ def method_paths_from_routes(routes: Sequence[BaseRoute]) -> Set[str]:
     return method_paths
 
 
+def _decompress_gzip(body: bytes, max_size: int) -> bytes:
+    """
+    Decompress a gzip body incrementally, raising a 413 as soon as the output grows
+    past `max_size` bytes rather than expanding the whole body first.
+    """
+    decompressed = bytearray()
+    # A gzip body may hold several members, each with its own end-of-stream marker
+    while body:
+        decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        decompressed += decompressor.decompress(body, max_size - len(decompressed) + 1)
+        if len(decompressed) > max_size:
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail=f"Decompressed request body exceeds {max_size} bytes.",
+            )
+        if not decompressor.eof:
+            raise EOFError("Compressed request body ended before the end of stream.")
+        body = decompressor.unused_data
+    return bytes(decompressed)
+
+
+class GzipRequest(Request):
+    """
+    A request whose body is decompressed when it was sent with a gzip
+    `Content-Encoding`.
+    """
+
+    async def body(self) -> bytes:
+        if not hasattr(self, "_body"):
+            body = await super().body()
+            if "gzip" in self.headers.getlist("Content-Encoding"):
+                body = _decompress_gzip(
+                    body,
+                    max_size=get_current_settings().server.api.max_decompressed_body_size,
+                )
+            self._body = body
+        return self._body
+
+
 class PrefectAPIRoute(APIRoute):
     """
     A FastAPIRoute class which attaches an async stack to requests that exits before
@@ -35,12 +77,18 @@ class PrefectAPIRoute(APIRoute):
     dependencies. If we want to close a dependency before the request is complete
     (i.e. before returning a response to the user), we need a stack with a different
     scope. This extension adds this stack at `request.state.response_scoped_stack`.
+
+    Request bodies sent with a gzip `Content-Encoding` are decompressed, allowing
+    clients to compress large payloads such as batches of logs.
     """
 
     def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
         default_handler = super().get_route_handler()
 
         async def handle_response_scoped_depends(request: Request) -> Response:
+            if "gzip" in request.headers.getlist("Content-Encoding"):
+                request = GzipRequest(request.scope, request.receive)
+
             # Create a new stack scoped to exit before the response is returned
             async with AsyncExitStack() as stack:
                 request.state.response_scoped_stack = stack
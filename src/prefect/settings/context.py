@@ -1,7 +1,20 @@
+import os
+import threading
 from contextlib import contextmanager
-from typing import TYPE_CHECKING, Any, Generator, Iterable, Mapping, Optional
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Generator,
+    Hashable,
+    Iterable,
+    Mapping,
+    Optional,
+    Tuple,
+)
 
 from prefect.settings.models.root import Settings
+from prefect.settings.sources import _get_profiles_path
 
 if TYPE_CHECKING:
     from prefect.settings.legacy import Setting
@@ -12,13 +25,80 @@ def get_current_settings() -> Settings:
     Returns a settings object populated with values from the current settings context
     or, if no settings context is active, the environment.
     """
-    from prefect.context import SettingsContext
+    import prefect.context
 
-    settings_context = SettingsContext.get()
+    settings_context = prefect.context.SettingsContext.get()
     if settings_context is not None:
         return settings_context.settings
 
-    return Settings()
+    return _get_settings_snapshot()
+
+
+_snapshot_lock = threading.Lock()
+# The settings and the fingerprint of the sources they were built from, swapped
+# together so readers never see a partial update
+_snapshot: Optional[Tuple[Settings, Tuple[Hashable, ...]]] = None
+_snapshot_profiles_path: Optional[Path] = None
+
+
+def _get_settings_snapshot() -> Settings:
+    """
+    Returns a copy of a process-wide settings object populated from the environment.
+
+    Building settings from the environment reads several files, so the settings are
+    only built again when the working directory or any of the settings files changed
+    since they were last built, or after `invalidate_settings_snapshot` is called.
+    Scanning the environment on every read is too slow in large environments, so
+    changes to environment variables are only seen after the snapshot is
+    invalidated.
+    """
+    global _snapshot, _snapshot_profiles_path
+
+    snapshot = _snapshot
+    if snapshot is None or snapshot[1] != _file_sources(_snapshot_profiles_path):
+        with _snapshot_lock:
+            snapshot = _snapshot
+            if snapshot is None or snapshot[1] != _file_sources(
+                _snapshot_profiles_path
+            ):
+                settings = Settings()
+                # the profiles path may be set by the other sources
+                _snapshot_profiles_path = _get_profiles_path()
+                snapshot = _snapshot = (
+                    settings,
+                    _file_sources(_snapshot_profiles_path),
+                )
+
+    # callers may modify the settings they are given, so each gets its own copy
+    return snapshot[0].model_copy(deep=True)
+
+
+def invalidate_settings_snapshot() -> None:
+    """
+    Makes the next settings read from the environment build its settings again, for
+    example after changing environment variables or writing to the profiles file.
+    """
+    global _snapshot
+
+    with _snapshot_lock:
+        _snapshot = None
+
+
+def _file_sources(profiles_path: Optional[Path]) -> Tuple[Hashable, ...]:
+    """Returns a fingerprint of the working directory and the settings files"""
+    files = [".env", "prefect.toml", "pyproject.toml"]
+    if profiles_path is not None:
+        files.append(str(profiles_path))
+
+    return (os.getcwd(), *(_file_version(file) for file in files))
+
+
+def _file_version(path: str) -> Optional[Tuple[int, int]]:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
 
 
 @contextmanager
@@ -59,7 +139,13 @@ def temporary_settings(
         updates=updates, set_defaults=set_defaults, restore_defaults=restore_defaults
     )
 
-    with prefect.context.SettingsContext(
-        profile=context.profile, settings=new_settings
-    ):
-        yield new_settings
+    # settings read from the environment inside and after the context see any
+    # environment variables changed since they were last read
+    invalidate_settings_snapshot()
+    try:
+        with prefect.context.SettingsContext(
+            profile=context.profile, settings=new_settings
+        ):
+            yield new_settings
+    finally:
+        invalidate_settings_snapshot()
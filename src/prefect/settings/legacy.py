@@ -26,6 +26,7 @@ class Setting:
             self.accessor = _env_var_to_accessor(name)
         else:
             self.accessor = accessor
+        self._path = tuple(self.accessor.split("."))
 
     @property
     def name(self):
@@ -44,10 +45,7 @@ class Setting:
         return self._default
 
     def value(self: Self) -> Any:
-        if (
-            self.name == "PREFECT_TEST_SETTING"
-            or self.name == "PREFECT_TESTING_TEST_SETTING"
-        ):
+        if self._name in ("PREFECT_TEST_SETTING", "PREFECT_TESTING_TEST_SETTING"):
             if (
                 "PREFECT_TEST_MODE" in os.environ
                 or "PREFECT_TESTING_TEST_MODE" in os.environ
@@ -59,9 +57,8 @@ class Setting:
         return self.value_from(get_current_settings())
 
     def value_from(self: Self, settings: "Settings") -> Any:
-        path = self.accessor.split(".")
         current_value = settings
-        for key in path:
+        for key in self._path:
             current_value = getattr(current_value, key, None)
         if isinstance(current_value, _SECRET_TYPES):
             return current_value.get_secret_value()  # type: ignore
@@ -1,3 +1,5 @@
+from typing import Literal, Optional
+
 from pydantic import AliasChoices, AliasPath, Field
 
 from prefect.settings.base import (
@@ -32,6 +34,118 @@ class ClientMetricsSettings(PrefectBaseSettings):
     )
 
 
+class ClientConcurrencySettings(PrefectBaseSettings):
+    """
+    Settings for controlling how the client acquires global concurrency slots
+    """
+
+    model_config = _build_settings_config(("client", "concurrency"))
+
+    lease_slots: int = Field(
+        default=0,
+        ge=0,
+        description="""
+        The number of slots to acquire from global concurrency and rate limits at once.
+        Leased slots are handed out to `concurrency` and `rate_limit` calls within the
+        process without a request to the API and unused slots are returned when the
+        lease expires. Set to 0 to acquire slots individually.
+        """,
+    )
+
+    lease_ttl_seconds: float = Field(
+        default=10.0,
+        gt=0.0,
+        description="""
+        The number of seconds after which leased slots are no longer handed out and any
+        unused slots are returned, so that other processes get a fair share of the limit.
+        When a lease can't be acquired, slots on the same limits are acquired
+        individually for this long before leasing is tried again.
+        """,
+    )
+
+    slot_wait_seconds: float = Field(
+        default=30.0,
+        ge=0.0,
+        description="""
+        The number of seconds each request to acquire global concurrency slots asks the
+        server to wait for slots to be released before responding, instead of retrying
+        after the server's estimate. Must be less than the API request timeout. Set to
+        0 to disable waiting on the server.
+        """,
+    )
+
+
+class ClientBlocksSettings(PrefectBaseSettings):
+    """
+    Settings for controlling how the client loads blocks
+    """
+
+    model_config = _build_settings_config(("client", "blocks"))
+
+    cache_enabled: bool = Field(
+        default=False,
+        description="""
+        Whether or not to cache the block documents read by `Block.load` and
+        `Block.load_from_ref` in the process, so that loading the same block again
+        doesn't make a request to the API. Cached block documents are dropped when the
+        block document is updated or deleted, or when they expire.
+        """,
+    )
+
+    cache_ttl_seconds: float = Field(
+        default=60.0,
+        gt=0.0,
+        description="The number of seconds a cached block document is used for before it is read from the API again.",
+    )
+
+    cache_max_size: int = Field(
+        default=256,
+        ge=1,
+        description="The maximum number of block documents cached in the process.",
+    )
+
+
+class ClientEventsSettings(PrefectBaseSettings):
+    """
+    Settings for controlling how the client emits events
+    """
+
+    model_config = _build_settings_config(("client", "events"))
+
+    batch_size: int = Field(
+        default=100,
+        ge=1,
+        description="The maximum number of events emitted to the API together. Servers that accept batches receive the events of a batch in a single websocket message.",
+    )
+
+    max_queue_items: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description="The maximum number of events waiting to be emitted. If not set, the number of waiting events is unbounded.",
+    )
+
+    max_queue_size: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description="The maximum total size in bytes of events waiting to be emitted. If not set, the size of waiting events is unbounded.",
+    )
+
+    overflow_policy: Literal["block", "drop_oldest", "spill"] = Field(
+        default="block",
+        description="""
+        Controls what happens to new events when the queue of events waiting to be
+        emitted is full.
+
+        The following options are available:
+
+        - "block": Wait until there is room in the queue.
+        - "drop_oldest": Drop the oldest waiting events.
+        - "spill": Write events to a local spool file, which is read back as the API
+            catches up.
+        """,
+    )
+
+
 class ClientSettings(PrefectBaseSettings):
     """
     Settings for controlling API client behavior
@@ -82,7 +196,22 @@ class ClientSettings(PrefectBaseSettings):
         """,
     )
 
+    blocks: ClientBlocksSettings = Field(
+        default_factory=ClientBlocksSettings,
+        description="Settings for controlling how the client loads blocks",
+    )
+
+    concurrency: ClientConcurrencySettings = Field(
+        default_factory=ClientConcurrencySettings,
+        description="Settings for controlling how the client acquires global concurrency slots",
+    )
+
     metrics: ClientMetricsSettings = Field(
         default_factory=ClientMetricsSettings,
         description="Settings for controlling metrics reporting from the client",
     )
+
+    events: ClientEventsSettings = Field(
+        default_factory=ClientEventsSettings,
+        description="Settings for controlling how the client emits events",
+    )
@@ -54,6 +54,38 @@ class LoggingToAPISettings(PrefectBaseSettings):
         description="The maximum size in bytes for a single log.",
     )
 
+    max_queue_items: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description="The maximum number of logs waiting to be sent to the API. If not set, the number of waiting logs is unbounded.",
+    )
+
+    max_queue_size: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description="The maximum total size in bytes of logs waiting to be sent to the API. If not set, the size of waiting logs is unbounded.",
+    )
+
+    overflow_policy: Literal["block", "drop_oldest", "spill"] = Field(
+        default="block",
+        description="""
+        Controls what happens to new logs when the queue of logs waiting to be sent to
+        the API is full.
+
+        The following options are available:
+
+        - "block": Wait until there is room in the queue.
+        - "drop_oldest": Drop the oldest waiting logs.
+        - "spill": Write logs to a local spool file, which is read back as the API
+            catches up.
+        """,
+    )
+
+    compress: bool = Field(
+        default=False,
+        description="If `True`, batches of logs will be gzip-compressed before being sent to the API. Requires an API that accepts gzip-encoded request bodies.",
+    )
+
     when_missing_flow: Literal["warn", "error", "ignore"] = Field(
         default="warn",
         description="""
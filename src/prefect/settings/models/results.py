@@ -33,6 +33,12 @@ class ResultsSettings(PrefectBaseSettings):
         ),
     )
 
+    memory_cache_max_bytes: int = Field(
+        default=100 * 1024 * 1024,
+        ge=0,
+        description="The maximum total size, in bytes of serialized results, of result records kept in memory by result stores. The cache is shared by all result stores in the process. Set to 0 to disable the in-memory cache.",
+    )
+
     local_storage_path: Optional[Path] = Field(
         default=None,
         description="The path to a directory to store results in.",
@@ -42,3 +48,14 @@ class ResultsSettings(PrefectBaseSettings):
             "prefect_local_storage_path",
         ),
     )
+
+    metadata_index_path: Optional[Path] = Field(
+        default=None,
+        description="The path to a directory to store an index of the metadata of persisted result records in. The index is used to check for the existence of result records without reading them from result storage. No index is kept unless a path is set.",
+    )
+
+    metadata_index_max_age_seconds: float = Field(
+        default=7 * 24 * 60 * 60,
+        gt=0,
+        description="The number of seconds after which entries of the result metadata index that haven't been used are removed from the index.",
+    )
@@ -152,10 +152,12 @@ class Settings(PrefectBaseSettings):
     ###########################################################################
     # allow deprecated access to PREFECT_SOME_SETTING_NAME
 
-    def __getattribute__(self, name: str) -> Any:
-        from prefect.settings.legacy import _env_var_to_accessor
-
+    def __getattr__(self, name: str) -> Any:
+        # only called when normal attribute lookup fails, which keeps the access to
+        # actual settings fast
         if name.startswith("PREFECT_"):
+            from prefect.settings.legacy import _env_var_to_accessor
+
             accessor = _env_var_to_accessor(name)
             warnings.warn(
                 f"Accessing `Settings().{name}` is deprecated. Use `Settings().{accessor}` instead.",
@@ -163,11 +165,11 @@ class Settings(PrefectBaseSettings):
                 stacklevel=2,
             )
             path = accessor.split(".")
-            value = super().__getattribute__(path[0])
+            value = getattr(self, path[0])
             for key in path[1:]:
                 value = getattr(value, key)
             return value
-        return super().__getattribute__(name)
+        return super().__getattr__(name)  # type: ignore[misc]
 
     ###########################################################################
 
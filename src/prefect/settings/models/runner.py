@@ -54,6 +54,18 @@ class RunnerSettings(PrefectBaseSettings):
         description="Number of seconds a runner should wait between queries for scheduled work.",
     )
 
+    subscribe_to_scheduled_flow_runs: bool = Field(
+        default=False,
+        description="""
+        Whether a runner should subscribe to be pushed scheduled flow runs by the
+        server as soon as they are due, in addition to querying for scheduled work.
+        The poll frequency can be raised when this is enabled. Requires a server that
+        supports flow run subscriptions. Subscriptions are held in the memory of
+        the server process a client connects to, so servers running more than one
+        replica only push flow runs to clients connected to the scheduling replica.
+        """,
+    )
+
     server: RunnerServerSettings = Field(
         default_factory=RunnerServerSettings,
         description="Settings for controlling runner server behavior",
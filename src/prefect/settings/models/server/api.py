@@ -32,6 +32,12 @@ class ServerAPISettings(PrefectBaseSettings):
         ),
     )
 
+    max_decompressed_body_size: int = Field(
+        default=50 * 1024 * 1024,
+        gt=0,
+        description="The maximum size, in bytes, of a gzip-encoded request body once it is decompressed. Larger bodies are rejected with a 413.",
+    )
+
     keepalive_timeout: int = Field(
         default=5,
         description="""
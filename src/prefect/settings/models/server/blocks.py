@@ -0,0 +1,33 @@
+from pydantic import Field
+
+from prefect.settings.base import PrefectBaseSettings, _build_settings_config
+
+
+class ServerBlocksSettings(PrefectBaseSettings):
+    """
+    Settings for controlling behavior of the blocks subsystem
+    """
+
+    model_config = _build_settings_config(("server", "blocks"))
+
+    cache_enabled: bool = Field(
+        default=False,
+        description="""
+        Whether or not to cache hydrated block documents read by ID or name in the
+        server process. The cache is cleared whenever block documents, block schemas
+        or block types are written by the same process. Reads that include
+        secrets are never cached.
+        """,
+    )
+
+    cache_ttl_seconds: float = Field(
+        default=60.0,
+        gt=0.0,
+        description="The number of seconds a cached block document is used for before it is read from the database again.",
+    )
+
+    cache_max_size: int = Field(
+        default=1000,
+        ge=1,
+        description="The maximum number of block documents cached in the server process.",
+    )
@@ -0,0 +1,21 @@
+from pydantic import Field
+
+from prefect.settings.base import PrefectBaseSettings, _build_settings_config
+
+
+class ServerConcurrencySettings(PrefectBaseSettings):
+    """
+    Settings for controlling server-side behavior of global concurrency limits
+    """
+
+    model_config = _build_settings_config(("server", "concurrency"))
+
+    max_slot_wait_seconds: float = Field(
+        default=30.0,
+        ge=0.0,
+        description="""
+        The maximum number of seconds a request to acquire global concurrency slots may
+        wait in line for slots to be released before the server responds with
+        `423 Locked`. Set to 0 to always respond immediately.
+        """,
+    )
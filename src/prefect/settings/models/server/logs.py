@@ -0,0 +1,29 @@
+from datetime import timedelta
+
+from pydantic import Field
+
+from prefect.settings.base import PrefectBaseSettings, _build_settings_config
+
+
+class ServerLogsSettings(PrefectBaseSettings):
+    """
+    Settings for controlling behavior of the logs subsystem
+    """
+
+    model_config = _build_settings_config(("server", "logs"))
+
+    stream_out_enabled: bool = Field(
+        default=False,
+        description="Whether or not to stream newly created logs out to the API via websockets.",
+    )
+
+    stream_batch_size: int = Field(
+        default=1000,
+        gt=0,
+        description="The number of logs to fetch from the database at a time when streaming logs out of the API.",
+    )
+
+    maximum_websocket_backfill: timedelta = Field(
+        default=timedelta(minutes=15),
+        description="The maximum range to look back for backfilling logs for a websocket subscriber.",
+    )
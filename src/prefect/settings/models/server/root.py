@@ -7,11 +7,14 @@ from prefect.settings.base import PrefectBaseSettings, _build_settings_config
 from prefect.types import LogLevel
 
 from .api import ServerAPISettings
+from .blocks import ServerBlocksSettings
+from .concurrency import ServerConcurrencySettings
 from .database import ServerDatabaseSettings
 from .deployments import ServerDeploymentsSettings
 from .ephemeral import ServerEphemeralSettings
 from .events import ServerEventsSettings
 from .flow_run_graph import ServerFlowRunGraphSettings
+from .logs import ServerLogsSettings
 from .services import ServerServicesSettings
 from .tasks import ServerTasksSettings
 from .ui import ServerUISettings
@@ -106,6 +109,14 @@ class ServerSettings(PrefectBaseSettings):
         default_factory=ServerAPISettings,
         description="Settings for controlling API server behavior",
     )
+    blocks: ServerBlocksSettings = Field(
+        default_factory=ServerBlocksSettings,
+        description="Settings for controlling server blocks behavior",
+    )
+    concurrency: ServerConcurrencySettings = Field(
+        default_factory=ServerConcurrencySettings,
+        description="Settings for controlling server-side behavior of global concurrency limits",
+    )
     database: ServerDatabaseSettings = Field(
         default_factory=ServerDatabaseSettings,
         description="Settings for controlling server database behavior",
@@ -126,6 +137,10 @@ class ServerSettings(PrefectBaseSettings):
         default_factory=ServerFlowRunGraphSettings,
         description="Settings for controlling flow run graph behavior",
     )
+    logs: ServerLogsSettings = Field(
+        default_factory=ServerLogsSettings,
+        description="Settings for controlling server logs behavior",
+    )
     services: ServerServicesSettings = Field(
         default_factory=ServerServicesSettings,
         description="Settings for controlling server services behavior",
@@ -74,6 +74,29 @@ class ServerServicesEventPersisterSettings(PrefectBaseSettings):
         ),
     )
 
+    max_batch_size: int = Field(
+        default=1000,
+        gt=0,
+        description="The largest number of events the event persister will accumulate before inserting them. The event persister grows its batches from `batch_size` up to this size while a batch fills faster than the previous one was inserted.",
+    )
+
+    max_flush_attempts: int = Field(
+        default=5,
+        gt=0,
+        description="The number of times the event persister attempts to insert a batch of events before moving it to its dead letter queue, so that a batch that can never be inserted doesn't hold up the events behind it.",
+    )
+
+    max_queue_size: int = Field(
+        default=10_000,
+        gt=0,
+        description="The maximum number of events the event persister will hold in memory. When the queue is full, the event persister stops consuming events until it has flushed.",
+    )
+
+    use_copy: bool = Field(
+        default=False,
+        description="Whether the event persister writes events to PostgreSQL databases with `COPY` instead of `INSERT` statements.",
+    )
+
 
 class ServerServicesFlowRunNotificationsSettings(PrefectBaseSettings):
     """
@@ -373,6 +396,61 @@ class ServerServicesPauseExpirationsSettings(PrefectBaseSettings):
     )
 
 
+class ServerServicesRunHistoryRollupsSettings(PrefectBaseSettings):
+    """
+    Settings for controlling the run history rollups service
+    """
+
+    model_config = _build_settings_config(("server", "services", "run_history_rollups"))
+
+    enabled: bool = Field(
+        default=False,
+        description="""
+        Whether or not to start the run history rollups service in the server application.
+        If enabled, run history queries over whole hours read precomputed run counts
+        instead of scanning the flow run and task run tables.
+        """,
+        validation_alias=AliasChoices(
+            AliasPath("enabled"),
+            "prefect_server_services_run_history_rollups_enabled",
+        ),
+    )
+
+    loop_seconds: float = Field(
+        default=60,
+        description="""
+        The run history rollups service will recompute the counts of recently updated runs this often. Defaults to `60`.
+        """,
+        validation_alias=AliasChoices(
+            AliasPath("loop_seconds"),
+            "prefect_server_services_run_history_rollups_loop_seconds",
+        ),
+    )
+
+    reconcile_seconds: float = Field(
+        default=3600,
+        description="""
+        The run history rollups service will recompute the counts of hours whose runs were deleted or moved to another hour this often. Defaults to `3600`.
+        """,
+        validation_alias=AliasChoices(
+            AliasPath("reconcile_seconds"),
+            "prefect_server_services_run_history_rollups_reconcile_seconds",
+        ),
+    )
+
+    commit_grace_seconds: float = Field(
+        default=60,
+        ge=0,
+        description="""
+        Runs are stamped with their update time when their transaction starts, so the run history rollups service leaves out runs updated this recently, to give their transactions time to commit. Runs in transactions that take longer to commit may be left out of the rollups until the next reconcile. Defaults to `60`.
+        """,
+        validation_alias=AliasChoices(
+            AliasPath("commit_grace_seconds"),
+            "prefect_server_services_run_history_rollups_commit_grace_seconds",
+        ),
+    )
+
+
 class ServerServicesTaskRunRecorderSettings(PrefectBaseSettings):
     """
     Settings for controlling the task run recorder service
@@ -444,6 +522,10 @@ class ServerServicesSettings(PrefectBaseSettings):
         default_factory=ServerServicesPauseExpirationsSettings,
         description="Settings for controlling the pause expiration service",
     )
+    run_history_rollups: ServerServicesRunHistoryRollupsSettings = Field(
+        default_factory=ServerServicesRunHistoryRollupsSettings,
+        description="Settings for controlling the run history rollups service",
+    )
     task_run_recorder: ServerServicesTaskRunRecorderSettings = Field(
         default_factory=ServerServicesTaskRunRecorderSettings,
         description="Settings for controlling the task run recorder service",
@@ -32,6 +32,22 @@ class ServerTasksSchedulingSettings(PrefectBaseSettings):
         ),
     )
 
+    queue_backend: str = Field(
+        default="prefect.server.task_queue.memory",
+        description="""
+        Which task queue implementation to use for delivering background task runs to
+        task workers. Should point to a module that exports a TaskQueue class. Use
+        `prefect.server.task_queue.database` to keep the queues in the database, so
+        that they survive restarts of the API.
+        """,
+    )
+
+    visibility_timeout: timedelta = Field(
+        default=timedelta(seconds=30),
+        gt=timedelta(0),
+        description="How long a background task run that was sent to a task worker without being acknowledged is kept from being delivered again.",
+    )
+
     pending_task_timeout: timedelta = Field(
         default=timedelta(0),
         description="How long before a PENDING task are made available to another task worker.",
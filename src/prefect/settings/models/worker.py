@@ -35,6 +35,28 @@ class WorkerSettings(PrefectBaseSettings):
         description="The number of seconds into the future a worker should query for scheduled work.",
     )
 
+    claim_flow_runs: bool = Field(
+        default=False,
+        description="""
+        Whether a worker should claim scheduled flow runs with a single request that
+        moves them to a Pending state, instead of querying for scheduled flow runs and
+        proposing a Pending state for each. Claimed flow runs are never sent to more
+        than one worker. Requires a server that supports claiming flow runs.
+        """,
+    )
+
+    subscribe_to_scheduled_flow_runs: bool = Field(
+        default=False,
+        description="""
+        Whether a worker should subscribe to be pushed scheduled flow runs by the
+        server as soon as they are due, in addition to querying for scheduled work.
+        The query interval can be raised when this is enabled. Requires a server that
+        supports flow run subscriptions. Subscriptions are held in the memory of
+        the server process a client connects to, so servers running more than one
+        replica only push flow runs to clients connected to the scheduling replica.
+        """,
+    )
+
     webserver: WorkerWebserverSettings = Field(
         default_factory=WorkerWebserverSettings,
         description="Settings for a worker's webserver",
@@ -16,7 +16,10 @@ from pydantic_settings import BaseSettings
 
 from prefect.exceptions import ProfileSettingsValidationError
 from prefect.settings.constants import DEFAULT_PROFILES_PATH
-from prefect.settings.context import get_current_settings
+from prefect.settings.context import (
+    get_current_settings,
+    invalidate_settings_snapshot,
+)
 from prefect.settings.legacy import Setting, _get_settings_fields
 from prefect.settings.models.root import Settings
 
@@ -337,7 +340,8 @@ def save_profiles(profiles: ProfilesCollection) -> None:
     profiles_path = get_current_settings().profiles_path
     assert profiles_path is not None, "Profiles path is not set."
     profiles = profiles.without_profile_source(DEFAULT_PROFILES_PATH)
-    return _write_profiles_to(profiles_path, profiles)
+    _write_profiles_to(profiles_path, profiles)
+    invalidate_settings_snapshot()
 
 
 def load_profile(name: str) -> Profile:
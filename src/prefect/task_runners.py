@@ -1,10 +1,14 @@
 import abc
 import asyncio
+import itertools
+import multiprocessing
+import os
 import sys
 import threading
 import uuid
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from contextvars import copy_context
+from copy import copy
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -12,26 +16,36 @@ from typing import (
     Dict,
     Generic,
     Iterable,
+    Iterator,
     List,
     Optional,
     Set,
+    Tuple,
     overload,
 )
 
+import cloudpickle
 from typing_extensions import ParamSpec, Self, TypeVar
 
 from prefect.client.schemas.objects import TaskRunInput
 from prefect.exceptions import MappingLengthMismatch, MappingMissingIterable
 from prefect.futures import (
+    PrefectChunkedFuture,
     PrefectConcurrentFuture,
     PrefectDistributedFuture,
     PrefectFuture,
     PrefectFutureList,
+    PrefectResultIterator,
+    resolve_futures_to_states,
 )
 from prefect.logging.loggers import get_logger, get_run_logger
-from prefect.settings import PREFECT_TASK_RUNNER_THREAD_POOL_MAX_WORKERS
+from prefect.settings import (
+    PREFECT_TASK_RUNNER_THREAD_POOL_MAX_WORKERS,
+    PREFECT_TASKS_RUNNER_PROCESS_POOL_MAX_WORKERS,
+)
 from prefect.utilities.annotations import allow_failure, quote, unmapped
 from prefect.utilities.callables import (
+    call_with_parameters,
     collapse_variadic_parameters,
     explode_variadic_parameter,
     get_parameter_defaults,
@@ -100,6 +114,7 @@ class TaskRunner(abc.ABC, Generic[F]):
         task: "Task[P, R]",
         parameters: Dict[str, Any],
         wait_for: Optional[Iterable[PrefectFuture[R]]] = None,
+        chunksize: Optional[int] = None,
     ) -> PrefectFutureList[F]:
         """
         Submit multiple tasks to the task run engine.
@@ -108,16 +123,99 @@ class TaskRunner(abc.ABC, Generic[F]):
             task: The task to submit.
             parameters: The parameters to use when running the task.
             wait_for: A list of futures that the task depends on.
+            chunksize: If provided, iterable parameters are consumed lazily and
+                submitted in chunks of this many elements, with one task run per
+                chunk instead of one per element.
 
         Returns:
             An iterable of future objects that can be used to wait for the tasks to
             complete and retrieve the results.
         """
+        if not self._started:
+            raise RuntimeError(
+                "The task runner must be started before submitting work."
+            )
+        if chunksize is not None and chunksize < 1:
+            raise ValueError("`chunksize` must be a positive integer.")
+
+        task_inputs, call_parameters = self._expand_map_parameters(
+            task, parameters, stream=bool(chunksize)
+        )
+
+        if chunksize:
+            return self._map_chunks(
+                task,
+                call_parameters,
+                chunksize=chunksize,
+                wait_for=wait_for,
+                dependencies=task_inputs,
+            )
+
+        futures: List[PrefectFuture] = []
+        for call_parameters_for_run in call_parameters:
+            futures.append(
+                self.submit(
+                    task=task,
+                    parameters=call_parameters_for_run,
+                    wait_for=wait_for,
+                    dependencies=task_inputs,
+                )
+            )
+
+        return PrefectFutureList(futures)
+
+    def map_unordered(
+        self,
+        task: "Task[P, R]",
+        parameters: Dict[str, Any],
+        wait_for: Optional[Iterable[PrefectFuture[R]]] = None,
+        max_in_flight: int = 100,
+    ) -> PrefectResultIterator[R]:
+        """
+        Lazily submit multiple tasks to the task run engine and iterate over their
+        results in the order they complete.
+
+        Args:
+            task: The task to submit.
+            parameters: The parameters to use when running the task.
+            wait_for: A list of futures that the task depends on.
+            max_in_flight: The maximum number of submitted task runs that have not
+                yet been consumed from the returned iterator.
+
+        Returns:
+            An iterator, usable with `for` or `async for`, over the results of the
+            task runs.
+        """
         if not self._started:
             raise RuntimeError(
                 "The task runner must be started before submitting work."
             )
 
+        task_inputs, call_parameters = self._expand_map_parameters(
+            task, parameters, stream=True
+        )
+        futures = (
+            self.submit(
+                task=task,
+                parameters=call_parameters_for_run,
+                wait_for=wait_for,
+                dependencies=task_inputs,
+            )
+            for call_parameters_for_run in call_parameters
+        )
+        return PrefectResultIterator(futures, max_in_flight=max_in_flight)
+
+    def _expand_map_parameters(
+        self, task: "Task[P, R]", parameters: Dict[str, Any], stream: bool = False
+    ) -> Tuple[Dict[str, Set[TaskRunInput]], Iterator[Dict[str, Any]]]:
+        """
+        Expand mapped parameters into the parameters for each task run.
+
+        Returns the upstream task inputs shared by all task runs and an iterator of
+        call parameters, one per element of the mapped iterables. If `stream` is
+        `True`, iterables are consumed lazily as the iterator is advanced instead of
+        being materialized up front.
+        """
         from prefect.utilities.engine import (
             collect_task_run_inputs_sync,
             resolve_inputs_sync,
@@ -150,7 +248,7 @@ class TaskRunner(abc.ABC, Generic[F]):
             if isinstance(val, unmapped):
                 static_parameters[key] = val.value
             elif isiterable(val):
-                iterable_parameters[key] = list(val)
+                iterable_parameters[key] = val if stream else list(val)
             else:
                 static_parameters[key] = val
 
@@ -160,8 +258,11 @@ class TaskRunner(abc.ABC, Generic[F]):
                 f"include at least one iterable. Parameters: {parameters}"
             )
 
+        # Lazy iterables without a length are checked as they are consumed
         iterable_parameter_lengths = {
-            key: len(val) for key, val in iterable_parameters.items()
+            key: len(val)
+            for key, val in iterable_parameters.items()
+            if hasattr(val, "__len__")
         }
         lengths = set(iterable_parameter_lengths.values())
         if len(lengths) > 1:
@@ -170,20 +271,14 @@ class TaskRunner(abc.ABC, Generic[F]):
                 f" must all be the same length. Got lengths: {iterable_parameter_lengths}"
             )
 
-        map_length = list(lengths)[0]
+        # Default values for parameters are skipped earlier since they should not be
+        # mapped over; they are added to each call below
+        parameter_defaults = get_parameter_defaults(task.fn)
 
-        futures: List[PrefectFuture] = []
-        for i in range(map_length):
-            call_parameters = {
-                key: value[i] for key, value in iterable_parameters.items()
-            }
-            call_parameters.update(
-                {key: value for key, value in static_parameters.items()}
-            )
-
-            # Add default values for parameters; these are skipped earlier since they should
-            # not be mapped over
-            for key, value in get_parameter_defaults(task.fn).items():
+        def build_call_parameters(values: Iterable[Any]) -> Dict[str, Any]:
+            call_parameters = dict(zip(iterable_parameters, values))
+            call_parameters.update(static_parameters)
+            for key, value in parameter_defaults.items():
                 call_parameters.setdefault(key, value)
 
             # Re-apply annotations to each key again
@@ -191,15 +286,42 @@ class TaskRunner(abc.ABC, Generic[F]):
                 call_parameters[key] = annotation.rewrap(call_parameters[key])
 
             # Collapse any previously exploded kwargs
-            call_parameters = collapse_variadic_parameters(task.fn, call_parameters)
+            return collapse_variadic_parameters(task.fn, call_parameters)
 
-            futures.append(
-                self.submit(
-                    task=task,
-                    parameters=call_parameters,
-                    wait_for=wait_for,
-                    dependencies=task_inputs,
-                )
+        return task_inputs, (
+            build_call_parameters(values)
+            for values in _zip_mapped_iterables(iterable_parameters)
+        )
+
+    def _map_chunks(
+        self,
+        task: "Task[P, R]",
+        call_parameters: Iterable[Dict[str, Any]],
+        chunksize: int,
+        wait_for: Optional[Iterable[PrefectFuture[R]]] = None,
+        dependencies: Optional[Dict[str, Set[TaskRunInput]]] = None,
+    ) -> PrefectFutureList[PrefectChunkedFuture[R]]:
+        """
+        Submit one run of a chunked copy of `task` per `chunksize` elements of
+        `call_parameters` and return one future per element.
+        """
+        chunk_task = _chunked_task(task)
+        call_parameters = iter(call_parameters)
+        # Upstream links are tracked against the single `chunk` parameter
+        chunk_dependencies = {
+            "chunk": set().union(*(dependencies or {}).values()),
+        }
+
+        futures: List[PrefectChunkedFuture[R]] = []
+        while chunk := list(itertools.islice(call_parameters, chunksize)):
+            chunk_future = self.submit(
+                task=chunk_task,
+                parameters={"chunk": chunk},
+                wait_for=wait_for,
+                dependencies=chunk_dependencies,
+            )
+            futures.extend(
+                PrefectChunkedFuture(chunk_future, index) for index in range(len(chunk))
             )
 
         return PrefectFutureList(futures)
@@ -313,6 +435,9 @@ class ThreadPoolTaskRunner(TaskRunner[PrefectConcurrentFuture]):
                 run_task_sync,
                 **submit_kwargs,
             )
+        # Release the cancel event once the task run is finished so that long-running
+        # flows with many task runs do not accumulate them
+        future.add_done_callback(lambda _: self._cancel_events.pop(task_run_id, None))
         prefect_future = PrefectConcurrentFuture(
             task_run_id=task_run_id, wrapped_future=future
         )
@@ -324,6 +449,7 @@ class ThreadPoolTaskRunner(TaskRunner[PrefectConcurrentFuture]):
         task: "Task[P, Coroutine[Any, Any, R]]",
         parameters: Dict[str, Any],
         wait_for: Optional[Iterable[PrefectFuture]] = None,
+        chunksize: Optional[int] = None,
     ) -> PrefectFutureList[PrefectConcurrentFuture[R]]:
         ...
 
@@ -333,6 +459,7 @@ class ThreadPoolTaskRunner(TaskRunner[PrefectConcurrentFuture]):
         task: "Task[Any, R]",
         parameters: Dict[str, Any],
         wait_for: Optional[Iterable[PrefectFuture]] = None,
+        chunksize: Optional[int] = None,
     ) -> PrefectFutureList[PrefectConcurrentFuture[R]]:
         ...
 
@@ -341,11 +468,12 @@ class ThreadPoolTaskRunner(TaskRunner[PrefectConcurrentFuture]):
         task: "Task",
         parameters: Dict[str, Any],
         wait_for: Optional[Iterable[PrefectFuture]] = None,
+        chunksize: Optional[int] = None,
     ):
-        return super().map(task, parameters, wait_for)
+        return super().map(task, parameters, wait_for, chunksize=chunksize)
 
     def cancel_all(self):
-        for event in self._cancel_events.values():
+        for event in list(self._cancel_events.values()):
             event.set()
             self.logger.debug("Set cancel event")
 
@@ -371,10 +499,283 @@ class ThreadPoolTaskRunner(TaskRunner[PrefectConcurrentFuture]):
         return self._max_workers == value._max_workers
 
 
+def _zip_mapped_iterables(iterables: Dict[str, Iterable[Any]]) -> Iterator[tuple]:
+    """
+    Lazily zip mapped iterables, raising `MappingLengthMismatch` if any of them is
+    exhausted before the others.
+    """
+    sentinel = object()
+    for values in itertools.zip_longest(*iterables.values(), fillvalue=sentinel):
+        if any(value is sentinel for value in values):
+            raise MappingLengthMismatch(
+                "Received iterable parameters with different lengths. Parameters for"
+                " map must all be the same length."
+            )
+        yield values
+
+
+def _chunked_task(task: "Task[P, R]") -> "Task[..., List[R]]":
+    """
+    Return a copy of `task` that calls the task function once for each set of
+    parameters in its `chunk` parameter and returns the list of results.
+    """
+    from prefect.cache_policies import CachePolicy, _Chunked, _None
+
+    if task.result_storage_key is not None:
+        raise ValueError(
+            "`chunksize` cannot be used with tasks that set `result_storage_key`"
+            " because all elements of a chunk share a single result."
+        )
+
+    if task.isasync:
+
+        async def run_chunk(chunk: List[Dict[str, Any]]) -> List[Any]:
+            return [await call_with_parameters(task.fn, p) for p in chunk]
+
+    else:
+
+        def run_chunk(chunk: List[Dict[str, Any]]) -> List[Any]:
+            return [call_with_parameters(task.fn, p) for p in chunk]
+
+    chunk_task = copy(task)
+    chunk_task.fn = run_chunk
+    chunk_task.task_key = f"{task.task_key}-chunk"
+    # Run name templates refer to the parameters of a single element
+    chunk_task.task_run_name = None
+    # Cache keys are computed from the parameters of each element of the chunk
+    chunk_task.cache_key_fn = None
+    if isinstance(task.cache_policy, CachePolicy) and not isinstance(
+        task.cache_policy, _None
+    ):
+        chunk_task.cache_policy = _Chunked(
+            policy=task.cache_policy,
+            key_storage=task.cache_policy.key_storage,
+            isolation_level=task.cache_policy.isolation_level,
+            lock_manager=task.cache_policy.lock_manager,
+        )
+    return chunk_task
+
+
 # Here, we alias ConcurrentTaskRunner to ThreadPoolTaskRunner for backwards compatibility
 ConcurrentTaskRunner = ThreadPoolTaskRunner
 
 
+def _run_task_in_subprocess(payload: bytes) -> bytes:
+    """
+    Run a cloudpickled task submission in a `ProcessPoolTaskRunner` worker process
+    and return the cloudpickled final state.
+
+    Defined at the top-level so it can be pickled by the Python pickler.
+    """
+    from prefect.task_engine import run_task_async, run_task_sync
+
+    task, submit_kwargs = cloudpickle.loads(payload)
+    if task.isasync:
+        state = asyncio.run(run_task_async(task=task, **submit_kwargs))
+    else:
+        state = run_task_sync(task=task, **submit_kwargs)
+    return cloudpickle.dumps(state)
+
+
+class ProcessPoolTaskRunner(TaskRunner[PrefectConcurrentFuture]):
+    """
+    A task runner that executes tasks in a pool of worker processes.
+
+    Useful for CPU-bound tasks that would otherwise contend for the GIL. Tasks and
+    their parameters are serialized with `cloudpickle` and the current run context
+    and settings are forwarded to the worker processes. Worker processes are started
+    with the `spawn` method and are reused for every task submitted while the task
+    runner is started.
+
+    Upstream futures are resolved to their final states in the parent process before
+    a task is sent to a worker process, so tasks submitted to this task runner may
+    depend on futures from any other task runner.
+
+    Args:
+        max_workers: The maximum number of worker processes. Defaults to the
+            value of `PREFECT_TASKS_RUNNER_PROCESS_POOL_MAX_WORKERS` or the number
+            of CPUs.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None):
+        super().__init__()
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._dispatcher: Optional[ThreadPoolExecutor] = None
+        self._max_workers = (
+            (
+                PREFECT_TASKS_RUNNER_PROCESS_POOL_MAX_WORKERS.value()
+                or os.cpu_count()
+                or 1
+            )
+            if max_workers is None
+            else max_workers
+        )
+
+    def duplicate(self) -> "ProcessPoolTaskRunner":
+        return type(self)(max_workers=self._max_workers)
+
+    @overload
+    def submit(
+        self,
+        task: "Task[P, Coroutine[Any, Any, R]]",
+        parameters: Dict[str, Any],
+        wait_for: Optional[Iterable[PrefectFuture]] = None,
+        dependencies: Optional[Dict[str, Set[TaskRunInput]]] = None,
+    ) -> PrefectConcurrentFuture[R]:
+        ...
+
+    @overload
+    def submit(
+        self,
+        task: "Task[Any, R]",
+        parameters: Dict[str, Any],
+        wait_for: Optional[Iterable[PrefectFuture]] = None,
+        dependencies: Optional[Dict[str, Set[TaskRunInput]]] = None,
+    ) -> PrefectConcurrentFuture[R]:
+        ...
+
+    def submit(
+        self,
+        task: "Task",
+        parameters: Dict[str, Any],
+        wait_for: Optional[Iterable[PrefectFuture]] = None,
+        dependencies: Optional[Dict[str, Set[TaskRunInput]]] = None,
+    ):
+        """
+        Submit a task to the task run engine running in a separate process.
+
+        Args:
+            task: The task to submit.
+            parameters: The parameters to use when running the task.
+            wait_for: A list of futures that the task depends on.
+
+        Returns:
+            A future object that can be used to wait for the task to complete and
+            retrieve the result.
+        """
+        if not self._started or self._executor is None or self._dispatcher is None:
+            raise RuntimeError("Task runner is not started")
+
+        from prefect.context import FlowRunContext, serialize_context
+
+        task_run_id = uuid.uuid4()
+
+        flow_run_ctx = FlowRunContext.get()
+        if flow_run_ctx:
+            get_run_logger(flow_run_ctx).debug(
+                f"Submitting task {task.name} to process pool executor..."
+            )
+        else:
+            self.logger.debug(
+                f"Submitting task {task.name} to process pool executor..."
+            )
+
+        future = self._dispatcher.submit(
+            self._run_in_subprocess,
+            task=task,
+            task_run_id=task_run_id,
+            parameters=parameters,
+            wait_for=wait_for,
+            dependencies=dependencies,
+            context=serialize_context(),
+        )
+        return PrefectConcurrentFuture(task_run_id=task_run_id, wrapped_future=future)
+
+    def _run_in_subprocess(
+        self,
+        task: "Task",
+        task_run_id: uuid.UUID,
+        parameters: Dict[str, Any],
+        wait_for: Optional[Iterable[PrefectFuture]],
+        dependencies: Optional[Dict[str, Set[TaskRunInput]]],
+        context: Dict[str, Any],
+    ):
+        """
+        Wait for upstream futures, then send the task to a worker process and block
+        until its final state is returned.
+
+        Futures are bound to this process and cannot be pickled, so they are replaced
+        with their final states which the task engine resolves like futures.
+        """
+        if self._executor is None:
+            raise RuntimeError("Task runner is not started")
+
+        payload = cloudpickle.dumps(
+            (
+                task,
+                dict(
+                    task_run_id=task_run_id,
+                    parameters=resolve_futures_to_states(parameters),
+                    wait_for=resolve_futures_to_states(wait_for) if wait_for else None,
+                    return_type="state",
+                    dependencies=dependencies,
+                    context=context,
+                ),
+            )
+        )
+        return cloudpickle.loads(
+            self._executor.submit(_run_task_in_subprocess, payload).result()
+        )
+
+    @overload
+    def map(
+        self,
+        task: "Task[P, Coroutine[Any, Any, R]]",
+        parameters: Dict[str, Any],
+        wait_for: Optional[Iterable[PrefectFuture]] = None,
+        chunksize: Optional[int] = None,
+    ) -> PrefectFutureList[PrefectConcurrentFuture[R]]:
+        ...
+
+    @overload
+    def map(
+        self,
+        task: "Task[Any, R]",
+        parameters: Dict[str, Any],
+        wait_for: Optional[Iterable[PrefectFuture]] = None,
+        chunksize: Optional[int] = None,
+    ) -> PrefectFutureList[PrefectConcurrentFuture[R]]:
+        ...
+
+    def map(
+        self,
+        task: "Task",
+        parameters: Dict[str, Any],
+        wait_for: Optional[Iterable[PrefectFuture]] = None,
+        chunksize: Optional[int] = None,
+    ):
+        return super().map(task, parameters, wait_for, chunksize=chunksize)
+
+    def cancel_all(self):
+        if self._dispatcher is not None:
+            self._dispatcher.shutdown(wait=False, cancel_futures=True)
+            self._dispatcher = None
+
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
+
+    def __enter__(self):
+        super().__enter__()
+        # The dispatcher threads only wait on upstream futures and worker results, so
+        # they are sized to keep every worker process busy
+        self._dispatcher = ThreadPoolExecutor(max_workers=self._max_workers)
+        self._executor = ProcessPoolExecutor(
+            max_workers=self._max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.cancel_all()
+        super().__exit__(exc_type, exc_value, traceback)
+
+    def __eq__(self, value: object) -> bool:
+        if not isinstance(value, ProcessPoolTaskRunner):
+            return False
+        return self._max_workers == value._max_workers
+
+
 class PrefectTaskRunner(TaskRunner[PrefectDistributedFuture]):
     def __init__(self):
         super().__init__()
@@ -445,6 +846,7 @@ class PrefectTaskRunner(TaskRunner[PrefectDistributedFuture]):
         task: "Task[P, Coroutine[Any, Any, R]]",
         parameters: Dict[str, Any],
         wait_for: Optional[Iterable[PrefectFuture]] = None,
+        chunksize: Optional[int] = None,
     ) -> PrefectFutureList[PrefectDistributedFuture[R]]:
         ...
 
@@ -454,6 +856,7 @@ class PrefectTaskRunner(TaskRunner[PrefectDistributedFuture]):
         task: "Task[Any, R]",
         parameters: Dict[str, Any],
         wait_for: Optional[Iterable[PrefectFuture]] = None,
+        chunksize: Optional[int] = None,
     ) -> PrefectFutureList[PrefectDistributedFuture[R]]:
         ...
 
@@ -462,5 +865,6 @@ class PrefectTaskRunner(TaskRunner[PrefectDistributedFuture]):
         task: "Task",
         parameters: Dict[str, Any],
         wait_for: Optional[Iterable[PrefectFuture]] = None,
+        chunksize: Optional[int] = None,
     ):
-        return super().map(task, parameters, wait_for)
+        return super().map(task, parameters, wait_for, chunksize=chunksize)
@@ -50,7 +50,12 @@ from prefect.context import (
     TaskRunContext,
     serialize_context,
 )
-from prefect.futures import PrefectDistributedFuture, PrefectFuture, PrefectFutureList
+from prefect.futures import (
+    PrefectDistributedFuture,
+    PrefectFuture,
+    PrefectFutureList,
+    PrefectResultIterator,
+)
 from prefect.logging.loggers import get_logger
 from prefect.results import (
     ResultSerializer,
@@ -1190,6 +1195,7 @@ class Task(Generic[P, R]):
         return_state: Literal[True],
         wait_for: Optional[Iterable[Union[PrefectFuture[R], R]]] = ...,
         deferred: bool = ...,
+        chunksize: Optional[int] = ...,
         **kwargs: Any,
     ) -> List[State[R]]:
         ...
@@ -1200,6 +1206,7 @@ class Task(Generic[P, R]):
         *args: Any,
         wait_for: Optional[Iterable[Union[PrefectFuture[R], R]]] = ...,
         deferred: bool = ...,
+        chunksize: Optional[int] = ...,
         **kwargs: Any,
     ) -> PrefectFutureList[R]:
         ...
@@ -1211,6 +1218,7 @@ class Task(Generic[P, R]):
         return_state: Literal[True],
         wait_for: Optional[Iterable[Union[PrefectFuture[R], R]]] = ...,
         deferred: bool = ...,
+        chunksize: Optional[int] = ...,
         **kwargs: Any,
     ) -> List[State[R]]:
         ...
@@ -1221,6 +1229,7 @@ class Task(Generic[P, R]):
         *args: Any,
         wait_for: Optional[Iterable[Union[PrefectFuture[R], R]]] = ...,
         deferred: bool = ...,
+        chunksize: Optional[int] = ...,
         **kwargs: Any,
     ) -> PrefectFutureList[R]:
         ...
@@ -1232,6 +1241,7 @@ class Task(Generic[P, R]):
         return_state: Literal[True],
         wait_for: Optional[Iterable[Union[PrefectFuture[R], R]]] = ...,
         deferred: bool = ...,
+        chunksize: Optional[int] = ...,
         **kwargs: Any,
     ) -> List[State[R]]:
         ...
@@ -1243,6 +1253,7 @@ class Task(Generic[P, R]):
         return_state: Literal[False],
         wait_for: Optional[Iterable[Union[PrefectFuture[R], R]]] = ...,
         deferred: bool = ...,
+        chunksize: Optional[int] = ...,
         **kwargs: Any,
     ) -> PrefectFutureList[R]:
         ...
@@ -1253,6 +1264,7 @@ class Task(Generic[P, R]):
         return_state: bool = False,
         wait_for: Optional[Iterable[Union[PrefectFuture[R], R]]] = None,
         deferred: bool = False,
+        chunksize: Optional[int] = None,
         **kwargs: Any,
     ) -> Union[List[State[R]], PrefectFutureList[R]]:
         """
@@ -1280,6 +1292,11 @@ class Task(Generic[P, R]):
                 of each task run.
             wait_for: Upstream task futures to wait for before starting the
                 task
+            chunksize: If provided, iterables are consumed lazily and submitted in
+                chunks of this many elements. Each chunk runs in a single task run
+                and all elements of a chunk share its state, so a failure of one
+                element fails the whole chunk. A future is still returned for each
+                element.
             **kwargs: Keyword iterable arguments to run the task with
 
         Returns:
@@ -1367,6 +1384,11 @@ class Task(Generic[P, R]):
             >>>
             >>> my_flow()
             [[11, 21], [12, 22], [13, 23]]
+
+            Map over a large iterable with one task run per chunk of 1000 elements
+            >>> @flow
+            >>> def my_flow():
+            >>>     return my_task.map(range(100_000), chunksize=1000).result()
         """
 
         from prefect.task_runners import TaskRunner
@@ -1387,6 +1409,8 @@ class Task(Generic[P, R]):
             )
 
         if deferred:
+            if chunksize is not None:
+                raise ValueError("`chunksize` is not supported with `deferred=True`.")
             parameters_list = expand_mapping_parameters(self.fn, parameters)
             futures = [
                 self.apply_async(kwargs=parameters, wait_for=wait_for)
@@ -1394,7 +1418,12 @@ class Task(Generic[P, R]):
             ]
         elif task_runner := getattr(flow_run_context, "task_runner", None):
             assert isinstance(task_runner, TaskRunner)
-            futures = task_runner.map(self, parameters, wait_for)
+            if chunksize is None:
+                futures = task_runner.map(self, parameters, wait_for)
+            else:
+                futures = task_runner.map(
+                    self, parameters, wait_for, chunksize=chunksize
+                )
         else:
             raise RuntimeError(
                 "Unable to determine task runner to use for mapped task runs. If"
@@ -1411,6 +1440,89 @@ class Task(Generic[P, R]):
         else:
             return futures
 
+    @overload
+    def map_unordered(
+        self: "Task[P, Coroutine[Any, Any, R]]",
+        *args: Any,
+        max_in_flight: int = ...,
+        wait_for: Optional[Iterable[Union[PrefectFuture[R], R]]] = ...,
+        **kwargs: Any,
+    ) -> PrefectResultIterator[R]:
+        ...
+
+    @overload
+    def map_unordered(
+        self: "Task[P, R]",
+        *args: Any,
+        max_in_flight: int = ...,
+        wait_for: Optional[Iterable[Union[PrefectFuture[R], R]]] = ...,
+        **kwargs: Any,
+    ) -> PrefectResultIterator[R]:
+        ...
+
+    def map_unordered(
+        self,
+        *args: Any,
+        max_in_flight: int = 100,
+        wait_for: Optional[Iterable[Union[PrefectFuture[R], R]]] = None,
+        **kwargs: Any,
+    ) -> PrefectResultIterator[R]:
+        """
+        Submit a mapped run of the task to a worker and iterate over the results of
+        the task runs as they complete.
+
+        Unlike `Task.map`, task runs are submitted lazily while the returned iterator
+        is consumed, with at most `max_in_flight` task runs whose results have not
+        yet been consumed. Iterables are consumed lazily as well, so this is suited to
+        fanning out over very large or unbounded iterables with flat memory use.
+
+        Must be called within a flow run context. Arguments are handled as in
+        `Task.map`. Results are yielded in completion order, not input order.
+
+        Args:
+            *args: Iterable and static arguments to run the tasks with
+            max_in_flight: The maximum number of task runs submitted ahead of the
+                consumer of the iterator
+            wait_for: Upstream task futures to wait for before starting the
+                task
+            **kwargs: Keyword iterable arguments to run the task with
+
+        Returns:
+            An iterator over the results of the task runs that can be used with both
+            `for` and `async for`. An exception is raised from the iterator if a task
+            run fails.
+
+        Examples:
+
+            Reduce the results of a large fan-out as they arrive
+
+            >>> from prefect import flow, task
+            >>> @task
+            >>> def square(x):
+            >>>     return x * x
+            >>>
+            >>> @flow
+            >>> def my_flow():
+            >>>     total = 0
+            >>>     for result in square.map_unordered(range(1_000_000), max_in_flight=50):
+            >>>         total += result
+            >>>     return total
+        """
+        from prefect.task_runners import TaskRunner
+
+        parameters = get_call_parameters(self.fn, args, kwargs, apply_defaults=False)
+        flow_run_context = FlowRunContext.get()
+
+        task_runner = getattr(flow_run_context, "task_runner", None)
+        if not isinstance(task_runner, TaskRunner):
+            raise RuntimeError(
+                "Unable to determine task runner to use for mapped task runs."
+                " `map_unordered` must be called within a flow."
+            )
+        return task_runner.map_unordered(
+            self, parameters, wait_for, max_in_flight=max_in_flight
+        )
+
     def apply_async(
         self,
         args: Optional[Tuple[Any, ...]] = None,
@@ -4,7 +4,7 @@ import os
 import socket
 import sys
 from contextlib import contextmanager
-from typing import AsyncGenerator, Generator, List, Optional, Union
+from typing import AsyncGenerator, Generator, List, Optional, Sequence, Union
 from unittest import mock
 from uuid import UUID
 
@@ -13,11 +13,13 @@ import httpx
 import pendulum
 import pytest
 from starlette.status import WS_1008_POLICY_VIOLATION
+from websockets import Subprotocol
 from websockets.exceptions import ConnectionClosed
 from websockets.legacy.server import WebSocketServer, WebSocketServerProtocol, serve
 
 from prefect.events import Event
 from prefect.events.clients import (
+    BATCHED_EVENTS_SUBPROTOCOL,
     AssertingEventsClient,
     AssertingPassthroughEventsClient,
 )
@@ -250,6 +252,7 @@ class Recorder:
     connections: int
     path: Optional[str]
     events: List[Event]
+    batches: List[List[Event]]
     token: Optional[str]
     filter: Optional[EventFilter]
 
@@ -257,6 +260,7 @@ class Recorder:
         self.connections = 0
         self.path = None
         self.events = []
+        self.batches = []
 
 
 class Puppeteer:
@@ -265,6 +269,7 @@ class Puppeteer:
     hard_auth_failure: bool
     refuse_any_further_connections: bool
     hard_disconnect_after: Optional[UUID]
+    accept_batches: bool
 
     outgoing_events: List[Event]
 
@@ -272,6 +277,7 @@ class Puppeteer:
         self.hard_auth_failure = False
         self.refuse_any_further_connections = False
         self.hard_disconnect_after = None
+        self.accept_batches = True
         self.outgoing_events = []
 
 
@@ -311,10 +317,14 @@ async def events_server(
             except ConnectionClosed:
                 return
 
-            event = Event.model_validate_json(message)
-            recorder.events.append(event)
+            if message.startswith("["):
+                events = [Event.model_validate(event) for event in json.loads(message)]
+                recorder.batches.append(events)
+            else:
+                events = [Event.model_validate_json(message)]
+            recorder.events.extend(events)
 
-            if puppeteer.hard_disconnect_after == event.id:
+            if any(puppeteer.hard_disconnect_after == event.id for event in events):
                 raise ValueError("zonk")
 
     async def outgoing_events(socket: WebSocketServerProtocol):
@@ -352,7 +362,24 @@ async def events_server(
                 puppeteer.hard_disconnect_after = None
                 raise ValueError("zonk")
 
-    async with serve(handler, host="localhost", port=unused_tcp_port) as server:
+    def select_subprotocol(
+        client_subprotocols: Sequence[Subprotocol],
+        server_subprotocols: Sequence[Subprotocol],
+    ) -> Optional[Subprotocol]:
+        if (
+            puppeteer.accept_batches
+            and BATCHED_EVENTS_SUBPROTOCOL in client_subprotocols
+        ):
+            return BATCHED_EVENTS_SUBPROTOCOL
+        return None
+
+    async with serve(
+        handler,
+        host="localhost",
+        port=unused_tcp_port,
+        subprotocols=[BATCHED_EVENTS_SUBPROTOCOL],
+        select_subprotocol=select_subprotocol,
+    ) as server:
         yield server
 
 
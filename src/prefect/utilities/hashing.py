@@ -1,7 +1,10 @@
 import hashlib
+import sys
+import threading
+import weakref
 from functools import partial
 from pathlib import Path
-from typing import Any, Callable, Optional, Union
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple, Union
 
 import cloudpickle  # type: ignore  # no stubs available
 
@@ -9,6 +12,12 @@ from prefect.exceptions import HashError
 from prefect.serializers import JSONSerializer
 
 _md5 = partial(hashlib.md5, usedforsecurity=False)
+_blake2b = partial(hashlib.blake2b, digest_size=16)
+
+BytesLike = Union[bytes, bytearray, memoryview]
+TypeHasher = Callable[[Any], Union[BytesLike, Iterable[BytesLike]]]
+
+_type_hashers: Dict[type, TypeHasher] = {}
 
 
 def stable_hash(*args: Union[str, bytes], hash_algo: Callable[..., Any] = _md5) -> str:
@@ -89,3 +98,290 @@ def hash_objects(
         raise HashError(msg)
 
     return None
+
+
+def register_type_hasher(
+    type_: type, hasher: Optional[TypeHasher] = None
+) -> Callable[..., Any]:
+    """
+    Register a function that produces the content to hash for objects of a type
+    when hashing with `stream_hash_objects`.
+
+    The function receives the object and returns either a bytes-like object or an
+    iterable of bytes-like objects, which are fed to the hash without being joined.
+    Registered hashers take precedence over the built-in handling of objects and
+    apply to subclasses of the registered type.
+
+    Can be used as a decorator:
+
+    ```python
+    @register_type_hasher(MyTable)
+    def hash_my_table(table: MyTable):
+        yield table.schema.encode()
+        yield from table.column_buffers()
+    ```
+
+    Args:
+        type_: The type to register the hasher for.
+        hasher: The function that produces the content to hash.
+    """
+
+    def register(hasher: TypeHasher) -> TypeHasher:
+        _type_hashers[type_] = hasher
+        return hasher
+
+    if hasher is None:
+        return register
+    return register(hasher)
+
+
+def _hash_pandas_object(obj: Any) -> Iterable[BytesLike]:
+    import pandas as pd
+
+    if isinstance(obj, pd.DataFrame):
+        yield repr(list(obj.columns)).encode()
+        yield repr(list(obj.dtypes)).encode()
+    else:
+        yield repr(obj.name).encode()
+        yield repr(obj.dtype).encode()
+    yield repr(list(obj.index.names)).encode()
+    # One 64-bit hash per row, much smaller than a serialized copy of the object
+    yield pd.util.hash_pandas_object(obj, index=True).to_numpy()
+
+
+def _lookup_type_hasher(type_: type) -> Optional[TypeHasher]:
+    if (
+        type_.__module__.startswith("pandas.")
+        and "pandas" in sys.modules
+        and sys.modules["pandas"].DataFrame not in _type_hashers
+    ):
+        import pandas as pd
+
+        _type_hashers.setdefault(pd.DataFrame, _hash_pandas_object)
+        _type_hashers.setdefault(pd.Series, _hash_pandas_object)
+
+    for cls in type_.__mro__:
+        if cls in _type_hashers:
+            return _type_hashers[cls]
+    return None
+
+
+class HashMemo:
+    """
+    Memoizes the digests of buffer objects backed by immutable memory, such as NumPy
+    arrays created with `np.frombuffer` over a `bytes` object, by object identity.
+
+    Objects whose memory could be modified are not memoized. A NumPy array that owns
+    its data can be made writeable again after being marked read-only, so marking it
+    read-only is not enough. Entries are dropped when their object is garbage
+    collected.
+    """
+
+    def __init__(self):
+        self._digests: Dict[int, Tuple[weakref.ref, bytes]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, obj: Any) -> Optional[bytes]:
+        with self._lock:
+            entry = self._digests.get(id(obj))
+        if entry is not None and entry[0]() is obj:
+            return entry[1]
+        return None
+
+    def set(self, obj: Any, digest: bytes) -> None:
+        key = id(obj)
+
+        def remove(ref: weakref.ref) -> None:
+            with self._lock:
+                if (entry := self._digests.get(key)) is not None and entry[0] is ref:
+                    del self._digests[key]
+
+        try:
+            ref = weakref.ref(obj, remove)
+        except TypeError:
+            # Objects that can't be weakly referenced are not memoized
+            return
+        with self._lock:
+            self._digests[key] = (ref, digest)
+
+    def __len__(self) -> int:
+        return len(self._digests)
+
+
+class _StreamHasher:
+    def __init__(self, hash_algo: Callable[..., Any], memo: Optional[HashMemo]):
+        self.hash_algo = hash_algo
+        self.memo = memo
+        self._json_serializer: Optional[JSONSerializer] = None
+
+    def digest(self, obj: Any) -> bytes:
+        h = self.hash_algo()
+        self.update(h, obj)
+        return h.digest()
+
+    def update(self, h: Any, obj: Any) -> None:
+        if obj is None:
+            h.update(b"n")
+        elif isinstance(obj, bool):
+            h.update(b"t" if obj else b"f")
+        elif isinstance(obj, (int, float)):
+            self._update_sized(h, b"i" if isinstance(obj, int) else b"d", repr(obj))
+        elif isinstance(obj, str):
+            self._update_sized(h, b"s", obj.encode())
+        elif isinstance(obj, (list, tuple)):
+            h.update(b"l" if isinstance(obj, list) else b"u")
+            h.update(len(obj).to_bytes(8, "little"))
+            for item in obj:
+                self.update(h, item)
+        elif isinstance(obj, dict):
+            # Hash items independently so the key does not depend on their order
+            self._update_unordered(h, b"m", (self.digest(item) for item in obj.items()))
+        elif isinstance(obj, (set, frozenset)):
+            self._update_unordered(h, b"e", (self.digest(item) for item in obj))
+        elif (type_hasher := _lookup_type_hasher(type(obj))) is not None:
+            self._update_with_type_hasher(h, obj, type_hasher)
+        elif (view := _as_memoryview(obj)) is not None:
+            self._update_buffer(h, obj, view)
+        else:
+            self._update_serialized(h, obj)
+
+    def _update_sized(self, h: Any, tag: bytes, content: Union[str, BytesLike]):
+        if isinstance(content, str):
+            content = content.encode()
+        view = memoryview(content)
+        h.update(tag)
+        h.update(view.nbytes.to_bytes(8, "little"))
+        h.update(view if view.c_contiguous else view.tobytes())
+
+    def _update_unordered(self, h: Any, tag: bytes, digests: Iterable[bytes]):
+        sorted_digests = sorted(digests)
+        h.update(tag)
+        h.update(len(sorted_digests).to_bytes(8, "little"))
+        for digest in sorted_digests:
+            h.update(digest)
+
+    def _update_with_type_hasher(self, h: Any, obj: Any, type_hasher: TypeHasher):
+        try:
+            content = type_hasher(obj)
+            sub = self.hash_algo()
+            if isinstance(content, (bytes, bytearray, memoryview)):
+                content = [content]
+            for chunk in content:
+                self._update_sized(sub, b"c", chunk)
+        except Exception:
+            # Fall back to the default handling if the registered hasher fails
+            self._update_serialized(h, obj)
+            return
+        self._update_sized(h, b"r", _type_name(type(obj)))
+        h.update(sub.digest())
+
+    def _update_buffer(self, h: Any, obj: Any, view: memoryview):
+        memoize = self.memo is not None and _is_immutable_buffer(obj, view)
+        digest = self.memo.get(obj) if memoize else None
+        if digest is None:
+            sub = self.hash_algo()
+            sub.update(view if view.c_contiguous else view.tobytes())
+            digest = sub.digest()
+            if memoize:
+                self.memo.set(obj, digest)
+        self._update_sized(h, b"b", _type_name(type(obj)))
+        self._update_sized(h, b"b", f"{view.format}:{view.shape}")
+        h.update(digest)
+
+    def _update_serialized(self, h: Any, obj: Any):
+        try:
+            if self._json_serializer is None:
+                self._json_serializer = JSONSerializer(dumps_kwargs={"sort_keys": True})
+            self._update_sized(h, b"j", self._json_serializer.dumps(obj))
+            return
+        except Exception as e:
+            json_error = str(e)
+
+        try:
+            self._update_sized(h, b"p", cloudpickle.dumps(obj))  # type: ignore[reportUnknownMemberType]
+            return
+        except Exception as e:
+            pickle_error = str(e)
+
+        raise HashError(
+            "Unable to create hash - objects could not be serialized.\n"
+            f"  JSON error: {json_error}\n"
+            f"  Pickle error: {pickle_error}"
+        )
+
+
+def _as_memoryview(obj: Any) -> Optional[memoryview]:
+    try:
+        return memoryview(obj)
+    except (TypeError, ValueError):
+        # Objects that don't support the buffer protocol or whose contents can't be
+        # exposed through it, like NumPy arrays of Python objects
+        return None
+
+
+def _is_immutable_buffer(obj: Any, view: memoryview) -> bool:
+    if not view.readonly or isinstance(obj, memoryview):
+        return False
+    # A read-only NumPy array may be a view of writeable memory owned by another
+    # array, and an array that owns its memory can be made writeable again, so only
+    # arrays over memory owned by an immutable object are safe to memoize
+    base = getattr(obj, "base", None)
+    while getattr(base, "base", None) is not None:
+        base = base.base
+    return isinstance(base, bytes)
+
+
+def _type_name(type_: type) -> str:
+    return f"{type_.__module__}.{type_.__qualname__}"
+
+
+def stream_hash_objects(
+    *args: Any,
+    hash_algo: Callable[..., Any] = _blake2b,
+    memo: Optional[HashMemo] = None,
+    raise_on_failure: bool = False,
+    **kwargs: Any,
+) -> Optional[str]:
+    """
+    Hash objects by feeding their contents to the hash incrementally.
+
+    Unlike `hash_objects`, the objects are never serialized as a whole. Containers
+    are traversed, objects supporting the buffer protocol (such as `bytes`,
+    `memoryview` and NumPy arrays) are hashed without being copied, pandas objects
+    are hashed by their row hashes, and types registered with `register_type_hasher`
+    are hashed with their registered function. Any other object is serialized on its
+    own to JSON or, failing that, with cloudpickle.
+
+    The resulting hashes differ from those of `hash_objects`.
+
+    Args:
+        *args: Positional arguments to hash
+        hash_algo: Hash algorithm to use. Must produce a hash object with `update`
+            and `digest` methods, such as those from `hashlib` or `xxhash`.
+        memo: A memo to reuse the digests of read-only buffer objects across calls
+        raise_on_failure: If True, raise exceptions instead of returning None
+        **kwargs: Keyword arguments to hash
+
+    Returns:
+        A hash string or None if hashing failed
+
+    Raises:
+        HashError: If objects cannot be hashed and raise_on_failure is True
+    """
+    hasher = _StreamHasher(hash_algo=hash_algo, memo=memo)
+    h = hash_algo()
+    try:
+        hasher.update(h, args)
+        hasher.update(h, kwargs)
+    except HashError:
+        if raise_on_failure:
+            raise
+        return None
+    except RecursionError as exc:
+        if raise_on_failure:
+            raise HashError(
+                "Unable to create hash - objects are nested too deeply or contain "
+                "themselves."
+            ) from exc
+        return None
+    return h.hexdigest()
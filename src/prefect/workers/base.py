@@ -27,6 +27,7 @@ from prefect.client.schemas.objects import (
     WorkerMetadata,
     WorkPool,
 )
+from prefect.client.subscriptions import watch_due_flow_runs
 from prefect.client.utilities import inject_client
 from prefect.events import Event, RelatedResource, emit_event
 from prefect.events.related import object_as_related_resource, tags_as_related_resources
@@ -43,17 +44,21 @@ from prefect.plugins import load_prefect_collections
 from prefect.settings import (
     PREFECT_API_URL,
     PREFECT_TEST_MODE,
+    PREFECT_WORKER_CLAIM_FLOW_RUNS,
     PREFECT_WORKER_HEARTBEAT_SECONDS,
     PREFECT_WORKER_PREFETCH_SECONDS,
     PREFECT_WORKER_QUERY_SECONDS,
+    PREFECT_WORKER_SUBSCRIBE_TO_SCHEDULED_FLOW_RUNS,
     get_current_settings,
 )
 from prefect.states import (
     Crashed,
     Pending,
+    Scheduled,
     exception_to_failed_state,
 )
 from prefect.types import KeyValueLabels
+from prefect.utilities.asyncutils import asyncnullcontext
 from prefect.utilities.dispatch import get_registry_for_type, register_base_type
 from prefect.utilities.engine import propose_state
 from prefect.utilities.services import critical_service_loop
@@ -446,6 +451,11 @@ class BaseWorker(abc.ABC):
         self._limit = limit
         self._limiter: Optional[anyio.CapacityLimiter] = None
         self._submitting_flow_run_ids = set()
+        self._claimed_flow_run_ids: Set[UUID] = set()
+        self._claim_flow_runs: bool = PREFECT_WORKER_CLAIM_FLOW_RUNS.value()
+        # claims are sized by the free flow run slots, so only one poll may claim
+        # and submit runs at a time
+        self._get_and_submit_lock = anyio.Lock()
         self._cancelling_flow_run_ids = set()
         self._scheduled_task_scopes = set()
         self._worker_metadata_sent = False
@@ -573,6 +583,14 @@ class BaseWorker(abc.ABC):
                             backoff=4,
                         )
                     )
+                    if (
+                        PREFECT_WORKER_SUBSCRIBE_TO_SCHEDULED_FLOW_RUNS.value()
+                        and not run_once
+                    ):
+                        # submit flow runs as soon as they are due in between polls
+                        loops_task_group.start_soon(
+                            self._subscribe_to_scheduled_flow_runs
+                        )
 
                     self._started_event = await self._emit_worker_started_event()
 
@@ -692,11 +710,16 @@ class BaseWorker(abc.ABC):
         return is_still_polling
 
     async def get_and_submit_flow_runs(self):
-        runs_response = await self._get_scheduled_flow_runs()
+        async with (
+            self._get_and_submit_lock if self._claim_flow_runs else asyncnullcontext()
+        ):
+            runs_response = await self._get_scheduled_flow_runs()
 
-        self._last_polled_time = pendulum.now("utc")
+            self._last_polled_time = pendulum.now("utc")
 
-        return await self._submit_scheduled_flow_runs(flow_run_response=runs_response)
+            return await self._submit_scheduled_flow_runs(
+                flow_run_response=runs_response
+            )
 
     async def _update_local_work_pool_info(self):
         try:
@@ -842,6 +865,9 @@ class BaseWorker(abc.ABC):
         Retrieve scheduled flow runs from the work pool's queues.
         """
         scheduled_before = pendulum.now("utc").add(seconds=int(self._prefetch_seconds))
+        if self._claim_flow_runs:
+            return await self._claim_scheduled_flow_runs(scheduled_before)
+
         self._logger.debug(
             f"Querying for flow runs scheduled before {scheduled_before}"
         )
@@ -862,6 +888,54 @@ class BaseWorker(abc.ABC):
             # heartbeat (or an appropriate warning will be logged)
             return []
 
+    async def _subscribe_to_scheduled_flow_runs(self):
+        """
+        Gets and submits scheduled flow runs whenever the server reports that a flow
+        run in the work pool's queues is due.
+        """
+        await watch_due_flow_runs(
+            path=f"/work_pools/{self._work_pool_name}/subscriptions/scheduled_flow_runs",
+            keys=sorted(self._work_queues),
+            on_due=self.get_and_submit_flow_runs,
+            prefetch_seconds=self._prefetch_seconds,
+            client_id=self.name,
+            retry_seconds=PREFECT_WORKER_QUERY_SECONDS.value(),
+        )
+
+    async def _claim_scheduled_flow_runs(
+        self, scheduled_before: pendulum.DateTime
+    ) -> List["WorkerFlowRunResponse"]:
+        """
+        Claim scheduled flow runs from the work pool's queues, moving them to a
+        Pending state so that they don't need to be proposed one at a time.
+        """
+        # only claim as many runs as can be submitted, since claimed runs are not
+        # returned to the pool
+        limit = int(self._limiter.available_tokens) if self._limiter else None
+        if limit == 0:
+            self._logger.debug("Flow run limit reached; not claiming flow runs.")
+            return []
+
+        self._logger.debug(f"Claiming flow runs scheduled before {scheduled_before}")
+        try:
+            claimed_flow_runs = await self._client.claim_flow_runs_for_work_pool(
+                work_pool_name=self._work_pool_name,
+                scheduled_before=scheduled_before,
+                work_queue_names=list(self._work_queues),
+                limit=limit,
+                worker_name=self.name,
+            )
+        except ObjectNotFound:
+            # the pool doesn't exist; it will be created on the next
+            # heartbeat (or an appropriate warning will be logged)
+            return []
+
+        self._logger.debug(f"Claimed {len(claimed_flow_runs)} flow runs")
+        self._claimed_flow_run_ids.update(
+            entry.flow_run.id for entry in claimed_flow_runs
+        )
+        return claimed_flow_runs
+
     async def _submit_scheduled_flow_runs(
         self, flow_run_response: List["WorkerFlowRunResponse"]
     ) -> List["FlowRun"]:
@@ -871,7 +945,7 @@ class BaseWorker(abc.ABC):
         """
         submittable_flow_runs = [entry.flow_run for entry in flow_run_response]
 
-        for flow_run in submittable_flow_runs:
+        for index, flow_run in enumerate(submittable_flow_runs):
             if flow_run.id in self._submitting_flow_run_ids:
                 continue
             try:
@@ -882,6 +956,12 @@ class BaseWorker(abc.ABC):
                     f"Flow run limit reached; {self._limiter.borrowed_tokens} flow runs"
                     " in progress."
                 )
+                # claimed runs were already moved to a Pending state, so return the
+                # ones that can't be submitted to the work pool
+                for unsubmitted_flow_run in submittable_flow_runs[index:]:
+                    if unsubmitted_flow_run.id in self._claimed_flow_run_ids:
+                        self._claimed_flow_run_ids.discard(unsubmitted_flow_run.id)
+                        await self._propose_scheduled_state(unsubmitted_flow_run)
                 break
             else:
                 run_logger = self.get_flow_run_logger(flow_run)
@@ -938,9 +1018,12 @@ class BaseWorker(abc.ABC):
         """
         run_logger = self.get_flow_run_logger(flow_run)
 
+        claimed = flow_run.id in self._claimed_flow_run_ids
+        self._claimed_flow_run_ids.discard(flow_run.id)
+
         try:
             await self._check_flow_run(flow_run)
-        except (ValueError, ObjectNotFound):
+        except (ValueError, ObjectNotFound) as exc:
             self._logger.exception(
                 (
                     "Flow run %s did not pass checks and will not be submitted for"
@@ -948,10 +1031,14 @@ class BaseWorker(abc.ABC):
                 ),
                 flow_run.id,
             )
+            if claimed:
+                # the run was already moved out of the Scheduled state
+                await self._propose_failed_state(flow_run, exc)
             self._submitting_flow_run_ids.remove(flow_run.id)
             return
 
-        ready_to_submit = await self._propose_pending_state(flow_run)
+        # claimed runs were already moved to a Pending state by the server
+        ready_to_submit = claimed or await self._propose_pending_state(flow_run)
 
         if ready_to_submit:
             readiness_result = await self._runs_task_group.start(
@@ -1127,6 +1214,29 @@ class BaseWorker(abc.ABC):
 
         return True
 
+    async def _propose_scheduled_state(self, flow_run: "FlowRun") -> None:
+        run_logger = self.get_flow_run_logger(flow_run)
+        try:
+            await propose_state(
+                self._client,
+                Scheduled(scheduled_time=flow_run.expected_start_time),
+                flow_run_id=flow_run.id,
+            )
+        except Abort as exc:
+            run_logger.info(
+                f"Could not return flow run '{flow_run.id}' to the work pool. "
+                f"Server sent an abort signal: {exc}"
+            )
+        except Exception:
+            run_logger.exception(
+                f"Failed to update state of flow run '{flow_run.id}'",
+            )
+        else:
+            run_logger.info(
+                f"Returned flow run '{flow_run.id}' to the work pool; flow run limit"
+                " reached."
+            )
+
     async def _propose_failed_state(self, flow_run: "FlowRun", exc: Exception) -> None:
         run_logger = self.get_flow_run_logger(flow_run)
         try:
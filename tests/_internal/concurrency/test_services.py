@@ -12,6 +12,7 @@ from prefect._internal.concurrency.api import create_call, from_async, from_sync
 from prefect._internal.concurrency.services import (
     BatchedQueueService,
     QueueService,
+    SpillableItemsMixin,
     drain_on_exit,
     drain_on_exit_async,
 )
@@ -421,6 +422,36 @@ def test_batched_queue_service_min_interval():
     )
 
 
+def test_batched_queue_service_without_min_interval_batches_waiting_items():
+    handling = threading.Event()
+    release = threading.Event()
+
+    class GreedyMockBatchedService(MockBatchedService):
+        _max_batch_size = 10
+        _min_interval = 0
+
+    def handle(instance, items):
+        handling.set()
+        assert release.wait(10.0), "Batch not released within 10s"
+
+    instance = GreedyMockBatchedService.instance()
+    instance.mock.side_effect = handle
+
+    # The first item is handled without waiting for the batch to fill up...
+    instance.send(1)
+    assert handling.wait(10.0), "Item not handled within 10s"
+
+    # ...while items sent in the meantime are handled together
+    instance.send(2)
+    instance.send(3)
+    release.set()
+
+    GreedyMockBatchedService.drain_all()
+    GreedyMockBatchedService.mock.assert_has_calls(
+        [call(instance, [1]), call(instance, [2, 3])]
+    )
+
+
 @pytest.mark.parametrize(
     "level,expected", [("DEBUG", True), ("INFO", False), ("WARNING", False)]
 )
@@ -488,3 +519,152 @@ def test_queue_service_start_failure_contains_traceback_only_at_debug(
         instance.drain()
 
     assert (ExceptionOnHandleService.exception_msg in caplog.text) == expected
+
+
+class BoundedMockService(SpillableItemsMixin[int], QueueService[int]):
+    _max_queue_items = 2
+
+    def __init__(self, *args) -> None:
+        super().__init__(*args)
+        self.handling = threading.Event()
+        self.release = threading.Event()
+        self.mock = MagicMock()
+
+    async def _handle(self, item: int):
+        self.handling.set()
+        while not self.release.is_set():
+            await asyncio.sleep(0.01)
+        self.mock(self, item)
+
+    def _serialize_item(self, item: int) -> bytes:
+        return str(item).encode()
+
+    def _deserialize_item(self, data: bytes) -> int:
+        return int(data)
+
+
+def fill_bounded_service(instance: BoundedMockService, count: int):
+    # The first item is taken from the queue and held by the handler, so the
+    # remaining items are left waiting
+    instance.send(0)
+    assert instance.handling.wait(timeout=5)
+    for i in range(1, count):
+        instance.send(i)
+
+
+def test_queue_service_blocks_when_full():
+    instance = BoundedMockService._new_instance()
+    fill_bounded_service(instance, 3)
+
+    sender = threading.Thread(target=instance.send, args=(3,))
+    sender.start()
+    sender.join(timeout=0.5)
+    assert sender.is_alive(), "Sending should wait for room in the queue"
+    assert instance.stats.depth == 2
+
+    instance.release.set()
+    sender.join(timeout=5)
+    assert not sender.is_alive()
+
+    instance.drain()
+    instance.mock.assert_has_calls([call(instance, i) for i in range(4)])
+    assert instance.stats.dropped == 0
+
+
+def test_queue_service_warns_when_it_cannot_block_on_the_loop_thread(
+    caplog: pytest.LogCaptureFixture,
+):
+    instance = BoundedMockService._new_instance()
+    fill_bounded_service(instance, 3)
+
+    for item in (3, 4):
+        from_sync.call_soon_in_loop_thread(create_call(instance.send, item)).result()
+
+    assert instance.stats.dropped == 2
+    warnings = [
+        record
+        for record in caplog.records
+        if record.name == "BoundedMockService" and record.levelname == "WARNING"
+    ]
+    assert len(warnings) == 1
+    assert "oldest waiting items are being dropped" in warnings[0].getMessage()
+
+    instance.release.set()
+    instance.drain()
+
+
+def test_queue_service_drops_oldest_items_when_full():
+    class DroppingService(BoundedMockService):
+        _overflow_policy = "drop_oldest"
+
+    instance = DroppingService._new_instance()
+    fill_bounded_service(instance, 6)
+
+    stats = instance.stats
+    assert stats.depth == 2
+    assert stats.dropped == 3
+
+    instance.release.set()
+    instance.drain()
+    assert instance.mock.call_args_list == [
+        call(instance, 0),
+        call(instance, 4),
+        call(instance, 5),
+    ]
+
+
+def test_queue_service_spills_items_when_full():
+    class SpillingService(BoundedMockService):
+        _overflow_policy = "spill"
+
+    instance = SpillingService._new_instance()
+    fill_bounded_service(instance, 6)
+
+    stats = instance.stats
+    assert stats.depth == 2
+    assert stats.spooled == 3
+    assert stats.spilled == 3
+
+    instance.release.set()
+    instance.drain()
+    assert instance.mock.call_args_list == [call(instance, i) for i in range(6)]
+
+    stats = instance.stats
+    assert stats.depth == 0
+    assert stats.spooled == 0
+    assert stats.dropped == 0
+
+
+def test_queue_service_spill_requires_serialization():
+    class UnserializableService(MockService):
+        _overflow_policy = "spill"
+
+    with pytest.raises(ValueError, match="does not support spilling"):
+        UnserializableService()
+
+
+def test_batched_queue_service_bounds_the_size_of_the_queue():
+    class SizedBatchedService(BatchedQueueService[int]):
+        _max_batch_size = 100
+        _max_queue_size = 10
+        _overflow_policy = "drop_oldest"
+        mock = MagicMock()
+
+        async def _handle_batch(self, items: List[int]):
+            self.mock(items)
+
+        async def _main_loop(self):
+            # Hold items in the queue until the service is drained
+            await self._done_event.wait()
+
+        def _get_size(self, item: int) -> int:
+            return item
+
+    instance = SizedBatchedService()
+    for item in [4, 4, 4, 1]:
+        instance.send(item)
+
+    stats = instance.stats
+    assert stats.depth == 3
+    assert stats.size == 9
+    assert stats.dropped == 1
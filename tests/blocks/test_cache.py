@@ -0,0 +1,190 @@
+import time
+from uuid import uuid4
+
+import pendulum
+import pytest
+
+from prefect.blocks.cache import BlockDocumentCache
+from prefect.blocks.core import Block
+from prefect.client.orchestration import PrefectClient
+from prefect.client.schemas.objects import BlockDocument, BlockType
+from prefect.settings import (
+    PREFECT_CLIENT_BLOCKS_CACHE_ENABLED,
+    PREFECT_CLIENT_BLOCKS_CACHE_MAX_SIZE,
+    PREFECT_CLIENT_BLOCKS_CACHE_TTL_SECONDS,
+    temporary_settings,
+)
+
+API_URL = "http://127.0.0.1:4200/api"
+
+
+class CachedBlock(Block):
+    x: int
+
+
+@pytest.fixture(autouse=True)
+def reset_cache():
+    BlockDocumentCache._instance = None
+    yield
+    if BlockDocumentCache._instance is not None:
+        BlockDocumentCache._instance.stop()
+    BlockDocumentCache._instance = None
+
+
+def make_block_document(name="doc", data=None, references=None) -> BlockDocument:
+    now = pendulum.now("UTC")
+    return BlockDocument(
+        id=uuid4(),
+        name=name,
+        data=data or {"x": 1},
+        block_schema_id=uuid4(),
+        block_type_id=uuid4(),
+        block_type=BlockType(
+            id=uuid4(), created=now, updated=now, name="Cached", slug="cached"
+        ),
+        block_type_name="Cached",
+        block_document_references=references or {},
+    )
+
+
+def reference_to(block_document: BlockDocument):
+    return {
+        "block_document": {
+            "id": block_document.id,
+            "name": block_document.name,
+            "block_document_references": block_document.block_document_references,
+        }
+    }
+
+
+class TestBlockDocumentCache:
+    def test_get_missing_document(self):
+        cache = BlockDocumentCache(max_size=10, ttl_seconds=60)
+
+        assert cache.get_by_id(API_URL, uuid4()) is None
+        assert cache.get_by_name(API_URL, "cached", "doc") is None
+
+    def test_set_caches_by_id_and_name(self):
+        cache = BlockDocumentCache(max_size=10, ttl_seconds=60)
+        block_document = make_block_document()
+
+        cache.set(API_URL, block_document)
+
+        assert cache.get_by_id(API_URL, block_document.id) == block_document
+        assert cache.get_by_name(API_URL, "cached", "doc") == block_document
+        assert cache.get_by_id("http://other/api", block_document.id) is None
+
+    def test_returns_copies(self):
+        cache = BlockDocumentCache(max_size=10, ttl_seconds=60)
+        block_document = make_block_document()
+        cache.set(API_URL, block_document)
+        block_document.data["x"] = 2
+
+        cache.get_by_id(API_URL, block_document.id).data["x"] = 3
+
+        assert cache.get_by_id(API_URL, block_document.id).data == {"x": 1}
+
+    def test_documents_expire(self):
+        cache = BlockDocumentCache(max_size=10, ttl_seconds=0.1)
+        block_document = make_block_document()
+        cache.set(API_URL, block_document)
+
+        time.sleep(0.2)
+
+        assert cache.get_by_id(API_URL, block_document.id) is None
+
+    def test_invalidate_drops_the_document_and_documents_referencing_it(self):
+        cache = BlockDocumentCache(max_size=10, ttl_seconds=60)
+        inner = make_block_document(name="inner")
+        middle = make_block_document(
+            name="middle", references={"inner": reference_to(inner)}
+        )
+        outer = make_block_document(
+            name="outer", references={"middle": reference_to(middle)}
+        )
+        unrelated = make_block_document(name="unrelated")
+        for block_document in (inner, middle, outer, unrelated):
+            cache.set(API_URL, block_document)
+
+        cache.invalidate(inner.id)
+
+        assert cache.get_by_id(API_URL, inner.id) is None
+        assert cache.get_by_id(API_URL, middle.id) is None
+        assert cache.get_by_name(API_URL, "cached", "outer") is None
+        assert cache.get_by_id(API_URL, unrelated.id) == unrelated
+        assert len(cache) == 2
+
+    def test_instance_is_none_when_disabled(self):
+        assert BlockDocumentCache.instance() is None
+
+    def test_instance_is_shared_until_settings_change(self):
+        with temporary_settings({PREFECT_CLIENT_BLOCKS_CACHE_ENABLED: True}):
+            cache = BlockDocumentCache.instance()
+            assert cache is not None
+            assert BlockDocumentCache.instance() is cache
+
+            with temporary_settings(
+                {
+                    PREFECT_CLIENT_BLOCKS_CACHE_MAX_SIZE: 5,
+                    PREFECT_CLIENT_BLOCKS_CACHE_TTL_SECONDS: 5,
+                }
+            ):
+                resized = BlockDocumentCache.instance()
+
+        assert resized is not cache
+        assert (resized.max_size, resized.ttl_seconds) == (5, 5)
+
+
+class TestLoadWithCache:
+    @pytest.fixture
+    async def block_document_id(self, prefect_client):
+        return await CachedBlock(x=1).save("cached", client=prefect_client)
+
+    @pytest.fixture
+    def api_reads(self, monkeypatch):
+        reads = []
+        for method in ("read_block_document", "read_block_document_by_name"):
+            original = getattr(PrefectClient, method)
+
+            async def read(self, *args, __original=original, **kwargs):
+                reads.append(kwargs)
+                return await __original(self, *args, **kwargs)
+
+            monkeypatch.setattr(PrefectClient, method, read)
+        return reads
+
+    async def test_load_reads_from_the_api_by_default(
+        self, block_document_id, api_reads
+    ):
+        await CachedBlock.load("cached")
+        block = await CachedBlock.load("cached")
+
+        assert block.x == 1
+        assert len(api_reads) == 2
+
+    async def test_load_reads_from_the_cache(self, block_document_id, api_reads):
+        with temporary_settings({PREFECT_CLIENT_BLOCKS_CACHE_ENABLED: True}):
+            await CachedBlock.load("cached")
+            by_name = await CachedBlock.load("cached")
+            by_id = await CachedBlock.load_from_ref(block_document_id)
+
+        assert by_name.x == 1
+        assert by_id.x == 1
+        assert len(api_reads) == 1
+
+    async def test_save_invalidates_the_cache(self, block_document_id):
+        with temporary_settings({PREFECT_CLIENT_BLOCKS_CACHE_ENABLED: True}):
+            await CachedBlock.load("cached")
+            await CachedBlock(x=2).save("cached", overwrite=True)
+
+            block = await CachedBlock.load("cached")
+
+        assert block.x == 2
+
+    async def test_delete_invalidates_the_cache(self, block_document_id):
+        with temporary_settings({PREFECT_CLIENT_BLOCKS_CACHE_ENABLED: True}):
+            await CachedBlock.load("cached")
+            await CachedBlock.delete("cached")
+
+            with pytest.raises(ValueError, match="Unable to find block document"):
+                await CachedBlock.load("cached")
@@ -998,6 +998,28 @@ async def test_read_flow_runs_with_filtering(prefect_client):
     assert {flow_run.id for flow_run in flow_runs} == {fr_id_4, fr_id_5}
 
 
+async def test_iter_flow_runs_reads_every_page(prefect_client):
+    @flow
+    def foo():
+        pass
+
+    @flow
+    def bar():
+        pass
+
+    expected = {(await prefect_client.create_flow_run(foo)).id for _ in range(5)}
+    await prefect_client.create_flow_run(bar)
+
+    flow_runs = [
+        flow_run
+        async for flow_run in prefect_client.iter_flow_runs(
+            flow_filter=FlowFilter(name=dict(any_=["foo"])), page_size=2
+        )
+    ]
+    assert all(isinstance(flow_run, client_schemas.FlowRun) for flow_run in flow_runs)
+    assert [flow_run.id for flow_run in flow_runs] == sorted(expected, reverse=True)
+
+
 @pytest.mark.parametrize(
     "run_tags,filter_tags,expected_match",
     [
@@ -1452,6 +1474,52 @@ async def test_read_filtered_logs(session, prefect_client, deployment):
         assert log.flow_run_id not in flow_runs[3:]
 
 
+async def test_iter_logs_reads_every_page(prefect_client):
+    flow_run_id = uuid4()
+    now = DateTime.now("UTC")
+    logs = [
+        LogCreate(
+            name="prefect.flow_runs",
+            level=20,
+            message=f"Log {i}",
+            timestamp=now.add(seconds=i),
+            flow_run_id=flow_run_id,
+        )
+        for i in range(7)
+    ]
+    await prefect_client.create_logs(logs)
+
+    logs = [
+        log
+        async for log in prefect_client.iter_logs(
+            log_filter=LogFilter(flow_run_id=LogFilterFlowRunId(any_=[flow_run_id])),
+            page_size=3,
+        )
+    ]
+    assert [log.message for log in logs] == [f"Log {i}" for i in range(7)]
+
+
+async def test_create_compressed_logs(prefect_client):
+    flow_run_id = uuid4()
+    logs = [
+        LogCreate(
+            name="prefect.flow_runs",
+            level=20,
+            message=f"Log {i} from a chatty flow run.",
+            timestamp=DateTime.now(),
+            flow_run_id=flow_run_id,
+        )
+        for i in range(100)
+    ]
+
+    await prefect_client.create_logs(logs, compress=True)
+
+    logs = await prefect_client.read_logs(
+        log_filter=LogFilter(flow_run_id=LogFilterFlowRunId(any_=[flow_run_id]))
+    )
+    assert len(logs) == 100
+
+
 async def test_prefect_api_tls_insecure_skip_verify_setting_set_to_true(monkeypatch):
     with temporary_settings(updates={PREFECT_API_TLS_INSECURE_SKIP_VERIFY: True}):
         mock = Mock()
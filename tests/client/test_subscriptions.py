@@ -0,0 +1,81 @@
+import asyncio
+from typing import List
+from uuid import uuid4
+
+import pytest
+
+import prefect.client.subscriptions
+from prefect.client.schemas.responses import DueFlowRun
+from prefect.client.subscriptions import watch_due_flow_runs
+from prefect.settings import PREFECT_API_URL, temporary_settings
+
+
+class FakeSubscription:
+    pushed: List[DueFlowRun] = []
+
+    def __init__(self, **kwargs):
+        pass
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        for flow_run in self.pushed:
+            yield flow_run
+        await asyncio.Event().wait()
+
+
+@pytest.fixture
+def fake_subscription(monkeypatch: pytest.MonkeyPatch):
+    FakeSubscription.pushed = [DueFlowRun(id=uuid4()) for _ in range(5)]
+    monkeypatch.setattr(prefect.client.subscriptions, "Subscription", FakeSubscription)
+    with temporary_settings({PREFECT_API_URL: "http://localhost:4200/api"}):
+        yield
+
+
+async def test_due_flow_runs_pushed_together_are_handled_once(fake_subscription):
+    calls = 0
+    handled = asyncio.Event()
+
+    async def on_due():
+        nonlocal calls
+        calls += 1
+        handled.set()
+
+    watcher = asyncio.create_task(
+        watch_due_flow_runs("/test", keys=["*"], on_due=on_due)
+    )
+    try:
+        await asyncio.wait_for(handled.wait(), timeout=5)
+        await asyncio.sleep(0.1)
+    finally:
+        watcher.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await watcher
+
+    assert calls == 1
+
+
+async def test_failing_handler_does_not_stop_the_subscription(fake_subscription):
+    calls = 0
+    handled = asyncio.Event()
+
+    async def on_due():
+        nonlocal calls
+        calls += 1
+        handled.set()
+        raise ValueError("boom")
+
+    watcher = asyncio.create_task(
+        watch_due_flow_runs("/test", keys=["*"], on_due=on_due)
+    )
+    try:
+        await asyncio.wait_for(handled.wait(), timeout=5)
+        await asyncio.sleep(0.1)
+        assert not watcher.done()
+    finally:
+        watcher.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await watcher
+
+    assert calls == 1
@@ -7,6 +7,7 @@ from prefect.client.schemas.responses import MinimalConcurrencyLimitResponse
 from prefect.concurrency.asyncio import (
     _aacquire_concurrency_slots,
 )
+from prefect.settings import PREFECT_CLIENT_CONCURRENCY_SLOT_WAIT_SECONDS
 
 
 async def test_calls_increment_client_method():
@@ -31,6 +32,7 @@ async def test_calls_increment_client_method():
             slots=1,
             mode="concurrency",
             create_if_missing=None,
+            wait_seconds=PREFECT_CLIENT_CONCURRENCY_SLOT_WAIT_SECONDS.value(),
         )
 
 
@@ -1,4 +1,5 @@
 import asyncio
+import time
 from unittest import mock
 
 import pytest
@@ -6,6 +7,7 @@ from httpx import HTTPStatusError, Request, Response
 
 from prefect.client.orchestration import get_client
 from prefect.concurrency.services import ConcurrencySlotAcquisitionService
+from prefect.settings import PREFECT_CLIENT_CONCURRENCY_SLOT_WAIT_SECONDS
 
 
 @pytest.fixture
@@ -51,6 +53,7 @@ async def test_returns_successful_response(mocked_client):
         slots=expected_slots,
         mode=expected_mode,
         create_if_missing=True,
+        wait_seconds=PREFECT_CLIENT_CONCURRENCY_SLOT_WAIT_SECONDS.value(),
     )
 
 
@@ -115,3 +118,89 @@ async def test_basic_exception_returns_exception(mocked_client):
 
     assert isinstance(exception, Exception)
     assert exception == exc
+
+
+async def test_retries_immediately_after_server_waited_for_slots(mocked_client):
+    calls = 0
+
+    async def increment_concurrency_slots(*args, **kwargs):
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            # the server held the request in line for the full wait
+            time.sleep(kwargs["wait_seconds"])
+            raise HTTPStatusError(
+                "Limit is locked",
+                request=Request("get", "/"),
+                response=Response(423, headers={"Retry-After": "30"}),
+            )
+        return Response(200)
+
+    mocked_client.client.increment_concurrency_slots.side_effect = (
+        increment_concurrency_slots
+    )
+
+    limit_names = sorted(["api", "database"])
+    service = ConcurrencySlotAcquisitionService.instance(frozenset(limit_names))
+
+    with mock.patch.object(
+        ConcurrencySlotAcquisitionService, "_wait_seconds", return_value=0.1
+    ):
+        with mock.patch("prefect.concurrency.services.asyncio.sleep") as sleep:
+            future = service.send((1, "concurrency", None, True, None))
+            await service.drain()
+            returned_response = await asyncio.wrap_future(future)
+
+    assert returned_response.status_code == 200
+    sleep.assert_not_called()
+    assert calls == 2
+
+
+async def test_does_not_wait_on_the_server_without_retries_left(mocked_client):
+    mocked_client.client.increment_concurrency_slots.side_effect = HTTPStatusError(
+        "Limit is locked",
+        request=Request("get", "/"),
+        response=Response(423, headers={"Retry-After": "2"}),
+    )
+
+    limit_names = sorted(["api", "database"])
+    service = ConcurrencySlotAcquisitionService.instance(frozenset(limit_names))
+
+    future = service.send((1, "concurrency", None, True, 0))
+    await service.drain()
+    exception = await asyncio.wrap_future(future)
+
+    assert isinstance(exception, HTTPStatusError)
+    mocked_client.client.increment_concurrency_slots.assert_called_once_with(
+        names=limit_names,
+        slots=1,
+        mode="concurrency",
+        create_if_missing=True,
+        wait_seconds=0.0,
+    )
+
+
+async def test_waits_on_the_server_only_for_attempts_with_retries_left(
+    mocked_client,
+):
+    mocked_client.client.increment_concurrency_slots.side_effect = [
+        HTTPStatusError(
+            "Limit is locked",
+            request=Request("get", "/"),
+            response=Response(423, headers={"Retry-After": "0"}),
+        ),
+        Response(200),
+    ]
+
+    limit_names = sorted(["api", "database"])
+    service = ConcurrencySlotAcquisitionService.instance(frozenset(limit_names))
+
+    future = service.send((1, "concurrency", None, True, 1))
+    await service.drain()
+    await asyncio.wrap_future(future)
+
+    wait_seconds = [
+        call.kwargs["wait_seconds"]
+        for call in mocked_client.client.increment_concurrency_slots.call_args_list
+    ]
+    assert wait_seconds == [PREFECT_CLIENT_CONCURRENCY_SLOT_WAIT_SECONDS.value(), 0.0]
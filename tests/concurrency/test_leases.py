@@ -0,0 +1,225 @@
+import time
+from typing import List
+from unittest import mock
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from prefect.client.orchestration import PrefectClient
+from prefect.concurrency import leases
+from prefect.concurrency.asyncio import concurrency, rate_limit
+from prefect.concurrency.leases import ConcurrencySlotLease
+from prefect.concurrency.sync import concurrency as sync_concurrency
+from prefect.server.models.concurrency_limits_v2 import (
+    create_concurrency_limit,
+    read_concurrency_limit,
+)
+from prefect.server.schemas.core import ConcurrencyLimitV2
+from prefect.settings import (
+    PREFECT_CLIENT_CONCURRENCY_LEASE_SLOTS,
+    PREFECT_CLIENT_CONCURRENCY_LEASE_TTL_SECONDS,
+    temporary_settings,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_leases():
+    leases.expire_leases()
+    yield
+    leases.expire_leases()
+
+
+@pytest.fixture
+def leasing():
+    with temporary_settings(
+        {
+            PREFECT_CLIENT_CONCURRENCY_LEASE_SLOTS: 5,
+            PREFECT_CLIENT_CONCURRENCY_LEASE_TTL_SECONDS: 60,
+        }
+    ):
+        yield
+
+
+@pytest.fixture
+async def roomy_limit(session: AsyncSession) -> ConcurrencyLimitV2:
+    concurrency_limit = await create_concurrency_limit(
+        session=session,
+        concurrency_limit=ConcurrencyLimitV2(name="roomy", limit=10),
+    )
+    await session.commit()
+    return ConcurrencyLimitV2.model_validate(concurrency_limit, from_attributes=True)
+
+
+@pytest.fixture
+async def roomy_limit_with_decay(session: AsyncSession) -> ConcurrencyLimitV2:
+    concurrency_limit = await create_concurrency_limit(
+        session=session,
+        concurrency_limit=ConcurrencyLimitV2(
+            name="roomy", limit=10, slot_decay_per_second=0.01
+        ),
+    )
+    await session.commit()
+    return ConcurrencyLimitV2.model_validate(concurrency_limit, from_attributes=True)
+
+
+async def active_slots(session: AsyncSession, limit: ConcurrencyLimitV2) -> int:
+    session.expunge_all()
+    model = await read_concurrency_limit(session, concurrency_limit_id=limit.id)
+    assert model
+    return model.active_slots
+
+
+def make_lease(slots: int, mode="concurrency", ttl_seconds: float = 60):
+    returned: List[int] = []
+    lease = ConcurrencySlotLease(
+        names=["roomy"],
+        mode=mode,
+        slots=slots,
+        limits=[],
+        ttl_seconds=ttl_seconds,
+        on_return=lambda lease, slots: returned.append(slots),
+    )
+    return lease, returned
+
+
+def test_lease_hands_out_and_takes_back_slots():
+    lease, returned = make_lease(3)
+
+    assert lease.take(2)
+    assert not lease.take(2)
+    assert lease.release(2) == 0
+    assert lease.take(3)
+    assert lease.available == 0
+
+    lease.expire()
+    assert returned == []
+    assert lease.release(3) == 3
+
+
+def test_rate_limit_lease_consumes_slots():
+    lease, returned = make_lease(3, mode="rate_limit")
+
+    assert lease.take(2)
+    assert lease.take(1)
+    assert not lease.take(1)
+
+    lease.expire()
+    assert returned == []
+
+
+def test_expired_lease_returns_unused_slots():
+    lease, returned = make_lease(3, ttl_seconds=0.1)
+    assert lease.take(1)
+
+    time.sleep(0.5)
+
+    assert not lease.take(1)
+    assert returned == [2]
+    assert lease.release(1) == 1
+
+
+async def test_concurrency_leases_slots(
+    leasing, roomy_limit: ConcurrencyLimitV2, session: AsyncSession
+):
+    with mock.patch.object(
+        PrefectClient,
+        "increment_concurrency_slots",
+        autospec=True,
+        side_effect=PrefectClient.increment_concurrency_slots,
+    ) as increment_spy:
+        for _ in range(10):
+            async with concurrency("roomy", occupy=2):
+                pass
+
+    # The first lease is held for every acquisition
+    assert increment_spy.call_count == 1
+    assert await active_slots(session, roomy_limit) == 5
+
+    leases.expire_leases()
+    assert await active_slots(session, roomy_limit) == 0
+
+
+async def test_concurrency_slots_released_after_lease_expires_go_to_the_server(
+    leasing, roomy_limit: ConcurrencyLimitV2, session: AsyncSession
+):
+    async with concurrency("roomy", occupy=2):
+        leases.expire_leases()
+        assert await active_slots(session, roomy_limit) == 2
+
+    assert await active_slots(session, roomy_limit) == 0
+
+
+async def test_concurrency_falls_back_when_lease_is_unavailable(
+    leasing, roomy_limit: ConcurrencyLimitV2, session: AsyncSession
+):
+    async with concurrency("roomy", occupy=6):
+        # the lease of 5 slots doesn't fit, so these are acquired individually
+        async with concurrency("roomy", occupy=4):
+            assert await active_slots(session, roomy_limit) == 10
+
+    assert await active_slots(session, roomy_limit) == 0
+
+
+async def test_concurrency_skips_leasing_after_a_lease_is_unavailable(
+    leasing, roomy_limit: ConcurrencyLimitV2
+):
+    with mock.patch.object(
+        PrefectClient,
+        "increment_concurrency_slots",
+        autospec=True,
+        side_effect=PrefectClient.increment_concurrency_slots,
+    ) as increment_spy:
+        async with concurrency("roomy", occupy=6):
+            # the lease of 5 slots doesn't fit
+            async with concurrency("roomy", occupy=1):
+                pass
+            increment_spy.reset_mock()
+
+            # so it isn't tried again until a lease would have expired
+            async with concurrency("roomy", occupy=1):
+                pass
+
+    assert increment_spy.call_count == 1
+    assert leases.lease_recently_failed((frozenset(["roomy"]), "concurrency"))
+
+
+async def test_lease_size_is_capped_by_the_limit(
+    session: AsyncSession, concurrency_limit: ConcurrencyLimitV2
+):
+    with temporary_settings({PREFECT_CLIENT_CONCURRENCY_LEASE_SLOTS: 5}):
+        # The lease is larger than the limit of 1, so slots are acquired
+        # individually and no slots are held afterwards
+        for _ in range(3):
+            async with concurrency("test", occupy=1):
+                pass
+
+    assert await active_slots(session, concurrency_limit) == 0
+
+
+async def test_rate_limit_leases_slots(
+    leasing, roomy_limit_with_decay: ConcurrencyLimitV2
+):
+    with mock.patch.object(
+        PrefectClient,
+        "increment_concurrency_slots",
+        autospec=True,
+        side_effect=PrefectClient.increment_concurrency_slots,
+    ) as increment_spy:
+        for _ in range(5):
+            await rate_limit("roomy")
+
+    assert increment_spy.call_count == 1
+
+
+def test_sync_concurrency_leases_slots(leasing, roomy_limit: ConcurrencyLimitV2):
+    with mock.patch.object(
+        PrefectClient,
+        "increment_concurrency_slots",
+        autospec=True,
+        side_effect=PrefectClient.increment_concurrency_slots,
+    ) as increment_spy:
+        for _ in range(10):
+            with sync_concurrency("roomy", occupy=2):
+                pass
+
+    assert increment_spy.call_count == 1
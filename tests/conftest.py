@@ -66,6 +66,7 @@ from prefect.settings import (
     PREFECT_SERVER_LOGGING_LEVEL,
     PREFECT_UNIT_TEST_LOOP_DEBUG,
 )
+from prefect.settings.context import invalidate_settings_snapshot
 from prefect.utilities.dispatch import get_registry_for_type
 
 # isort: split
@@ -535,6 +536,17 @@ def start_of_test() -> pendulum.DateTime:
     return pendulum.now("UTC")
 
 
+@pytest.fixture(autouse=True)
+def reset_settings_snapshot():
+    """
+    Settings read from the environment are cached until invalidated, so tests that
+    change environment variables don't leak them into later tests.
+    """
+    invalidate_settings_snapshot()
+    yield
+    invalidate_settings_snapshot()
+
+
 @pytest.fixture(autouse=True)
 def reset_sys_modules():
     import importlib
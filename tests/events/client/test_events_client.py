@@ -369,3 +369,79 @@ async def test_events_client_warn_if_connect_fails(
     assert any(
         "Unable to connect to 'ws" in record.message for record in caplog.records
     )
+
+
+async def test_emits_batches_in_a_single_message(
+    Client: Type[PrefectEventsClient],
+    example_event_1: Event,
+    example_event_2: Event,
+    example_event_3: Event,
+    recorder: Recorder,
+):
+    async with Client() as client:
+        await client.emit_batch([example_event_1, example_event_2, example_event_3])
+
+    assert recorder.batches == [[example_event_1, example_event_2, example_event_3]]
+    assert recorder.events == [example_event_1, example_event_2, example_event_3]
+
+
+async def test_splits_batches_larger_than_the_maximum_message_size(
+    example_event_1: Event,
+    example_event_2: Event,
+    example_event_3: Event,
+    recorder: Recorder,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    size = len(example_event_1.model_dump_json())
+    monkeypatch.setattr(PrefectEventsClient, "max_frame_size", 2 * size + 10)
+
+    async with PrefectEventsClient() as client:
+        await client.emit_batch([example_event_1, example_event_2, example_event_3])
+
+    assert recorder.events == [example_event_1, example_event_2, example_event_3]
+    assert recorder.batches == [[example_event_1, example_event_2]]
+
+
+async def test_emits_batches_one_event_at_a_time_to_servers_without_batches(
+    Client: Type[PrefectEventsClient],
+    example_event_1: Event,
+    example_event_2: Event,
+    example_event_3: Event,
+    recorder: Recorder,
+    puppeteer: Puppeteer,
+):
+    puppeteer.accept_batches = False
+
+    async with Client() as client:
+        await client.emit_batch([example_event_1, example_event_2, example_event_3])
+
+    assert recorder.batches == []
+    assert recorder.events == [example_event_1, example_event_2, example_event_3]
+
+
+async def test_reconnects_and_resends_batches_after_hard_disconnect(
+    Client: Type[PrefectEventsClient],
+    example_event_1: Event,
+    example_event_2: Event,
+    example_event_3: Event,
+    example_event_4: Event,
+    example_event_5: Event,
+    recorder: Recorder,
+    puppeteer: Puppeteer,
+):
+    client = Client(checkpoint_every=1)
+    async with client:
+        puppeteer.hard_disconnect_after = example_event_2.id
+        await client.emit_batch([example_event_1, example_event_2])
+
+        await client.emit_batch([example_event_3, example_event_4])
+        await client.emit(example_event_5)
+
+    assert recorder.connections == 2
+    assert recorder.batches == [
+        [example_event_1, example_event_2],
+        [example_event_3, example_event_4],
+        # resent due to the hard disconnect after the first batch
+        [example_event_3, example_event_4],
+    ]
+    assert recorder.events[-1] == example_event_5
@@ -1,9 +1,11 @@
 import uuid
+from typing import List
 
 import pytest
 
 from prefect import flow
-from prefect.client.schemas.objects import State
+from prefect._internal.concurrency.api import create_call, from_sync
+from prefect.client.schemas.objects import FlowRun, State
 from prefect.events import Event
 from prefect.events.clients import (
     AssertingEventsClient,
@@ -12,6 +14,9 @@ from prefect.events.clients import (
 from prefect.events.worker import EventsWorker
 from prefect.settings import (
     PREFECT_API_URL,
+    PREFECT_CLIENT_EVENTS_MAX_QUEUE_ITEMS,
+    PREFECT_CLIENT_EVENTS_MAX_QUEUE_SIZE,
+    PREFECT_CLIENT_EVENTS_OVERFLOW_POLICY,
     temporary_settings,
 )
 
@@ -33,6 +38,35 @@ def test_emits_event_via_client(asserting_events_worker: EventsWorker, event: Ev
     assert asserting_events_worker._client.events == [event]
 
 
+def test_emits_waiting_events_together(monkeypatch: pytest.MonkeyPatch):
+    batches: List[List[Event]] = []
+    emit_batch = AssertingEventsClient._emit_batch
+
+    async def record_batch(self, events: List[Event]):
+        batches.append(list(events))
+        await emit_batch(self, events)
+
+    monkeypatch.setattr(AssertingEventsClient, "_emit_batch", record_batch)
+
+    events = [
+        Event(
+            event="vogon.poetry.read",
+            resource={"prefect.resource.id": f"poem.{uuid.uuid4()}"},
+        )
+        for _ in range(3)
+    ]
+
+    worker = EventsWorker(AssertingEventsClient, (("batched", True),))
+    for event in events:
+        worker.send(event)
+    from_sync.call_soon_in_loop_thread(create_call(worker.start)).result()
+    worker.drain()
+
+    assert batches == [events]
+    assert worker._client.events == events
+    assert worker._context_cache == {}
+
+
 def test_worker_instance_server_client_non_cloud_api_url():
     with temporary_settings(updates={PREFECT_API_URL: "http://localhost:8080/api"}):
         worker = EventsWorker.instance()
@@ -88,3 +122,95 @@ async def test_includes_related_resources_from_run_context(
     assert event.related[1].id == f"prefect.flow.{db_flow.id}"
     assert event.related[1].role == "flow"
     assert event.related[1]["prefect.resource.name"] == db_flow.name
+
+
+def test_dropped_events_are_removed_from_the_context_cache(event: Event):
+    with temporary_settings(
+        updates={
+            PREFECT_CLIENT_EVENTS_MAX_QUEUE_ITEMS: 1,
+            PREFECT_CLIENT_EVENTS_OVERFLOW_POLICY: "drop_oldest",
+        }
+    ):
+        worker = EventsWorker(AssertingEventsClient, ())
+
+    newer = Event(
+        event="vogon.poetry.read",
+        resource={"prefect.resource.id": f"poem.{uuid.uuid4()}"},
+    )
+    worker.send(event)
+    worker.send(newer)
+
+    assert worker.stats.dropped == 1
+    assert list(worker._context_cache) == [newer.id]
+
+
+def test_waiting_events_are_bounded_by_their_size(event: Event):
+    with temporary_settings(
+        updates={
+            PREFECT_CLIENT_EVENTS_MAX_QUEUE_SIZE: 1,
+            PREFECT_CLIENT_EVENTS_OVERFLOW_POLICY: "drop_oldest",
+        }
+    ):
+        worker = EventsWorker(AssertingEventsClient, ())
+
+    newer = Event(
+        event="vogon.poetry.read",
+        resource={"prefect.resource.id": f"poem.{uuid.uuid4()}"},
+    )
+    worker.send(event)
+    worker.send(newer)
+
+    stats = worker.stats
+    assert stats.dropped == 1
+    assert stats.depth == 1
+    assert stats.size == len(newer.model_dump_json().encode())
+
+
+def test_events_are_batched_by_count_when_bounded_by_size(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    batches: List[List[Event]] = []
+    emit_batch = AssertingEventsClient._emit_batch
+
+    async def record_batch(self, events: List[Event]):
+        batches.append(list(events))
+        await emit_batch(self, events)
+
+    monkeypatch.setattr(AssertingEventsClient, "_emit_batch", record_batch)
+
+    events = [
+        Event(
+            event="vogon.poetry.read",
+            resource={"prefect.resource.id": f"poem.{uuid.uuid4()}"},
+        )
+        for _ in range(3)
+    ]
+
+    with temporary_settings(updates={PREFECT_CLIENT_EVENTS_MAX_QUEUE_SIZE: 100_000}):
+        worker = EventsWorker(AssertingEventsClient, (("batched", True),))
+    for event in events:
+        worker.send(event)
+    from_sync.call_soon_in_loop_thread(create_call(worker.start)).result()
+    worker.drain()
+
+    assert batches == [events]
+
+
+def test_spilled_events_are_read_back(event: Event):
+    with temporary_settings(
+        updates={
+            PREFECT_CLIENT_EVENTS_MAX_QUEUE_ITEMS: 1,
+            PREFECT_CLIENT_EVENTS_OVERFLOW_POLICY: "spill",
+        }
+    ):
+        worker = EventsWorker(AssertingEventsClient, ())
+
+    flow_run = FlowRun(flow_id=uuid.uuid4(), name="vogon-reading")
+    worker._context_cache[event.id] = (flow_run, None)
+
+    data = worker._serialize_item(event)
+    # The spilled event's runs are no longer held in memory
+    assert worker._context_cache == {}
+
+    assert worker._deserialize_item(data) == event
+    assert worker._context_cache == {event.id: (flow_run, None)}
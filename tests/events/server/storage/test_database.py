@@ -165,6 +165,58 @@ class TestWriteEvents:
                 )
                 assert len(list(results)) == len(event.related) + 1
 
+    async def test_copy_events_on_postgres(
+        self,
+        session: AsyncSession,
+        db: PrefectDBInterface,
+        event: ReceivedEvent,
+        other_events: List[ReceivedEvent],
+    ):
+        if db.database_config.connection_url.startswith("sqlite"):
+            pytest.skip("COPY is only used on PostgreSQL")
+
+        # Write the event ahead of the batch so that copying it again is skipped
+        async with session as session:
+            await write_events(session=session, events=[event], use_copy=True)
+            await session.commit()
+
+        events = other_events[:250] + [event] + other_events[250:]
+        async with session as session:
+            await write_events(session=session, events=events, use_copy=True)
+            await session.commit()
+
+        async with session as session:
+            event_ids = [e.id for e in other_events] + [event.id]
+            results = await session.execute(
+                sa.select(sa.func.count(db.Event.id)).where(db.Event.id.in_(event_ids))
+            )
+            assert results.scalar() == len(event_ids)
+
+            results = await session.execute(
+                sa.select(sa.func.count(db.EventResource.id)).where(
+                    db.EventResource.event_id.in_(event_ids)
+                )
+            )
+            # Each event has its own resource and three related resources, and the
+            # event copied twice has only one set of them
+            assert results.scalar() == len(event_ids) * 4
+
+            copied = await read_events(
+                session=session,
+                events_filter=EventFilter(
+                    id=EventIDFilter(id=[other_events[0].id]),
+                    occurred=EventOccurredFilter(
+                        since=pendulum.now("UTC").subtract(days=1)
+                    ),
+                ),
+            )
+            assert len(copied) == 1
+            assert copied[0].event == other_events[0].event
+            assert copied[0].resource == other_events[0].resource
+            assert copied[0].related == other_events[0].related
+            assert copied[0].payload == other_events[0].payload
+            assert copied[0].received == other_events[0].received
+
 
 class TestReadEvents:
     @pytest.fixture
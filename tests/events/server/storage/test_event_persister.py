@@ -1,6 +1,8 @@
 import asyncio
+import json
 from datetime import timedelta
-from typing import TYPE_CHECKING, AsyncGenerator, Optional, Sequence
+from pathlib import Path
+from typing import TYPE_CHECKING, AsyncGenerator, List, Optional, Sequence
 from uuid import UUID, uuid4
 
 import pytest
@@ -295,6 +297,240 @@ async def test_flushes_messages_periodically(
         assert (await get_event_count(session)) == 9
 
 
+def event_messages(event: ReceivedEvent, count: int) -> List[CapturedMessage]:
+    return [
+        CapturedMessage(
+            data=event.model_copy(update={"id": uuid4()}).model_dump_json().encode(),
+            attributes={},
+        )
+        for _ in range(count)
+    ]
+
+
+async def test_grows_batches_while_messages_arrive_quickly(
+    event: ReceivedEvent,
+    session: AsyncSession,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    batch_sizes: List[int] = []
+
+    async def record_batch_sizes(session, events, **kwargs):
+        batch_sizes.append(len(events))
+        await asyncio.sleep(0.05)  # writes take longer than the batches take to fill
+        await write_events(session, events, **kwargs)
+
+    monkeypatch.setattr(event_persister, "write_events", record_batch_sizes)
+
+    async with event_persister.create_handler(
+        batch_size=2,
+        max_batch_size=8,
+        flush_every=timedelta(days=100),
+    ) as handler:
+        for message in event_messages(event, 30):
+            await handler(message)
+
+    assert batch_sizes == [2, 4, 8, 8, 8]
+    assert (await get_event_count(session)) == 30
+
+
+async def test_keeps_batches_small_while_messages_arrive_slowly(
+    event: ReceivedEvent,
+    session: AsyncSession,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    batch_sizes: List[int] = []
+
+    async def record_batch_sizes(session, events, **kwargs):
+        batch_sizes.append(len(events))
+
+    monkeypatch.setattr(event_persister, "write_events", record_batch_sizes)
+
+    async with event_persister.create_handler(
+        batch_size=2,
+        max_batch_size=8,
+        flush_every=timedelta(days=100),
+    ) as handler:
+        for message in event_messages(event, 6):
+            await asyncio.sleep(0.05)  # batches take longer to fill than to write
+            await handler(message)
+
+    assert batch_sizes == [2, 2, 2]
+
+
+async def test_retries_failed_batches(
+    event: ReceivedEvent,
+    session: AsyncSession,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    attempts: List[int] = []
+
+    async def fail_once(session, events, **kwargs):
+        attempts.append(len(events))
+        if len(attempts) == 1:
+            raise ValueError("the database is unavailable")
+        await write_events(session, events, **kwargs)
+
+    monkeypatch.setattr(event_persister, "write_events", fail_once)
+
+    async with event_persister.create_handler(
+        batch_size=3,
+        flush_every=timedelta(seconds=0.001),
+    ) as handler:
+        for message in event_messages(event, 3):
+            await handler(message)
+
+        await asyncio.sleep(0.1)  # this is 100x the time necessary
+
+        assert (await get_event_count(session)) == 3
+
+    assert attempts == [3, 3]
+
+
+def dead_lettered_events(path: Path) -> List[List[ReceivedEvent]]:
+    return [
+        [ReceivedEvent.model_validate(e) for e in json.loads(f.read_text())]
+        for f in path.iterdir()
+    ]
+
+
+async def test_keeps_retrying_while_the_database_is_unavailable(
+    event: ReceivedEvent,
+    session: AsyncSession,
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+):
+    attempts: List[int] = []
+
+    async def fail_for_a_while(session, events, **kwargs):
+        attempts.append(len(events))
+        if len(attempts) <= 10:
+            raise ValueError("the database is unavailable")
+        await write_events(session, events, **kwargs)
+
+    monkeypatch.setattr(event_persister, "write_events", fail_for_a_while)
+
+    messages = event_messages(event, 5)
+    async with event_persister.create_handler(
+        batch_size=2,
+        flush_every=timedelta(seconds=0.001),
+        max_retry_delay=timedelta(seconds=0.005),
+        max_flush_attempts=20,
+        dead_letter_queue_path=tmp_path,
+    ) as handler:
+        for message in messages:
+            await handler(message)
+
+        await asyncio.sleep(0.5)
+
+        assert (await get_event_count(session)) == 5
+
+    # The failed batch is only retried by the periodic flush, not by each message
+    assert attempts[:11] == [2] * 11
+    assert not list(tmp_path.iterdir())
+
+
+async def test_moves_batches_that_keep_failing_to_the_dead_letter_queue(
+    event: ReceivedEvent,
+    session: AsyncSession,
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+):
+    messages = event_messages(event, 3)
+    failing = [ReceivedEvent.model_validate_json(m.data) for m in messages[:2]]
+    attempts: List[int] = []
+
+    async def fail_the_first_batch(session, events, **kwargs):
+        attempts.append(len(events))
+        if any(e.id == failing[0].id for e in events):
+            raise ValueError("the database is unavailable")
+        await write_events(session, events, **kwargs)
+
+    monkeypatch.setattr(event_persister, "write_events", fail_the_first_batch)
+
+    async with event_persister.create_handler(
+        batch_size=2,
+        flush_every=timedelta(seconds=0.001),
+        max_retry_delay=timedelta(seconds=0.005),
+        max_flush_attempts=3,
+        dead_letter_queue_path=tmp_path,
+    ) as handler:
+        for message in messages:
+            await handler(message)
+
+        await asyncio.sleep(0.5)
+
+        # the events behind the dead-lettered batch are still written
+        assert (await get_event_count(session)) == 1
+
+    assert attempts[:3] == [2, 2, 2]
+    assert dead_lettered_events(tmp_path) == [failing]
+
+
+async def test_dead_letters_only_the_events_the_database_rejects(
+    event: ReceivedEvent,
+    session: AsyncSession,
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+):
+    attempts: List[int] = []
+    messages = event_messages(event, 4)
+    rejected = ReceivedEvent.model_validate_json(messages[2].data)
+
+    async def reject_one_event(session, events, **kwargs):
+        attempts.append(len(events))
+        if any(e.id == rejected.id for e in events):
+            raise sa.exc.DataError("INSERT", {}, Exception("invalid event"))
+        await write_events(session, events, **kwargs)
+
+    monkeypatch.setattr(event_persister, "write_events", reject_one_event)
+
+    async with event_persister.create_handler(
+        batch_size=4,
+        flush_every=timedelta(days=100),
+        dead_letter_queue_path=tmp_path,
+    ) as handler:
+        for message in messages:
+            await handler(message)
+
+    assert attempts == [4, 2, 2, 1, 1]
+    assert (await get_event_count(session)) == 3
+    assert not await get_event(rejected.id)
+    assert dead_lettered_events(tmp_path) == [[rejected]]
+
+
+async def test_full_queue_pushes_back_on_consumer(
+    event: ReceivedEvent,
+    session: AsyncSession,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    database_available = False
+
+    async def write_when_available(session, events, **kwargs):
+        if not database_available:
+            raise ValueError("the database is unavailable")
+        await write_events(session, events, **kwargs)
+
+    monkeypatch.setattr(event_persister, "write_events", write_when_available)
+
+    messages = event_messages(event, 5)
+    async with event_persister.create_handler(
+        batch_size=2,
+        max_queue_size=2,
+        flush_every=timedelta(days=100),
+    ) as handler:
+        # The first two events fail to flush and are held for a retry, the next two
+        # fill the queue without another attempt to flush
+        for message in messages[:4]:
+            await handler(message)
+
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(handler(messages[4]), timeout=0.1)
+
+        database_available = True
+
+    assert (await get_event_count(session)) == 4
+
+
 async def test_trims_messages_periodically(
     event: ReceivedEvent,
     session: AsyncSession,
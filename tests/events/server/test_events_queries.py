@@ -20,7 +20,7 @@ from prefect.server.events.filters import (
     EventResourceFilter,
 )
 from prefect.server.events.schemas.events import ReceivedEvent
-from prefect.server.events.storage import from_page_token
+from prefect.server.events.storage import from_page_token, to_page_token
 from prefect.server.events.storage.database import (
     query_events,
     query_next_page,
@@ -280,6 +280,66 @@ async def test_returns_pages(
     assert_events_ordered_descending(events)
 
 
+@pytest.mark.parametrize("order", [EventOrder.DESC, EventOrder.ASC])
+async def test_pages_return_every_event_once(
+    events_query_session: AsyncSession,
+    full_occurred_range: EventOccurredFilter,
+    order: EventOrder,
+):
+    filter = EventFilter(occurred=full_occurred_range, order=order)
+
+    all_events, count, _ = await query_events(
+        session=events_query_session,
+        filter=filter,
+        page_size=1000,
+    )
+    assert len(all_events) == count
+
+    paged: List[ReceivedEvent] = []
+    events, _, page_token = await query_events(
+        session=events_query_session,
+        filter=filter,
+        page_size=3,
+    )
+    paged.extend(events)
+    while page_token:
+        events, _, page_token = await query_next_page(
+            session=events_query_session,
+            page_token=page_token,
+        )
+        paged.extend(events)
+
+    assert [event.id for event in paged] == [event.id for event in all_events]
+
+
+async def test_page_tokens_without_cursors_still_page_by_offset(
+    events_query_session: AsyncSession,
+    full_occurred_range: EventOccurredFilter,
+):
+    filter = EventFilter(occurred=full_occurred_range)
+
+    first_page, count, page_token = await query_events(
+        session=events_query_session,
+        filter=filter,
+        page_size=3,
+    )
+    assert page_token
+
+    legacy_token = to_page_token(filter, count, 3, 0)
+    assert legacy_token
+    assert from_page_token(legacy_token)[-1] is None
+
+    with_cursor, _, _ = await query_next_page(
+        session=events_query_session, page_token=page_token
+    )
+    with_offset, _, _ = await query_next_page(
+        session=events_query_session, page_token=legacy_token
+    )
+    assert len(with_offset) == 3
+    assert not {event.id for event in with_offset} & {e.id for e in first_page}
+    assert len(with_cursor) == 3
+
+
 async def test_can_request_in_ascending_order(
     events_query_session: AsyncSession,
     full_occurred_range: EventOccurredFilter,
@@ -0,0 +1,174 @@
+from typing import Dict, List, Optional, Set, Union
+from uuid import uuid4
+
+import pendulum
+import pytest
+
+from prefect.server.events import actions, triggers
+from prefect.server.events.schemas.automations import (
+    Automation,
+    EventTrigger,
+    Posture,
+)
+from prefect.server.events.schemas.events import ReceivedEvent
+
+
+def make_trigger(
+    expect: Optional[Set[str]] = None,
+    after: Optional[Set[str]] = None,
+    match: Optional[Dict[str, Union[str, List[str]]]] = None,
+    match_related: Optional[Dict[str, Union[str, List[str]]]] = None,
+) -> EventTrigger:
+    return EventTrigger(
+        expect=expect or set(),
+        after=after or set(),
+        match=match or {},
+        match_related=match_related or {},
+        posture=Posture.Reactive,
+        threshold=1,
+    )
+
+
+def make_event(
+    event: str,
+    resource_id: str,
+    related: Optional[List[Dict[str, str]]] = None,
+) -> ReceivedEvent:
+    return ReceivedEvent(
+        occurred=pendulum.now("UTC"),
+        event=event,
+        resource={"prefect.resource.id": resource_id},
+        related=related or [],
+        id=uuid4(),
+    )
+
+
+TRIGGERS = {
+    "exact-resource": make_trigger(
+        expect={"animal.walked"}, match={"prefect.resource.id": "spider.1"}
+    ),
+    "prefixed-resource": make_trigger(match={"prefect.resource.id": "spider.*"}),
+    "several-resources": make_trigger(
+        match={"prefect.resource.id": ["woodchuck.1", "spider.2"]}
+    ),
+    "negated-resource": make_trigger(
+        expect={"animal.walked"}, match={"prefect.resource.id": "!spider.1"}
+    ),
+    "related-resource": make_trigger(
+        match_related={
+            "prefect.resource.id": "garden.lilies",
+            "prefect.resource.role": "meal",
+        }
+    ),
+    "exact-event": make_trigger(expect={"animal.nibbled"}),
+    "prefixed-event": make_trigger(expect={"animal.*"}),
+    "wildcard-inside-event": make_trigger(expect={"animal.*.left"}),
+    "after-event": make_trigger(expect={"animal.walked"}, after={"animal.woke"}),
+    "any-event": make_trigger(expect={"*"}),
+    "everything": make_trigger(),
+    "other-labels": make_trigger(match={"class": "Arachnida"}),
+}
+
+EVENTS = [
+    make_event("animal.walked", "spider.1"),
+    make_event("animal.walked", "spider.2"),
+    make_event("animal.walked", "spider"),
+    make_event("animal.nibbled", "woodchuck.1"),
+    make_event(
+        "animal.nibbled",
+        "woodchuck.2",
+        related=[
+            {"prefect.resource.id": "garden.lilies", "prefect.resource.role": "meal"}
+        ],
+    ),
+    make_event(
+        "animal.nibbled",
+        "woodchuck.2",
+        related=[
+            {"prefect.resource.id": "garden.lilies", "prefect.resource.role": "bed"}
+        ],
+    ),
+    make_event("animal.woke", "woodchuck.3"),
+    make_event("animal.paw.left", "woodchuck.3"),
+    make_event("animal.", "woodchuck.3"),
+    make_event("plant.grew", "garden.lilies"),
+]
+
+
+@pytest.fixture
+def index() -> triggers.TriggerIndex:
+    index = triggers.TriggerIndex()
+    for trigger in TRIGGERS.values():
+        index.add(trigger)
+    return index
+
+
+@pytest.mark.parametrize("event", EVENTS, ids=lambda e: f"{e.event}-{e.resource.id}")
+def test_index_finds_every_covering_trigger(
+    index: triggers.TriggerIndex, event: ReceivedEvent
+):
+    candidates = index.candidates(event)
+
+    assert [t for t in candidates if t.covers(event)] == [
+        t for t in TRIGGERS.values() if t.covers(event)
+    ]
+
+
+def test_index_narrows_the_candidates(index: triggers.TriggerIndex):
+    candidates = index.candidates(make_event("plant.grew", "garden.lilies"))
+
+    assert set(t.id for t in candidates) == {
+        TRIGGERS[name].id for name in ["any-event", "everything", "other-labels"]
+    }
+
+
+def test_index_removes_triggers(index: triggers.TriggerIndex):
+    event = make_event("animal.walked", "spider.1")
+    assert TRIGGERS["exact-resource"] in index.candidates(event)
+    assert TRIGGERS["prefixed-resource"] in index.candidates(event)
+
+    index.remove(TRIGGERS["exact-resource"].id)
+    index.remove(TRIGGERS["prefixed-resource"].id)
+
+    assert TRIGGERS["exact-resource"] not in index.candidates(event)
+    assert TRIGGERS["prefixed-resource"] not in index.candidates(event)
+    assert len(index) == len(TRIGGERS) - 2
+
+    # removing an unknown trigger is a no-op
+    index.remove(TRIGGERS["exact-resource"].id)
+    assert len(index) == len(TRIGGERS) - 2
+
+
+def test_index_replaces_triggers_with_the_same_id(index: triggers.TriggerIndex):
+    original = TRIGGERS["exact-resource"]
+    updated = EventTrigger.model_validate(
+        {
+            **original.model_dump(),
+            "match": {"prefect.resource.id": "woodchuck.1"},
+        }
+    )
+    assert updated.id == original.id
+
+    index.add(updated)
+
+    assert len(index) == len(TRIGGERS)
+    assert updated not in index.candidates(make_event("animal.walked", "spider.1"))
+    assert updated in index.candidates(make_event("animal.walked", "woodchuck.1"))
+
+
+def test_loading_and_forgetting_automations_maintains_the_index():
+    automation = Automation(
+        name="Watch a spider",
+        trigger=make_trigger(
+            expect={"animal.walked"}, match={"prefect.resource.id": "spider.1"}
+        ),
+        actions=[actions.DoNothing()],
+    )
+    event = make_event("animal.walked", "spider.1")
+
+    triggers.load_automation(automation)
+    assert triggers.find_interested_triggers(event) == [automation.trigger]
+
+    triggers.forget_automation(automation.id)
+    assert triggers.find_interested_triggers(event) == []
+    assert len(triggers.trigger_index) == 0
@@ -1,20 +1,33 @@
+import os
+import threading
+import time
+from datetime import timedelta
+
+import pendulum
 import pytest
+from cachetools import LRUCache
 
 import prefect.exceptions
 import prefect.results
 from prefect import flow, task
 from prefect.context import FlowRunContext, get_run_context
-from prefect.filesystems import LocalFileSystem
+from prefect.filesystems import LocalFileSystem, WritableFileSystem
 from prefect.locking.memory import MemoryLockManager
 from prefect.results import (
+    ResultMetadataIndex,
     ResultRecord,
+    ResultRecordCache,
     ResultStore,
+    get_result_metadata_index,
+    get_result_record_cache,
     should_persist_result,
 )
 from prefect.serializers import JSONSerializer, PickleSerializer
 from prefect.settings import (
     PREFECT_LOCAL_STORAGE_PATH,
     PREFECT_RESULTS_DEFAULT_SERIALIZER,
+    PREFECT_RESULTS_METADATA_INDEX_MAX_AGE_SECONDS,
+    PREFECT_RESULTS_METADATA_INDEX_PATH,
     PREFECT_RESULTS_PERSIST_BY_DEFAULT,
     PREFECT_TASKS_DEFAULT_PERSIST_RESULT,
     temporary_settings,
@@ -866,6 +879,329 @@ async def test_result_store_exists_with_no_metadata_storage(tmp_path):
     assert not result_store.exists(key=key)
 
 
+class TestResultRecordCache:
+    def test_evicts_least_recently_used_records_by_size(self):
+        cache = ResultRecordCache(max_bytes=10)
+        records = [ResultRecord(metadata={}, result=i) for i in range(3)]
+        cache.set("a", records[0], nbytes=4)
+        cache.set("b", records[1], nbytes=4)
+        assert cache.get("a") is records[0]
+
+        cache.set("c", records[2], nbytes=4)
+        assert "a" in cache
+        assert "b" not in cache
+        assert "c" in cache
+        assert cache.current_bytes == 8
+
+    def test_does_not_cache_records_larger_than_cache(self):
+        cache = ResultRecordCache(max_bytes=10)
+        cache.set("a", ResultRecord(metadata={}, result=1), nbytes=11)
+        assert "a" not in cache
+
+    def test_result_stores_share_cache_by_default(self):
+        assert ResultStore().shared_cache is get_result_record_cache()
+        assert ResultStore().shared_cache is ResultStore().shared_cache
+
+    def test_result_stores_keep_their_own_cache(self):
+        assert isinstance(ResultStore().cache, LRUCache)
+        assert ResultStore().cache is not ResultStore().cache
+
+        cache = LRUCache(maxsize=10)
+        assert ResultStore(cache=cache).cache is cache
+
+
+async def test_result_store_read_uses_memory_cache_across_stores(tmp_path, monkeypatch):
+    result_storage = LocalFileSystem(basepath=tmp_path / "results")
+    key = "test-shared-cache"
+    store = ResultStore(result_storage=result_storage)
+    await store.awrite(key=key, obj="value")
+    await ResultStore(result_storage=result_storage).aread(key=key)
+
+    # Reading from another store does not read from storage
+    def fail(*args, **kwargs):
+        raise AssertionError("storage should not be read")
+
+    monkeypatch.setattr(LocalFileSystem, "read_path", fail)
+    other_store = ResultStore(result_storage=result_storage)
+    assert await other_store.aexists(key=key)
+    record = await other_store.aread(key=key)
+    assert record.result == "value"
+
+
+async def test_result_store_exists_evicts_records_deleted_from_storage(tmp_path):
+    result_storage = LocalFileSystem(basepath=tmp_path / "results")
+    key = "test-deleted-record"
+    store = ResultStore(result_storage=result_storage)
+    await store.awrite(key=key, obj="value")
+    await ResultStore(result_storage=result_storage).aread(key=key)
+    assert store._cache_key(key) in store.cache
+    assert store._cache_key(key) in store.shared_cache
+
+    (tmp_path / "results" / key).unlink()
+    assert not await store.aexists(key=key)
+    assert store._cache_key(key) not in store.cache
+    assert store._cache_key(key) not in store.shared_cache
+    with pytest.raises(ValueError, match="does not exist"):
+        await store.aread(key=key)
+
+
+async def test_result_store_writes_are_only_shared_once_read(tmp_path, monkeypatch):
+    result_storage = LocalFileSystem(basepath=tmp_path / "results")
+    key = "test-written-record"
+    store = ResultStore(result_storage=result_storage)
+    await store.awrite(key=key, obj="value")
+
+    assert store._cache_key(key) in store.cache
+    assert store._cache_key(key) not in store.shared_cache
+
+    reads = []
+    original_read_path = LocalFileSystem.read_path
+
+    async def read_path(self, path):
+        reads.append(path)
+        return await original_read_path(self, path)
+
+    monkeypatch.setattr(LocalFileSystem, "read_path", read_path)
+    other_store = ResultStore(result_storage=result_storage)
+    assert (await other_store.aread(key=key)).result == "value"
+    assert (await ResultStore(result_storage=result_storage).aread(key=key)).result == (
+        "value"
+    )
+    assert len(reads) == 1
+
+
+async def test_result_store_writes_replace_records_in_the_shared_cache(tmp_path):
+    result_storage = LocalFileSystem(basepath=tmp_path / "results")
+    key = "test-overwritten-record"
+    await ResultStore(result_storage=result_storage).awrite(key=key, obj="old")
+    assert (
+        await ResultStore(result_storage=result_storage).aread(key=key)
+    ).result == "old"
+
+    await ResultStore(result_storage=result_storage).awrite(key=key, obj="new")
+
+    assert (
+        await ResultStore(result_storage=result_storage).aread(key=key)
+    ).result == "new"
+
+
+def test_result_store_cache_keys_differ_across_storages(tmp_path):
+    class Bucket(WritableFileSystem):
+        bucket: str
+
+        def _resolve_path(self, path):
+            return path
+
+        async def read_path(self, path):
+            raise NotImplementedError
+
+        async def write_path(self, path, content):
+            raise NotImplementedError
+
+    first = ResultStore(result_storage=Bucket(bucket="first"))
+    second = ResultStore(result_storage=Bucket(bucket="second"))
+    assert first._cache_key("key") != second._cache_key("key")
+    assert ResultStore(result_storage=Bucket(bucket="first"))._cache_key(
+        "key"
+    ) == first._cache_key("key")
+
+
+async def test_result_store_exists_reads_only_record_metadata(tmp_path, monkeypatch):
+    result_storage = LocalFileSystem(basepath=tmp_path / "results")
+    await ResultStore(
+        result_storage=result_storage, cache_result_in_memory=False
+    ).awrite(key="current", obj="x" * 100_000)
+    await ResultStore(
+        result_storage=result_storage, cache_result_in_memory=False
+    ).awrite(
+        key="expired",
+        obj="x" * 100_000,
+        expiration=pendulum.now("utc").subtract(days=1),
+    )
+
+    def fail(*args, **kwargs):
+        raise AssertionError("the whole record should not be read")
+
+    monkeypatch.setattr(LocalFileSystem, "read_path", fail)
+    store = ResultStore(result_storage=result_storage, metadata_index=None)
+    assert await store.aexists(key="current")
+    assert not await store.aexists(key="expired")
+    assert not await store.aexists(key="missing")
+
+
+async def test_result_store_exists_reads_record_when_metadata_exceeds_prefix(
+    tmp_path, monkeypatch
+):
+    monkeypatch.setattr("prefect.results.RECORD_METADATA_PREFIX_SIZE", 16)
+    result_storage = LocalFileSystem(basepath=tmp_path / "results")
+    key = "test-exists-then-read"
+    await ResultStore(
+        result_storage=result_storage, cache_result_in_memory=False
+    ).awrite(key=key, obj="value")
+
+    store = ResultStore(result_storage=result_storage, metadata_index=None)
+    assert await store.aexists(key=key)
+
+    # The whole record was read, so it is kept for a subsequent read
+    def fail(*args, **kwargs):
+        raise AssertionError("storage should not be read")
+
+    monkeypatch.setattr(LocalFileSystem, "read_path", fail)
+    assert (await store.aread(key=key)).result == "value"
+
+
+class TestResultMetadataIndex:
+    @pytest.fixture
+    def index(self, tmp_path):
+        return ResultMetadataIndex(tmp_path / "index")
+
+    @pytest.fixture
+    def store(self, tmp_path, index):
+        return ResultStore(
+            result_storage=LocalFileSystem(basepath=tmp_path / "results"),
+            cache_result_in_memory=False,
+            metadata_index=index,
+        )
+
+    def test_no_default_index_without_setting(self):
+        with temporary_settings({PREFECT_RESULTS_METADATA_INDEX_PATH: None}):
+            assert get_result_metadata_index() is None
+            assert ResultStore().metadata_index is None
+
+    def test_default_index_uses_setting(self, tmp_path):
+        with temporary_settings({PREFECT_RESULTS_METADATA_INDEX_PATH: tmp_path}):
+            assert get_result_metadata_index().path == tmp_path
+            assert ResultStore().metadata_index.path == tmp_path
+
+    def test_set_get_remove(self, index):
+        record = ResultStore().create_result_record(obj="value", key="foo")
+        assert index.get("foo") is None
+
+        index.set("foo", record.metadata)
+        assert index.get("foo") == record.metadata
+        assert index.get("bar") is None
+
+        index.remove("foo")
+        assert index.get("foo") is None
+        index.remove("foo")
+
+    def test_prune_removes_unused_entries(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(ResultMetadataIndex, "_prune_if_due", lambda self: None)
+        index = ResultMetadataIndex(tmp_path / "index", max_age=timedelta(days=1))
+        metadata = ResultStore().create_result_record(obj="value", key="foo").metadata
+        index.set("old", metadata)
+        index.set("used", metadata)
+        index.set("new", metadata)
+
+        two_days_ago = time.time() - timedelta(days=2).total_seconds()
+        for key in ("old", "used"):
+            os.utime(index._entry_path(key), (two_days_ago, two_days_ago))
+        assert index.get("used") is not None
+
+        assert index.prune() == 1
+        assert index.get("old") is None
+        assert index.get("used") is not None
+        assert index.get("new") is not None
+
+    def test_set_prunes_at_most_once_per_interval(self, tmp_path, monkeypatch):
+        index = ResultMetadataIndex(tmp_path / "index", max_age=timedelta(days=1))
+        monkeypatch.setattr(ResultMetadataIndex, "_last_pruned", {})
+        pruned = []
+        done = threading.Event()
+
+        def prune():
+            pruned.append(threading.current_thread())
+            done.set()
+
+        monkeypatch.setattr(index, "prune", prune)
+        metadata = ResultStore().create_result_record(obj="value", key="foo").metadata
+
+        index.set("foo", metadata)
+        index.set("bar", metadata)
+        assert done.wait(timeout=5)
+        assert len(pruned) == 1
+        assert pruned[0] is not threading.current_thread()
+
+    def test_default_index_uses_max_age_setting(self, tmp_path):
+        with temporary_settings(
+            {
+                PREFECT_RESULTS_METADATA_INDEX_PATH: tmp_path,
+                PREFECT_RESULTS_METADATA_INDEX_MAX_AGE_SECONDS: 60,
+            }
+        ):
+            assert get_result_metadata_index().max_age == timedelta(seconds=60)
+
+    def test_get_ignores_invalid_entries(self, index):
+        index.path.mkdir()
+        index._entry_path("foo").write_text("not metadata")
+        assert index.get("foo") is None
+
+    async def test_write_indexes_metadata(self, store, index):
+        await store.awrite(key="foo", obj="value", expiration=pendulum.now("utc"))
+        metadata = index.get(store._cache_key("foo"))
+        assert metadata is not None
+        assert metadata.expiration is not None
+
+    async def test_exists_does_not_read_indexed_records(self, store, monkeypatch):
+        await store.awrite(key="foo", obj="value")
+
+        def fail(*args, **kwargs):
+            raise AssertionError("storage should not be read")
+
+        monkeypatch.setattr(LocalFileSystem, "read_path", fail)
+        assert await store.aexists(key="foo")
+
+    async def test_exists_uses_indexed_expiration(self, store, monkeypatch):
+        await store.awrite(
+            key="foo", obj="value", expiration=pendulum.now("utc").subtract(seconds=1)
+        )
+
+        def fail(*args, **kwargs):
+            raise AssertionError("storage should not be read")
+
+        monkeypatch.setattr(LocalFileSystem, "read_path", fail)
+        assert not await store.aexists(key="foo")
+
+    async def test_exists_removes_expired_records_from_index(self, store, index):
+        await store.awrite(
+            key="foo", obj="value", expiration=pendulum.now("utc").subtract(seconds=1)
+        )
+
+        assert not await store.aexists(key="foo")
+        assert index.get(store._cache_key("foo")) is None
+
+    async def test_exists_removes_missing_records_from_index(self, store, index):
+        await store.awrite(key="foo", obj="value")
+        os.unlink(store.result_storage._resolve_path("foo"))
+
+        assert not await store.aexists(key="foo")
+        assert index.get(store._cache_key("foo")) is None
+
+    async def test_exists_indexes_records_read_from_storage(self, store, index):
+        await ResultStore(
+            result_storage=store.result_storage,
+            cache_result_in_memory=False,
+            metadata_index=None,
+        ).awrite(key="foo", obj="value")
+        assert index.get(store._cache_key("foo")) is None
+
+        assert await store.aexists(key="foo")
+        assert index.get(store._cache_key("foo")) is not None
+
+    async def test_exists_with_metadata_storage_checks_metadata(self, tmp_path, index):
+        store = ResultStore(
+            result_storage=LocalFileSystem(basepath=tmp_path / "results"),
+            metadata_storage=LocalFileSystem(basepath=tmp_path / "metadata"),
+            cache_result_in_memory=False,
+            metadata_index=index,
+        )
+        await store.awrite(key="foo", obj="value")
+        assert await store.aexists(key="foo")
+
+        os.unlink(store.metadata_storage._resolve_path("foo"))
+        assert not await store.aexists(key="foo")
+
+
 async def test_supports_isolation_level():
     store_with_lock_manager = ResultStore(lock_manager=MemoryLockManager())
     store_without_lock_manager = ResultStore()
@@ -6,6 +6,9 @@ order. This is purely so that we can test sorting by flow run and
 task run ID with a stable order across test machines.
 """
 
+import gzip
+import json
+from contextlib import asynccontextmanager, contextmanager
 from datetime import timedelta
 from unittest import mock
 from uuid import uuid1
@@ -13,11 +16,20 @@ from uuid import uuid1
 import pendulum
 import pytest
 from sqlalchemy.orm.exc import FlushError
+from starlette.status import WS_1002_PROTOCOL_ERROR, WS_1008_POLICY_VIOLATION
+from starlette.websockets import WebSocketDisconnect
 
 from prefect.server import models
+from prefect.server.logs import stream
 from prefect.server.schemas.actions import LogCreate
 from prefect.server.schemas.core import Log
 from prefect.server.schemas.filters import LogFilter
+from prefect.settings import (
+    PREFECT_SERVER_API_MAX_DECOMPRESSED_BODY_SIZE,
+    PREFECT_SERVER_LOGS_MAXIMUM_WEBSOCKET_BACKFILL,
+    PREFECT_SERVER_LOGS_STREAM_OUT_ENABLED,
+    temporary_settings,
+)
 
 NOW = pendulum.now("UTC")
 CREATE_LOGS_URL = "/logs/"
@@ -91,6 +103,62 @@ class TestCreateLogs:
             == log_data[1]
         )
 
+    async def test_create_gzip_encoded_logs(
+        self, session, client, log_data, flow_run_id
+    ):
+        response = await client.post(
+            CREATE_LOGS_URL,
+            content=gzip.compress(json.dumps(log_data).encode()),
+            headers={"Content-Type": "application/json", "Content-Encoding": "gzip"},
+        )
+        assert response.status_code == 201
+
+        log_filter = LogFilter(flow_run_id={"any_": [flow_run_id]})
+        logs = await models.logs.read_logs(session=session, log_filter=log_filter)
+        assert len(logs) == 2
+
+    async def test_create_logs_with_multiple_gzip_members(
+        self, session, client, log_data, flow_run_id
+    ):
+        body = json.dumps(log_data).encode()
+        response = await client.post(
+            CREATE_LOGS_URL,
+            content=gzip.compress(body[:10]) + gzip.compress(body[10:]),
+            headers={"Content-Type": "application/json", "Content-Encoding": "gzip"},
+        )
+        assert response.status_code == 201
+
+    async def test_create_logs_rejects_oversized_gzip_body(self, client, log_data):
+        body = json.dumps(log_data).encode()
+        with temporary_settings(
+            {PREFECT_SERVER_API_MAX_DECOMPRESSED_BODY_SIZE: len(body) - 1}
+        ):
+            response = await client.post(
+                CREATE_LOGS_URL,
+                content=gzip.compress(body),
+                headers={
+                    "Content-Type": "application/json",
+                    "Content-Encoding": "gzip",
+                },
+            )
+        assert response.status_code == 413
+
+    async def test_create_logs_with_truncated_gzip_body(self, client, log_data):
+        response = await client.post(
+            CREATE_LOGS_URL,
+            content=gzip.compress(json.dumps(log_data).encode())[:-10],
+            headers={"Content-Type": "application/json", "Content-Encoding": "gzip"},
+        )
+        assert response.status_code == 400
+
+    async def test_create_logs_with_invalid_gzip_encoding(self, client, log_data):
+        response = await client.post(
+            CREATE_LOGS_URL,
+            content=json.dumps(log_data).encode(),
+            headers={"Content-Type": "application/json", "Content-Encoding": "gzip"},
+        )
+        assert response.status_code == 400
+
     async def test_database_failure(
         self, client_without_exceptions, session, flow_run_id, task_run_id, log_data
     ):
@@ -175,3 +243,325 @@ class TestReadLogs:
         api_logs = [Log(**log_data) for log_data in response.json()]
         assert api_logs[0].timestamp > api_logs[1].timestamp
         assert api_logs[0].message == "Black flag ahead, captain!"
+
+
+class TestPaginateLogs:
+    PAGINATE_LOGS_URL = "/logs/paginate"
+
+    @pytest.fixture()
+    async def logs(self, client, flow_run_id):
+        log_data = [
+            LogCreate(
+                name="prefect.flow_run",
+                level=20,
+                message=f"Log {i}",
+                # pairs of logs share a timestamp to exercise the id tiebreaker
+                timestamp=NOW + timedelta(seconds=i // 2),
+                flow_run_id=flow_run_id,
+            ).model_dump(mode="json")
+            for i in range(7)
+        ]
+        await client.post(CREATE_LOGS_URL, json=log_data)
+
+    async def read_all_pages(self, client, **body):
+        pages = []
+        cursor = None
+        while True:
+            response = await client.post(
+                self.PAGINATE_LOGS_URL, json={**body, "cursor": cursor}
+            )
+            assert response.status_code == 200, response.text
+            data = response.json()
+            pages.append([Log(**log).message for log in data["results"]])
+            cursor = data["next_page"]
+            if cursor is None:
+                return pages
+
+    async def test_paginate_logs_follows_cursors(self, client, logs):
+        pages = await self.read_all_pages(client, limit=3, sort="TIMESTAMP_ASC")
+        assert [len(page) for page in pages] == [3, 3, 1]
+        messages = [message for page in pages for message in page]
+        assert len(set(messages)) == 7
+        # logs with the same timestamp are ordered by their random ids
+        assert set(messages[:2]) == {"Log 0", "Log 1"}
+        assert messages[-1] == "Log 6"
+
+    async def test_paginate_logs_descending(self, client, logs):
+        pages = await self.read_all_pages(client, limit=2, sort="TIMESTAMP_DESC")
+        messages = [message for page in pages for message in page]
+        assert len(set(messages)) == 7
+        assert messages[0] == "Log 6"
+        assert set(messages[-2:]) == {"Log 0", "Log 1"}
+
+    async def test_paginate_logs_applies_filter(self, client, logs, log_data):
+        await client.post(CREATE_LOGS_URL, json=log_data)
+        pages = await self.read_all_pages(
+            client,
+            limit=4,
+            logs={"level": {"ge_": 50}},
+        )
+        assert pages == [["Black flag ahead, captain!"]]
+
+    async def test_paginate_logs_with_empty_cursor_reads_first_page(self, client, logs):
+        response = await client.post(
+            self.PAGINATE_LOGS_URL, json={"limit": 10, "cursor": ""}
+        )
+        assert response.status_code == 200
+        assert len(response.json()["results"]) == 7
+        assert response.json()["next_page"] is None
+
+    async def test_paginate_logs_rejects_invalid_cursor(self, client, logs):
+        response = await client.post(
+            self.PAGINATE_LOGS_URL, json={"cursor": "not-a-cursor"}
+        )
+        assert response.status_code == 422
+        assert "cursor" in response.json()["exception_message"]
+
+    async def test_paginate_logs_rejects_cursor_for_another_sort(self, client, logs):
+        response = await client.post(
+            self.PAGINATE_LOGS_URL, json={"limit": 2, "sort": "TIMESTAMP_ASC"}
+        )
+        cursor = response.json()["next_page"]
+
+        response = await client.post(
+            self.PAGINATE_LOGS_URL, json={"cursor": cursor, "sort": "TIMESTAMP_DESC"}
+        )
+        assert response.status_code == 422
+
+
+class TestExportLogs:
+    EXPORT_LOGS_URL = "/logs/export"
+
+    @pytest.fixture()
+    async def logs(self, client, log_data):
+        await client.post(CREATE_LOGS_URL, json=log_data)
+
+    async def export(self, client, **body):
+        async with client.stream("POST", self.EXPORT_LOGS_URL, json=body) as response:
+            assert response.status_code == 200
+            content_type = response.headers["content-type"]
+            return content_type, "".join(
+                [chunk async for chunk in response.aiter_text()]
+            )
+
+    async def test_export_logs_as_ndjson(self, client, logs):
+        content_type, body = await self.export(client)
+        assert content_type == "application/x-ndjson"
+
+        logs = [Log.model_validate_json(line) for line in body.splitlines()]
+        assert [log.message for log in logs] == [
+            "Ahoy, captain",
+            "Black flag ahead, captain!",
+        ]
+
+    async def test_export_logs_applies_filter_and_sort(self, client, logs, task_run_id):
+        content_type, body = await self.export(client, sort="TIMESTAMP_DESC")
+        assert [
+            Log.model_validate_json(line).message for line in body.splitlines()
+        ] == [
+            "Black flag ahead, captain!",
+            "Ahoy, captain",
+        ]
+
+        _, body = await self.export(
+            client, logs={"task_run_id": {"any_": [str(task_run_id)]}}
+        )
+        assert len(body.splitlines()) == 1
+        assert Log.model_validate_json(body).task_run_id == task_run_id
+
+    async def test_export_logs_as_csv(self, client, logs, monkeypatch):
+        # read the logs in more than one batch
+        monkeypatch.setattr(
+            "prefect.server.api.logs.PREFECT_SERVER_LOGS_STREAM_BATCH_SIZE.value",
+            lambda: 1,
+        )
+
+        content_type, body = await self.export(client, format="csv")
+        assert content_type.startswith("text/csv")
+
+        lines = body.splitlines()
+        assert lines[0] == "timestamp,level,flow_run_id,task_run_id,message"
+        assert len(lines) == 3
+        assert lines[1].endswith(',"Ahoy, captain"')
+
+    async def test_export_logs_as_csv_without_logs(self, client):
+        _, body = await self.export(client, format="csv")
+        assert body.splitlines() == ["timestamp,level,flow_run_id,task_run_id,message"]
+
+    async def test_export_logs_without_logs(self, client):
+        _, body = await self.export(client)
+        assert body == ""
+
+
+class TestStreamLogsOut:
+    @pytest.fixture(autouse=True)
+    def enable_stream_out(self):
+        # the test logs are timestamped when this module is imported
+        with temporary_settings(
+            {
+                PREFECT_SERVER_LOGS_STREAM_OUT_ENABLED: True,
+                PREFECT_SERVER_LOGS_MAXIMUM_WEBSOCKET_BACKFILL: timedelta(days=1),
+            }
+        ):
+            yield
+
+    @pytest.fixture()
+    async def logs(self, client, log_data):
+        await client.post(CREATE_LOGS_URL, json=log_data)
+        response = await client.post(READ_LOGS_URL)
+        return [Log(**log) for log in response.json()]
+
+    @pytest.fixture
+    def new_log(self, flow_run_id) -> Log:
+        return Log(
+            name="prefect.flow_run",
+            level=20,
+            message="Land ho!",
+            timestamp=NOW + timedelta(hours=2),
+            flow_run_id=flow_run_id,
+        )
+
+    @pytest.fixture
+    def stream_mock(self, monkeypatch: pytest.MonkeyPatch, logs, new_log):
+        filters = []
+
+        @asynccontextmanager
+        async def mock_stream(log_filter: LogFilter):
+            filters.append(log_filter)
+
+            async def _fake_stream():
+                # the stream may repeat logs that were also backfilled
+                yield logs[1]
+                yield None
+                yield new_log
+
+            yield _fake_stream()
+
+        monkeypatch.setattr("prefect.server.api.logs.stream.logs", mock_stream)
+        return filters
+
+    @contextmanager
+    def authenticated_socket(self, test_client):
+        with test_client.websocket_connect(
+            "api/logs/out", subprotocols=["prefect"]
+        ) as websocket:
+            websocket.send_json({"type": "auth", "token": None})
+            assert websocket.receive_json() == {"type": "auth_success"}
+            yield websocket
+
+    def test_streaming_requires_a_filter_message(self, test_client):
+        with pytest.raises(WebSocketDisconnect) as exception:
+            with self.authenticated_socket(test_client) as websocket:
+                websocket.send_json({"type": "what?"})
+                websocket.receive_json()
+
+        assert exception.value.code == WS_1002_PROTOCOL_ERROR
+        assert exception.value.reason == "Expected 'filter' message"
+
+    def test_streaming_requires_a_valid_filter(self, test_client):
+        with pytest.raises(WebSocketDisconnect) as exception:
+            with self.authenticated_socket(test_client) as websocket:
+                websocket.send_json({"type": "filter", "filter": {"level": "loud"}})
+                websocket.receive_json()
+
+        assert exception.value.code == WS_1002_PROTOCOL_ERROR
+        assert exception.value.reason.startswith("Invalid filter")
+
+    def test_streaming_backfills_then_follows(
+        self, test_client, logs, new_log, stream_mock, flow_run_id
+    ):
+        log_filter = LogFilter(flow_run_id={"any_": [flow_run_id]})
+
+        with self.authenticated_socket(test_client) as websocket:
+            websocket.send_json(
+                {"type": "filter", "filter": log_filter.model_dump(mode="json")}
+            )
+
+            backfill = websocket.receive_json()
+            assert backfill["type"] == "logs"
+            assert [Log(**log) for log in backfill["logs"]] == logs
+
+            followed = websocket.receive_json()
+            assert [Log(**log) for log in followed["logs"]] == [new_log]
+
+        assert stream_mock == [log_filter]
+
+    def test_streaming_without_backfill(self, test_client, logs, new_log, stream_mock):
+        with self.authenticated_socket(test_client) as websocket:
+            websocket.send_json({"type": "filter", "backfill": False})
+
+            (first,) = websocket.receive_json()["logs"]
+            assert Log(**first) == logs[1]
+            (second,) = websocket.receive_json()["logs"]
+            assert Log(**second) == new_log
+
+    def test_streaming_without_following(self, test_client, logs, stream_mock):
+        with pytest.raises(WebSocketDisconnect):
+            with self.authenticated_socket(test_client) as websocket:
+                websocket.send_json({"type": "filter", "follow": False})
+
+                backfill = websocket.receive_json()
+                assert [Log(**log) for log in backfill["logs"]] == logs
+
+                websocket.receive_json()
+
+        assert stream_mock == []
+
+    async def test_backfill_is_limited_to_recent_logs(
+        self, client, test_client, logs, flow_run_id
+    ):
+        old_log = LogCreate(
+            name="prefect.flow_run",
+            level=20,
+            message="Long ago",
+            timestamp=pendulum.now("UTC") - timedelta(hours=2),
+            flow_run_id=flow_run_id,
+        )
+        await client.post(CREATE_LOGS_URL, json=[old_log.model_dump(mode="json")])
+
+        with temporary_settings(
+            {PREFECT_SERVER_LOGS_MAXIMUM_WEBSOCKET_BACKFILL: timedelta(hours=1)}
+        ):
+            with pytest.raises(WebSocketDisconnect):
+                with self.authenticated_socket(test_client) as websocket:
+                    websocket.send_json({"type": "filter", "follow": False})
+
+                    backfill = websocket.receive_json()
+                    messages = [log["message"] for log in backfill["logs"]]
+                    assert "Long ago" not in messages
+                    assert logs[1].message in messages
+
+                    websocket.receive_json()
+
+    def test_following_requires_stream_out(self, test_client):
+        with temporary_settings({PREFECT_SERVER_LOGS_STREAM_OUT_ENABLED: False}):
+            with pytest.raises(WebSocketDisconnect) as exception:
+                with self.authenticated_socket(test_client) as websocket:
+                    websocket.send_json({"type": "filter"})
+                    websocket.receive_json()
+
+        assert exception.value.code == WS_1008_POLICY_VIOLATION
+
+    async def test_created_logs_are_published(self, client, log_data):
+        await stream.start_distributor()
+        try:
+            async with stream.logs(LogFilter()) as subscription:
+                await client.post(CREATE_LOGS_URL, json=log_data)
+
+                published = [await subscription.__anext__() for _ in log_data]
+        finally:
+            await stream.stop_distributor()
+
+        response = await client.post(READ_LOGS_URL)
+        assert published == [Log(**log) for log in response.json()]
+
+    async def test_created_logs_are_not_published_without_stream_out(
+        self, client, log_data, monkeypatch
+    ):
+        publish = mock.AsyncMock()
+        monkeypatch.setattr("prefect.server.api.logs.messaging.publish", publish)
+
+        with temporary_settings({PREFECT_SERVER_LOGS_STREAM_OUT_ENABLED: False}):
+            await client.post(CREATE_LOGS_URL, json=log_data)
+
+        publish.assert_not_called()
@@ -84,6 +84,9 @@ async def test_injecting_really_dumb_query_components():
         def least(self, *values):
             ...
 
+        def truncate_to_hour(self, timestamp):
+            ...
+
         # --- dialect-specific JSON handling
 
         def uses_json_strings(self) -> bool:
@@ -1,3 +1,5 @@
+from uuid import UUID
+
 import pendulum
 import pytest
 import sqlalchemy as sa
@@ -752,3 +754,41 @@ class TestGetRunsFromWorkQueueQuery:
             scheduled_after=pendulum.now("UTC").add(hours=1),
         )
         assert len(runs) == 0
+
+    async def test_statements_are_reused_for_each_combination_of_options(
+        self, session, db: PrefectDBInterface, work_pools
+    ):
+        db.queries.SCHEDULED_FLOW_RUNS_STATEMENTS.clear()
+
+        for _ in range(3):
+            await db.queries.get_scheduled_flow_runs_from_work_pool(session=session)
+            await db.queries.get_scheduled_flow_runs_from_work_pool(
+                session=session, work_pool_ids=[work_pools["wp_a"].id]
+            )
+            await db.queries.get_scheduled_flow_runs_from_work_pool(
+                session=session,
+                work_pool_ids=[work_pools["wp_a"].id, work_pools["wp_b"].id],
+            )
+
+        assert len(db.queries.SCHEDULED_FLOW_RUNS_STATEMENTS) == 2
+
+    async def test_runs_match_validated_flow_runs(
+        self, session, db: PrefectDBInterface, work_pools, work_queues
+    ):
+        runs = await db.queries.get_scheduled_flow_runs_from_work_pool(session=session)
+        assert runs
+
+        for run in runs:
+            flow_run = await models.flow_runs.read_flow_run(
+                session=session, flow_run_id=run.flow_run.id
+            )
+            expected = schemas.core.FlowRun.model_validate(
+                flow_run, from_attributes=True
+            )
+            # the estimated start time delta is computed against the current time
+            exclude = {"state", "estimated_start_time_delta"}
+            assert run.flow_run.model_dump(exclude=exclude) == expected.model_dump(
+                exclude=exclude
+            )
+            assert run.work_queue_id == flow_run.work_queue_id
+            assert isinstance(run.work_pool_id, UUID)
@@ -0,0 +1,137 @@
+import asyncio
+from typing import AsyncGenerator, AsyncIterator, Optional
+from uuid import uuid4
+
+import pendulum
+import pytest
+
+from prefect.server.logs import messaging, stream
+from prefect.server.schemas.core import Log
+from prefect.server.schemas.filters import LogFilter
+
+NOW = pendulum.now("UTC")
+
+
+@pytest.fixture
+def flow_run_id():
+    return uuid4()
+
+
+@pytest.fixture
+def log1(flow_run_id) -> Log:
+    return Log(
+        name="prefect.flow_run",
+        level=20,
+        message="Ahoy, captain",
+        timestamp=NOW,
+        flow_run_id=flow_run_id,
+    )
+
+
+@pytest.fixture
+def log2(flow_run_id) -> Log:
+    return Log(
+        name="prefect.task_run",
+        level=50,
+        message="Black flag ahead, captain!",
+        timestamp=NOW.add(hours=1),
+        flow_run_id=flow_run_id,
+        task_run_id=uuid4(),
+    )
+
+
+@pytest.fixture
+async def distributor_running() -> AsyncGenerator[None, None]:
+    await stream.start_distributor()
+    await stream.start_distributor()  # this should be a no-op, covers that case
+    try:
+        yield
+    finally:
+        await stream.stop_distributor()
+        await stream.stop_distributor()  # this should be a no-op, covers that case
+
+
+async def next_log(subscription: AsyncIterator[Optional[Log]]) -> Optional[Log]:
+    return await asyncio.wait_for(subscription.__anext__(), timeout=5)
+
+
+async def test_subscriptions_are_cleaned_up_when_the_context_is_closed():
+    assert len(stream.subscribers) == 0
+
+    async with stream.subscribed(LogFilter()):
+        assert len(stream.subscribers) == 1
+        async with stream.subscribed(LogFilter()):
+            assert len(stream.subscribers) == 2
+        assert len(stream.subscribers) == 1
+
+    assert len(stream.subscribers) == 0
+
+
+async def test_subscribing_to_stream(distributor_running: None, log1: Log, log2: Log):
+    async with stream.logs(LogFilter()) as subscription:
+        await messaging.publish([log1, log2])
+        assert await next_log(subscription) == log1
+        assert await next_log(subscription) == log2
+
+
+async def test_subscriptions_only_receive_matching_logs(
+    distributor_running: None, log1: Log, log2: Log
+):
+    errors_only = LogFilter(level={"ge_": 40})
+    async with stream.logs(errors_only) as errors, stream.logs(
+        LogFilter()
+    ) as everything:
+        await messaging.publish([log1, log2])
+
+        assert await next_log(everything) == log1
+        assert await next_log(everything) == log2
+        assert await next_log(errors) == log2
+
+
+async def test_maximum_backlog(
+    monkeypatch: pytest.MonkeyPatch, distributor_running: None, log1: Log
+):
+    monkeypatch.setattr(stream, "SUBSCRIPTION_BACKLOG", 3)
+
+    async with stream.subscribed(LogFilter()) as queue:
+        await messaging.publish([log1] * 5)
+
+        while queue.qsize() < 3:
+            await asyncio.sleep(0.01)
+        await asyncio.sleep(0.1)
+
+        assert queue.qsize() == 3
+
+
+@pytest.mark.parametrize(
+    "log_filter, expected",
+    [
+        ({}, True),
+        ({"level": {"ge_": 20}}, True),
+        ({"level": {"ge_": 30}}, False),
+        ({"level": {"le_": 10}}, False),
+        ({"level": {"ge_": 10, "le_": 20}}, True),
+        ({"timestamp": {"after_": NOW.isoformat()}}, True),
+        ({"timestamp": {"after_": NOW.add(seconds=1).isoformat()}}, False),
+        ({"timestamp": {"before_": NOW.subtract(seconds=1).isoformat()}}, False),
+        ({"task_run_id": {"is_null_": True}}, True),
+        ({"task_run_id": {"is_null_": False}}, False),
+        ({"task_run_id": {"any_": [str(uuid4())]}}, False),
+        ({"level": {"ge_": 30}, "task_run_id": {"is_null_": True}}, False),
+        (
+            {
+                "operator": "or_",
+                "level": {"ge_": 30},
+                "task_run_id": {"is_null_": True},
+            },
+            True,
+        ),
+    ],
+)
+def test_includes_matches_the_filter(log1: Log, log_filter: dict, expected: bool):
+    assert stream.includes(LogFilter.model_validate(log_filter), log1) is expected
+
+
+def test_includes_matches_flow_run_ids(log1: Log, flow_run_id):
+    assert stream.includes(LogFilter(flow_run_id={"any_": [flow_run_id]}), log1)
+    assert not stream.includes(LogFilter(flow_run_id={"any_": [uuid4()]}), log1)
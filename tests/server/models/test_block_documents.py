@@ -1,3 +1,4 @@
+import asyncio
 import string
 from typing import List
 from uuid import uuid4
@@ -10,6 +11,11 @@ from prefect.blocks.core import Block
 from prefect.server import models, schemas
 from prefect.server.database import orm_models
 from prefect.server.schemas.actions import BlockDocumentCreate
+from prefect.settings import (
+    PREFECT_SERVER_BLOCKS_CACHE_ENABLED,
+    PREFECT_SERVER_BLOCKS_CACHE_TTL_SECONDS,
+    temporary_settings,
+)
 from prefect.types import SecretDict
 from prefect.utilities.names import obfuscate, obfuscate_string
 
@@ -1793,3 +1799,175 @@ class TestSecretBlockDocuments:
         )
 
         assert block.data["w"] == {"secret": [W, W]}
+
+
+class TestBlockDocumentCache:
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        models.block_documents.clear_block_document_cache()
+        yield
+        models.block_documents.clear_block_document_cache()
+
+    @pytest.fixture
+    async def block_document(self, session, block_schemas):
+        block_document = await models.block_documents.create_block_document(
+            session,
+            block_document=schemas.actions.BlockDocumentCreate(
+                name="cached",
+                data=dict(x=1),
+                block_schema_id=block_schemas[1].id,
+                block_type_id=block_schemas[1].block_type_id,
+            ),
+        )
+        await session.commit()
+        return block_document
+
+    async def overwrite_data(self, session, block_document_id, data):
+        # write directly to the ORM model, bypassing the cache invalidation
+        orm_block_document = await session.get(
+            orm_models.BlockDocument, block_document_id
+        )
+        await orm_block_document.encrypt_data(session=session, data=data)
+        await session.commit()
+
+    async def test_reads_are_not_cached_by_default(self, session, block_document):
+        await models.block_documents.read_block_document_by_id(
+            session, block_document_id=block_document.id
+        )
+        await self.overwrite_data(session, block_document.id, dict(x=2))
+
+        read = await models.block_documents.read_block_document_by_id(
+            session, block_document_id=block_document.id
+        )
+        assert read.data == dict(x=2)
+
+    async def test_reads_by_id_and_name_are_cached(self, session, block_document):
+        with temporary_settings({PREFECT_SERVER_BLOCKS_CACHE_ENABLED: True}):
+            await models.block_documents.read_block_document_by_id(
+                session, block_document_id=block_document.id
+            )
+            await models.block_documents.read_block_document_by_name(
+                session,
+                name="cached",
+                block_type_slug=block_document.block_type.slug,
+            )
+            await self.overwrite_data(session, block_document.id, dict(x=2))
+
+            by_id = await models.block_documents.read_block_document_by_id(
+                session, block_document_id=block_document.id
+            )
+            by_name = await models.block_documents.read_block_document_by_name(
+                session,
+                name="cached",
+                block_type_slug=block_document.block_type.slug,
+            )
+
+        assert by_id.data == dict(x=1)
+        assert by_name.data == dict(x=1)
+
+    async def test_cached_reads_are_copies(self, session, block_document):
+        with temporary_settings({PREFECT_SERVER_BLOCKS_CACHE_ENABLED: True}):
+            read = await models.block_documents.read_block_document_by_id(
+                session, block_document_id=block_document.id
+            )
+            read.data["x"] = 3
+
+            read = await models.block_documents.read_block_document_by_id(
+                session, block_document_id=block_document.id
+            )
+
+        assert read.data == dict(x=1)
+
+    async def test_updates_clear_the_cache(self, session, block_document):
+        with temporary_settings({PREFECT_SERVER_BLOCKS_CACHE_ENABLED: True}):
+            await models.block_documents.read_block_document_by_id(
+                session, block_document_id=block_document.id
+            )
+            await models.block_documents.update_block_document(
+                session,
+                block_document_id=block_document.id,
+                block_document=schemas.actions.BlockDocumentUpdate(data=dict(x=2)),
+            )
+            await session.commit()
+
+            read = await models.block_documents.read_block_document_by_id(
+                session, block_document_id=block_document.id
+            )
+
+        assert read.data == dict(x=2)
+
+    async def test_deletes_clear_the_cache(self, session, block_document):
+        with temporary_settings({PREFECT_SERVER_BLOCKS_CACHE_ENABLED: True}):
+            await models.block_documents.read_block_document_by_id(
+                session, block_document_id=block_document.id
+            )
+            await models.block_documents.delete_block_document(
+                session, block_document_id=block_document.id
+            )
+            await session.commit()
+
+            read = await models.block_documents.read_block_document_by_id(
+                session, block_document_id=block_document.id
+            )
+
+        assert read is None
+
+    async def test_expired_documents_are_read_again(self, session, block_document):
+        with temporary_settings(
+            {
+                PREFECT_SERVER_BLOCKS_CACHE_ENABLED: True,
+                PREFECT_SERVER_BLOCKS_CACHE_TTL_SECONDS: 0.1,
+            }
+        ):
+            await models.block_documents.read_block_document_by_id(
+                session, block_document_id=block_document.id
+            )
+            await self.overwrite_data(session, block_document.id, dict(x=2))
+            await asyncio.sleep(0.2)
+
+            read = await models.block_documents.read_block_document_by_id(
+                session, block_document_id=block_document.id
+            )
+
+        assert read.data == dict(x=2)
+
+    async def test_reads_including_secrets_are_not_cached(
+        self, session, block_document
+    ):
+        with temporary_settings({PREFECT_SERVER_BLOCKS_CACHE_ENABLED: True}):
+            await models.block_documents.read_block_document_by_id(
+                session, block_document_id=block_document.id, include_secrets=True
+            )
+            await self.overwrite_data(session, block_document.id, dict(x=2))
+
+            read = await models.block_documents.read_block_document_by_id(
+                session, block_document_id=block_document.id, include_secrets=True
+            )
+
+        assert read.data == dict(x=2)
+
+    async def test_reads_in_progress_during_a_clear_are_not_cached(
+        self, session, block_document
+    ):
+        async def read():
+            # a write commits while this read is in progress
+            models.block_documents.clear_block_document_cache()
+            (read,) = await models.block_documents.read_block_documents(
+                session,
+                block_document_filter=schemas.filters.BlockDocumentFilter(
+                    id=dict(any_=[block_document.id])
+                ),
+            )
+            return read
+
+        with temporary_settings({PREFECT_SERVER_BLOCKS_CACHE_ENABLED: True}):
+            await models.block_documents._read_cached_block_document(
+                ("id", block_document.id), read, include_secrets=False
+            )
+            await self.overwrite_data(session, block_document.id, dict(x=2))
+
+            read = await models.block_documents.read_block_document_by_id(
+                session, block_document_id=block_document.id
+            )
+
+        assert read.data == dict(x=2)
@@ -273,6 +273,169 @@ class TestCreateFlowRunState:
                 assert frs.status == schemas.responses.SetStateStatus.ABORT
 
 
+class TestSetFlowRunStates:
+    @pytest.fixture
+    async def flow_runs(self, session, flow):
+        runs = [
+            await models.flow_runs.create_flow_run(
+                session=session,
+                flow_run=schemas.actions.FlowRunCreate(flow_id=flow.id),
+            )
+            for _ in range(3)
+        ]
+        await session.commit()
+        return runs
+
+    async def test_sets_a_state_on_each_run(self, flow_runs, session):
+        results = await models.flow_runs.set_flow_run_states(
+            session=session,
+            flow_run_ids=[run.id for run in flow_runs],
+            state=Running(),
+        )
+
+        assert set(results) == {run.id for run in flow_runs}
+        state_ids = set()
+        for run in flow_runs:
+            result = results[run.id]
+            assert result.status == schemas.responses.SetStateStatus.ACCEPT
+            assert result.state.type == StateType.RUNNING
+            assert result.state.state_details.flow_run_id == run.id
+            state_ids.add(result.state.id)
+
+            await session.refresh(run)
+            assert run.state.id == result.state.id
+            assert run.run_count == 1
+
+        assert len(state_ids) == len(flow_runs)
+
+    async def test_omits_runs_that_do_not_exist(self, flow_runs, session):
+        results = await models.flow_runs.set_flow_run_states(
+            session=session,
+            flow_run_ids=[flow_runs[0].id, uuid4()],
+            state=Running(),
+        )
+
+        assert list(results) == [flow_runs[0].id]
+
+    async def test_orchestrates_each_run_independently(self, flow_runs, session):
+        await models.flow_runs.set_flow_run_state(
+            session=session,
+            flow_run_id=flow_runs[0].id,
+            state=Scheduled(scheduled_time=pendulum.now("UTC").add(months=1)),
+            flow_policy=await provide_flow_policy(),
+        )
+
+        results = await models.flow_runs.set_flow_run_states(
+            session=session,
+            flow_run_ids=[run.id for run in flow_runs],
+            state=Running(),
+            flow_policy=await provide_flow_policy(),
+        )
+
+        # the run scheduled in the future is told to wait, the others proceed
+        assert results[flow_runs[0].id].status == schemas.responses.SetStateStatus.WAIT
+        assert (
+            results[flow_runs[1].id].status == schemas.responses.SetStateStatus.ACCEPT
+        )
+        assert (
+            results[flow_runs[2].id].status == schemas.responses.SetStateStatus.ACCEPT
+        )
+
+    async def test_rule_errors_abort_only_their_run(self, flow_runs, session):
+        failing_run_id = flow_runs[1].id
+
+        class FailingRule(BaseOrchestrationRule):
+            FROM_STATES = ALL_ORCHESTRATION_STATES
+            TO_STATES = ALL_ORCHESTRATION_STATES
+
+            async def before_transition(self, initial_state, proposed_state, context):
+                if context.run.id == failing_run_id:
+                    raise ValueError("this run is cursed")
+
+        class FailingPolicy(BaseOrchestrationPolicy):
+            @staticmethod
+            def priority():
+                return [FailingRule]
+
+        results = await models.flow_runs.set_flow_run_states(
+            session=session,
+            flow_run_ids=[run.id for run in flow_runs],
+            state=Running(),
+            flow_policy=FailingPolicy,
+        )
+
+        assert results[failing_run_id].status == schemas.responses.SetStateStatus.ABORT
+        assert results[failing_run_id].state is None
+        for run in (flow_runs[0], flow_runs[2]):
+            assert results[run.id].status == schemas.responses.SetStateStatus.ACCEPT
+
+    async def test_write_errors_abort_only_their_run(self, flow_runs, session):
+        # the first two runs propose states with the same id, so they can't both be
+        # written
+        conflicting_state_id = uuid4()
+
+        class ConflictingRule(BaseOrchestrationRule):
+            FROM_STATES = ALL_ORCHESTRATION_STATES
+            TO_STATES = ALL_ORCHESTRATION_STATES
+
+            async def before_transition(self, initial_state, proposed_state, context):
+                if context.run.id in (flow_runs[0].id, flow_runs[1].id):
+                    self.context.proposed_state.id = conflicting_state_id
+
+        class ConflictingPolicy(BaseOrchestrationPolicy):
+            @staticmethod
+            def priority():
+                return [ConflictingRule]
+
+        results = await models.flow_runs.set_flow_run_states(
+            session=session,
+            flow_run_ids=[run.id for run in flow_runs],
+            state=Running(),
+            flow_policy=ConflictingPolicy,
+        )
+        await session.commit()
+
+        statuses = [results[run.id].status for run in flow_runs]
+        assert sorted(statuses[:2]) == sorted(
+            [
+                schemas.responses.SetStateStatus.ACCEPT,
+                schemas.responses.SetStateStatus.ABORT,
+            ]
+        )
+        assert statuses[2] == schemas.responses.SetStateStatus.ACCEPT
+
+        for run in flow_runs:
+            await session.refresh(run)
+            result = results[run.id]
+            if result.status == schemas.responses.SetStateStatus.ACCEPT:
+                assert run.state.id == result.state.id
+                assert run.state_type == StateType.RUNNING
+            else:
+                assert run.state is None
+
+    async def test_compiles_rules_once_per_transition(self, flow_runs, session):
+        compiled = []
+
+        class CountingPolicy(BaseOrchestrationPolicy):
+            @staticmethod
+            def priority():
+                return []
+
+            @classmethod
+            def compile_transition_rules(cls, from_state=None, to_state=None):
+                compiled.append((from_state, to_state))
+                return []
+
+        await models.flow_runs.set_flow_run_states(
+            session=session,
+            flow_run_ids=[run.id for run in flow_runs],
+            state=Running(),
+            flow_policy=CountingPolicy,
+        )
+
+        assert compiled == [(None, StateType.RUNNING)]
+
+
 class TestReadFlowRunState:
     async def test_read_flow_run_state(self, flow_run, session):
         # create a flow run to read
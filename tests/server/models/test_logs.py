@@ -138,3 +138,46 @@ class TestReadLogs:
 
         assert len(logs) == 1
         assert all([log.task_run_id is not None for log in logs])
+
+
+class TestStreamLogs:
+    async def test_stream_logs_in_batches(self, session, logs, flow_run_id):
+        batches = [
+            batch
+            async for batch in models.logs.stream_logs(
+                session=session,
+                log_filter=LogFilter(flow_run_id={"any_": [flow_run_id]}),
+                batch_size=2,
+            )
+        ]
+
+        assert [len(batch) for batch in batches] == [2, 1]
+        assert [log.message for batch in batches for log in batch] == [
+            "Ahoy, captain",
+            "Aye-aye, captain!",
+            "Black flag ahead, captain!",
+        ]
+
+    async def test_stream_logs_sorted(self, session, logs):
+        batches = [
+            batch
+            async for batch in models.logs.stream_logs(
+                session=session,
+                log_filter=LogFilter(level={"ge_": 20}),
+                sort=LogSort.TIMESTAMP_DESC,
+            )
+        ]
+
+        assert [log.message for batch in batches for log in batch] == [
+            "Black flag ahead, captain!",
+            "Aye-aye, captain!",
+        ]
+
+    async def test_stream_logs_without_matches(self, session, logs):
+        batches = [
+            batch
+            async for batch in models.logs.stream_logs(
+                session=session, log_filter=LogFilter(flow_run_id={"any_": [uuid4()]})
+            )
+        ]
+        assert batches == []
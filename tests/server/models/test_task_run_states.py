@@ -18,7 +18,14 @@ from prefect.server.orchestration.rules import (
     ALL_ORCHESTRATION_STATES,
     BaseOrchestrationRule,
 )
-from prefect.server.schemas.states import Failed, Running, Scheduled, StateType
+from prefect.server.schemas.states import (
+    Completed,
+    Crashed,
+    Failed,
+    Running,
+    Scheduled,
+    StateType,
+)
 
 
 class TestCreateTaskRunState:
@@ -229,6 +236,72 @@ class TestCreateTaskRunState:
             )
 
 
+class TestSetTaskRunStates:
+    @pytest.fixture
+    async def task_runs(self, session, flow_run):
+        runs = [
+            await models.task_runs.create_task_run(
+                session=session,
+                task_run=schemas.actions.TaskRunCreate(
+                    flow_run_id=flow_run.id, task_key="my-key", dynamic_key=str(i)
+                ),
+            )
+            for i in range(3)
+        ]
+        await session.commit()
+        return runs
+
+    async def test_sets_a_state_on_each_run(self, task_runs, session):
+        results = await models.task_runs.set_task_run_states(
+            session=session,
+            task_run_ids=[run.id for run in task_runs],
+            state=Running(),
+        )
+
+        assert set(results) == {run.id for run in task_runs}
+        for run in task_runs:
+            result = results[run.id]
+            assert result.status == schemas.responses.SetStateStatus.ACCEPT
+            assert result.state.type == StateType.RUNNING
+            assert result.state.state_details.task_run_id == run.id
+
+            await session.refresh(run)
+            assert run.state.id == result.state.id
+
+    async def test_omits_runs_that_do_not_exist(self, task_runs, session):
+        results = await models.task_runs.set_task_run_states(
+            session=session,
+            task_run_ids=[task_runs[0].id, uuid4()],
+            state=Running(),
+        )
+
+        assert list(results) == [task_runs[0].id]
+
+    async def test_orchestrates_each_run_independently(self, task_runs, session):
+        await models.task_runs.set_task_run_state(
+            session=session,
+            task_run_id=task_runs[0].id,
+            state=Completed(),
+            force=True,
+        )
+
+        results = await models.task_runs.set_task_run_states(
+            session=session,
+            task_run_ids=[run.id for run in task_runs],
+            state=Crashed(),
+            task_policy=await provide_task_policy(),
+        )
+
+        # the completed run can't crash anymore, the others proceed
+        assert results[task_runs[0].id].status == schemas.responses.SetStateStatus.ABORT
+        assert (
+            results[task_runs[1].id].status == schemas.responses.SetStateStatus.ACCEPT
+        )
+        assert (
+            results[task_runs[2].id].status == schemas.responses.SetStateStatus.ACCEPT
+        )
+
+
 class TestReadTaskRunState:
     async def test_read_task_run_state(self, task_run, session):
         # create a task run to read
@@ -8,6 +8,7 @@ from starlette import status
 
 from prefect.blocks.core import Block
 from prefect.server import models, schemas
+from prefect.server.events.clients import AssertingEventsClient
 from prefect.server.schemas.actions import BlockDocumentCreate, BlockDocumentUpdate
 from prefect.server.schemas.core import BlockDocument
 from prefect.types import SecretDict
@@ -313,6 +314,17 @@ class TestCreateBlockDocument:
         assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
 
 
+@pytest.fixture
+def events_client(monkeypatch: pytest.MonkeyPatch):
+    AssertingEventsClient.reset()
+    monkeypatch.setattr(
+        "prefect.server.api.block_documents.PrefectServerEventsClient",
+        AssertingEventsClient,
+    )
+    yield AssertingEventsClient
+    AssertingEventsClient.reset()
+
+
 class TestReadBlockDocument:
     async def test_read_missing_block_document(self, client):
         response = await client.get(f"/block_documents/{uuid4()}")
@@ -769,6 +781,32 @@ class TestDeleteBlockDocument:
         response = await client.get(f"/block_documents/{result.id}")
         assert response.status_code == status.HTTP_404_NOT_FOUND
 
+    async def test_delete_block_emits_event(
+        self, session, client, block_schemas, events_client
+    ):
+        block_document = await models.block_documents.create_block_document(
+            session,
+            block_document=schemas.actions.BlockDocumentCreate(
+                name="x",
+                data=dict(y=1),
+                block_schema_id=block_schemas[0].id,
+                block_type_id=block_schemas[0].block_type_id,
+            ),
+        )
+        await session.commit()
+
+        response = await client.delete(f"/block_documents/{block_document.id}")
+        assert response.status_code == status.HTTP_204_NO_CONTENT
+
+        events = [event for client in events_client.all for event in client.events]
+        assert len(events) == 1
+        assert events[0].event == "prefect.block-document.deleted"
+        assert events[0].resource.id == f"prefect.block-document.{block_document.id}"
+        assert events[0].resource.name == "x"
+        assert events[0].related[0].id == (
+            f"prefect.block-type.{block_document.block_type.slug}"
+        )
+
     async def test_delete_missing_block(self, session, client, block_schemas):
         response = await client.delete(f"/block_documents/{uuid4()}")
         assert response.status_code == status.HTTP_404_NOT_FOUND
@@ -808,6 +846,46 @@ class TestUpdateBlockDocument:
         )
         assert updated_block_document.data == dict(x=2)
 
+    async def test_update_block_document_emits_event(
+        self, session, client, block_schemas, events_client
+    ):
+        block_document = await models.block_documents.create_block_document(
+            session,
+            block_document=schemas.actions.BlockDocumentCreate(
+                name="test-update-data",
+                data=dict(x=1),
+                block_schema_id=block_schemas[1].id,
+                block_type_id=block_schemas[1].block_type_id,
+            ),
+        )
+        await session.commit()
+
+        response = await client.patch(
+            f"/block_documents/{block_document.id}",
+            json=BlockDocumentUpdate(data=dict(x=2)).model_dump(
+                mode="json", exclude_unset=True
+            ),
+        )
+        assert response.status_code == status.HTTP_204_NO_CONTENT
+
+        events = [event for client in events_client.all for event in client.events]
+        assert len(events) == 1
+        assert events[0].event == "prefect.block-document.updated"
+        assert events[0].resource.id == f"prefect.block-document.{block_document.id}"
+
+    async def test_missing_block_document_emits_no_event(
+        self, client, block_schemas, events_client
+    ):
+        response = await client.patch(
+            f"/block_documents/{uuid4()}",
+            json=BlockDocumentUpdate(data=dict(x=2)).model_dump(
+                mode="json", exclude_unset=True
+            ),
+        )
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+        assert not [event for client in events_client.all for event in client.events]
+
     @pytest.mark.parametrize("new_data", [{"x": 4}, {}])
     async def test_update_block_document_data_without_merging_existing_data(
         self, session, client, block_schemas, new_data
@@ -1,3 +1,4 @@
+import asyncio
 import uuid
 
 import pytest
@@ -5,6 +6,7 @@ from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from prefect.client import schemas as client_schemas
+from prefect.server.concurrency_waiters import ConcurrencySlotWaiters
 from prefect.server.database.interface import PrefectDBInterface
 from prefect.server.models.concurrency_limits_v2 import (
     bulk_update_denied_slots,
@@ -12,6 +14,10 @@ from prefect.server.models.concurrency_limits_v2 import (
     read_concurrency_limit,
 )
 from prefect.server.schemas.core import ConcurrencyLimitV2
+from prefect.settings import (
+    PREFECT_SERVER_CONCURRENCY_MAX_SLOT_WAIT_SECONDS,
+    temporary_settings,
+)
 
 
 @pytest.fixture
@@ -578,3 +584,131 @@ async def test_decrement_concurrency_limit(
     )
     assert refreshed_limit
     assert refreshed_limit.active_slots == refreshed_limit.limit - 1
+
+
+@pytest.fixture(autouse=True)
+def reset_slot_waiters():
+    ConcurrencySlotWaiters.reset()
+    yield
+    ConcurrencySlotWaiters.reset()
+
+
+async def wait_for_waiters(limit: ConcurrencyLimitV2, count: int):
+    while ConcurrencySlotWaiters.waiting(limit.id) < count:
+        await asyncio.sleep(0.01)
+
+
+async def test_increment_concurrency_limit_waits_for_released_slots(
+    locked_concurrency_limit: ConcurrencyLimitV2,
+    client: AsyncClient,
+    ignore_prefect_deprecation_warnings,
+):
+    waiting = asyncio.create_task(
+        client.post(
+            "/v2/concurrency_limits/increment",
+            json={
+                "names": [locked_concurrency_limit.name],
+                "slots": 1,
+                "mode": "concurrency",
+                "wait_seconds": 10,
+            },
+        )
+    )
+    await asyncio.wait_for(wait_for_waiters(locked_concurrency_limit, 1), 5)
+
+    response = await client.post(
+        "/v2/concurrency_limits/decrement",
+        json={"names": [locked_concurrency_limit.name], "slots": 1},
+    )
+    assert response.status_code == 200
+
+    response = await asyncio.wait_for(waiting, 5)
+    assert response.status_code == 200
+    assert ConcurrencySlotWaiters.waiting(locked_concurrency_limit.id) == 0
+
+
+async def test_increment_concurrency_limit_wakes_waiters_in_order(
+    locked_concurrency_limit: ConcurrencyLimitV2,
+    client: AsyncClient,
+    ignore_prefect_deprecation_warnings,
+):
+    def increment():
+        return asyncio.create_task(
+            client.post(
+                "/v2/concurrency_limits/increment",
+                json={
+                    "names": [locked_concurrency_limit.name],
+                    "slots": 1,
+                    "mode": "concurrency",
+                    "wait_seconds": 10,
+                },
+            )
+        )
+
+    first = increment()
+    await asyncio.wait_for(wait_for_waiters(locked_concurrency_limit, 1), 5)
+    second = increment()
+    await asyncio.wait_for(wait_for_waiters(locked_concurrency_limit, 2), 5)
+
+    await client.post(
+        "/v2/concurrency_limits/decrement",
+        json={"names": [locked_concurrency_limit.name], "slots": 1},
+    )
+
+    response = await asyncio.wait_for(first, 5)
+    assert response.status_code == 200
+    assert not second.done()
+
+    await client.post(
+        "/v2/concurrency_limits/decrement",
+        json={"names": [locked_concurrency_limit.name], "slots": 1},
+    )
+
+    response = await asyncio.wait_for(second, 5)
+    assert response.status_code == 200
+
+
+async def test_increment_concurrency_limit_wait_times_out(
+    locked_concurrency_limit: ConcurrencyLimitV2,
+    client: AsyncClient,
+    session: AsyncSession,
+):
+    response = await client.post(
+        "/v2/concurrency_limits/increment",
+        json={
+            "names": [locked_concurrency_limit.name],
+            "slots": 1,
+            "mode": "concurrency",
+            "wait_seconds": 0.5,
+        },
+    )
+    assert response.status_code == 423
+    assert "Retry-After" in response.headers
+
+    refreshed_limit = await read_concurrency_limit(
+        session=session, concurrency_limit_id=locked_concurrency_limit.id
+    )
+    assert refreshed_limit
+    assert refreshed_limit.active_slots == refreshed_limit.limit
+    # The request is only denied once, however many times it retried
+    assert refreshed_limit.denied_slots == 1
+
+
+async def test_increment_concurrency_limit_wait_is_capped_by_the_server(
+    locked_concurrency_limit: ConcurrencyLimitV2,
+    client: AsyncClient,
+):
+    with temporary_settings({PREFECT_SERVER_CONCURRENCY_MAX_SLOT_WAIT_SECONDS: 0}):
+        response = await asyncio.wait_for(
+            client.post(
+                "/v2/concurrency_limits/increment",
+                json={
+                    "names": [locked_concurrency_limit.name],
+                    "slots": 1,
+                    "mode": "concurrency",
+                    "wait_seconds": 60,
+                },
+            ),
+            5,
+        )
+    assert response.status_code == 423
@@ -0,0 +1,209 @@
+import asyncio
+import time
+from contextlib import contextmanager
+from typing import Generator
+from uuid import UUID
+
+import pendulum
+import pytest
+from fastapi import FastAPI
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.testclient import TestClient, WebSocketTestSession
+from starlette.websockets import WebSocketDisconnect
+
+from prefect.client.schemas.responses import DueFlowRun
+from prefect.server import models, schemas
+from prefect.server.flow_run_subscriptions import FlowRunSubscriptions
+
+
+@pytest.fixture(autouse=True)
+def reset_flow_run_subscriptions() -> Generator[None, None, None]:
+    FlowRunSubscriptions.reset()
+
+    yield
+
+    FlowRunSubscriptions.reset()
+
+
+@contextmanager
+def authenticated_socket(
+    app: FastAPI, path: str
+) -> Generator[WebSocketTestSession, None, None]:
+    socket: WebSocketTestSession
+    with TestClient(app).websocket_connect(
+        f"/api{path}", subprotocols=["prefect"]
+    ) as socket:
+        socket.send_json({"type": "auth", "token": None})
+        assert socket.receive_json() == {"type": "auth_success"}
+        yield socket
+
+
+def wait_for_subscribers(expected: int = 1):
+    # subscriptions are handled by the test client's event loop in another thread
+    deadline = time.monotonic() + 5
+    while FlowRunSubscriptions.subscribers() < expected:
+        assert time.monotonic() < deadline, "Timed out waiting for a subscriber"
+        time.sleep(0.01)
+
+
+@pytest.fixture
+async def work_pool(session: AsyncSession):
+    work_pool = await models.workers.create_work_pool(
+        session=session,
+        work_pool=schemas.actions.WorkPoolCreate(name="subscribed"),
+    )
+    await session.commit()
+    return work_pool
+
+
+async def schedule_flow_run(
+    session: AsyncSession, flow, scheduled_time=None, **kwargs
+) -> UUID:
+    flow_run = await models.flow_runs.create_flow_run(
+        session=session,
+        flow_run=schemas.core.FlowRun(
+            flow_id=flow.id,
+            state=schemas.states.Scheduled(
+                scheduled_time=scheduled_time or pendulum.now("UTC")
+            ),
+            **kwargs,
+        ),
+    )
+    await session.commit()
+    return flow_run.id
+
+
+async def test_receiving_due_flow_runs_of_a_work_pool(
+    app: FastAPI, session: AsyncSession, flow, work_pool
+):
+    with authenticated_socket(
+        app, f"/work_pools/{work_pool.name}/subscriptions/scheduled_flow_runs"
+    ) as socket:
+        socket.send_json({"type": "subscribe", "keys": [], "client_id": "worker"})
+        wait_for_subscribers()
+        assert FlowRunSubscriptions.subscribers(work_pool.default_queue_id) == 1
+
+        flow_run_id = await schedule_flow_run(
+            session, flow, work_queue_id=work_pool.default_queue_id
+        )
+
+        received = DueFlowRun.model_validate(socket.receive_json())
+        socket.send_json({"type": "quit"})
+
+    assert received.id == flow_run_id
+    assert received.work_queue_id == work_pool.default_queue_id
+
+
+async def test_flow_runs_in_other_work_queues_are_not_received(
+    app: FastAPI, session: AsyncSession, flow, work_pool
+):
+    other_queue = await models.workers.create_work_queue(
+        session=session,
+        work_pool_id=work_pool.id,
+        work_queue=schemas.actions.WorkQueueCreate(name="other"),
+    )
+    await session.commit()
+
+    with authenticated_socket(
+        app, f"/work_pools/{work_pool.name}/subscriptions/scheduled_flow_runs"
+    ) as socket:
+        socket.send_json({"type": "subscribe", "keys": ["default"]})
+        wait_for_subscribers()
+        assert FlowRunSubscriptions.subscribers(other_queue.id) == 0
+
+        await schedule_flow_run(session, flow, work_queue_id=other_queue.id)
+        flow_run_id = await schedule_flow_run(
+            session, flow, work_queue_id=work_pool.default_queue_id
+        )
+
+        received = DueFlowRun.model_validate(socket.receive_json())
+        socket.send_json({"type": "quit"})
+
+    assert received.id == flow_run_id
+
+
+async def test_receiving_due_flow_runs_of_a_deployment(
+    app: FastAPI, session: AsyncSession, deployment
+):
+    with authenticated_socket(
+        app, "/deployments/subscriptions/scheduled_flow_runs"
+    ) as socket:
+        socket.send_json(
+            {
+                "type": "subscribe",
+                "keys": [str(deployment.id)],
+                "prefetch_seconds": 2 * 24 * 60 * 60,
+            }
+        )
+        wait_for_subscribers()
+
+        # runs inserted by the scheduler are pushed too, and the next daily run is
+        # due within the prefetch window
+        flow_run_ids = await models.deployments.schedule_runs(
+            session=session, deployment_id=deployment.id, min_runs=1, max_runs=1
+        )
+        await session.commit()
+        assert len(flow_run_ids) == 1
+
+        received = DueFlowRun.model_validate(socket.receive_json())
+        socket.send_json({"type": "quit"})
+
+    assert received.id == flow_run_ids[0]
+    assert received.deployment_id == deployment.id
+
+
+def test_subscribing_to_invalid_deployment_ids(app: FastAPI):
+    with authenticated_socket(
+        app, "/deployments/subscriptions/scheduled_flow_runs"
+    ) as socket:
+        socket.send_json({"type": "subscribe", "keys": ["not-a-uuid"]})
+
+        with pytest.raises(WebSocketDisconnect) as exc:
+            socket.receive_json()
+
+    assert exc.value.code == 4001
+
+
+def test_subscribing_requires_a_subscribe_message(app: FastAPI):
+    with authenticated_socket(
+        app, "/work_pools/anything/subscriptions/scheduled_flow_runs"
+    ) as socket:
+        socket.send_json({"type": "hello"})
+
+        with pytest.raises(WebSocketDisconnect) as exc:
+            socket.receive_json()
+
+    assert exc.value.code == 4001
+
+
+async def test_flow_runs_are_due_in_order_of_their_scheduled_time():
+    now = pendulum.now("UTC")
+    later = DueFlowRun(id=UUID(int=1), next_scheduled_start_time=now.add(seconds=0.5))
+    sooner = DueFlowRun(id=UUID(int=2), next_scheduled_start_time=now)
+    future = DueFlowRun(id=UUID(int=3), next_scheduled_start_time=now.add(hours=1))
+
+    with FlowRunSubscriptions.subscribe(work_queue_ids=[UUID(int=0)]) as subscription:
+        FlowRunSubscriptions.notify(
+            [
+                run.model_copy(update={"work_queue_id": UUID(int=0)})
+                for run in (later, future, sooner)
+            ]
+        )
+
+        assert (await subscription.next_due(timeout=1)).id == sooner.id
+        assert (await subscription.next_due(timeout=1)).id == later.id
+        assert await subscription.next_due(timeout=0.1) is None
+
+    assert FlowRunSubscriptions.subscribers() == 0
+
+
+async def test_waiting_subscriptions_are_woken_by_notifications():
+    flow_run = DueFlowRun(id=UUID(int=1), deployment_id=UUID(int=2))
+
+    with FlowRunSubscriptions.subscribe(deployment_ids=[UUID(int=2)]) as subscription:
+        waiting = asyncio.create_task(subscription.next_due(timeout=5))
+        await asyncio.sleep(0.1)
+
+        FlowRunSubscriptions.notify([flow_run])
+
+        assert (await asyncio.wait_for(waiting, 1)).id == flow_run.id
@@ -1907,6 +1907,84 @@ class TestSetFlowRunState:
                 mock_before_transition.assert_not_awaited()
 
 
+class TestSetFlowRunStates:
+    @pytest.fixture
+    async def flow_runs(self, session, flow):
+        runs = [
+            await models.flow_runs.create_flow_run(
+                session=session,
+                flow_run=schemas.actions.FlowRunCreate(flow_id=flow.id),
+            )
+            for _ in range(3)
+        ]
+        await session.commit()
+        return runs
+
+    async def test_set_flow_run_states(self, flow_runs, client, session):
+        response = await client.post(
+            "/flow_runs/set_state",
+            json=dict(
+                flow_run_ids=[str(run.id) for run in flow_runs],
+                state=dict(type="RUNNING", name="Test State"),
+            ),
+        )
+        assert response.status_code == 200, response.text
+
+        results = parse_obj_as(List[responses.RunOrchestrationResult], response.json())
+        assert {result.id for result in results} == {run.id for run in flow_runs}
+        for result in results:
+            assert result.status == responses.SetStateStatus.ACCEPT
+            assert result.state.name == "Test State"
+            assert result.state.state_details.flow_run_id == result.id
+
+        session.expire_all()
+        for result in results:
+            run = await models.flow_runs.read_flow_run(
+                session=session, flow_run_id=result.id
+            )
+            assert run.state.type == StateType.RUNNING
+            assert run.state.name == "Test State"
+
+    async def test_set_flow_run_states_orchestrates_each_run(self, flow_runs, client):
+        response = await client.post(
+            f"/flow_runs/{flow_runs[0].id}/set_state",
+            json=dict(state=dict(type="RUNNING")),
+        )
+        assert response.status_code == 201, response.text
+
+        response = await client.post(
+            "/flow_runs/set_state",
+            json=dict(
+                flow_run_ids=[str(run.id) for run in flow_runs],
+                state=dict(type="PENDING"),
+            ),
+        )
+        assert response.status_code == 200, response.text
+
+        results = {
+            result.id: result.status
+            for result in parse_obj_as(
+                List[responses.RunOrchestrationResult], response.json()
+            )
+        }
+        assert results == {
+            flow_runs[0].id: responses.SetStateStatus.ABORT,
+            flow_runs[1].id: responses.SetStateStatus.ACCEPT,
+            flow_runs[2].id: responses.SetStateStatus.ACCEPT,
+        }
+
+    async def test_set_flow_run_states_omits_missing_runs(self, flow_runs, client):
+        response = await client.post(
+            "/flow_runs/set_state",
+            json=dict(
+                flow_run_ids=[str(flow_runs[0].id), str(uuid4())],
+                state=dict(type="RUNNING"),
+            ),
+        )
+        assert response.status_code == 200, response.text
+        assert [result["id"] for result in response.json()] == [str(flow_runs[0].id)]
+
+
 class TestManuallyRetryingFlowRuns:
     async def test_manual_flow_run_retries(
         self, failed_flow_run_with_deployment, client, session
@@ -2803,6 +2881,123 @@ class TestPaginateFlowRuns:
         assert response.status_code == status.HTTP_200_OK, response.text
         assert len(response.json()["results"]) == 0
 
+    @pytest.fixture
+    async def many_flow_runs(self, flow, session):
+        now = pendulum.now("UTC")
+        flow_runs = []
+        for i in range(7):
+            flow_runs.append(
+                await models.flow_runs.create_flow_run(
+                    session=session,
+                    flow_run=schemas.core.FlowRun(
+                        flow_id=flow.id,
+                        name=f"fr{i}",
+                        # some runs share a start time and some don't have one, to
+                        # exercise the id tiebreaker and the ordering of nulls
+                        state=(
+                            schemas.states.Scheduled(
+                                scheduled_time=now.add(minutes=i // 2)
+                            )
+                            if i % 3
+                            else None
+                        ),
+                    ),
+                )
+            )
+        await session.commit()
+        return flow_runs
+
+    async def read_all_pages(self, client, **body):
+        pages = []
+        cursor = ""
+        while cursor is not None:
+            response = await client.post(
+                "/flow_runs/paginate", json={**body, "cursor": cursor}
+            )
+            assert response.status_code == status.HTTP_200_OK, response.text
+            pages.append([run["name"] for run in response.json()["results"]])
+            cursor = response.json()["next_page"]
+        return pages
+
+    async def test_read_flow_runs_only_returns_next_page_with_cursor(
+        self, flow_runs, client
+    ):
+        response = await client.post("/flow_runs/paginate", json={"limit": 1})
+        assert response.json()["next_page"] is None
+
+        response = await client.post(
+            "/flow_runs/paginate", json={"limit": 1, "cursor": ""}
+        )
+        assert response.json()["next_page"] is not None
+
+    async def test_read_flow_runs_with_cursor_does_not_count_runs(
+        self, flow_runs, client, monkeypatch
+    ):
+        count_flow_runs = mock.AsyncMock()
+        monkeypatch.setattr(models.flow_runs, "count_flow_runs", count_flow_runs)
+
+        response = await client.post(
+            "/flow_runs/paginate", json={"limit": 1, "cursor": ""}
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["count"] is None
+        assert response.json()["pages"] is None
+        assert response.json()["page"] is None
+        count_flow_runs.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "sort",
+        [
+            "ID_DESC",
+            "NAME_ASC",
+            "NAME_DESC",
+            "START_TIME_ASC",
+            "EXPECTED_START_TIME_ASC",
+            "EXPECTED_START_TIME_DESC",
+            "NEXT_SCHEDULED_START_TIME_ASC",
+            "END_TIME_DESC",
+        ],
+    )
+    async def test_read_flow_runs_with_cursor_reads_every_run_once(
+        self, many_flow_runs, client, sort
+    ):
+        pages = await self.read_all_pages(client, limit=2, sort=sort)
+
+        assert [len(page) for page in pages] == [2, 2, 2, 1]
+        names = [name for page in pages for name in page]
+        assert sorted(names) == sorted(run.name for run in many_flow_runs)
+
+        # the pages are in the same order as a single query would return them
+        response = await client.post(
+            "/flow_runs/paginate", json={"limit": 10, "sort": sort, "cursor": ""}
+        )
+        assert names == [run["name"] for run in response.json()["results"]]
+
+    async def test_read_flow_runs_with_cursor_sorts_nulls_last(
+        self, many_flow_runs, client
+    ):
+        for sort in ["EXPECTED_START_TIME_ASC", "EXPECTED_START_TIME_DESC"]:
+            pages = await self.read_all_pages(client, limit=3, sort=sort)
+            names = [name for page in pages for name in page]
+            assert set(names[-3:]) == {"fr0", "fr3", "fr6"}
+
+    async def test_read_flow_runs_with_cursor_applies_filter(
+        self, many_flow_runs, client
+    ):
+        pages = await self.read_all_pages(
+            client,
+            limit=2,
+            flow_runs={"name": {"any_": ["fr1", "fr2", "fr4"]}},
+            sort="NAME_ASC",
+        )
+        assert pages == [["fr1", "fr2"], ["fr4"]]
+
+    async def test_read_flow_runs_with_invalid_cursor(self, flow_runs, client):
+        response = await client.post(
+            "/flow_runs/paginate", json={"cursor": "not-a-cursor"}
+        )
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
 
 class TestDownloadFlowRunLogs:
     @pytest.fixture
@@ -12,6 +12,10 @@ from pydantic import TypeAdapter
 from prefect.server import models
 from prefect.server.schemas import actions, core, responses, states
 from prefect.server.schemas.states import StateType
+from prefect.settings import (
+    PREFECT_SERVER_SERVICES_RUN_HISTORY_ROLLUPS_ENABLED,
+    temporary_settings,
+)
 
 dt = pendulum.datetime(2021, 7, 1)
 
@@ -840,6 +844,141 @@ async def test_last_bin_contains_end_date(client, route):
     assert parsed[1].interval_end == dt.add(days=2)
 
 
+class TestRunHistoryRollups:
+    @pytest.fixture
+    async def rollups(self, db):
+        refreshed_until = pendulum.now("UTC").add(minutes=1)
+        async with db.session_context(begin_transaction=True) as session:
+            for run_type in ("flow_run", "task_run"):
+                await models.run_history_rollups.refresh_buckets(
+                    session=session,
+                    run_type=run_type,
+                    bucket_starts=await models.run_history_rollups.read_stale_buckets(
+                        session=session, run_type=run_type, updated_since=None
+                    ),
+                    refreshed_until=refreshed_until,
+                )
+            await models.run_history_rollups.write_refreshed_until(
+                session=session, refreshed_until=refreshed_until
+            )
+
+        yield
+
+        async with db.session_context(begin_transaction=True) as session:
+            await session.execute(sa.delete(db.RunHistoryRollup))
+            await session.execute(
+                sa.delete(db.Configuration).where(
+                    db.Configuration.key
+                    == models.run_history_rollups.RUN_HISTORY_ROLLUPS_CONFIGURATION_KEY
+                )
+            )
+
+    @staticmethod
+    def comparable(histories):
+        # the run times and lateness of unfinished runs grow between requests
+        for history in histories:
+            for state in history["states"]:
+                if state["state_type"] not in states.TERMINAL_STATES:
+                    del state["sum_estimated_run_time"]
+                    del state["sum_estimated_lateness"]
+        return histories
+
+    async def history(self, client, route, rollups_enabled, **params):
+        with temporary_settings(
+            {PREFECT_SERVER_SERVICES_RUN_HISTORY_ROLLUPS_ENABLED: rollups_enabled}
+        ):
+            response = await client.post(route, json=params)
+        return self.comparable(validate_response(response))
+
+    @pytest.mark.parametrize("route", ["/flow_runs/history", "/task_runs/history"])
+    @pytest.mark.parametrize(
+        "start,end,interval",
+        [
+            (dt.subtract(days=14), dt.add(days=3), timedelta(days=1)),
+            (dt.subtract(days=5), dt.add(days=1), timedelta(hours=6)),
+            (dt.subtract(days=1), dt.add(days=1), timedelta(hours=1)),
+        ],
+    )
+    async def test_history_from_rollups_matches_history_from_runs(
+        self, client, rollups, route, start, end, interval
+    ):
+        params = dict(
+            history_start=str(start),
+            history_end=str(end),
+            history_interval_seconds=interval.total_seconds(),
+        )
+        from_rollups = await self.history(client, route, True, **params)
+        from_runs = await self.history(client, route, False, **params)
+
+        assert any(history["states"] for history in from_runs)
+        assert_datetime_dictionaries_equal(from_rollups, from_runs)
+
+    @pytest.mark.parametrize("route", ["/flow_runs/history", "/task_runs/history"])
+    async def test_history_from_rollups_filtered_by_flow(
+        self, client, session, rollups, route
+    ):
+        flow = await models.flows.read_flow_by_name(session=session, name="f-1")
+        other_flow = await models.flows.read_flow_by_name(session=session, name="f-2")
+
+        params = dict(
+            history_start=str(dt.subtract(days=14)),
+            history_end=str(dt.add(days=3)),
+            history_interval_seconds=timedelta(days=1).total_seconds(),
+        )
+        for flow_id, has_runs in [(flow.id, True), (other_flow.id, False)]:
+            params["flows"] = dict(id=dict(any_=[str(flow_id)]))
+            from_rollups = await self.history(client, route, True, **params)
+            from_runs = await self.history(client, route, False, **params)
+
+            assert any(history["states"] for history in from_runs) == has_runs
+            assert_datetime_dictionaries_equal(from_rollups, from_runs)
+
+    @pytest.fixture
+    async def inflated_rollups(self, db, rollups):
+        async with db.session_context(begin_transaction=True) as session:
+            await session.execute(
+                sa.update(db.RunHistoryRollup)
+                .where(
+                    db.RunHistoryRollup.run_type == "flow_run",
+                    db.RunHistoryRollup.state_type == StateType.COMPLETED.value,
+                )
+                .values(count_runs=db.RunHistoryRollup.count_runs + 100)
+            )
+
+    async def test_history_reads_counts_from_rollups(self, client, inflated_rollups):
+        params = dict(
+            history_start=str(dt.subtract(days=1)),
+            history_end=str(dt),
+            history_interval_seconds=timedelta(days=1).total_seconds(),
+        )
+        from_rollups = await self.history(client, "/flow_runs/history", True, **params)
+        from_runs = await self.history(client, "/flow_runs/history", False, **params)
+
+        def count_completed(histories):
+            return sum(
+                state["count_runs"]
+                for history in histories
+                for state in history["states"]
+                if state["state_type"] == StateType.COMPLETED
+            )
+
+        assert count_completed(from_runs) > 0
+        assert count_completed(from_rollups) > count_completed(from_runs)
+
+    async def test_history_for_partial_hours_is_read_from_runs(
+        self, client, inflated_rollups
+    ):
+        params = dict(
+            history_start=str(dt.subtract(days=1, minutes=30)),
+            history_end=str(dt),
+            history_interval_seconds=timedelta(days=1).total_seconds(),
+        )
+        from_rollups = await self.history(client, "/flow_runs/history", True, **params)
+        from_runs = await self.history(client, "/flow_runs/history", False, **params)
+
+        assert_datetime_dictionaries_equal(from_rollups, from_runs)
+
+
 async def test_flow_run_lateness(client, session):
     await session.execute(sa.text("delete from flow where true;"))
 
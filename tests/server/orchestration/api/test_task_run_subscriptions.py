@@ -1,10 +1,8 @@
-import asyncio
 import os
 import socket
 from collections import Counter
 from contextlib import contextmanager
 from typing import Generator, List
-from unittest.mock import patch
 from uuid import uuid4
 
 import pytest
@@ -17,6 +15,7 @@ from prefect.server import models
 from prefect.server.api import task_runs
 from prefect.server.schemas import states as server_states
 from prefect.server.schemas.core import TaskRun as ServerTaskRun
+from prefect.server.task_queue import TaskQueueFull
 
 
 @pytest.fixture
@@ -326,16 +325,14 @@ class TestQueueLimit:
             )
             await queue.put(task_run)
 
-        with patch("asyncio.sleep", return_value=None), pytest.raises(
-            asyncio.TimeoutError
-        ):
-            extra_task_run = ServerTaskRun(
-                id=uuid4(),
-                flow_run_id=None,
-                task_key=task_key,
-                dynamic_key=f"{task_key}-2",
-            )
-            await asyncio.wait_for(queue.put(extra_task_run), timeout=0.01)
+        extra_task_run = ServerTaskRun(
+            id=uuid4(),
+            flow_run_id=None,
+            task_key=task_key,
+            dynamic_key=f"{task_key}-2",
+        )
+        with pytest.raises(TaskQueueFull):
+            await queue.put(extra_task_run)
 
         assert (
             queue._scheduled_queue.qsize() == max_scheduled_size
@@ -356,16 +353,14 @@ class TestQueueLimit:
         )
         await queue.retry(task_run)
 
-        with patch("asyncio.sleep", return_value=None), pytest.raises(
-            asyncio.TimeoutError
-        ):
-            extra_task_run = ServerTaskRun(
-                id=uuid4(),
-                flow_run_id=None,
-                task_key=task_key,
-                dynamic_key=f"{task_key}-2",
-            )
-            await asyncio.wait_for(queue.retry(extra_task_run), timeout=0.01)
+        extra_task_run = ServerTaskRun(
+            id=uuid4(),
+            flow_run_id=None,
+            task_key=task_key,
+            dynamic_key=f"{task_key}-2",
+        )
+        with pytest.raises(TaskQueueFull):
+            await queue.retry(extra_task_run)
 
         assert (
             queue._retry_queue.qsize() == max_retry_size
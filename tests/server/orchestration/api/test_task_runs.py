@@ -361,6 +361,66 @@ class TestReadTaskRuns:
         assert response.json()[0]["id"] == str(task_run.id)
 
 
+class TestPaginateTaskRuns:
+    @pytest.fixture
+    async def task_runs(self, flow_run, session):
+        task_runs = []
+        for i in range(5):
+            task_runs.append(
+                await models.task_runs.create_task_run(
+                    session=session,
+                    task_run=schemas.actions.TaskRunCreate(
+                        flow_run_id=flow_run.id,
+                        name=f"tr{i}",
+                        task_key="my-key",
+                        dynamic_key=str(i),
+                    ),
+                )
+            )
+        await session.commit()
+        return task_runs
+
+    @pytest.mark.parametrize(
+        "sort", [sort_option.value for sort_option in schemas.sorting.TaskRunSort]
+    )
+    async def test_paginate_task_runs_reads_every_run_once(
+        self, task_runs, client, sort
+    ):
+        ids = []
+        cursor = None
+        for _ in range(3):
+            response = await client.post(
+                "/task_runs/paginate", json=dict(limit=2, sort=sort, cursor=cursor)
+            )
+            assert response.status_code == status.HTTP_200_OK, response.text
+            ids.extend(task_run["id"] for task_run in response.json()["results"])
+            cursor = response.json()["next_page"]
+
+        assert cursor is None
+        assert sorted(ids) == sorted(str(task_run.id) for task_run in task_runs)
+
+    async def test_paginate_task_runs_applies_filter(self, task_runs, client):
+        response = await client.post(
+            "/task_runs/paginate",
+            json=dict(
+                task_runs={"name": {"any_": ["tr1", "tr3"]}},
+                sort=schemas.sorting.TaskRunSort.NAME_DESC.value,
+            ),
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert [task_run["name"] for task_run in response.json()["results"]] == [
+            "tr3",
+            "tr1",
+        ]
+        assert response.json()["next_page"] is None
+
+    async def test_paginate_task_runs_rejects_invalid_cursor(self, client):
+        response = await client.post(
+            "/task_runs/paginate", json=dict(cursor="not-a-cursor")
+        )
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
 class TestDeleteTaskRuns:
     async def test_delete_task_runs(self, task_run, client, session):
         # delete the task run
@@ -584,6 +644,61 @@ class TestSetTaskRunState:
         assert response_2.status == responses.SetStateStatus.ABORT
 
 
+class TestSetTaskRunStates:
+    @pytest.fixture
+    async def task_runs(self, session, flow_run):
+        runs = [
+            await models.task_runs.create_task_run(
+                session=session,
+                task_run=schemas.actions.TaskRunCreate(
+                    flow_run_id=flow_run.id, task_key="my-key", dynamic_key=str(i)
+                ),
+            )
+            for i in range(3)
+        ]
+        await session.commit()
+        return runs
+
+    async def test_set_task_run_states(self, task_runs, client, session):
+        response = await client.post(
+            "/task_runs/set_state",
+            json=dict(
+                task_run_ids=[str(run.id) for run in task_runs],
+                state=dict(type="PENDING", name="Test State"),
+            ),
+        )
+        assert response.status_code == 200, response.text
+
+        results = [
+            responses.RunOrchestrationResult.model_validate(result)
+            for result in response.json()
+        ]
+        assert {result.id for result in results} == {run.id for run in task_runs}
+        for result in results:
+            assert result.status == responses.SetStateStatus.ACCEPT
+            assert result.state.state_details.task_run_id == result.id
+
+        session.expire_all()
+        for result in results:
+            run = await models.task_runs.read_task_run(
+                session=session, task_run_id=result.id
+            )
+            assert run.state.type == states.StateType.PENDING
+            assert run.state.name == "Test State"
+
+    async def test_set_task_run_states_with_client(
+        self, task_runs, prefect_client: PrefectClient
+    ):
+        results = await prefect_client.set_task_run_states(
+            task_run_ids=[run.id for run in task_runs], state=Pending()
+        )
+
+        assert {result.id for result in results} == {run.id for run in task_runs}
+        assert all(
+            result.status == responses.SetStateStatus.ACCEPT for result in results
+        )
+
+
 class TestTaskRunHistory:
     async def test_history_interval_must_be_one_second_or_larger(self, client):
         response = await client.post(
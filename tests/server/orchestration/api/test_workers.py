@@ -1990,3 +1990,92 @@ class TestGetScheduledRuns:
         updated_deployment_response = await client.get(f"/deployments/{deployment.id}")
         assert updated_deployment_response.status_code == status.HTTP_200_OK
         assert updated_deployment_response.json()["status"] == "READY"
+
+
+class TestClaimFlowRuns:
+    @pytest.fixture
+    async def work_pool(self, session):
+        work_pool = await models.workers.create_work_pool(
+            session=session,
+            work_pool=schemas.actions.WorkPoolCreate(name="claims"),
+        )
+        await session.commit()
+        return work_pool
+
+    @pytest.fixture
+    async def scheduled_flow_runs(self, session, flow, work_pool):
+        flow_runs = []
+        # create 5 scheduled runs from an hour ago to three hours in the future
+        for i in range(3, -2, -1):
+            flow_runs.append(
+                await models.flow_runs.create_flow_run(
+                    session=session,
+                    flow_run=schemas.core.FlowRun(
+                        flow_id=flow.id,
+                        state=prefect.server.schemas.states.Scheduled(
+                            scheduled_time=pendulum.now("UTC").add(hours=i)
+                        ),
+                        work_queue_id=work_pool.default_queue_id,
+                    ),
+                )
+            )
+        await session.commit()
+        return flow_runs
+
+    async def test_claim_flow_runs(
+        self, client, session, work_pool, scheduled_flow_runs
+    ):
+        response = await client.post(
+            f"/work_pools/{work_pool.name}/claim_flow_runs",
+            json=dict(worker_name="my-worker"),
+        )
+        assert response.status_code == status.HTTP_200_OK, response.text
+
+        data = parse_obj_as(
+            List[schemas.responses.WorkerFlowRunResponse], response.json()
+        )
+        assert {r.flow_run.id for r in data} == {r.id for r in scheduled_flow_runs}
+        for run in data:
+            assert run.work_pool_id == work_pool.id
+            assert run.work_queue_id == work_pool.default_queue_id
+            assert run.flow_run.state_type == schemas.states.StateType.PENDING
+            assert run.flow_run.state.message == "Claimed by worker 'my-worker'"
+
+        for flow_run in scheduled_flow_runs:
+            await session.refresh(flow_run)
+            assert flow_run.state_type == schemas.states.StateType.PENDING
+
+    async def test_claimed_flow_runs_are_not_claimed_again(
+        self, client, work_pool, scheduled_flow_runs
+    ):
+        response = await client.post(
+            f"/work_pools/{work_pool.name}/claim_flow_runs",
+            json=dict(limit=2),
+        )
+        assert response.status_code == status.HTTP_200_OK, response.text
+        first = {r["flow_run"]["id"] for r in response.json()}
+        assert len(first) == 2
+
+        response = await client.post(f"/work_pools/{work_pool.name}/claim_flow_runs")
+        assert response.status_code == status.HTTP_200_OK, response.text
+        second = {r["flow_run"]["id"] for r in response.json()}
+        assert len(second) == 3
+        assert not first & second
+
+        response = await client.post(f"/work_pools/{work_pool.name}/claim_flow_runs")
+        assert response.status_code == status.HTTP_200_OK, response.text
+        assert response.json() == []
+
+    async def test_claim_flow_runs_scheduled_before(
+        self, client, work_pool, scheduled_flow_runs
+    ):
+        response = await client.post(
+            f"/work_pools/{work_pool.name}/claim_flow_runs",
+            json=dict(scheduled_before=str(pendulum.now("UTC"))),
+        )
+        assert response.status_code == status.HTTP_200_OK, response.text
+        assert len(response.json()) == 2
+
+    async def test_claim_flow_runs_from_missing_work_pool(self, client):
+        response = await client.post("/work_pools/missing/claim_flow_runs")
+        assert response.status_code == status.HTTP_404_NOT_FOUND, response.text
@@ -1,3 +1,10 @@
+import pytest
+
+from prefect.server.orchestration.core_policy import CoreFlowPolicy, CoreTaskPolicy
+from prefect.server.orchestration.global_policy import (
+    GlobalFlowPolicy,
+    GlobalTaskPolicy,
+)
 from prefect.server.orchestration.policies import BaseOrchestrationPolicy
 from prefect.server.orchestration.rules import (
     ALL_ORCHESTRATION_STATES,
@@ -79,3 +86,74 @@ class TestPoliciesRespectOrdering:
 
         transition = (states.StateType.PENDING, states.StateType.RUNNING)
         assert Bureaucracy.compile_transition_rules(*transition) == [ValidRule]
+
+
+class TestTransitionTables:
+    @pytest.mark.parametrize(
+        "policy", [CoreFlowPolicy, CoreTaskPolicy, GlobalFlowPolicy, GlobalTaskPolicy]
+    )
+    def test_table_matches_filtered_rules(self, policy):
+        table = policy.transition_table()
+
+        assert len(table) == len(ALL_ORCHESTRATION_STATES) ** 2
+        for (from_state, to_state), rules in table.items():
+            assert list(rules) == [
+                rule
+                for rule in policy.priority()
+                if from_state in rule.FROM_STATES and to_state in rule.TO_STATES
+            ]
+
+    def test_table_is_built_once_and_immutable(self):
+        class ValidRule(BaseOrchestrationRule):
+            TO_STATES = ALL_ORCHESTRATION_STATES
+            FROM_STATES = ALL_ORCHESTRATION_STATES
+
+        calls = 0
+
+        class CountedPolicy(BaseOrchestrationPolicy):
+            @staticmethod
+            def priority():
+                nonlocal calls
+                calls += 1
+                return [ValidRule]
+
+        transition = (states.StateType.PENDING, states.StateType.RUNNING)
+        for _ in range(3):
+            rules = CountedPolicy.compile_transition_rules(*transition)
+            assert rules == [ValidRule]
+            # callers can't change the table through the returned rules
+            rules.clear()
+
+        assert CountedPolicy.transition_table() is CountedPolicy.transition_table()
+        with pytest.raises(TypeError):
+            CountedPolicy.transition_table()[transition] = ()
+
+        calls_after_building = calls
+        CountedPolicy.compile_transition_rules(*transition)
+        assert calls == calls_after_building
+
+    def test_subclasses_build_their_own_tables(self):
+        class FirstRule(BaseOrchestrationRule):
+            TO_STATES = ALL_ORCHESTRATION_STATES
+            FROM_STATES = ALL_ORCHESTRATION_STATES
+
+        class SecondRule(BaseOrchestrationRule):
+            TO_STATES = ALL_ORCHESTRATION_STATES
+            FROM_STATES = ALL_ORCHESTRATION_STATES
+
+        class ParentPolicy(BaseOrchestrationPolicy):
+            @staticmethod
+            def priority():
+                return [FirstRule]
+
+        class ChildPolicy(ParentPolicy):
+            @staticmethod
+            def priority():
+                return [FirstRule, SecondRule]
+
+        transition = (states.StateType.RUNNING, states.StateType.COMPLETED)
+        assert ParentPolicy.compile_transition_rules(*transition) == [FirstRule]
+        assert ChildPolicy.compile_transition_rules(*transition) == [
+            FirstRule,
+            SecondRule,
+        ]
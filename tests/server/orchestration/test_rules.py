@@ -17,6 +17,7 @@ from prefect.server.orchestration.rules import (
     BaseUniversalTransform,
     OrchestrationContext,
     TaskOrchestrationContext,
+    temporary_rule_timing_hook,
 )
 from prefect.server.schemas import states
 from prefect.server.schemas.responses import (
@@ -203,6 +204,69 @@ class TestBaseOrchestrationRule:
         assert after_transition_hook.call_count == 1
         assert cleanup_step.call_count == 0
 
+    async def test_rule_timings_are_reported_to_the_hook(self, session, task_run):
+        timings = []
+
+        class MinimalRule(BaseOrchestrationRule):
+            FROM_STATES = ALL_ORCHESTRATION_STATES
+            TO_STATES = ALL_ORCHESTRATION_STATES
+
+        intended_transition = (states.StateType.PENDING, states.StateType.RUNNING)
+        initial_state = await commit_task_run_state(
+            session, task_run, intended_transition[0]
+        )
+
+        ctx = OrchestrationContext(
+            session=session,
+            initial_state=initial_state,
+            proposed_state=states.State(type=intended_transition[1]),
+        )
+
+        with temporary_rule_timing_hook(
+            lambda rule, phase, seconds: timings.append((rule, phase, seconds))
+        ):
+            async with MinimalRule(ctx, *intended_transition):
+                pass
+
+        assert [(rule, phase) for rule, phase, _ in timings] == [
+            (MinimalRule, "enter"),
+            (MinimalRule, "exit"),
+        ]
+        assert all(seconds >= 0 for _, _, seconds in timings)
+
+    async def test_errors_in_the_rule_timing_hook_do_not_break_rules(
+        self, session, task_run
+    ):
+        after_transition_hook = MagicMock()
+
+        class MinimalRule(BaseOrchestrationRule):
+            FROM_STATES = ALL_ORCHESTRATION_STATES
+            TO_STATES = ALL_ORCHESTRATION_STATES
+
+            async def after_transition(self, initial_state, validated_state, context):
+                after_transition_hook()
+
+        def broken_hook(rule, phase, seconds):
+            raise ValueError("stopwatch broke")
+
+        intended_transition = (states.StateType.PENDING, states.StateType.RUNNING)
+        initial_state = await commit_task_run_state(
+            session, task_run, intended_transition[0]
+        )
+
+        ctx = OrchestrationContext(
+            session=session,
+            initial_state=initial_state,
+            proposed_state=states.State(type=intended_transition[1]),
+        )
+
+        with temporary_rule_timing_hook(broken_hook):
+            async with MinimalRule(ctx, *intended_transition) as ctx:
+                pass
+
+        assert after_transition_hook.call_count == 1
+        assert ctx.orchestration_error is None
+
     async def test_invalid_rules_are_noops(self, session, task_run):
         before_transition_hook = MagicMock()
         after_transition_hook = MagicMock()
@@ -0,0 +1,212 @@
+import pendulum
+import pytest
+import sqlalchemy as sa
+
+from prefect.server import models, schemas
+from prefect.server.services.run_history_rollups import RunHistoryRollups
+from prefect.settings import (
+    PREFECT_SERVER_SERVICES_RUN_HISTORY_ROLLUPS_COMMIT_GRACE_SECONDS,
+    temporary_settings,
+)
+
+HOUR = pendulum.datetime(2024, 1, 1, 10)
+
+
+@pytest.fixture(autouse=True)
+def count_every_commit():
+    # the service leaves out runs updated in the last minute; count the runs
+    # created by these tests straight away instead
+    with temporary_settings(
+        {PREFECT_SERVER_SERVICES_RUN_HISTORY_ROLLUPS_COMMIT_GRACE_SECONDS: 0}
+    ):
+        yield
+
+
+async def create_flow_run(session, flow, state):
+    async with session.begin():
+        return await models.flow_runs.create_flow_run(
+            session=session,
+            flow_run=schemas.core.FlowRun(flow_id=flow.id, state=state),
+        )
+
+
+async def read_rollups(db):
+    async with db.session_context() as session:
+        result = await session.execute(
+            sa.select(db.RunHistoryRollup).order_by(
+                db.RunHistoryRollup.bucket_start, db.RunHistoryRollup.state_type
+            )
+        )
+        return result.scalars().all()
+
+
+async def test_rolls_up_finished_runs_by_hour(session, db, flow):
+    for minutes in (0, 20, 70):
+        await create_flow_run(
+            session,
+            flow,
+            schemas.states.Completed(timestamp=HOUR.add(minutes=minutes)),
+        )
+    await create_flow_run(
+        session, flow, schemas.states.Failed(timestamp=HOUR.add(minutes=30))
+    )
+
+    await RunHistoryRollups().start(loops=1)
+
+    rollups = await read_rollups(db)
+    assert [
+        (r.run_type, r.bucket_start, r.flow_id, r.state_type, r.count_runs)
+        for r in rollups
+    ] == [
+        ("flow_run", HOUR, flow.id, "COMPLETED", 2),
+        ("flow_run", HOUR, flow.id, "FAILED", 1),
+        ("flow_run", HOUR.add(hours=1), flow.id, "COMPLETED", 1),
+    ]
+    assert await models.run_history_rollups.read_refreshed_until(session=session)
+
+
+async def test_does_not_roll_up_unfinished_runs(session, db, flow):
+    await create_flow_run(session, flow, schemas.states.Running(timestamp=HOUR))
+    await create_flow_run(session, flow, schemas.states.Scheduled(scheduled_time=HOUR))
+
+    await RunHistoryRollups().start(loops=1)
+
+    assert await read_rollups(db) == []
+
+
+async def test_leaves_out_runs_updated_within_the_commit_grace_period(
+    session, db, flow
+):
+    await create_flow_run(session, flow, schemas.states.Completed(timestamp=HOUR))
+
+    with temporary_settings(
+        {PREFECT_SERVER_SERVICES_RUN_HISTORY_ROLLUPS_COMMIT_GRACE_SECONDS: 60}
+    ):
+        await RunHistoryRollups().start(loops=1)
+
+    assert await read_rollups(db) == []
+
+
+async def test_recomputes_hours_with_updated_runs(session, db, flow):
+    flow_run = await create_flow_run(
+        session, flow, schemas.states.Running(timestamp=HOUR)
+    )
+    await RunHistoryRollups().start(loops=1)
+    assert await read_rollups(db) == []
+
+    async with session.begin():
+        await models.flow_runs.set_flow_run_state(
+            session=session,
+            flow_run_id=flow_run.id,
+            state=schemas.states.Completed(timestamp=HOUR.add(minutes=5)),
+            force=True,
+        )
+    await RunHistoryRollups().start(loops=1)
+
+    rollups = await read_rollups(db)
+    assert [(r.bucket_start, r.state_type, r.count_runs) for r in rollups] == [
+        (HOUR, "COMPLETED", 1)
+    ]
+    assert rollups[0].sum_estimated_run_time == pytest.approx(300)
+
+
+async def test_rolls_up_task_runs_with_their_flow(session, db, flow):
+    flow_run = await create_flow_run(
+        session, flow, schemas.states.Running(timestamp=HOUR)
+    )
+    async with session.begin():
+        await models.task_runs.create_task_run(
+            session=session,
+            task_run=schemas.core.TaskRun(
+                flow_run_id=flow_run.id,
+                task_key="a",
+                dynamic_key="0",
+                state=schemas.states.Completed(timestamp=HOUR),
+            ),
+        )
+
+    await RunHistoryRollups().start(loops=1)
+
+    rollups = await read_rollups(db)
+    assert [
+        (r.run_type, r.bucket_start, r.flow_id, r.state_type, r.count_runs)
+        for r in rollups
+    ] == [("task_run", HOUR, flow.id, "COMPLETED", 1)]
+
+
+async def test_recomputes_hours_of_deleted_runs(session, db, flow):
+    flow_run = await create_flow_run(
+        session, flow, schemas.states.Completed(timestamp=HOUR)
+    )
+    await RunHistoryRollups().start(loops=1)
+    assert len(await read_rollups(db)) == 1
+
+    async with session.begin():
+        await models.flow_runs.delete_flow_run(session=session, flow_run_id=flow_run.id)
+    await RunHistoryRollups().start(loops=1)
+
+    assert await read_rollups(db) == []
+
+
+async def test_recomputes_hours_runs_moved_out_of(session, db, flow):
+    flow_run = await create_flow_run(
+        session, flow, schemas.states.Completed(timestamp=HOUR)
+    )
+    await RunHistoryRollups().start(loops=1)
+
+    async with session.begin():
+        await session.execute(
+            sa.update(db.FlowRun)
+            .where(db.FlowRun.id == flow_run.id)
+            .values(expected_start_time=HOUR.add(hours=2))
+        )
+    await RunHistoryRollups().start(loops=1)
+
+    rollups = await read_rollups(db)
+    assert [(r.bucket_start, r.count_runs) for r in rollups] == [(HOUR.add(hours=2), 1)]
+
+
+async def test_reconciles_once_per_interval(session, db, flow):
+    flow_run = await create_flow_run(
+        session, flow, schemas.states.Completed(timestamp=HOUR)
+    )
+    service = RunHistoryRollups()
+    await service.start(loops=1)
+
+    async with session.begin():
+        await models.flow_runs.delete_flow_run(session=session, flow_run_id=flow_run.id)
+    await service.start(loops=1)
+    assert len(await read_rollups(db)) == 1
+
+    service._last_reconciled -= service.reconcile_interval
+    await service.start(loops=1)
+    assert await read_rollups(db) == []
+
+
+async def test_refreshes_in_batches_of_runs(session, db, flow, monkeypatch):
+    for hours in range(3):
+        await create_flow_run(
+            session, flow, schemas.states.Completed(timestamp=HOUR.add(hours=hours))
+        )
+
+    written = []
+    write_refreshed_until = models.run_history_rollups.write_refreshed_until
+
+    async def record_write(session, refreshed_until):
+        written.append(refreshed_until)
+        await write_refreshed_until(session=session, refreshed_until=refreshed_until)
+
+    monkeypatch.setattr(
+        models.run_history_rollups, "write_refreshed_until", record_write
+    )
+
+    service = RunHistoryRollups()
+    service.batch_size = 1
+    await service.start(loops=1)
+
+    assert len(written) > 1
+    assert written == sorted(written)
+    rollups = await read_rollups(db)
+    assert [(r.bucket_start, r.count_runs) for r in rollups] == [
+        (HOUR.add(hours=hours), 1) for hours in range(3)
+    ]
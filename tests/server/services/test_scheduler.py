@@ -225,6 +225,106 @@ async def test_create_schedules_from_multiple_deployments(flow, session):
     assert set(expected_dates) == {r.state.state_details.scheduled_time for r in runs}
 
 
+async def test_deployments_with_identical_schedules_each_get_runs(flow, session):
+    schedule = schemas.schedules.CronSchedule(cron="0 * * * *")
+    deployments = [
+        await models.deployments.create_deployment(
+            session=session,
+            deployment=schemas.core.Deployment(
+                name=f"test-{i}",
+                flow_id=flow.id,
+                schedules=[schemas.core.DeploymentSchedule(schedule=schedule)],
+            ),
+        )
+        for i in range(3)
+    ]
+    await session.commit()
+
+    service = Scheduler()
+    await service.start(loops=1)
+
+    runs = await models.flow_runs.read_flow_runs(session)
+    for deployment in deployments:
+        dates = {
+            run.state.state_details.scheduled_time
+            for run in runs
+            if run.deployment_id == deployment.id
+        }
+        assert len(dates) == service.min_runs
+
+    # every deployment is scheduled from the same dates
+    assert len({r.state.state_details.scheduled_time for r in runs}) == service.min_runs
+
+
+async def test_errors_scheduling_one_deployment_do_not_affect_others(
+    flow, session, monkeypatch
+):
+    await models.deployments.create_deployment(
+        session=session,
+        deployment=schemas.core.Deployment(
+            name="broken",
+            flow_id=flow.id,
+            schedules=[
+                schemas.core.DeploymentSchedule(
+                    schedule=schemas.schedules.RRuleSchedule(rrule="FREQ=DAILY")
+                )
+            ],
+        ),
+    )
+    working = await models.deployments.create_deployment(
+        session=session,
+        deployment=schemas.core.Deployment(
+            name="working",
+            flow_id=flow.id,
+            schedules=[
+                schemas.core.DeploymentSchedule(
+                    schedule=schemas.schedules.IntervalSchedule(
+                        interval=datetime.timedelta(hours=1)
+                    )
+                )
+            ],
+        ),
+    )
+    await session.commit()
+
+    def broken_dates(*args, **kwargs):
+        raise ValueError("this schedule is broken")
+
+    monkeypatch.setattr(
+        schemas.schedules.RRuleSchedule, "_get_dates_generator", broken_dates
+    )
+
+    service = Scheduler()
+    await service.start(loops=1)
+
+    runs = await models.flow_runs.read_flow_runs(session)
+    assert runs
+    assert {run.deployment_id for run in runs} == {working.id}
+
+
+async def test_read_deployments_to_schedule(
+    session,
+    deployment_with_active_schedules,
+    deployment_with_inactive_schedules,
+    deployment_without_schedules,
+):
+    deployments = await models.deployments._read_deployments_to_schedule(
+        session=session,
+        deployment_ids=[
+            deployment_with_active_schedules.id,
+            deployment_with_inactive_schedules.id,
+            deployment_without_schedules.id,
+        ],
+    )
+
+    schedules = {deployment.id: schedules for deployment, schedules in deployments}
+    assert {
+        schedule.interval for schedule in schedules[deployment_with_active_schedules.id]
+    } == {datetime.timedelta(hours=1), datetime.timedelta(hours=2)}
+    assert schedules[deployment_with_inactive_schedules.id] == []
+    assert schedules[deployment_without_schedules.id] == []
+
+
 async def test_create_schedules_from_multiple_deployments_in_batches(flow, session):
     await models.flows.create_flow(
         session=session, flow=schemas.core.Flow(name="flow-2")
@@ -369,6 +469,43 @@ async def test_only_looks_at_deployments_with_active_schedules(
     assert deployment_ids[0] == deployment_with_active_schedules.id
 
 
+@pytest.mark.parametrize("scheduler_class", [Scheduler, RecentDeploymentsScheduler])
+async def test_schedulers_use_overridden_bulk_hook(
+    session, deployment_with_active_schedules, scheduler_class
+):
+    scheduled = []
+
+    class OneRunScheduler(scheduler_class):
+        async def _generate_scheduled_flow_runs(
+            self, session, deployment_ids, **kwargs
+        ):
+            scheduled.extend(deployment_ids)
+            runs = await super()._generate_scheduled_flow_runs(
+                session, deployment_ids, **kwargs
+            )
+            return runs[:1]
+
+    await OneRunScheduler().start(loops=1)
+
+    assert scheduled == [deployment_with_active_schedules.id]
+    runs = await models.flow_runs.read_flow_runs(session)
+    assert len(runs) == 1
+    assert runs[0].deployment_id == deployment_with_active_schedules.id
+
+
+def test_identical_schedules_share_a_dates_cache_key():
+    assert models.deployments._schedule_cache_key(
+        schemas.schedules.CronSchedule(cron="0 * * * *")
+    ) == models.deployments._schedule_cache_key(
+        schemas.schedules.CronSchedule(cron="0 * * * *")
+    )
+    assert models.deployments._schedule_cache_key(
+        schemas.schedules.CronSchedule(cron="0 * * * *")
+    ) != models.deployments._schedule_cache_key(
+        schemas.schedules.CronSchedule(cron="0 * * * *", timezone="Europe/Paris")
+    )
+
+
 class TestRecentDeploymentsScheduler:
     async def test_tight_loop_by_default(self):
         assert RecentDeploymentsScheduler().loop_seconds == 5
@@ -0,0 +1,352 @@
+import asyncio
+from datetime import timedelta
+from typing import AsyncGenerator, Generator, List
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from prefect.server import models
+from prefect.server.schemas.core import TaskRun
+from prefect.server.task_queue import (
+    MultiQueue,
+    TaskQueue,
+    TaskQueueFull,
+    get_task_run_priority,
+)
+from prefect.settings import (
+    PREFECT_SERVER_TASKS_SCHEDULING_QUEUE_BACKEND,
+    PREFECT_SERVER_TASKS_SCHEDULING_VISIBILITY_TIMEOUT,
+    temporary_settings,
+)
+
+
+@pytest.fixture(autouse=True)
+def reset_task_queues() -> Generator[None, None, None]:
+    TaskQueue.reset()
+    yield
+    TaskQueue.reset()
+    TaskQueue._weights.clear()
+
+
+@pytest.fixture
+def short_visibility_timeout() -> Generator[None, None, None]:
+    with temporary_settings(
+        {PREFECT_SERVER_TASKS_SCHEDULING_VISIBILITY_TIMEOUT: timedelta(seconds=0.1)}
+    ):
+        yield
+
+
+def new_task_run(task_key: str = "mytasks.taskA", tags: List[str] = []) -> TaskRun:
+    return TaskRun(
+        id=uuid4(),
+        flow_run_id=None,
+        task_key=task_key,
+        dynamic_key=str(uuid4()),
+        tags=tags,
+    )
+
+
+@pytest.mark.parametrize(
+    "tags, priority",
+    [
+        ([], 0),
+        (["other"], 0),
+        (["priority:5"], 5),
+        (["priority:-2"], -2),
+        (["priority:high"], 0),
+        (["priority:1", "priority:3"], 3),
+    ],
+)
+def test_task_run_priority_is_read_from_tags(tags: List[str], priority: int):
+    assert get_task_run_priority(new_task_run(tags=tags)) == priority
+
+
+class TestMemoryTaskQueue:
+    async def test_higher_priorities_are_delivered_first(self):
+        queue = TaskQueue.for_key("mytasks.taskA")
+        low, normal, high = new_task_run(), new_task_run(), new_task_run()
+
+        await queue.put(low, priority=-1)
+        await queue.put(normal)
+        await queue.put(high, priority=10)
+
+        assert [await queue.take() for _ in range(3)] == [high, normal, low]
+        assert await queue.take() is None
+
+    async def test_equal_priorities_are_delivered_in_order(self):
+        queue = TaskQueue.for_key("mytasks.taskA")
+        runs = [new_task_run() for _ in range(3)]
+
+        for run in runs:
+            await queue.put(run, priority=1)
+
+        assert [await queue.take() for _ in range(3)] == runs
+
+    async def test_retries_are_delivered_before_scheduled_runs(self):
+        queue = TaskQueue.for_key("mytasks.taskA")
+        scheduled, retried = new_task_run(), new_task_run()
+
+        await queue.put(scheduled, priority=10)
+        await queue.retry(retried)
+
+        assert await queue.take() == retried
+        assert await queue.take() == scheduled
+
+    @pytest.mark.usefixtures("short_visibility_timeout")
+    async def test_unacknowledged_runs_are_delivered_again(self):
+        queue = TaskQueue.for_key("mytasks.taskA")
+        task_run = new_task_run()
+        await queue.put(task_run)
+
+        assert await queue.take() == task_run
+        assert await queue.take() is None
+
+        await asyncio.sleep(0.2)
+
+        assert await queue.take() == task_run
+
+    @pytest.mark.usefixtures("short_visibility_timeout")
+    async def test_acknowledged_runs_are_not_delivered_again(self):
+        queue = TaskQueue.for_key("mytasks.taskA")
+        task_run = new_task_run()
+        await queue.put(task_run)
+
+        assert await queue.take() == task_run
+        await queue.ack(task_run)
+
+        await asyncio.sleep(0.2)
+
+        assert await queue.take() is None
+
+    @pytest.mark.usefixtures("short_visibility_timeout")
+    async def test_extended_runs_are_not_delivered_again(self):
+        queue = TaskQueue.for_key("mytasks.taskA")
+        task_run = new_task_run()
+        await queue.put(task_run)
+
+        assert await queue.take() == task_run
+        await asyncio.sleep(0.06)
+        await queue.extend(task_run)
+        await asyncio.sleep(0.06)
+
+        assert await queue.take() is None
+
+    async def test_enqueued_runs_are_prioritized_by_their_tags(self):
+        low, normal, high = (
+            new_task_run(tags=["priority:-1"]),
+            new_task_run(),
+            new_task_run(tags=["priority:10"]),
+        )
+
+        for run in (low, normal, high):
+            await TaskQueue.enqueue(run)
+
+        queue = TaskQueue.for_key("mytasks.taskA")
+        assert [await queue.take() for _ in range(3)] == [high, normal, low]
+
+    async def test_putting_on_a_full_queue_raises(self):
+        TaskQueue.configure_task_key("mytasks.full", scheduled_size=1)
+        queue = TaskQueue.for_key("mytasks.full")
+        await queue.put(new_task_run("mytasks.full"))
+
+        with pytest.raises(TaskQueueFull):
+            await queue.put(new_task_run("mytasks.full"))
+
+    @pytest.mark.usefixtures("short_visibility_timeout")
+    async def test_runs_that_cannot_be_retried_stay_in_flight(self):
+        TaskQueue.configure_task_key("mytasks.full", retry_size=1)
+        queue = TaskQueue.for_key("mytasks.full")
+        task_run, other = new_task_run("mytasks.full"), new_task_run("mytasks.full")
+        await queue.put(task_run)
+        assert await queue.take() == task_run
+        await queue.retry(other)
+
+        with pytest.raises(TaskQueueFull):
+            await queue.retry(task_run)
+
+        assert await queue.take() == other
+        await queue.ack(other)
+        await asyncio.sleep(0.2)
+
+        assert await queue.take() == task_run
+
+
+class TestMultiQueue:
+    async def test_queues_take_turns(self):
+        a_runs = [new_task_run("a") for _ in range(3)]
+        b_runs = [new_task_run("b") for _ in range(3)]
+        for run in a_runs + b_runs:
+            await TaskQueue.enqueue(run)
+
+        queue = MultiQueue(["a", "b"])
+
+        taken = [(await queue.take()).task_key for _ in range(6)]
+
+        assert taken == ["a", "b", "a", "b", "a", "b"]
+        assert await queue.take() is None
+
+    async def test_queues_take_turns_by_weight(self):
+        TaskQueue.configure_task_key("a", weight=2)
+        for _ in range(4):
+            await TaskQueue.enqueue(new_task_run("a"))
+            await TaskQueue.enqueue(new_task_run("b"))
+
+        queue = MultiQueue(["a", "b"])
+
+        taken = [(await queue.take()).task_key for _ in range(6)]
+
+        assert taken == ["a", "a", "b", "a", "a", "b"]
+
+    async def test_a_busy_queue_does_not_starve_the_others(self):
+        for _ in range(10):
+            await TaskQueue.enqueue(new_task_run("busy"))
+        await TaskQueue.enqueue(new_task_run("quiet"))
+
+        queue = MultiQueue(["busy", "quiet"])
+
+        taken = [(await queue.take()).task_key for _ in range(2)]
+
+        assert taken == ["busy", "quiet"]
+
+    async def test_a_queue_keeps_delivering_when_the_others_are_empty(self):
+        for _ in range(3):
+            await TaskQueue.enqueue(new_task_run("a"))
+
+        queue = MultiQueue(["a", "b"])
+
+        taken = [(await queue.take()).task_key for _ in range(3)]
+
+        assert taken == ["a", "a", "a"]
+
+    async def test_get_returns_none_after_the_timeout(self):
+        queue = MultiQueue(["a"])
+
+        assert await queue.get(timeout=0.05) is None
+
+    async def test_get_is_woken_by_queued_runs(self):
+        queue = MultiQueue(["a", "b"])
+        task_run = new_task_run("b")
+
+        async def enqueue_later():
+            await asyncio.sleep(0.05)
+            await TaskQueue.enqueue(task_run)
+
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        enqueuing = asyncio.create_task(enqueue_later())
+
+        assert await queue.get(timeout=5) == task_run
+        assert loop.time() - started < TaskQueue.poll_interval
+        await enqueuing
+
+
+class TestDatabaseTaskQueue:
+    @pytest.fixture(autouse=True)
+    def database_backend(self) -> Generator[None, None, None]:
+        with temporary_settings(
+            {
+                PREFECT_SERVER_TASKS_SCHEDULING_QUEUE_BACKEND: (
+                    "prefect.server.task_queue.database"
+                )
+            }
+        ):
+            TaskQueue.reset()
+            yield
+            TaskQueue.reset()
+
+    @pytest.fixture
+    async def stored_runs(self, session: AsyncSession) -> AsyncGenerator[List, None]:
+        runs = []
+        for _ in range(3):
+            runs.append(
+                TaskRun.model_validate(
+                    await models.task_runs.create_task_run(
+                        session, new_task_run("mytasks.taskA")
+                    )
+                )
+            )
+        await session.commit()
+        yield runs
+
+    async def test_uses_the_database_backend(self):
+        from prefect.server.task_queue import database
+
+        assert isinstance(TaskQueue.for_key("mytasks.taskA"), database.TaskQueue)
+
+    async def test_higher_priorities_are_delivered_first(
+        self, stored_runs: List[TaskRun]
+    ):
+        queue = TaskQueue.for_key("mytasks.taskA")
+        low, normal, high = stored_runs
+
+        await queue.put(low, priority=-1)
+        await queue.put(normal)
+        await queue.put(high, priority=10)
+
+        taken = [(await queue.take()).id for _ in range(3)]
+
+        assert taken == [high.id, normal.id, low.id]
+        assert await queue.take() is None
+
+    async def test_retries_are_delivered_before_scheduled_runs(
+        self, stored_runs: List[TaskRun]
+    ):
+        queue = TaskQueue.for_key("mytasks.taskA")
+        scheduled, retried, _ = stored_runs
+
+        await queue.put(scheduled, priority=10)
+        await queue.retry(retried)
+
+        assert (await queue.take()).id == retried.id
+        assert (await queue.take()).id == scheduled.id
+
+    async def test_queued_runs_survive_a_restart(self, stored_runs: List[TaskRun]):
+        await TaskQueue.enqueue(stored_runs[0])
+
+        TaskQueue.reset()
+
+        assert (await TaskQueue.for_key("mytasks.taskA").take()).id == stored_runs[0].id
+
+    @pytest.mark.usefixtures("short_visibility_timeout")
+    async def test_unacknowledged_runs_are_delivered_again(
+        self, stored_runs: List[TaskRun], monkeypatch: pytest.MonkeyPatch
+    ):
+        queue = TaskQueue.for_key("mytasks.taskA")
+        monkeypatch.setattr(queue, "poll_interval", 0)
+        task_run = stored_runs[0]
+        await queue.put(task_run)
+
+        assert (await queue.take()).id == task_run.id
+        assert await queue.take() is None
+
+        await asyncio.sleep(0.2)
+
+        assert (await queue.take()).id == task_run.id
+
+    @pytest.mark.usefixtures("short_visibility_timeout")
+    async def test_acknowledged_runs_are_not_delivered_again(
+        self, stored_runs: List[TaskRun], monkeypatch: pytest.MonkeyPatch
+    ):
+        queue = TaskQueue.for_key("mytasks.taskA")
+        monkeypatch.setattr(queue, "poll_interval", 0)
+        task_run = stored_runs[0]
+        await queue.put(task_run)
+
+        assert (await queue.take()).id == task_run.id
+        await queue.ack(task_run)
+
+        await asyncio.sleep(0.2)
+
+        assert await queue.take() is None
+
+    async def test_runs_queued_in_a_transaction_are_delivered_after_commit(
+        self, session: AsyncSession, stored_runs: List[TaskRun]
+    ):
+        queue = TaskQueue.for_key("mytasks.taskA")
+        assert await queue.take() is None
+
+        await queue.put(stored_runs[0], session=session)
+        await session.commit()
+
+        assert (await queue.take()).id == stored_runs[0].id
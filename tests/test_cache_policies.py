@@ -3,8 +3,10 @@ from dataclasses import dataclass
 from typing import Callable
 from unittest.mock import MagicMock, patch
 
+import numpy as np
 import pytest
 
+from prefect import flow
 from prefect.cache_policies import (
     DEFAULT,
     CachePolicy,
@@ -14,7 +16,8 @@ from prefect.cache_policies import (
     TaskSource,
     _None,
 )
-from prefect.context import TaskRunContext
+from prefect.context import FlowRunContext, TaskRunContext
+from prefect.utilities.hashing import hash_objects
 
 
 class TestBaseClass:
@@ -70,6 +73,33 @@ class TestInputsPolicy:
 
         assert z_key not in [x_key, y_key]
 
+    def test_default_keys_are_unchanged(self):
+        key = Inputs().compute_key(
+            task_ctx=None, inputs={"x": 42, "y": "foo"}, flow_parameters=None
+        )
+        assert key == hash_objects({"x": 42, "y": "foo"})
+
+    def test_streaming_keys_differ_from_default_keys(self):
+        inputs = {"x": 42}
+        assert Inputs(streaming=True).compute_key(
+            task_ctx=None, inputs=inputs, flow_parameters=None
+        ) != Inputs().compute_key(task_ctx=None, inputs=inputs, flow_parameters=None)
+
+    def test_key_varies_on_buffer_contents(self):
+        policy = Inputs(streaming=True)
+        array = np.zeros(100)
+        key = policy.compute_key(
+            task_ctx=None, inputs={"x": array}, flow_parameters=None
+        )
+        assert key == policy.compute_key(
+            task_ctx=None, inputs={"x": array.copy()}, flow_parameters=None
+        )
+
+        array[0] = 1
+        assert key != policy.compute_key(
+            task_ctx=None, inputs={"x": array}, flow_parameters=None
+        )
+
     def test_key_doesnt_vary_on_other_kwargs(self):
         policy = Inputs()
         key = policy.compute_key(task_ctx=None, inputs={"x": 42}, flow_parameters=None)
@@ -99,6 +129,26 @@ class TestInputsPolicy:
         assert policy != new_policy
         assert policy.exclude != new_policy.exclude
 
+    def test_subtraction_keeps_streaming(self):
+        policy = Inputs(streaming=True) - "foo"
+        assert policy.streaming
+
+    def test_streaming_memo_is_scoped_to_the_flow_run(self):
+        policy = Inputs(streaming=True)
+        array = np.frombuffer(bytes(80), dtype=np.int64)
+        memos = []
+
+        @flow
+        def hash_array():
+            policy.compute_key(task_ctx=None, inputs={"x": array}, flow_parameters=None)
+            memos.append(FlowRunContext.get().input_hash_memo)
+
+        hash_array()
+        hash_array()
+
+        assert len(memos[0]) == 1
+        assert memos[0] is not memos[1]
+
     def test_excluded_can_be_manipulated_via_subtraction(self):
         policy = Inputs() - "y"
         assert policy.exclude == ["y"]
@@ -58,6 +58,21 @@ class TestLocalFileSystem:
         assert path.endswith("test.txt")
         assert await fs.read_path("test.txt") == b"hello"
 
+    async def test_exists(self, tmp_path):
+        fs = LocalFileSystem(basepath=str(tmp_path))
+        assert not await fs.exists("test.txt")
+        await fs.write_path("folder/test.txt", content=b"hello")
+        assert await fs.exists("folder/test.txt")
+        assert not await fs.exists("folder")
+
+    async def test_read_path_prefix(self, tmp_path):
+        fs = LocalFileSystem(basepath=str(tmp_path))
+        await fs.write_path("test.txt", content=b"hello")
+        assert await fs.read_path_prefix("test.txt", 2) == b"he"
+        assert await fs.read_path_prefix("test.txt", 10) == b"hello"
+        with pytest.raises(ValueError, match="does not exist"):
+            await fs.read_path_prefix("missing.txt", 2)
+
     async def test_write_with_missing_directory_creates(self, tmp_path):
         fs = LocalFileSystem(basepath=str(tmp_path))
         dst = Path("folder") / "test.txt"
@@ -245,6 +260,19 @@ class TestRemoteFileSystem:
         assert path.endswith("test.txt")
         assert await fs.read_path("test.txt") == b"hello"
 
+    async def test_exists(self):
+        fs = RemoteFileSystem(basepath="memory://exists")
+        assert not await fs.exists("test.txt")
+        await fs.write_path("folder/test.txt", content=b"hello")
+        assert await fs.exists("folder/test.txt")
+        assert not await fs.exists("folder")
+
+    async def test_read_path_prefix(self):
+        fs = RemoteFileSystem(basepath="memory://prefix")
+        await fs.write_path("test.txt", content=b"hello")
+        assert await fs.read_path_prefix("test.txt", 2) == b"he"
+        assert await fs.read_path_prefix("test.txt", 10) == b"hello"
+
     async def test_write_with_missing_directory_succeeds(self):
         fs = RemoteFileSystem(basepath="memory://root/")
         await fs.write_path("memory://root/folder/test.txt", content=b"hello")
@@ -14,6 +14,7 @@ from prefect.futures import (
     PrefectDistributedFuture,
     PrefectFuture,
     PrefectFutureList,
+    PrefectResultIterator,
     PrefectWrappedFuture,
     as_completed,
     resolve_futures_to_states,
@@ -486,3 +487,57 @@ class TestPrefectFutureList:
 
         with pytest.raises(TimeoutError, match="oops"):
             futures.result()
+
+
+class TestPrefectResultIterator:
+    def test_yields_all_results(self):
+        futures = (MockFuture(data=i) for i in range(10))
+        assert sorted(PrefectResultIterator(futures, max_in_flight=3)) == list(
+            range(10)
+        )
+
+    def test_limits_futures_in_flight(self):
+        submitted = []
+
+        def submit():
+            for i in range(10):
+                submitted.append(i)
+                yield MockFuture(data=i)
+
+        results = PrefectResultIterator(submit(), max_in_flight=3)
+        next(results)
+        assert len(submitted) == 3
+        next(results)
+        assert len(submitted) == 4
+
+    def test_yields_in_completion_order(self):
+        pending = Future()
+        futures = [
+            PrefectConcurrentFuture(uuid.uuid4(), pending),
+            MockFuture(data=1),
+        ]
+        results = PrefectResultIterator(iter(futures), max_in_flight=2)
+        assert next(results) == 1
+        pending.set_result(Completed(data=0))
+        assert next(results) == 0
+        with pytest.raises(StopIteration):
+            next(results)
+
+    def test_raises_on_failure(self):
+        failed = Future()
+        failed.set_result(Failed(data=ValueError("oops")))
+        futures = iter([PrefectConcurrentFuture(uuid.uuid4(), failed)])
+
+        with pytest.raises(ValueError, match="oops"):
+            list(PrefectResultIterator(futures, max_in_flight=1))
+
+    async def test_async_iteration(self):
+        futures = (MockFuture(data=i) for i in range(5))
+        results = [
+            result async for result in PrefectResultIterator(futures, max_in_flight=2)
+        ]
+        assert sorted(results) == list(range(5))
+
+    def test_max_in_flight_must_be_positive(self):
+        with pytest.raises(ValueError, match="max_in_flight"):
+            PrefectResultIterator(iter([]), max_in_flight=0)
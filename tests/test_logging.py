@@ -59,8 +59,11 @@ from prefect.settings import (
     PREFECT_LOGGING_SETTINGS_PATH,
     PREFECT_LOGGING_TO_API_BATCH_INTERVAL,
     PREFECT_LOGGING_TO_API_BATCH_SIZE,
+    PREFECT_LOGGING_TO_API_COMPRESS,
     PREFECT_LOGGING_TO_API_ENABLED,
     PREFECT_LOGGING_TO_API_MAX_LOG_SIZE,
+    PREFECT_LOGGING_TO_API_MAX_QUEUE_ITEMS,
+    PREFECT_LOGGING_TO_API_OVERFLOW_POLICY,
     PREFECT_LOGGING_TO_API_WHEN_MISSING_FLOW,
     PREFECT_TEST_MODE,
     temporary_settings,
@@ -635,6 +638,53 @@ class TestAPILogHandler:
         handler = APILogHandler()
         assert handler._get_payload_size(dict_log) == log_size
 
+    def test_handler_knows_how_large_logs_with_escaped_characters_are(self):
+        dict_log = {
+            "name": "prefect.flow_runs",
+            "level": 20,
+            "message": 'A "quoted" message\nwith\ttabs, ünïcödé and ☃',
+            "timestamp": "2023-02-08T17:55:52.993831+00:00",
+            "flow_run_id": "47014fb1-9202-4a78-8739-c993d8c24415",
+            "task_run_id": None,
+        }
+
+        handler = APILogHandler()
+        assert handler._get_payload_size(dict_log) == len(json.dumps(dict_log).encode())
+
+    def test_prepared_logs_match_log_create_schema(self, handler, flow_run):
+        record = logging.LogRecord(
+            name="prefect.flow_runs",
+            level=logging.INFO,
+            pathname=__file__,
+            lineno=1,
+            msg="Finished in state %s",
+            args=("Completed()",),
+            exc_info=None,
+        )
+        record.flow_run_id = flow_run.id
+        record.task_run_id = uuid.uuid4()
+
+        log = handler.prepare(record)
+
+        assert log.pop("__payload_size__") == len(json.dumps(log))
+        assert log == LogCreate(
+            flow_run_id=flow_run.id,
+            task_run_id=record.task_run_id,
+            name="prefect.flow_runs",
+            level=logging.INFO,
+            message="Finished in state Completed()",
+            timestamp=pendulum.from_timestamp(record.created),
+        ).model_dump(mode="json")
+
+    def test_does_not_enqueue_logs_with_malformed_run_ids(
+        self, logger, mock_log_worker, capsys, flow_run
+    ):
+        with FlowRunContext.model_construct(flow_run=flow_run):
+            logger.info("test", extra={"task_run_id": "not-a-uuid"})
+
+        mock_log_worker.instance().send.assert_not_called()
+        assert "ValidationError" in capsys.readouterr().err
+
 
 WORKER_ID = uuid.uuid4()
 
@@ -808,6 +858,42 @@ class TestAPILogWorker:
         assert "--- Error logging to API ---" in err
         assert "ValueError: Test" in err
 
+    async def test_sends_compressed_logs_when_enabled(self, log_dict, monkeypatch):
+        mock_create_logs = AsyncMock()
+        monkeypatch.setattr(
+            "prefect.client.orchestration.PrefectClient.create_logs", mock_create_logs
+        )
+
+        with temporary_settings(updates={PREFECT_LOGGING_TO_API_COMPRESS: True}):
+            worker = APILogWorker.instance()
+            worker.send(log_dict)
+            await worker.drain()
+
+        mock_create_logs.assert_awaited_once_with([log_dict], compress=True)
+
+    def test_spills_logs_when_the_queue_is_full(self, log_dict):
+        with temporary_settings(
+            updates={
+                PREFECT_LOGGING_TO_API_MAX_QUEUE_ITEMS: 1,
+                PREFECT_LOGGING_TO_API_OVERFLOW_POLICY: "spill",
+            }
+        ):
+            worker = APILogWorker(*range(6))
+
+        for _ in range(3):
+            worker.send(dict(log_dict))
+
+        stats = worker.stats
+        assert stats.depth == 1
+        assert stats.spilled == 2
+
+        # Logs are read back into the queue as it is emptied
+        item, size = worker._queue.get_nowait()
+        worker._release(size)
+        assert item == log_dict
+        assert worker.stats.spooled == 1
+        assert worker._queue.get_nowait() == (log_dict, size)
+
     async def test_send_logs_batches_by_size(self, log_dict, monkeypatch):
         mock_create_logs = AsyncMock()
         monkeypatch.setattr(
@@ -1,9 +1,11 @@
+import contextvars
 import copy
 import os
 import textwrap
 import warnings
 from datetime import timedelta
 from pathlib import Path
+from unittest.mock import MagicMock
 
 import pydantic
 import pytest
@@ -180,8 +182,18 @@ SUPPORTED_SETTINGS = {
     "PREFECT_API_TASK_CACHE_KEY_MAX_LENGTH": {"test_value": 10, "legacy": True},
     "PREFECT_API_TLS_INSECURE_SKIP_VERIFY": {"test_value": True},
     "PREFECT_API_URL": {"test_value": "https://api.prefect.io"},
+    "PREFECT_CLIENT_BLOCKS_CACHE_ENABLED": {"test_value": True},
+    "PREFECT_CLIENT_BLOCKS_CACHE_MAX_SIZE": {"test_value": 10},
+    "PREFECT_CLIENT_BLOCKS_CACHE_TTL_SECONDS": {"test_value": 5.0},
+    "PREFECT_CLIENT_CONCURRENCY_LEASE_SLOTS": {"test_value": 10},
+    "PREFECT_CLIENT_CONCURRENCY_LEASE_TTL_SECONDS": {"test_value": 5.0},
+    "PREFECT_CLIENT_CONCURRENCY_SLOT_WAIT_SECONDS": {"test_value": 5.0},
     "PREFECT_CLIENT_CSRF_SUPPORT_ENABLED": {"test_value": True},
     "PREFECT_CLIENT_ENABLE_METRICS": {"test_value": True, "legacy": True},
+    "PREFECT_CLIENT_EVENTS_BATCH_SIZE": {"test_value": 10},
+    "PREFECT_CLIENT_EVENTS_MAX_QUEUE_ITEMS": {"test_value": 10},
+    "PREFECT_CLIENT_EVENTS_MAX_QUEUE_SIZE": {"test_value": 10_000},
+    "PREFECT_CLIENT_EVENTS_OVERFLOW_POLICY": {"test_value": "drop_oldest"},
     "PREFECT_CLIENT_MAX_RETRIES": {"test_value": 3},
     "PREFECT_CLIENT_METRICS_ENABLED": {
         "test_value": True,
@@ -255,8 +267,12 @@ SUPPORTED_SETTINGS = {
     },
     "PREFECT_LOGGING_TO_API_BATCH_INTERVAL": {"test_value": 10.0},
     "PREFECT_LOGGING_TO_API_BATCH_SIZE": {"test_value": 5_000_000},
+    "PREFECT_LOGGING_TO_API_COMPRESS": {"test_value": True},
     "PREFECT_LOGGING_TO_API_ENABLED": {"test_value": True},
     "PREFECT_LOGGING_TO_API_MAX_LOG_SIZE": {"test_value": 10},
+    "PREFECT_LOGGING_TO_API_MAX_QUEUE_ITEMS": {"test_value": 10},
+    "PREFECT_LOGGING_TO_API_MAX_QUEUE_SIZE": {"test_value": 10_000},
+    "PREFECT_LOGGING_TO_API_OVERFLOW_POLICY": {"test_value": "spill"},
     "PREFECT_LOGGING_TO_API_WHEN_MISSING_FLOW": {"test_value": "ignore"},
     "PREFECT_MEMOIZE_BLOCK_AUTO_REGISTRATION": {"test_value": True, "legacy": True},
     "PREFECT_MEMO_STORE_PATH": {"test_value": Path("/path/to/memo"), "legacy": True},
@@ -266,6 +282,9 @@ SUPPORTED_SETTINGS = {
     "PREFECT_RESULTS_DEFAULT_SERIALIZER": {"test_value": "serializer"},
     "PREFECT_RESULTS_DEFAULT_STORAGE_BLOCK": {"test_value": "block"},
     "PREFECT_RESULTS_LOCAL_STORAGE_PATH": {"test_value": Path("/path/to/storage")},
+    "PREFECT_RESULTS_MEMORY_CACHE_MAX_BYTES": {"test_value": 1024},
+    "PREFECT_RESULTS_METADATA_INDEX_MAX_AGE_SECONDS": {"test_value": 10.0},
+    "PREFECT_RESULTS_METADATA_INDEX_PATH": {"test_value": Path("/path/to/index")},
     "PREFECT_RESULTS_PERSIST_BY_DEFAULT": {"test_value": True},
     "PREFECT_RUNNER_POLL_FREQUENCY": {"test_value": 10},
     "PREFECT_RUNNER_PROCESS_LIMIT": {"test_value": 10},
@@ -274,6 +293,7 @@ SUPPORTED_SETTINGS = {
     "PREFECT_RUNNER_SERVER_LOG_LEVEL": {"test_value": "INFO"},
     "PREFECT_RUNNER_SERVER_MISSED_POLLS_TOLERANCE": {"test_value": 10},
     "PREFECT_RUNNER_SERVER_PORT": {"test_value": 8080},
+    "PREFECT_RUNNER_SUBSCRIBE_TO_SCHEDULED_FLOW_RUNS": {"test_value": True},
     "PREFECT_SERVER_ALLOW_EPHEMERAL_MODE": {"test_value": True, "legacy": True},
     "PREFECT_SERVER_ANALYTICS_ENABLED": {"test_value": True},
     "PREFECT_SERVER_API_CORS_ALLOWED_HEADERS": {"test_value": "foo"},
@@ -284,7 +304,12 @@ SUPPORTED_SETTINGS = {
     "PREFECT_SERVER_API_DEFAULT_LIMIT": {"test_value": 10},
     "PREFECT_SERVER_API_HOST": {"test_value": "host"},
     "PREFECT_SERVER_API_KEEPALIVE_TIMEOUT": {"test_value": 10},
+    "PREFECT_SERVER_API_MAX_DECOMPRESSED_BODY_SIZE": {"test_value": 1024},
     "PREFECT_SERVER_API_PORT": {"test_value": 4200},
+    "PREFECT_SERVER_BLOCKS_CACHE_ENABLED": {"test_value": True},
+    "PREFECT_SERVER_BLOCKS_CACHE_MAX_SIZE": {"test_value": 10},
+    "PREFECT_SERVER_BLOCKS_CACHE_TTL_SECONDS": {"test_value": 5.0},
+    "PREFECT_SERVER_CONCURRENCY_MAX_SLOT_WAIT_SECONDS": {"test_value": 5.0},
     "PREFECT_SERVER_CORS_ALLOWED_HEADERS": {"test_value": "foo", "legacy": True},
     "PREFECT_SERVER_CORS_ALLOWED_METHODS": {"test_value": "foo", "legacy": True},
     "PREFECT_SERVER_CORS_ALLOWED_ORIGINS": {"test_value": "foo", "legacy": True},
@@ -332,6 +357,11 @@ SUPPORTED_SETTINGS = {
     "PREFECT_SERVER_FLOW_RUN_GRAPH_MAX_ARTIFACTS": {"test_value": 10},
     "PREFECT_SERVER_FLOW_RUN_GRAPH_MAX_NODES": {"test_value": 100},
     "PREFECT_SERVER_LOGGING_LEVEL": {"test_value": "INFO"},
+    "PREFECT_SERVER_LOGS_MAXIMUM_WEBSOCKET_BACKFILL": {
+        "test_value": timedelta(minutes=15)
+    },
+    "PREFECT_SERVER_LOGS_STREAM_BATCH_SIZE": {"test_value": 100},
+    "PREFECT_SERVER_LOGS_STREAM_OUT_ENABLED": {"test_value": True},
     "PREFECT_SERVER_LOG_RETRYABLE_ERRORS": {"test_value": True},
     "PREFECT_SERVER_MEMO_STORE_PATH": {"test_value": Path("/path/to/memo")},
     "PREFECT_SERVER_MEMOIZE_BLOCK_AUTO_REGISTRATION": {"test_value": True},
@@ -342,6 +372,10 @@ SUPPORTED_SETTINGS = {
     "PREFECT_SERVER_SERVICES_EVENT_PERSISTER_BATCH_SIZE": {"test_value": 10},
     "PREFECT_SERVER_SERVICES_EVENT_PERSISTER_ENABLED": {"test_value": True},
     "PREFECT_SERVER_SERVICES_EVENT_PERSISTER_FLUSH_INTERVAL": {"test_value": 10.0},
+    "PREFECT_SERVER_SERVICES_EVENT_PERSISTER_MAX_BATCH_SIZE": {"test_value": 100},
+    "PREFECT_SERVER_SERVICES_EVENT_PERSISTER_MAX_FLUSH_ATTEMPTS": {"test_value": 3},
+    "PREFECT_SERVER_SERVICES_EVENT_PERSISTER_MAX_QUEUE_SIZE": {"test_value": 100},
+    "PREFECT_SERVER_SERVICES_EVENT_PERSISTER_USE_COPY": {"test_value": True},
     "PREFECT_SERVER_SERVICES_FLOW_RUN_NOTIFICATIONS_ENABLED": {"test_value": True},
     "PREFECT_SERVER_SERVICES_FOREMAN_DEPLOYMENT_LAST_POLLED_TIMEOUT_SECONDS": {
         "test_value": 10
@@ -362,6 +396,14 @@ SUPPORTED_SETTINGS = {
     "PREFECT_SERVER_SERVICES_LATE_RUNS_LOOP_SECONDS": {"test_value": 10.0},
     "PREFECT_SERVER_SERVICES_PAUSE_EXPIRATIONS_ENABLED": {"test_value": True},
     "PREFECT_SERVER_SERVICES_PAUSE_EXPIRATIONS_LOOP_SECONDS": {"test_value": 10.0},
+    "PREFECT_SERVER_SERVICES_RUN_HISTORY_ROLLUPS_COMMIT_GRACE_SECONDS": {
+        "test_value": 10.0
+    },
+    "PREFECT_SERVER_SERVICES_RUN_HISTORY_ROLLUPS_ENABLED": {"test_value": True},
+    "PREFECT_SERVER_SERVICES_RUN_HISTORY_ROLLUPS_LOOP_SECONDS": {"test_value": 10.0},
+    "PREFECT_SERVER_SERVICES_RUN_HISTORY_ROLLUPS_RECONCILE_SECONDS": {
+        "test_value": 10.0
+    },
     "PREFECT_SERVER_SERVICES_SCHEDULER_DEPLOYMENT_BATCH_SIZE": {"test_value": 10},
     "PREFECT_SERVER_SERVICES_SCHEDULER_ENABLED": {"test_value": True},
     "PREFECT_SERVER_SERVICES_SCHEDULER_INSERT_BATCH_SIZE": {"test_value": 10},
@@ -382,6 +424,12 @@ SUPPORTED_SETTINGS = {
     "PREFECT_SERVER_TASKS_SCHEDULING_PENDING_TASK_TIMEOUT": {
         "test_value": timedelta(seconds=10),
     },
+    "PREFECT_SERVER_TASKS_SCHEDULING_QUEUE_BACKEND": {
+        "test_value": "prefect.server.task_queue.database"
+    },
+    "PREFECT_SERVER_TASKS_SCHEDULING_VISIBILITY_TIMEOUT": {
+        "test_value": timedelta(seconds=10),
+    },
     "PREFECT_SERVER_TASKS_TAG_CONCURRENCY_SLOT_WAIT_SECONDS": {
         "test_value": 10.0,
     },
@@ -396,6 +444,7 @@ SUPPORTED_SETTINGS = {
     "PREFECT_TASKS_DEFAULT_RETRIES": {"test_value": 10},
     "PREFECT_TASKS_DEFAULT_RETRY_DELAY_SECONDS": {"test_value": 10},
     "PREFECT_TASKS_REFRESH_CACHE": {"test_value": True},
+    "PREFECT_TASKS_RUNNER_PROCESS_POOL_MAX_WORKERS": {"test_value": 5},
     "PREFECT_TASKS_RUNNER_THREAD_POOL_MAX_WORKERS": {"test_value": 5},
     "PREFECT_TASKS_SCHEDULING_DEFAULT_STORAGE_BLOCK": {"test_value": "block"},
     "PREFECT_TASKS_SCHEDULING_DELETE_FAILED_SUBMISSIONS": {"test_value": True},
@@ -435,9 +484,11 @@ SUPPORTED_SETTINGS = {
     "PREFECT_UI_URL": {"test_value": "https://ui.prefect.io"},
     "PREFECT_UNIT_TEST_LOOP_DEBUG": {"test_value": True, "legacy": True},
     "PREFECT_UNIT_TEST_MODE": {"test_value": True, "legacy": True},
+    "PREFECT_WORKER_CLAIM_FLOW_RUNS": {"test_value": True},
     "PREFECT_WORKER_HEARTBEAT_SECONDS": {"test_value": 10.0},
     "PREFECT_WORKER_PREFETCH_SECONDS": {"test_value": 10.0},
     "PREFECT_WORKER_QUERY_SECONDS": {"test_value": 10.0},
+    "PREFECT_WORKER_SUBSCRIBE_TO_SCHEDULED_FLOW_RUNS": {"test_value": True},
     "PREFECT_WORKER_WEBSERVER_HOST": {"test_value": "host"},
     "PREFECT_WORKER_WEBSERVER_PORT": {"test_value": 8080},
     "PREFECT_TASK_RUNNER_THREAD_POOL_MAX_WORKERS": {"test_value": 5, "legacy": True},
@@ -1127,6 +1178,75 @@ class TestTemporarySettings:
         assert PREFECT_TEST_MODE.value() is True
 
 
+class TestSettingsSnapshot:
+    @pytest.fixture(autouse=True)
+    def fresh_snapshot(self):
+        prefect.settings.context.invalidate_settings_snapshot()
+        yield
+        prefect.settings.context.invalidate_settings_snapshot()
+
+    def test_snapshot_is_reused(self, monkeypatch: pytest.MonkeyPatch):
+        build = MagicMock(wraps=Settings)
+        monkeypatch.setattr(prefect.settings.context, "Settings", build)
+
+        snapshot = prefect.settings.context._get_settings_snapshot()
+        assert prefect.settings.context._get_settings_snapshot() == snapshot
+
+        build.assert_called_once()
+
+    def test_snapshot_returns_a_copy(self):
+        snapshot = prefect.settings.context._get_settings_snapshot()
+        snapshot.client.max_retries = 99
+
+        new_snapshot = prefect.settings.context._get_settings_snapshot()
+        assert new_snapshot is not snapshot
+        assert new_snapshot.client.max_retries != 99
+
+    def test_snapshot_is_rebuilt_when_invalidated(
+        self, monkeypatch: pytest.MonkeyPatch
+    ):
+        snapshot = prefect.settings.context._get_settings_snapshot()
+
+        monkeypatch.setenv("PREFECT_CLIENT_RETRY_EXTRA_CODES", "420")
+        assert prefect.settings.context._get_settings_snapshot() == snapshot
+
+        prefect.settings.context.invalidate_settings_snapshot()
+
+        new_snapshot = prefect.settings.context._get_settings_snapshot()
+        assert new_snapshot.client.retry_extra_codes == {420}
+
+    def test_snapshot_is_rebuilt_after_temporary_settings(
+        self, monkeypatch: pytest.MonkeyPatch
+    ):
+        prefect.settings.context._get_settings_snapshot()
+        monkeypatch.setenv("PREFECT_CLIENT_RETRY_EXTRA_CODES", "420")
+
+        with temporary_settings():
+            pass
+
+        new_snapshot = prefect.settings.context._get_settings_snapshot()
+        assert new_snapshot.client.retry_extra_codes == {420}
+
+    def test_snapshot_is_rebuilt_when_settings_files_change(self, temporary_env_file):
+        temporary_env_file("PREFECT_CLIENT_RETRY_EXTRA_CODES=420")
+        snapshot = prefect.settings.context._get_settings_snapshot()
+        assert snapshot.client.retry_extra_codes == {420}
+
+        temporary_env_file("PREFECT_CLIENT_RETRY_EXTRA_CODES=420,500")
+
+        new_snapshot = prefect.settings.context._get_settings_snapshot()
+        assert new_snapshot.client.retry_extra_codes == {420, 500}
+
+    def test_current_settings_are_the_snapshot_without_a_settings_context(
+        self, monkeypatch: pytest.MonkeyPatch
+    ):
+        monkeypatch.setattr(prefect.context, "GLOBAL_SETTINGS_CONTEXT", None)
+
+        settings = contextvars.Context().run(get_current_settings)
+
+        assert settings == prefect.settings.context._get_settings_snapshot()
+
+
 class TestSettingsSources:
     def test_env_source(self, temporary_env_file):
         temporary_env_file("PREFECT_CLIENT_RETRY_EXTRA_CODES=420,500")
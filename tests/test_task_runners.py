@@ -1,3 +1,4 @@
+import os
 import time
 import uuid
 from concurrent.futures import Future
@@ -16,10 +17,15 @@ from prefect.settings import (
     PREFECT_DEFAULT_RESULT_STORAGE_BLOCK,
     PREFECT_TASK_RUNNER_THREAD_POOL_MAX_WORKERS,
     PREFECT_TASK_SCHEDULING_DEFAULT_STORAGE_BLOCK,
+    PREFECT_TASKS_RUNNER_PROCESS_POOL_MAX_WORKERS,
     temporary_settings,
 )
 from prefect.states import Completed, Running
-from prefect.task_runners import PrefectTaskRunner, ThreadPoolTaskRunner
+from prefect.task_runners import (
+    PrefectTaskRunner,
+    ProcessPoolTaskRunner,
+    ThreadPoolTaskRunner,
+)
 from prefect.task_worker import TaskWorker
 from prefect.tasks import task
 
@@ -232,6 +238,93 @@ class TestThreadPoolTaskRunner:
         assert test_flow().result() == 0
 
 
+class TestProcessPoolTaskRunner:
+    @pytest.fixture(autouse=True)
+    def default_storage_setting(self, tmp_path):
+        name = str(uuid.uuid4())
+        LocalFileSystem(basepath=tmp_path).save(name)
+        with temporary_settings(
+            {
+                PREFECT_DEFAULT_RESULT_STORAGE_BLOCK: f"local-file-system/{name}",
+                PREFECT_TASK_SCHEDULING_DEFAULT_STORAGE_BLOCK: f"local-file-system/{name}",
+            }
+        ):
+            yield
+
+    def test_duplicate(self):
+        runner = ProcessPoolTaskRunner(max_workers=4)
+        duplicate_runner = runner.duplicate()
+        assert isinstance(duplicate_runner, ProcessPoolTaskRunner)
+        assert duplicate_runner is not runner
+        assert duplicate_runner == runner
+
+    def test_runner_must_be_started(self):
+        runner = ProcessPoolTaskRunner()
+        with pytest.raises(RuntimeError, match="Task runner is not started"):
+            runner.submit(my_test_task, {})
+
+    def test_set_max_workers(self):
+        with ProcessPoolTaskRunner(max_workers=2) as runner:
+            assert runner._executor._max_workers == 2
+
+    def test_set_max_workers_through_settings(self):
+        with temporary_settings({PREFECT_TASKS_RUNNER_PROCESS_POOL_MAX_WORKERS: 3}):
+            with ProcessPoolTaskRunner() as runner:
+                assert runner._executor._max_workers == 3
+
+    def test_submit_sync_task(self):
+        with ProcessPoolTaskRunner(max_workers=2) as runner:
+            parameters = {"param1": 1, "param2": 2}
+            future = runner.submit(my_test_task, parameters)
+            assert isinstance(future, PrefectFuture)
+            assert isinstance(future.task_run_id, UUID)
+            assert isinstance(future.wrapped_future, Future)
+
+            assert future.result() == (1, 2)
+
+    def test_submit_async_task(self):
+        with ProcessPoolTaskRunner(max_workers=2) as runner:
+            parameters = {"param1": 1, "param2": 2}
+            future = runner.submit(my_test_async_task, parameters)
+            assert future.result() == (1, 2)
+
+    def test_submit_sync_task_receives_context(self):
+        with tags("tag1", "tag2"):
+            with ProcessPoolTaskRunner(max_workers=2) as runner:
+                future = runner.submit(context_matters, {})
+                assert future.result() == {"tag1", "tag2"}
+
+    def test_map_sync_task(self):
+        with ProcessPoolTaskRunner(max_workers=2) as runner:
+            parameters = {"param1": [1, 2, 3], "param2": [4, 5, 6]}
+            futures = runner.map(my_test_task, parameters)
+            assert all(isinstance(future, PrefectFuture) for future in futures)
+
+            results = [future.result() for future in futures]
+            assert results == [(1, 4), (2, 5), (3, 6)]
+
+    def test_runs_in_worker_process(self):
+        @task
+        def get_pid():
+            return os.getpid()
+
+        with ProcessPoolTaskRunner(max_workers=2) as runner:
+            assert runner.submit(get_pid, {}).result() != os.getpid()
+
+    def test_resolves_upstream_futures_before_submission(self):
+        @task
+        def add_one(x):
+            return x + 1
+
+        @flow(task_runner=ProcessPoolTaskRunner(max_workers=2))
+        def test_flow():
+            upstream = add_one.submit(1)
+            downstream = add_one.submit(upstream, wait_for=[upstream])
+            return downstream.result()
+
+        assert test_flow() == 3
+
+
 class TestPrefectTaskRunner:
     @pytest.fixture(autouse=True)
     def clear_cache(self):
@@ -39,7 +39,11 @@ from prefect.exceptions import (
     ReservedArgumentError,
 )
 from prefect.filesystems import LocalFileSystem
-from prefect.futures import PrefectDistributedFuture, PrefectFuture
+from prefect.futures import (
+    PrefectChunkedFuture,
+    PrefectDistributedFuture,
+    PrefectFuture,
+)
 from prefect.locking.filesystem import FileSystemLockManager
 from prefect.locking.memory import MemoryLockManager
 from prefect.logging import get_run_logger
@@ -4082,6 +4086,164 @@ class TestTaskMap:
         task_states = my_flow()
         assert [await state.result() for state in task_states] == [2, 3, 4]
 
+    async def test_chunked_map(self):
+        @flow
+        def my_flow():
+            futures = TestTaskMap.add_together.map([1, 2, 3, 4, 5], 10, chunksize=2)
+            assert all(isinstance(f, PrefectChunkedFuture) for f in futures)
+            # Each chunk runs in a single task run
+            assert len({f.task_run_id for f in futures}) == 3
+            return futures.result()
+
+        assert my_flow() == [11, 12, 13, 14, 15]
+
+    async def test_chunked_map_async_task(self):
+        @flow
+        def my_flow():
+            return TestTaskMap.add_one.map([1, 2, 3], chunksize=2)
+
+        task_states = my_flow()
+        assert [await state.result() for state in task_states] == [2, 3, 4]
+
+    async def test_chunked_map_return_state_true(self):
+        @flow
+        def my_flow():
+            return TestTaskMap.add_one.map([1, 2, 3], chunksize=2, return_state=True)
+
+        states = my_flow()
+        assert all(isinstance(s, State) for s in states)
+        assert [await state.result() for state in states] == [2, 3, 4]
+
+    async def test_chunked_map_consumes_iterables_lazily(self):
+        consumed = []
+
+        def generate_numbers():
+            for i in range(5):
+                consumed.append(i)
+                yield i
+
+        @flow
+        def my_flow():
+            return TestTaskMap.add_together.map(
+                generate_numbers(), range(5), chunksize=2
+            ).result()
+
+        assert my_flow() == [0, 2, 4, 6, 8]
+        assert consumed == [0, 1, 2, 3, 4]
+
+    async def test_chunked_map_with_keyword_with_default(self):
+        @task
+        def add_some(x, y=5):
+            return x + y
+
+        @flow
+        def my_flow():
+            return add_some.map([1, 2, 3], chunksize=10).result()
+
+        assert my_flow() == [6, 7, 8]
+
+    def test_chunked_map_mismatching_lazy_input_lengths(self):
+        @flow
+        def my_flow():
+            return TestTaskMap.add_together.map(
+                iter([1, 2, 3]), iter([4, 5]), chunksize=2
+            )
+
+        with pytest.raises(MappingLengthMismatch):
+            my_flow()
+
+    def test_chunked_map_rejects_invalid_chunksize(self):
+        @flow
+        def my_flow():
+            return TestTaskMap.add_together.map([1, 2], [3, 4], chunksize=0)
+
+        with pytest.raises(ValueError, match="chunksize"):
+            my_flow()
+
+    def test_chunked_map_computes_cache_keys_per_element(self):
+        calls = []
+
+        def cache_key_fn(context, parameters):
+            return str(parameters["x"])
+
+        @task(cache_key_fn=cache_key_fn, persist_result=True)
+        def double(x):
+            calls.append(x)
+            return x * 2
+
+        @flow
+        def my_flow():
+            first = double.map([1, 2, 3, 4], chunksize=2).result()
+            # The second chunk differs from every first-run chunk and must not
+            # be served from another chunk's cache
+            second = double.map([1, 2, 5, 6], chunksize=2).result()
+            return first, second
+
+        assert my_flow() == ([2, 4, 6, 8], [2, 4, 10, 12])
+        assert calls == [1, 2, 3, 4, 5, 6]
+
+    def test_chunked_map_rejects_result_storage_key(self):
+        @task(result_storage_key="{parameters[x]}")
+        def double(x):
+            return x * 2
+
+        @flow
+        def my_flow():
+            return double.map([1, 2, 3], chunksize=2)
+
+        with pytest.raises(ValueError, match="result_storage_key"):
+            my_flow()
+
+    def test_chunked_map_not_supported_when_deferred(self):
+        with pytest.raises(ValueError, match="chunksize"):
+            TestTaskMap.add_together.map([1, 2], [3, 4], deferred=True, chunksize=2)
+
+    def test_map_unordered(self):
+        @flow
+        def my_flow():
+            return sum(TestTaskMap.add_together.map_unordered(range(10), 1))
+
+        assert my_flow() == 55
+
+    def test_map_unordered_submits_lazily(self):
+        consumed = []
+
+        def generate_numbers():
+            for i in range(10):
+                consumed.append(i)
+                yield i
+
+        @flow
+        def my_flow():
+            results = TestTaskMap.add_together.map_unordered(
+                generate_numbers(), 1, max_in_flight=2
+            )
+            first = next(results)
+            submitted = len(consumed)
+            return first, submitted, sorted([first, *results])
+
+        first, submitted, results = my_flow()
+        assert submitted == 2
+        assert results == list(range(1, 11))
+
+    async def test_map_unordered_async_iteration(self):
+        @flow
+        async def my_flow():
+            return sorted(
+                [
+                    result
+                    async for result in TestTaskMap.add_one.map_unordered(
+                        [1, 2, 3], max_in_flight=2
+                    )
+                ]
+            )
+
+        assert await my_flow() == [2, 3, 4]
+
+    def test_map_unordered_raises_outside_of_flow(self):
+        with pytest.raises(RuntimeError, match="within a flow"):
+            TestTaskMap.add_one.map_unordered([1, 2, 3])
+
     def test_map_raises_outside_of_flow_when_not_deferred(self):
         @task
         def test_task(x):
@@ -1,11 +1,21 @@
+import gc
 import hashlib
 import threading
 from unittest.mock import MagicMock
 
+import numpy as np
 import pytest
 
 from prefect.exceptions import HashError
-from prefect.utilities.hashing import file_hash, hash_objects, stable_hash
+from prefect.utilities import hashing
+from prefect.utilities.hashing import (
+    HashMemo,
+    file_hash,
+    hash_objects,
+    register_type_hasher,
+    stable_hash,
+    stream_hash_objects,
+)
 
 
 @pytest.mark.parametrize(
@@ -83,3 +93,189 @@ class TestHashObjects:
         assert "Unable to create hash" in error_msg
         assert "JSON error" in error_msg
         assert "Pickle error" in error_msg
+
+
+class Point:
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+
+class TestStreamHashObjects:
+    @pytest.fixture(autouse=True)
+    def restore_type_hashers(self, monkeypatch):
+        monkeypatch.setattr(hashing, "_type_hashers", dict(hashing._type_hashers))
+
+    def test_hash_is_stable(self):
+        assert stream_hash_objects(1, "a", x=[1, 2]) == stream_hash_objects(
+            1, "a", x=[1, 2]
+        )
+
+    def test_hash_uses_hash_algo(self):
+        assert len(stream_hash_objects("a")) == 32
+        assert len(stream_hash_objects("a", hash_algo=hashlib.sha256)) == 64
+
+    def test_dict_order_does_not_matter(self):
+        assert stream_hash_objects({"a": 1, "b": 2}) == stream_hash_objects(
+            {"b": 2, "a": 1}
+        )
+
+    @pytest.mark.parametrize(
+        "a,b",
+        [
+            (1, "1"),
+            (1, 1.0),
+            (1, True),
+            ([1, 2], (1, 2)),
+            (["ab"], ["a", "b"]),
+            ({"a": 1}, {"a": 2}),
+            ({1, 2}, {1, 3}),
+            (b"ab", "ab"),
+        ],
+    )
+    def test_different_objects_have_different_hashes(self, a, b):
+        assert stream_hash_objects(a) != stream_hash_objects(b)
+
+    def test_hashes_buffers_by_contents_and_shape(self):
+        array = np.arange(12, dtype="int64").reshape(3, 4)
+
+        assert stream_hash_objects(array) == stream_hash_objects(array.copy())
+        assert stream_hash_objects(array) == stream_hash_objects(
+            np.asfortranarray(array)
+        )
+        assert stream_hash_objects(array) != stream_hash_objects(array.reshape(4, 3))
+        assert stream_hash_objects(array) != stream_hash_objects(
+            array.astype("float64")
+        )
+        assert stream_hash_objects(array) != stream_hash_objects(array + 1)
+
+    def test_hashes_buffers_without_serializing(self, monkeypatch):
+        def fail(*args, **kwargs):
+            raise AssertionError("buffers should not be serialized")
+
+        monkeypatch.setattr(hashing.cloudpickle, "dumps", fail)
+        monkeypatch.setattr(hashing.JSONSerializer, "dumps", fail)
+
+        assert stream_hash_objects(b"data", memoryview(b"data"), np.zeros(10))
+
+    def test_falls_back_to_serialization(self):
+        assert stream_hash_objects(Point(1, 2)) == stream_hash_objects(Point(1, 2))
+        assert stream_hash_objects(Point(1, 2)) != stream_hash_objects(Point(1, 3))
+
+    def test_registered_type_hasher(self):
+        calls = []
+
+        @register_type_hasher(Point)
+        def hash_point(point):
+            calls.append(point)
+            yield str(point.x).encode()
+            yield memoryview(str(point.y).encode())
+
+        assert stream_hash_objects(Point(1, 2)) == stream_hash_objects(Point(1, 2))
+        assert stream_hash_objects(Point(1, 2)) != stream_hash_objects(Point(1, 3))
+        assert len(calls) == 4
+
+    def test_registered_type_hasher_applies_to_subclasses(self):
+        class Point3D(Point):
+            pass
+
+        register_type_hasher(Point, lambda point: b"same")
+        assert stream_hash_objects(Point3D(1, 2)) == stream_hash_objects(Point3D(3, 4))
+
+    def test_failing_type_hasher_falls_back_to_serialization(self):
+        def fail(point):
+            raise ValueError("oops")
+
+        register_type_hasher(Point, fail)
+        assert stream_hash_objects(Point(1, 2)) != stream_hash_objects(Point(1, 3))
+
+    def test_unhashable_objects(self):
+        lock = threading.Lock()
+        assert stream_hash_objects({"lock": lock}) is None
+
+        with pytest.raises(HashError) as exc:
+            stream_hash_objects({"lock": lock}, raise_on_failure=True)
+
+        error_msg = str(exc.value)
+        assert "Unable to create hash" in error_msg
+        assert "JSON error" in error_msg
+        assert "Pickle error" in error_msg
+
+    def test_self_referencing_objects(self):
+        items = []
+        items.append(items)
+        assert stream_hash_objects(items) is None
+
+        with pytest.raises(HashError):
+            stream_hash_objects(items, raise_on_failure=True)
+
+
+class TestHashMemo:
+    def test_memoizes_buffers_over_immutable_memory(self):
+        memo = HashMemo()
+        array = np.frombuffer(bytes(range(80)), dtype=np.int64)
+        hashed = []
+
+        def hash_algo():
+            h = hashlib.blake2b(digest_size=16)
+            hashed.append(h)
+            return h
+
+        key = stream_hash_objects(array, hash_algo=hash_algo, memo=memo)
+        assert len(memo) == 1
+        first_call_count = len(hashed)
+
+        hashed.clear()
+        assert stream_hash_objects(array, hash_algo=hash_algo, memo=memo) == key
+        # The array's digest is reused instead of hashing its contents again
+        assert len(hashed) == first_call_count - 1
+
+    def test_does_not_memoize_writeable_buffers(self):
+        memo = HashMemo()
+        array = np.arange(10)
+
+        key = stream_hash_objects(array, memo=memo)
+        array[0] = 100
+        assert len(memo) == 0
+        assert stream_hash_objects(array, memo=memo) != key
+
+    def test_memoizes_views_of_arrays_over_immutable_memory(self):
+        memo = HashMemo()
+        array = np.frombuffer(bytes(range(80)), dtype=np.int64)
+        view = array[2:]
+
+        stream_hash_objects(view, memo=memo)
+        assert len(memo) == 1
+
+    def test_does_not_memoize_read_only_arrays_that_own_their_data(self):
+        memo = HashMemo()
+        array = np.arange(10)
+        array.setflags(write=False)
+
+        key = stream_hash_objects(array, memo=memo)
+        assert len(memo) == 0
+
+        # the array can be made writeable again, so its digest can't be reused
+        array.setflags(write=True)
+        array[0] = 100
+        assert stream_hash_objects(array, memo=memo) != key
+
+    def test_does_not_memoize_read_only_views_of_writeable_arrays(self):
+        memo = HashMemo()
+        array = np.arange(10)
+        view = array.view()
+        view.setflags(write=False)
+
+        stream_hash_objects(view, memo=memo)
+        assert len(memo) == 0
+
+    def test_entries_are_removed_when_objects_are_collected(self):
+        memo = HashMemo()
+        array = np.frombuffer(bytes(range(80)), dtype=np.int64)
+
+        stream_hash_objects(array, memo=memo)
+        assert len(memo) == 1
+
+        del array
+        gc.collect()
+        assert len(memo) == 0
@@ -1,3 +1,4 @@
+import asyncio
 import uuid
 from typing import Any, Dict, Optional, Type
 from unittest import mock
@@ -29,6 +30,7 @@ from prefect.server.schemas.responses import DeploymentResponse
 from prefect.settings import (
     PREFECT_API_URL,
     PREFECT_TEST_MODE,
+    PREFECT_WORKER_CLAIM_FLOW_RUNS,
     PREFECT_WORKER_PREFETCH_SECONDS,
     get_current_settings,
     temporary_settings,
@@ -527,6 +529,182 @@ async def test_worker_calls_run_with_expected_arguments(
     }
 
 
+async def test_worker_claims_flow_runs(
+    prefect_client: PrefectClient, worker_deployment_wq1, work_pool
+):
+    run_mock = AsyncMock(return_value=MagicMock(status_code=0))
+
+    def create_run_with_deployment(state):
+        return prefect_client.create_flow_run_from_deployment(
+            worker_deployment_wq1.id, state=state
+        )
+
+    flow_runs = [
+        await create_run_with_deployment(Pending()),
+        await create_run_with_deployment(
+            Scheduled(scheduled_time=pendulum.now("utc").subtract(days=1))
+        ),
+        await create_run_with_deployment(
+            Scheduled(scheduled_time=pendulum.now("utc").add(seconds=5))
+        ),
+        await create_run_with_deployment(
+            Scheduled(scheduled_time=pendulum.now("utc").add(seconds=20))
+        ),
+    ]
+
+    with temporary_settings({PREFECT_WORKER_CLAIM_FLOW_RUNS: True}):
+        async with WorkerTestImpl(work_pool_name=work_pool.name) as worker:
+            worker._work_pool = work_pool
+            worker.run = run_mock  # don't run anything
+            worker._propose_pending_state = AsyncMock()
+            submitted_flow_runs = await worker.get_and_submit_flow_runs()
+
+    assert {flow_run.id for flow_run in submitted_flow_runs} == {
+        fr.id for fr in flow_runs[1:3]
+    }
+    assert {call.kwargs["flow_run"].id for call in run_mock.call_args_list} == {
+        fr.id for fr in flow_runs[1:3]
+    }
+    # the server moved the claimed runs to Pending
+    worker._propose_pending_state.assert_not_awaited()
+    for flow_run in flow_runs[1:3]:
+        flow_run = await prefect_client.read_flow_run(flow_run.id)
+        assert flow_run.state.is_pending()
+        assert flow_run.state.message == f"Claimed by worker {worker.name!r}"
+
+    assert worker._claimed_flow_run_ids == set()
+
+
+async def test_worker_claims_no_more_flow_runs_than_its_limit(
+    prefect_client: PrefectClient, worker_deployment_wq1, work_pool
+):
+    def create_run_with_deployment(state):
+        return prefect_client.create_flow_run_from_deployment(
+            worker_deployment_wq1.id, state=state
+        )
+
+    flow_runs = [
+        await create_run_with_deployment(
+            Scheduled(scheduled_time=pendulum.now("utc").subtract(minutes=i))
+        )
+        for i in range(3)
+    ]
+
+    with temporary_settings({PREFECT_WORKER_CLAIM_FLOW_RUNS: True}):
+        async with WorkerTestImpl(work_pool_name=work_pool.name, limit=2) as worker:
+            worker._submit_run = AsyncMock()  # don't run anything
+
+            submitted_flow_runs = await worker.get_and_submit_flow_runs()
+            assert len(submitted_flow_runs) == 2
+
+            # no slots are free, so nothing is claimed
+            submitted_flow_runs = await worker.get_and_submit_flow_runs()
+            assert submitted_flow_runs == []
+
+    states = [
+        (await prefect_client.read_flow_run(flow_run.id)).state
+        for flow_run in flow_runs
+    ]
+    assert sorted(state.type for state in states) == [
+        StateType.PENDING,
+        StateType.PENDING,
+        StateType.SCHEDULED,
+    ]
+
+
+async def test_worker_claims_flow_runs_one_poll_at_a_time(
+    prefect_client: PrefectClient, worker_deployment_wq1, work_pool
+):
+    flow_runs = [
+        await prefect_client.create_flow_run_from_deployment(
+            worker_deployment_wq1.id,
+            state=Scheduled(scheduled_time=pendulum.now("utc").subtract(minutes=i)),
+        )
+        for i in range(4)
+    ]
+
+    with temporary_settings({PREFECT_WORKER_CLAIM_FLOW_RUNS: True}):
+        async with WorkerTestImpl(work_pool_name=work_pool.name, limit=2) as worker:
+            worker._submit_run = AsyncMock()  # don't run anything
+            claim_flow_runs = AsyncMock(
+                wraps=worker._client.claim_flow_runs_for_work_pool
+            )
+            worker._client.claim_flow_runs_for_work_pool = claim_flow_runs
+
+            results = await asyncio.gather(
+                worker.get_and_submit_flow_runs(), worker.get_and_submit_flow_runs()
+            )
+
+    assert sum(len(submitted_flow_runs) for submitted_flow_runs in results) == 2
+    # the second poll waits for the first, then finds no free slots to claim
+    claim_flow_runs.assert_awaited_once()
+    states = [
+        (await prefect_client.read_flow_run(flow_run.id)).state
+        for flow_run in flow_runs
+    ]
+    assert sorted(state.type for state in states) == [
+        StateType.PENDING,
+        StateType.PENDING,
+        StateType.SCHEDULED,
+        StateType.SCHEDULED,
+    ]
+
+
+async def test_worker_polls_concurrently_without_claiming(work_pool):
+    polling = 0
+    max_polling = 0
+
+    async def get_scheduled_flow_runs(*args, **kwargs):
+        nonlocal polling, max_polling
+        polling += 1
+        max_polling = max(max_polling, polling)
+        await asyncio.sleep(0.1)
+        polling -= 1
+        return []
+
+    async with WorkerTestImpl(work_pool_name=work_pool.name) as worker:
+        worker._get_scheduled_flow_runs = get_scheduled_flow_runs
+
+        await asyncio.gather(
+            worker.get_and_submit_flow_runs(), worker.get_and_submit_flow_runs()
+        )
+
+    assert max_polling == 2
+
+
+async def test_worker_returns_claimed_flow_runs_it_cannot_submit(
+    prefect_client: PrefectClient, worker_deployment_wq1, work_pool
+):
+    flow_runs = [
+        await prefect_client.create_flow_run_from_deployment(
+            worker_deployment_wq1.id,
+            state=Scheduled(scheduled_time=pendulum.now("utc").subtract(minutes=i)),
+        )
+        for i in range(2)
+    ]
+
+    with temporary_settings({PREFECT_WORKER_CLAIM_FLOW_RUNS: True}):
+        async with WorkerTestImpl(work_pool_name=work_pool.name, limit=2) as worker:
+            worker._submit_run = AsyncMock()  # don't run anything
+
+            claimed_flow_runs = await worker._get_scheduled_flow_runs()
+            assert len(claimed_flow_runs) == 2
+
+            # another submission takes a slot before the claimed runs are submitted
+            worker._limiter.acquire_on_behalf_of_nowait(uuid.uuid4())
+            submitted_flow_runs = await worker._submit_scheduled_flow_runs(
+                claimed_flow_runs
+            )
+
+    assert len(submitted_flow_runs) == 1
+    unsubmitted_flow_run = next(
+        flow_run for flow_run in flow_runs if flow_run.id != submitted_flow_runs[0].id
+    )
+    assert unsubmitted_flow_run.id not in worker._claimed_flow_run_ids
+    unsubmitted_flow_run = await prefect_client.read_flow_run(unsubmitted_flow_run.id)
+    assert unsubmitted_flow_run.state.is_scheduled()
+
+
 async def test_worker_warns_when_running_a_flow_run_with_a_storage_block(
     prefect_client: PrefectClient, deployment, work_pool, caplog
 ):